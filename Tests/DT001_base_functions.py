@@ -0,0 +1,81 @@
+#usr/bin/python3
+"""
+Module statistics_lib.Tests.DT001_base_functions
+
+Implements the demonstration test TEST-D-100, verifying the requirement
+REQ-FUN-114.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '17-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import random
+import statistics
+import timeit
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from statistics_lib import base_functions as bf
+
+#globals
+
+LENGTH = 10 #length of the input data
+
+REPEATS = 5 #number of the timing runs, the best one is reported
+
+NUMBER = 20000 #number of the calls per timing run
+
+FUNCTIONS = (
+    ('Mean', bf.GetMean, statistics.mean),
+    ('VarianceP', bf.GetVarianceP, statistics.pvariance),
+    ('StdevP', bf.GetStdevP, statistics.pstdev),
+    ('VarianceS', bf.GetVarianceS, statistics.variance),
+    ('StdevS', bf.GetStdevS, statistics.stdev),
+    ('SE', bf.GetSE, None)
+)
+
+#functions
+
+def GetLatency(Function, *Args, **Kwargs) -> float:
+    """
+    Measures the best per call latency of a function in microseconds.
+    """
+    Timer = timeit.Timer(lambda: Function(*Args, **Kwargs))
+    return min(Timer.repeat(repeat = REPEATS, number = NUMBER)) * 1E6 / NUMBER
+
+if __name__ == '__main__':
+    #preparation
+    DataFloat = [random.uniform(-10.0, 10.0) for _ in range(LENGTH)]
+    DataInt = [random.randint(-100, 100) for _ in range(LENGTH)]
+    #per call latency test
+    for Title, Data in (('floats', DataFloat), ('integers', DataInt)):
+        print(f'Per call latency (us) on {LENGTH} {Title}')
+        print('{:<10} {:>10} {:>10} {:>12}'.format('Function', 'DoCheck',
+                                                    'no check', 'statistics'))
+        for Name, Function, Reference in FUNCTIONS:
+            Checked = GetLatency(Function, Data)
+            Unchecked = GetLatency(Function, Data, DoCheck = False)
+            if Reference is None:
+                Standard = '-'
+            else:
+                Standard = '{:.2f}'.format(GetLatency(Reference, Data))
+            print('{:<10} {:>10.2f} {:>10.2f} {:>12}'.format(Name, Checked,
+                                                        Unchecked, Standard))
+        input('Press Enter')
+    print('Test is done!')
@@ -21,6 +21,9 @@ import unittest
 import random
 import statistics
 import math
+import operator
+import array
+import fractions
 
 #+ custom modules
 
@@ -37,6 +40,11 @@ import statistics_lib.base_functions as test_module
 
 from phyqus_lib.base_classes import MeasuredValue
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 #globals
 
 FLOAT_CHECK_PRECISION = 8 #digits after comma
@@ -863,6 +871,25 @@ class Test_GetMoment(Test_Basis):
             self.assertAlmostEqual(TestResult, 0,
                                                 places = FLOAT_CHECK_PRECISION)
 
+    def test_NaN(self) -> None:
+        """
+        Checks that a NaN value in the data propagates into all kinds of the
+        moments (default missing values policy), instead of being treated as
+        the constant data.
+
+        Implements tests: TEST-T-100.
+        Covers the requirements REQ-FUN-101.
+        """
+        for Data in ([1.0, 2.0, math.nan, 4.0], [math.nan, 1, 1],
+                                                    [2.5, math.nan, 2.5]):
+            for Power in range(1, 7):
+                for IsCentral in (False, True):
+                    for IsNormalized in (False, True):
+                        TestResult = self.TestFunction(Data, Power,
+                                            IsCentral = IsCentral,
+                                            IsNormalized = IsNormalized)
+                        self.assertTrue(math.isnan(TestResult))
+
 class Test_GetCovariance(Test_Basis):
     """
     Unit-tests of the function GetCovariance().
@@ -1409,45 +1436,2031 @@ class Test_GetMoment2(Test_Basis):
                                                             IsNormalized = True)
 
 
-#+ test suites
+class Test_BufferInput(unittest.TestCase):
+    """
+    Unit-tests of the moment-based functions with the 1D buffers of real
+    numbers as the input.
 
-TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_GetMean)
+    Implements tests: TEST-T-103
+    Covers the requirements REQ-FUN-102.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        Length = random.randrange(10, 100)
+        cls.AllInt = [random.randint(-100, 100) for _ in range(Length)]
+        cls.AllFloat = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        cls.Functions1D = [test_module.GetMean, test_module.GetVarianceP,
+                            test_module.GetStdevP, test_module.GetVarianceS,
+                            test_module.GetStdevS, test_module.GetSE,
+                            test_module.GetSkewnessP, test_module.GetSkewnessS,
+                            test_module.GetKurtosisP, test_module.GetKurtosisS]
+        cls.Functions2D = [test_module.GetCovariance, test_module.GetPearsonR]
+    
+    def checkAll(self, Converter) -> None:
+        """
+        Compares the results of the functions for the converted input with
+        those for the original lists.
+        """
+        for Data, TypeCode in ((self.AllInt, 'l'), (self.AllFloat, 'd')):
+            Buffer = Converter(Data, TypeCode)
+            for Function in self.Functions1D:
+                TestResult = Function(Buffer)
+                self.assertIsInstance(TestResult, (int, float))
+                self.assertAlmostEqual(TestResult, Function(Data),
+                                                places = FLOAT_CHECK_PRECISION)
+            for Power in range(1, 7):
+                for IsCentral in (False, True):
+                    for IsNormalized in (False, True):
+                        TestResult = test_module.GetMoment(Buffer, Power,
+                                                        IsCentral = IsCentral,
+                                                    IsNormalized = IsNormalized)
+                        CheckResult = test_module.GetMoment(Data, Power,
+                                                        IsCentral = IsCentral,
+                                                    IsNormalized = IsNormalized)
+                        self.assertIsInstance(TestResult, (int, float))
+                        self.assertAlmostEqual(TestResult, CheckResult,
+                                    delta = DELTA_PRECISION * max(1,
+                                                            abs(CheckResult)))
+            for Function in self.Functions2D:
+                TestResult = Function(Buffer, Buffer[::-1])
+                CheckResult = Function(Data, Data[::-1])
+                self.assertIsInstance(TestResult, (int, float))
+                self.assertAlmostEqual(TestResult, CheckResult,
+                                                places = FLOAT_CHECK_PRECISION)
+            TestResult = test_module.GetMoment2(Buffer, Buffer[::-1], 2, 3,
+                                            IsCentral = True, IsNormalized = True)
+            CheckResult = test_module.GetMoment2(Data, Data[::-1], 2, 3,
+                                            IsCentral = True, IsNormalized = True)
+            self.assertAlmostEqual(TestResult, CheckResult,
+                                                places = FLOAT_CHECK_PRECISION)
+    
+    def test_ArrayArray(self) -> None:
+        """
+        Checks the array.array input, which is supported with and without NumPy
+        being installed.
 
-TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_GetVarianceP)
+        Implements tests: TEST-T-103.
+        Covers the requirements REQ-FUN-102.
+        """
+        self.checkAll(lambda Data, TypeCode: array.array(TypeCode, Data))
+    
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_NumpyArray(self) -> None:
+        """
+        Checks the numpy.ndarray input, including mixing with the lists.
 
-TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_GetStdevP)
+        Implements tests: TEST-T-103.
+        Covers the requirements REQ-FUN-102.
+        """
+        self.checkAll(lambda Data, TypeCode: np.array(Data))
+        self.checkAll(lambda Data, TypeCode: memoryview(
+                                                array.array(TypeCode, Data)))
+        Buffer = np.array(self.AllFloat)
+        for Function in self.Functions2D:
+            CheckResult = Function(self.AllFloat, self.AllInt)
+            self.assertAlmostEqual(Function(Buffer, self.AllInt), CheckResult,
+                                                places = FLOAT_CHECK_PRECISION)
+            self.assertAlmostEqual(Function(self.AllFloat,
+                                            np.array(self.AllInt, dtype = 'i4')),
+                                CheckResult, places = FLOAT_CHECK_PRECISION)
+    
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_NumpyConstant(self) -> None:
+        """
+        Checks the special case of a constant array.
 
-TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_GetVarianceS)
+        Implements tests: TEST-T-103.
+        Covers the requirements REQ-FUN-102.
+        """
+        Buffer = np.full(random.randrange(2, 20), 0.1)
+        self.assertEqual(test_module.GetVarianceP(Buffer), 0)
+        self.assertEqual(test_module.GetSkewnessP(Buffer), 0)
+        self.assertEqual(test_module.GetKurtosisP(Buffer), -3)
+        self.assertEqual(test_module.GetMoment(Buffer, 5, IsCentral = True,
+                                                        IsNormalized = True), 0)
+        with self.assertRaises(ValueError):
+            test_module.GetMoment(Buffer, 2, IsNormalized = True)
+    
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_NumpyErrors(self) -> None:
+        """
+        Checks that the improper arrays are rejected.
 
-TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_GetStdevS)
+        Implements tests: TEST-T-103.
+        Covers the requirements REQ-FUN-102.
+        """
+        for Buffer in (np.zeros((3, 3)), np.array(['a', 'b']),
+                                    np.array([1, 2], dtype = object),
+                                    np.array([1 + 1j, 2])):
+            for Function in self.Functions1D:
+                with self.assertRaises(TypeError):
+                    Function(Buffer)
+            for Function in self.Functions2D:
+                with self.assertRaises(TypeError):
+                    Function(Buffer, self.AllFloat)
+        for Function in self.Functions1D:
+            with self.assertRaises(ValueError):
+                Function(np.array([]))
+        for Function in self.Functions2D:
+            with self.assertRaises(ValueError):
+                Function(np.array(self.AllFloat), self.AllFloat[1:])
 
-TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_GetSE)
+class Test_MomentAccumulator(unittest.TestCase):
+    """
+    Unit-tests of the class MomentAccumulator.
 
-TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(Test_GetMeanSqrSE)
+    Implements tests: TEST-T-104
+    Covers the requirements REQ-FUN-103.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = test_module.MomentAccumulator
+        Length = random.randrange(20, 200)
+        cls.AllInt = [random.randint(-100, 100) for _ in range(Length)]
+        cls.AllFloat = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        cls.TotalMixed = list()
+        for Index in range(Length):
+            Temp = random.random()
+            if Temp >= 0.6:
+                cls.TotalMixed.append(MeasuredValue(cls.AllFloat[Index],
+                                                    random.uniform(0.0, 3.0)))
+            elif Temp >= 0.3:
+                cls.TotalMixed.append(cls.AllFloat[Index])
+            else:
+                cls.TotalMixed.append(cls.AllInt[Index])
+        cls.Properties = {
+            'N' : len,
+            'Mean' : test_module.GetMean,
+            'Var' : test_module.GetVarianceP,
+            'VarS' : test_module.GetVarianceS,
+            'Sigma' : test_module.GetStdevP,
+            'SE' : test_module.GetSE,
+            'Skew' : test_module.GetSkewnessP,
+            'SkewS' : test_module.GetSkewnessS,
+            'Kurt' : test_module.GetKurtosisP,
+            'KurtS' : test_module.GetKurtosisS,
+            'MeanSqrSE' : test_module.GetMeanSqrSE,
+            'FullVar' : lambda Data: (test_module.GetVarianceP(Data)
+                                        + test_module.GetMeanSqrSE(Data)),
+            'FullSE' : test_module.GetFullSE
+        }
+    
+    def checkAccumulator(self, Accumulator, Data) -> None:
+        """
+        Compares all properties of the accumulator with the values calculated
+        by the functions for the entire data set.
+        """
+        for Name, Function in self.Properties.items():
+            TestResult = getattr(Accumulator, Name)
+            self.assertIsInstance(TestResult, (int, float))
+            self.assertAlmostEqual(TestResult, Function(Data),
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(Accumulator.FullSigma,
+                                math.sqrt(self.Properties['FullVar'](Data)),
+                                                places = FLOAT_CHECK_PRECISION)
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks the accumulation by element, by sequences and by merging.
+
+        Implements tests: TEST-T-104.
+        Covers the requirements REQ-FUN-103.
+        """
+        for Data in (self.AllInt, self.AllFloat, self.TotalMixed):
+            Length = len(Data)
+            objTest = self.TestClass()
+            for Item in Data:
+                objTest.update(Item)
+            self.checkAccumulator(objTest, Data)
+            objTest = self.TestClass()
+            objTest.updateMany(Data)
+            self.checkAccumulator(objTest, Data)
+            objTest.updateMany([]) #empty sequence is ignored
+            self.checkAccumulator(objTest, Data)
+            #random partitioning into sequences and single elements
+            Bounds = sorted(random.sample(range(1, Length), 3))
+            Parts = [Data[:Bounds[0]], Data[Bounds[0]:Bounds[1]],
+                                    Data[Bounds[1]:Bounds[2]], Data[Bounds[2]:]]
+            Accumulators = []
+            for Index, Part in enumerate(Parts):
+                objTemp = self.TestClass()
+                if Index % 2:
+                    for Item in Part:
+                        objTemp.update(Item)
+                else:
+                    objTemp.updateMany(tuple(Part))
+                Accumulators.append(objTemp)
+            objTest = self.TestClass()
+            objTest.merge(self.TestClass()) #merging an empty one
+            for objTemp in reversed(Accumulators):
+                objTest.merge(objTemp)
+            self.checkAccumulator(objTest, Data)
+            #the merged instances are not changed
+            for Index, objTemp in enumerate(Accumulators):
+                self.assertEqual(objTemp.N, len(Parts[Index]))
+            #pairwise tree of merges
+            Accumulators[0].merge(Accumulators[1])
+            Accumulators[2].merge(Accumulators[3])
+            Accumulators[0].merge(Accumulators[2])
+            self.checkAccumulator(Accumulators[0], Data)
+    
+    def test_EdgeCases(self) -> None:
+        """
+        Checks the constant data and the merging with itself.
+
+        Implements tests: TEST-T-104.
+        Covers the requirements REQ-FUN-103.
+        """
+        objTest = self.TestClass()
+        objTest.updateMany([2.5] * 10)
+        self.assertEqual(objTest.Var, 0)
+        self.assertEqual(objTest.Skew, 0)
+        self.assertEqual(objTest.Kurt, -3)
+        objTest = self.TestClass()
+        objTest.updateMany(self.AllFloat)
+        objTest.merge(objTest)
+        self.checkAccumulator(objTest, self.AllFloat + self.AllFloat)
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper input data
+        type.
 
-TestSuite8 = unittest.TestLoader().loadTestsFromTestCase(Test_GetFullSE)
+        Implements test TEST-T-104.
+        Covers the requirement REQ-FUN-103.
+        """
+        objTest = self.TestClass()
+        for Temp in ['1', [1], None, int, MeasuredValue]:
+            with self.assertRaises(TypeError):
+                objTest.update(Temp)
+        for Temp in [1, 2.0, 'asd', [1, '1'], ('b', 2.0), int, {1:1, 2:2}]:
+            with self.assertRaises(TypeError):
+                objTest.updateMany(Temp)
+        for Temp in [1, [1, 2], test_module._MomentsSummary(1, 1, 0, 0, 0)]:
+            with self.assertRaises(TypeError):
+                objTest.merge(Temp)
+        self.assertEqual(objTest.N, 0)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised by the access to the
+        statistics of an empty or too short accumulator.
 
-TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(Test_GetSkewnessP)
+        Implements test TEST-T-104.
+        Covers the requirement REQ-FUN-103.
+        """
+        objTest = self.TestClass()
+        for Name in self.Properties:
+            if Name != 'N':
+                with self.assertRaises(ValueError):
+                    getattr(objTest, Name)
+        with self.assertRaises(ValueError):
+            objTest.getCentralMoment(2)
+        objTest.update(1)
+        with self.assertRaises(ValueError):
+            objTest.VarS
+        objTest.update(2)
+        with self.assertRaises(ValueError):
+            objTest.SkewS
+        objTest.update(4)
+        with self.assertRaises(ValueError):
+            objTest.KurtS
 
-TestSuite10 = unittest.TestLoader().loadTestsFromTestCase(Test_GetSkewnessS)
+class Test_Workers(unittest.TestCase):
+    """
+    Unit-tests of the moment-based functions with the calculations split
+    between several worker processes.
 
-TestSuite11 = unittest.TestLoader().loadTestsFromTestCase(Test_GetKurtosisP)
+    Implements tests: TEST-T-105
+    Covers the requirements REQ-FUN-104.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.MinLength = test_module.MIN_CHUNK_LENGTH
+        test_module.MIN_CHUNK_LENGTH = 10 #forces the split of the short data
+        Length = random.randrange(50, 200)
+        cls.AllInt = [random.randint(-100, 100) for _ in range(Length)]
+        cls.AllFloat = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        cls.Functions1D = [test_module.GetMean, test_module.GetVarianceP,
+                            test_module.GetStdevP, test_module.GetVarianceS,
+                            test_module.GetStdevS, test_module.GetSE,
+                            test_module.GetSkewnessP, test_module.GetSkewnessS,
+                            test_module.GetKurtosisP, test_module.GetKurtosisS]
+        cls.Functions2D = [test_module.GetCovariance, test_module.GetPearsonR]
+    
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        Clean-up after all test cases, done only once.
+        """
+        test_module.MIN_CHUNK_LENGTH = cls.MinLength
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the results do not depend on the number of the workers.
 
-TestSuite12 = unittest.TestLoader().loadTestsFromTestCase(Test_GetKurtosisS)
+        Implements tests: TEST-T-105.
+        Covers the requirements REQ-FUN-104.
+        """
+        for Data in (self.AllInt, self.AllFloat, self.AllInt[:15]):
+            for Workers in (1, 3):
+                for Function in self.Functions1D:
+                    TestResult = Function(Data, Workers = Workers)
+                    self.assertIsInstance(TestResult, (int, float))
+                    self.assertAlmostEqual(TestResult, Function(Data),
+                                                places = FLOAT_CHECK_PRECISION)
+                for Function in self.Functions2D:
+                    TestResult = Function(Data, Data[::-1], Workers = Workers)
+                    self.assertIsInstance(TestResult, (int, float))
+                    self.assertAlmostEqual(TestResult,
+                                            Function(Data, Data[::-1]),
+                                                places = FLOAT_CHECK_PRECISION)
+                for Power in (1, 3, 4, 5):
+                    for IsCentral in (False, True):
+                        for IsNormalized in (False, True):
+                            CheckResult = test_module.GetMoment(Data, Power,
+                                    IsCentral = IsCentral,
+                                    IsNormalized = IsNormalized)
+                            TestResult = test_module.GetMoment(Data, Power,
+                                    IsCentral = IsCentral,
+                                    IsNormalized = IsNormalized,
+                                    Workers = Workers)
+                            self.assertAlmostEqual(TestResult, CheckResult,
+                                    delta = DELTA_PRECISION * max(1,
+                                                            abs(CheckResult)))
+                            CheckResult = test_module.GetMoment2(Data,
+                                    Data[::-1], Power, 2,
+                                    IsCentral = IsCentral,
+                                    IsNormalized = IsNormalized)
+                            TestResult = test_module.GetMoment2(Data,
+                                    Data[::-1], Power, 2,
+                                    IsCentral = IsCentral,
+                                    IsNormalized = IsNormalized,
+                                    Workers = Workers)
+                            self.assertAlmostEqual(TestResult, CheckResult,
+                                    delta = DELTA_PRECISION * max(1,
+                                                            abs(CheckResult)))
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper type of the
+        number of the workers.
 
-TestSuite13 = unittest.TestLoader().loadTestsFromTestCase(Test_GetMoment)
+        Implements test TEST-T-105.
+        Covers the requirement REQ-FUN-104.
+        """
+        for Workers in (1.0, '2', [2]):
+            for Function in self.Functions1D:
+                with self.assertRaises(TypeError):
+                    Function(self.AllFloat, Workers = Workers)
+            for Function in self.Functions2D:
+                with self.assertRaises(TypeError):
+                    Function(self.AllFloat, self.AllFloat, Workers = Workers)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with zero or negative
+        number of the workers.
 
-TestSuite14 = unittest.TestLoader().loadTestsFromTestCase(Test_GetCovariance)
+        Implements test TEST-T-105.
+        Covers the requirement REQ-FUN-104.
+        """
+        for Workers in (0, -2):
+            for Function in self.Functions1D:
+                with self.assertRaises(ValueError):
+                    Function(self.AllFloat, Workers = Workers)
+            for Function in self.Functions2D:
+                with self.assertRaises(ValueError):
+                    Function(self.AllFloat, self.AllFloat, Workers = Workers)
 
-TestSuite15 = unittest.TestLoader().loadTestsFromTestCase(Test_GetPearsonR)
+class Test_ExtractData(Test_Basis):
+    """
+    Unit-tests of the helper function _ExtractData() splitting the input into
+    the values and the uncertainties in a single pass.
 
-TestSuite16 = unittest.TestLoader().loadTestsFromTestCase(Test_GetMoment2)
+    Implements tests: TEST-T-100, TEST-T-101, TEST-T-102
+    Covers the requirements REQ-FUN-101, REQ-AWM-100 and REQ-AWM-101.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        super().setUpClass()
+        cls.TestFunction = staticmethod(test_module._ExtractData)
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks the normal operation mode of the function being tested
+
+        Implements test TEST-T-100.
+        Covers the requirement REQ-FUN-101.
+        """
+        for BaseInput in [self.AllInt, self.AllFloat, self.Mixed]:
+            for TestInput in (BaseInput, tuple(BaseInput)):
+                Values, Errors = self.TestFunction(TestInput)
+                self.assertIsInstance(Values, list)
+                self.assertListEqual(Values, BaseInput)
+                self.assertIsNone(Errors) #no uncertainties present
+        for TestInput, BaseInput in ((self.IntErr, self.AllInt),
+                                        (self.FloatErr, self.AllFloat),
+                                        (self.MixedErr, self.Mixed),
+                                        (self.TotalMixed, self.Mixed)):
+            CheckErrors = [0 if isinstance(Item, (int, float)) else Item.SE
+                                                        for Item in TestInput]
+            for Input in (TestInput, tuple(TestInput)):
+                Values, Errors = self.TestFunction(Input)
+                self.assertListEqual(Values, BaseInput)
+                self.assertListEqual(Errors, CheckErrors)
+        #bool is an int sub-class - not homogeneous, but acceptable
+        Values, Errors = self.TestFunction([True, 1, 2.0])
+        self.assertListEqual(Values, [1, 1, 2])
+        self.assertListEqual(Errors, [0, 0, 0])
+
+class Test_CorrelationMatrices(unittest.TestCase):
+    """
+    Unit-tests of the functions GetCovarianceMatrix() and GetPearsonMatrix().
+
+    Implements tests: TEST-T-106
+    Covers the requirements REQ-FUN-105.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        Length = random.randrange(10, 100)
+        cls.AllInt = [random.randint(-100, 100) for _ in range(Length)]
+        cls.AllFloat = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        cls.Mixed = [MeasuredValue(Item, abs(Item) / 10)
+                                                    for Item in cls.AllFloat]
+        cls.Const = [random.randint(-100, 100)] * Length
+        cls.Data = [cls.AllInt, cls.AllFloat, cls.Mixed, cls.Const,
+                                                            cls.AllInt[::-1]]
+    
+    def checkMatrix(self, TestResult, Data, Function) -> None:
+        """
+        Compares the matrix element-wise with the results of the pairwise
+        function.
+        """
+        Size = len(Data)
+        self.assertIsInstance(TestResult, tuple)
+        self.assertEqual(len(TestResult), Size)
+        for Row in range(Size):
+            self.assertIsInstance(TestResult[Row], tuple)
+            self.assertEqual(len(TestResult[Row]), Size)
+            for Column in range(Size):
+                Value = TestResult[Row][Column]
+                self.assertIsInstance(Value, (int, float))
+                self.assertEqual(Value, TestResult[Column][Row])
+                self.assertAlmostEqual(Value,
+                                        Function(Data[Row], Data[Column]),
+                                                places = FLOAT_CHECK_PRECISION)
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks the normal operation mode of the functions being tested.
+
+        Implements tests: TEST-T-106.
+        Covers the requirements REQ-FUN-105.
+        """
+        for Data in (self.Data, tuple(self.Data), self.Data[:1]):
+            TestResult = test_module.GetCovarianceMatrix(Data)
+            self.checkMatrix(TestResult, Data, test_module.GetCovariance)
+            TestResult = test_module.GetPearsonMatrix(Data)
+            self.checkMatrix(TestResult, Data, test_module.GetPearsonR)
+            for Index in range(len(Data)):
+                self.assertEqual(TestResult[Index][Index], 1)
+        TestResult = test_module.GetPearsonMatrix([self.Const, self.AllInt])
+        self.assertEqual(TestResult[0][1], 0)
+        self.assertEqual(TestResult[1][0], 0)
+        TestResult = test_module.GetCovarianceMatrix([self.Const, self.Const])
+        self.assertEqual(TestResult, ((0, 0), (0, 0)))
+    
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_Buffers(self) -> None:
+        """
+        Checks that the buffers of real numbers, including a 2D NumPy array,
+        are accepted as the input.
+
+        Implements tests: TEST-T-106.
+        Covers the requirements REQ-FUN-105.
+        """
+        Data = [self.AllInt, self.AllFloat, self.AllInt[::-1]]
+        Matrix = np.array(Data, dtype = np.float64)
+        for Function in (test_module.GetCovarianceMatrix,
+                                                test_module.GetPearsonMatrix):
+            CheckResult = Function(Data)
+            for TestInput in (Matrix, [array.array('l', self.AllInt),
+                                    self.AllFloat, Matrix[2]]):
+                TestResult = Function(TestInput)
+                for Row in range(3):
+                    for Column in range(3):
+                        self.assertIsInstance(TestResult[Row][Column],
+                                                                (int, float))
+                        self.assertAlmostEqual(TestResult[Row][Column],
+                                                CheckResult[Row][Column],
+                                                places = FLOAT_CHECK_PRECISION)
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that the improper input data type is treated properly.
+
+        Implements tests: TEST-T-106.
+        Covers the requirements REQ-FUN-105.
+        """
+        for Function in (test_module.GetCovarianceMatrix,
+                                                test_module.GetPearsonMatrix):
+            for TestInput in (1, 1.0, 'abc', self.AllInt, [self.AllInt, 1],
+                                        [self.AllInt, 'abc'], [[1, 'a', 2]]):
+                with self.assertRaises(TypeError):
+                    Function(TestInput)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that the improper input data value is treated properly.
+
+        Implements tests: TEST-T-106.
+        Covers the requirements REQ-FUN-105.
+        """
+        for Function in (test_module.GetCovarianceMatrix,
+                                                test_module.GetPearsonMatrix):
+            for TestInput in ([], [[]], [self.AllInt, []],
+                                        [self.AllInt, self.AllFloat[1:]]):
+                with self.assertRaises(ValueError):
+                    Function(TestInput)
+
+class Test_GetMoments(Test_Basis):
+    """
+    Unit-tests of the function GetMoments().
+
+    Implements tests: TEST-T-107
+    Covers the requirements REQ-FUN-106.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        super().setUpClass()
+        cls.TestFunction = staticmethod(test_module.GetMoments)
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the results are the same as of GetMoment() per power.
+
+        Implements tests: TEST-T-107.
+        Covers the requirements REQ-FUN-106.
+        """
+        Powers = list(range(1, 9))
+        random.shuffle(Powers)
+        for Data in (self.AllInt, self.AllFloat, self.Mixed, self.MixedErr,
+                                                            self.TotalMixed):
+            for IsCentral in (False, True):
+                for IsNormalized in (False, True):
+                    for TestPowers in (Powers, tuple(Powers[:3]), [5]):
+                        TestResult = self.TestFunction(Data, TestPowers,
+                                                    IsCentral = IsCentral,
+                                                    IsNormalized = IsNormalized)
+                        self.assertIsInstance(TestResult, dict)
+                        self.assertListEqual(sorted(TestResult),
+                                                            sorted(TestPowers))
+                        for Power, Value in TestResult.items():
+                            self.assertIsInstance(Value, (int, float))
+                            CheckResult = test_module.GetMoment(Data, Power,
+                                                    IsCentral = IsCentral,
+                                                    IsNormalized = IsNormalized)
+                            self.assertAlmostEqual(Value, CheckResult,
+                                    delta = DELTA_PRECISION * max(1,
+                                                            abs(CheckResult)))
+        TestResult = self.TestFunction(self.AllInt)
+        self.assertListEqual(sorted(TestResult), [1, 2, 3, 4])
+        self.assertAlmostEqual(TestResult[1], statistics.mean(self.AllInt),
+                                                places = FLOAT_CHECK_PRECISION)
+        TestResult = self.TestFunction([1, 2, 3, 4], IsCentral = True,
+                                                            IsNormalized = True)
+        self.assertAlmostEqual(TestResult[1], 0, places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(TestResult[2], 1, places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(TestResult[3], 0, places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(TestResult[4], 1.64,
+                                                places = FLOAT_CHECK_PRECISION)
+        #constant sequence - exactly zero central moments
+        for IsNormalized in (False, True):
+            TestResult = self.TestFunction([0.1] * 7, Powers,
+                            IsCentral = True, IsNormalized = IsNormalized)
+            self.assertDictEqual(TestResult, {Power : 0 for Power in Powers})
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper input data
+        type or the improper powers.
+
+        Implements tests: TEST-T-107.
+        Covers the requirements REQ-FUN-106.
+        """
+        for Temp in self.BadCases:
+            for IsCentral in (False, True):
+                with self.assertRaises(TypeError):
+                    self.TestFunction(Temp, [1, 2], IsCentral = IsCentral)
+        for Powers in (1, 1.0, '12', [1, 2.0], (1, '2'), [1, [2]], [True],
+                                                        [MeasuredValue(1)]):
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.AllInt, Powers)
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.AllInt, Powers, IsCentral = True)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with empty input data,
+        improper powers or the zero variance of the data for the normalized
+        non-central moments.
+
+        Implements tests: TEST-T-107.
+        Covers the requirements REQ-FUN-106.
+        """
+        for Powers in ([], tuple(), [1, 0], (-1, 2), [2, 3, -4]):
+            with self.assertRaises(ValueError):
+                self.TestFunction(self.AllInt, Powers)
+        with self.assertRaises(ValueError):
+            self.TestFunction([], [1, 2])
+        with self.assertRaises(ValueError):
+            self.TestFunction([1] * 5, [1, 2], IsNormalized = True)
+    
+    def test_Workers(self) -> None:
+        """
+        Checks that the results do not depend on the number of the workers.
+
+        Implements tests: TEST-T-107.
+        Covers the requirements REQ-FUN-106.
+        """
+        MinLength = test_module.MIN_CHUNK_LENGTH
+        test_module.MIN_CHUNK_LENGTH = 10 #forces the split of the short data
+        try:
+            Data = [random.uniform(-10.0, 10.0) for _ in range(50)]
+            for IsCentral in (False, True):
+                for IsNormalized in (False, True):
+                    CheckResult = self.TestFunction(Data, range(1, 7),
+                                                    IsCentral = IsCentral,
+                                                    IsNormalized = IsNormalized)
+                    TestResult = self.TestFunction(Data, range(1, 7),
+                                                    IsCentral = IsCentral,
+                                                    IsNormalized = IsNormalized,
+                                                    Workers = 3)
+                    for Power, Value in CheckResult.items():
+                        self.assertAlmostEqual(TestResult[Power], Value,
+                                    delta = DELTA_PRECISION * max(1,
+                                                                abs(Value)))
+        finally:
+            test_module.MIN_CHUNK_LENGTH = MinLength
+    
+    def test_NaN(self) -> None:
+        """
+        Checks that a NaN value in the data propagates into all moments (default
+        missing values policy), instead of being treated as the constant data.
+
+        Implements tests: TEST-T-107.
+        Covers the requirements REQ-FUN-106.
+        """
+        for Data in ([1.0, 2.0, math.nan, 4.0], [math.nan, 1, 1],
+                                                    [2.5, math.nan, 2.5]):
+            for IsCentral in (False, True):
+                for IsNormalized in (False, True):
+                    TestResult = self.TestFunction(Data, range(1, 7),
+                                                    IsCentral = IsCentral,
+                                                    IsNormalized = IsNormalized)
+                    self.assertEqual(list(TestResult), list(range(1, 7)))
+                    for Value in TestResult.values():
+                        self.assertTrue(math.isnan(Value))
+
+class Test_GetMoments2(Test_Basis):
+    """
+    Unit-tests of the function GetMoments2().
+
+    Implements tests: TEST-T-108
+    Covers the requirements REQ-FUN-107.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        super().setUpClass()
+        cls.TestFunction = staticmethod(test_module.GetMoments2)
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the results are the same as of GetMoment2() per pair of the
+        powers.
+
+        Implements tests: TEST-T-108.
+        Covers the requirements REQ-FUN-107.
+        """
+        for DataX, DataY in ((self.AllInt, self.AllInt[::-1]),
+                                (self.AllFloat, self.AllFloat[::-1]),
+                                (self.MixedErr, self.MixedErr[::-1]),
+                                (self.TotalMixed, self.TotalMixed[::-1])):
+            for IsCentral in (False, True):
+                for IsNormalized in (False, True):
+                    for MaxPowerX, MaxPowerY in ((4, 4), (1, 3), (5, 1)):
+                        TestResult = self.TestFunction(DataX, DataY, MaxPowerX,
+                                    MaxPowerY, IsCentral = IsCentral,
+                                                    IsNormalized = IsNormalized)
+                        self.assertIsInstance(TestResult, dict)
+                        self.assertEqual(len(TestResult),
+                                                        MaxPowerX * MaxPowerY)
+                        for PowerX in range(1, MaxPowerX + 1):
+                            for PowerY in range(1, MaxPowerY + 1):
+                                Value = TestResult[(PowerX, PowerY)]
+                                self.assertIsInstance(Value, (int, float))
+                                CheckResult = test_module.GetMoment2(DataX,
+                                                DataY, PowerX, PowerY,
+                                                IsCentral = IsCentral,
+                                                IsNormalized = IsNormalized)
+                                self.assertAlmostEqual(Value, CheckResult,
+                                    delta = DELTA_PRECISION * max(1,
+                                                            abs(CheckResult)))
+        #constant sequence - exactly zero central moments
+        for IsNormalized in (False, True):
+            TestResult = self.TestFunction([0.1] * 5, [1, 2, 3, 4, 5], 3, 3,
+                            IsCentral = True, IsNormalized = IsNormalized)
+            self.assertTrue(all(Value == 0 for Value in TestResult.values()))
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper input data
+        type or the improper powers.
+
+        Implements tests: TEST-T-108.
+        Covers the requirements REQ-FUN-107.
+        """
+        for Temp in self.BadCases:
+            with self.assertRaises(TypeError):
+                self.TestFunction(Temp, self.AllInt, 2, 2)
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.AllInt, Temp, 2, 2, IsCentral = True)
+        for Power in [1.0, '1', [1], (1, 2), MeasuredValue(1), {1:1}]:
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.AllInt, self.AllFloat, Power, 2)
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.AllInt, self.AllFloat, 2, Power)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with empty input data,
+        the sequences of different length, improper powers or the zero variance
+        of the data for the normalized non-central moments.
+
+        Implements tests: TEST-T-108.
+        Covers the requirements REQ-FUN-107.
+        """
+        for Power in (0, -1):
+            with self.assertRaises(ValueError):
+                self.TestFunction(self.AllInt, self.AllFloat, Power, 2)
+            with self.assertRaises(ValueError):
+                self.TestFunction(self.AllInt, self.AllFloat, 2, Power)
+        with self.assertRaises(ValueError):
+            self.TestFunction([], [], 2, 2)
+        with self.assertRaises(ValueError):
+            self.TestFunction(self.AllInt, self.AllInt[1:], 2, 2)
+        with self.assertRaises(ValueError):
+            self.TestFunction([1] * 5, [1, 2, 3, 4, 5], 2, 2,
+                                                            IsNormalized = True)
+    
+    def test_Workers(self) -> None:
+        """
+        Checks that the results do not depend on the number of the workers.
+
+        Implements tests: TEST-T-108.
+        Covers the requirements REQ-FUN-107.
+        """
+        MinLength = test_module.MIN_CHUNK_LENGTH
+        test_module.MIN_CHUNK_LENGTH = 10 #forces the split of the short data
+        try:
+            DataX = [random.uniform(-10.0, 10.0) for _ in range(50)]
+            DataY = [random.randint(-10, 10) for _ in range(50)]
+            for IsCentral in (False, True):
+                for IsNormalized in (False, True):
+                    CheckResult = self.TestFunction(DataX, DataY, 3, 4,
+                                                    IsCentral = IsCentral,
+                                                    IsNormalized = IsNormalized)
+                    TestResult = self.TestFunction(DataX, DataY, 3, 4,
+                                                    IsCentral = IsCentral,
+                                                    IsNormalized = IsNormalized,
+                                                    Workers = 3)
+                    for Key, Value in CheckResult.items():
+                        self.assertAlmostEqual(TestResult[Key], Value,
+                                    delta = DELTA_PRECISION * max(1,
+                                                                abs(Value)))
+        finally:
+            test_module.MIN_CHUNK_LENGTH = MinLength
+    
+    def test_Blocks(self) -> None:
+        """
+        Checks that the sums accumulated over several blocks of data are the
+        same as calculated directly, and that the integer sums are exact.
+
+        Implements tests: TEST-T-108.
+        Covers the requirements REQ-FUN-107.
+        """
+        Length = 2 * test_module.STREAM_CHUNK_LENGTH + random.randint(1, 999)
+        DataX = [random.uniform(-2.0, 2.0) for _ in range(Length)]
+        DataY = [random.randint(-3, 3) for _ in range(Length)]
+        TestResult = self.TestFunction(DataX, DataY, 3, 2)
+        for (PowerX, PowerY), Value in TestResult.items():
+            Check = math.fsum(pow(ItemX, PowerX) * pow(ItemY, PowerY)
+                                    for ItemX, ItemY in zip(DataX, DataY))
+            self.assertAlmostEqual(Value, Check / Length,
+                                        delta = DELTA_PRECISION * max(1,
+                                                                abs(Value)))
+        TestResult = test_module._GetCrossPowerSums(DataY, DataY[::-1], 2, 3)
+        self.assertEqual(len(TestResult), 3)
+        self.assertEqual(TestResult[0][0], Length)
+        for PowerX, Row in enumerate(TestResult):
+            self.assertEqual(len(Row), 4)
+            for PowerY, Value in enumerate(Row):
+                self.assertIsInstance(Value, int)
+                self.assertEqual(Value, sum(pow(ItemX, PowerX) *
+                                    pow(ItemY, PowerY) for ItemX, ItemY in
+                                                zip(DataY, DataY[::-1])))
+    
+    def test_NaN(self) -> None:
+        """
+        Checks that a NaN value in either sequence propagates into all
+        moments (default missing values policy), instead of being treated as
+        the constant data.
+
+        Implements tests: TEST-T-108.
+        Covers the requirements REQ-FUN-107.
+        """
+        for DataX, DataY in (([1.0, math.nan, 3.0], [1, 2, 4]),
+                                ([1, 2, 4], [2.5, 2.5, math.nan]),
+                                ([math.nan, 1, 1], [2, 2, 2])):
+            for IsCentral in (False, True):
+                for IsNormalized in (False, True):
+                    TestResult = self.TestFunction(DataX, DataY, 3, 2,
+                                                    IsCentral = IsCentral,
+                                                    IsNormalized = IsNormalized)
+                    self.assertEqual(len(TestResult), 6)
+                    for Value in TestResult.values():
+                        self.assertTrue(math.isnan(Value))
+
+class Test_ExactIntegers(unittest.TestCase):
+    """
+    Unit-tests of the exact calculations for the sequences of only integers.
+
+    Implements tests: TEST-T-109
+    Covers the requirements REQ-FUN-108.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        Length = random.randrange(100, 1000)
+        Offset = 10**12 #large offset - catastrophic cancellation for floats
+        cls.DataX = [Offset + random.randint(-10**6, 10**6)
+                                                    for _ in range(Length)]
+        cls.DataY = [random.randint(-1000, 1000) for _ in range(Length)]
+    
+    @staticmethod
+    def getExact(DataX, DataY):
+        """
+        Calculates the correctly rounded mean of X, the population and sample
+        variances of X and the covariance using rational numbers.
+        """
+        Length = len(DataX)
+        MeanX = fractions.Fraction(sum(DataX), Length)
+        MeanY = fractions.Fraction(sum(DataY), Length)
+        SumX = sum((Item - MeanX)**2 for Item in DataX)
+        SumXY = sum((Item - MeanX) * (DataY[Index] - MeanY)
+                                        for Index, Item in enumerate(DataX))
+        return (float(MeanX), float(SumX / Length), float(SumX / (Length - 1)),
+                                                        float(SumXY / Length))
+    
+    def test_Extraction(self) -> None:
+        """
+        Checks that only the sequences of only integers are marked for the
+        exact calculations.
+
+        Implements tests: TEST-T-109.
+        Covers the requirements REQ-FUN-108.
+        """
+        Values, _ = test_module._ExtractData(tuple(self.DataY))
+        self.assertIsInstance(Values, test_module._IntegerList)
+        self.assertListEqual(Values, self.DataY)
+        for Data in ([1, 2.0, 3], [True, 1, 2], [1, MeasuredValue(2, 1)]):
+            Values, _ = test_module._ExtractData(Data)
+            self.assertNotIsInstance(Values, test_module._IntegerList)
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the mean, variance and covariance of the sequences of only
+        integers are the correctly rounded exact values.
+
+        Implements tests: TEST-T-109.
+        Covers the requirements REQ-FUN-108.
+        """
+        for DataX, DataY in ((self.DataX, self.DataY),
+                                (self.DataY, self.DataX), ([7] * 5, [1] * 5)):
+            Mean, Var, VarS, Cov = self.getExact(DataX, DataY)
+            self.assertEqual(test_module.GetMean(DataX), Mean)
+            self.assertEqual(test_module.GetVarianceP(DataX), Var)
+            self.assertEqual(test_module.GetVarianceS(DataX), VarS)
+            self.assertEqual(test_module.GetStdevP(DataX), math.sqrt(Var))
+            self.assertEqual(test_module.GetCovariance(DataX, DataY), Cov)
+        Summary = test_module._GetMomentsSummary(
+                                        test_module._IntegerList(self.DataY))
+        Check = test_module._GetMomentsSummary(list(map(float, self.DataY)))
+        for Attr in ('Mean', 'Var', 'Sigma', 'SE', 'Skew', 'Kurt', 'M2', 'M3',
+                                                                        'M4'):
+            self.assertAlmostEqual(getattr(Summary, Attr),
+                                    getattr(Check, Attr),
+                                    delta = DELTA_PRECISION * max(1,
+                                                    abs(getattr(Check, Attr))))
+        CheckResult = test_module.GetPearsonR(list(map(float, self.DataX)),
+                                                                    self.DataY)
+        self.assertAlmostEqual(test_module.GetPearsonR(self.DataX, self.DataY),
+                                    CheckResult, places = FLOAT_CHECK_PRECISION)
+        self.assertEqual(test_module.GetPearsonR([1, 1], [2, 2]), 1)
+        self.assertEqual(test_module.GetPearsonR([1, 2], [2, 2]), 0)
+        self.assertEqual(test_module.GetSkewnessP([3] * 4), 0)
+        self.assertEqual(test_module.GetKurtosisP([3] * 4), -3)
+    
+    def test_Workers(self) -> None:
+        """
+        Checks that the exact results do not depend on the number of the
+        workers.
+
+        Implements tests: TEST-T-109.
+        Covers the requirements REQ-FUN-108.
+        """
+        MinLength = test_module.MIN_CHUNK_LENGTH
+        test_module.MIN_CHUNK_LENGTH = 10 #forces the split of the short data
+        try:
+            _, Var, _, Cov = self.getExact(self.DataX, self.DataY)
+            self.assertEqual(test_module.GetVarianceP(self.DataX, Workers = 3),
+                                                                        Var)
+            self.assertEqual(test_module.GetCovariance(self.DataX, self.DataY,
+                                                        Workers = 3), Cov)
+        finally:
+            test_module.MIN_CHUNK_LENGTH = MinLength
+
+class Test_GetStreamSummary(unittest.TestCase):
+    """
+    Unit-tests of the function GetStreamSummary() and the method
+    MomentAccumulator.updateStream().
+
+    Implements tests: TEST-T-110
+    Covers the requirements REQ-FUN-109.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        Length = random.randrange(100, 1000)
+        cls.AllFloat = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        cls.Mixed = [Item if random.random() > 0.5 else
+                        MeasuredValue(Item, random.random())
+                                                    for Item in cls.AllFloat]
+        cls.Properties = ('N', 'Mean', 'Var', 'Sigma', 'SE', 'Skew', 'Kurt',
+                                        'MeanSqrSE', 'FullVar', 'FullSE')
+    
+    def checkSummary(self, TestResult, Data) -> None:
+        """
+        Compares the streamed statistics with the accumulated ones.
+        """
+        self.assertIsInstance(TestResult, test_module.MomentAccumulator)
+        CheckResult = test_module.MomentAccumulator()
+        CheckResult.updateMany(Data)
+        for Attr in self.Properties:
+            self.assertAlmostEqual(getattr(TestResult, Attr),
+                                        getattr(CheckResult, Attr),
+                                                places = FLOAT_CHECK_PRECISION)
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the iterables of the single data points and / or blocks of
+        data points are processed properly.
+
+        Implements tests: TEST-T-110.
+        Covers the requirements REQ-FUN-109.
+        """
+        for Data in (self.AllFloat, self.Mixed):
+            for ChunkSize in (None, 1, 7, 10000):
+                TestResult = test_module.GetStreamSummary(
+                            (Item for Item in Data), ChunkSize = ChunkSize)
+                self.checkSummary(TestResult, Data)
+            Blocks = (Data[Index : Index + 13]
+                                        for Index in range(0, len(Data), 13))
+            self.checkSummary(test_module.GetStreamSummary(Blocks), Data)
+            Blocks = [Data[:10], Data[10], [], tuple(Data[11:50])]
+            Blocks.extend(Data[50:])
+            self.checkSummary(test_module.GetStreamSummary(iter(Blocks),
+                                                        ChunkSize = 5), Data)
+        Buffers = (array.array('d', self.AllFloat[Index : Index + 100])
+                                for Index in range(0, len(self.AllFloat), 100))
+        self.checkSummary(test_module.GetStreamSummary(Buffers), self.AllFloat)
+        TestResult = test_module.MomentAccumulator()
+        TestResult.updateStream(iter(self.AllFloat[:20]))
+        TestResult.updateStream(iter(self.AllFloat[20:]), ChunkSize = 3)
+        self.checkSummary(TestResult, self.AllFloat)
+        TestResult.updateStream(iter([]))
+        self.checkSummary(TestResult, self.AllFloat)
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper input data
+        type.
+
+        Implements tests: TEST-T-110.
+        Covers the requirements REQ-FUN-109.
+        """
+        for Data in (1, 1.0, 'abc', int, MeasuredValue(1), iter([1, 'a']),
+                            iter([[1, 2], [3, 'b']]), iter([[1, 2], {1 : 2}])):
+            with self.assertRaises(TypeError):
+                test_module.GetStreamSummary(Data)
+        for ChunkSize in (1.0, '1', [1]):
+            with self.assertRaises(TypeError):
+                test_module.GetStreamSummary(iter([1, 2]),
+                                                        ChunkSize = ChunkSize)
+            with self.assertRaises(TypeError):
+                test_module.MomentAccumulator().updateStream(iter([1, 2]),
+                                                        ChunkSize = ChunkSize)
+        with self.assertRaises(TypeError):
+            test_module.MomentAccumulator().updateStream(1)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with no data points in
+        the stream or improper value of the chunk size.
+
+        Implements tests: TEST-T-110.
+        Covers the requirements REQ-FUN-109.
+        """
+        for Data in (iter([]), [], [[], tuple()]):
+            with self.assertRaises(ValueError):
+                test_module.GetStreamSummary(Data)
+        for ChunkSize in (0, -1):
+            with self.assertRaises(ValueError):
+                test_module.GetStreamSummary(iter([1, 2]),
+                                                        ChunkSize = ChunkSize)
+
+class Test_GetRolling(unittest.TestCase):
+    """
+    Unit-tests of the functions GetRollingMean(), GetRollingVarianceP(),
+    GetRollingSkewnessP() and GetRollingKurtosisP().
+
+    Implements tests: TEST-T-111
+    Covers the requirements REQ-FUN-110.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        Length = random.randrange(200, 500)
+        cls.AllFloat = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        for Index in range(0, Length, random.randrange(20, 50)):
+            cls.AllFloat[Index] *= 1000 #outliers
+        cls.AllInt = [random.randint(-100, 100) + 10**12
+                                                    for _ in range(Length)]
+        cls.Mixed = [MeasuredValue(Item, 1.0) if random.random() > 0.5
+                                            else Item for Item in cls.AllFloat]
+        cls.Pairs = ((test_module.GetRollingMean, test_module.GetMean),
+                    (test_module.GetRollingVarianceP, test_module.GetVarianceP),
+                    (test_module.GetRollingSkewnessP, test_module.GetSkewnessP),
+                    (test_module.GetRollingKurtosisP, test_module.GetKurtosisP))
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the statistics of each window are the same as calculated
+        by the respective function on the slice of the data.
+
+        Implements tests: TEST-T-111.
+        Covers the requirements REQ-FUN-110.
+        """
+        Windows = (1, 2, 3, random.randint(4, 30), random.randint(31, 199))
+        for Data, Check in ((self.AllFloat, self.AllFloat),
+                                (self.Mixed, self.AllFloat),
+                                (self.AllInt, self.AllInt)):
+            Length = len(Data)
+            for Window in Windows:
+                for Function, CheckFunction in self.Pairs:
+                    TestResult = Function(Data, Window)
+                    self.assertIsInstance(TestResult, tuple)
+                    self.assertEqual(len(TestResult), Length - Window + 1)
+                    for Index, Value in enumerate(TestResult):
+                        self.assertIsInstance(Value, (int, float))
+                        CheckValue = CheckFunction(
+                                                Check[Index : Index + Window])
+                        Delta = max(1, abs(CheckValue)) * DELTA_PRECISION**2
+                        self.assertAlmostEqual(Value, CheckValue,
+                                                                delta = Delta)
+            TestResult = test_module.GetRollingMean(Data, Length)
+            self.assertEqual(TestResult, (test_module.GetMean(Data), ))
+        #exact integers
+        TestResult = test_module.GetRollingVarianceP(self.AllInt, 10)
+        for Index, Value in enumerate(TestResult):
+            Window = self.AllInt[Index : Index + 10]
+            self.assertEqual(Value, test_module.GetVarianceP(Window))
+        if not (np is None):
+            Data = np.array(self.AllFloat)
+            for Function, _ in self.Pairs:
+                TestResult = Function(Data, 7)
+                for Value, Check in zip(TestResult, Function(self.AllFloat, 7)):
+                    self.assertAlmostEqual(Value, Check,
+                                delta = max(1, abs(Check)) * DELTA_PRECISION**2)
+    
+    def test_NonFinite(self) -> None:
+        """
+        Checks that NaN and infinity affect only the windows containing them,
+        which have non-finite statistics (NaN for NaN), and the statistics of
+        the following windows are the same as calculated by the respective
+        function on the slice of the data.
+
+        Implements tests: TEST-T-111.
+        Covers the requirements REQ-FUN-110.
+        """
+        Length = len(self.AllFloat)
+        for Bad in (math.nan, math.inf, -math.inf):
+            Data = list(self.AllFloat)
+            Positions = (3, random.randint(50, 100), Length - 2)
+            for Position in Positions:
+                Data[Position] = Bad
+            for Window in (1, 2, 10, random.randint(11, 40)):
+                for Function, CheckFunction in self.Pairs:
+                    TestResult = Function(Data, Window)
+                    self.assertEqual(len(TestResult), Length - Window + 1)
+                    for Index, Value in enumerate(TestResult):
+                        CheckValue = CheckFunction(
+                                                Data[Index : Index + Window])
+                        if Bad != Bad and CheckValue != CheckValue:
+                            self.assertNotEqual(Value, Value)
+                        elif not math.isfinite(CheckValue):
+                            self.assertFalse(math.isfinite(Value))
+                        else:
+                            Delta = max(1, abs(CheckValue)) * DELTA_PRECISION**2
+                            self.assertAlmostEqual(Value, CheckValue,
+                                                                delta = Delta)
+        #example from the review - NaN at the index 3, width 10
+        Data = [float(Index % 7) for Index in range(30)]
+        Data[3] = math.nan
+        TestResult = test_module.GetRollingVarianceP(Data, 10)
+        for Index, Value in enumerate(TestResult):
+            if Index <= 3:
+                self.assertNotEqual(Value, Value)
+            else:
+                self.assertAlmostEqual(Value,
+                            test_module.GetVarianceP(Data[Index : Index + 10]))
+        if not (np is None):
+            TestResult = test_module.GetRollingVarianceP(np.array(Data), 10)
+            self.assertNotEqual(TestResult[0], TestResult[0])
+            self.assertAlmostEqual(TestResult[4],
+                                        test_module.GetVarianceP(Data[4:14]))
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper input data
+        type.
+
+        Implements tests: TEST-T-111.
+        Covers the requirements REQ-FUN-110.
+        """
+        for Function, _ in self.Pairs:
+            for Data in (1, 1.0, 'abc', int, [1, 'a'], {1 : 2}):
+                with self.assertRaises(TypeError):
+                    Function(Data, 1)
+            for Window in (1.0, '1', [1], None):
+                with self.assertRaises(TypeError):
+                    Function(self.AllFloat, Window)
+            with self.assertRaises(TypeError):
+                Function(self.AllFloat, 1, SkipFrames = 1.0)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with an empty sequence or
+        improper window width.
+
+        Implements tests: TEST-T-111.
+        Covers the requirements REQ-FUN-110.
+        """
+        for Function, _ in self.Pairs:
+            with self.assertRaises(ValueError):
+                Function([], 1)
+            for Window in (0, -1, len(self.AllFloat) + 1):
+                with self.assertRaises(ValueError):
+                    Function(self.AllFloat, Window)
+            with self.assertRaises(ValueError):
+                Function(self.AllFloat, 1, SkipFrames = 0)
+
+class Test_EWAccumulator(unittest.TestCase):
+    """
+    Unit-tests of the class EWAccumulator.
+
+    Implements tests: TEST-T-112
+    Covers the requirements REQ-FUN-111.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = test_module.EWAccumulator
+        Length = random.randrange(20, 200)
+        cls.Values = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        cls.Errors = [random.uniform(0.0, 3.0) if random.random() > 0.5 else 0
+                                                        for _ in range(Length)]
+        cls.Data = [MeasuredValue(Value, Error) if Error else Value
+                                for Value, Error in zip(cls.Values, cls.Errors)]
+        Time = 0
+        cls.Times = list()
+        for _ in range(Length):
+            Time += random.choice((0, random.uniform(0.0, 5.0)))
+            cls.Times.append(Time)
+        cls.Names = ('Time', 'N', 'EffectiveN', 'Mean', 'Var', 'Sigma', 'SE',
+                                            'FullVar', 'FullSigma', 'FullSE')
+    
+    def getCheck(self, Times, HalfLife) -> dict:
+        """
+        Calculates the reference values directly from the weights.
+        """
+        Weights = [0.5 ** ((Times[-1] - Time) / HalfLife) for Time in Times]
+        Weight = sum(Weights)
+        Mean = sum(map(operator.mul, Weights, self.Values)) / Weight
+        Var = sum(Item * (Value - Mean)**2
+                        for Item, Value in zip(Weights, self.Values)) / Weight
+        SqrSE = sum(Item * Error * Error
+                        for Item, Error in zip(Weights, self.Errors)) / Weight
+        EffectiveN = Weight * Weight / sum(Item * Item for Item in Weights)
+        return {'Time' : Times[-1], 'N' : len(Times),
+                'EffectiveN' : EffectiveN, 'Mean' : Mean, 'Var' : Var,
+                'Sigma' : math.sqrt(Var), 'SE' : math.sqrt(Var / EffectiveN),
+                'FullVar' : Var + SqrSE, 'FullSigma' : math.sqrt(Var + SqrSE),
+                'FullSE' : math.sqrt((Var + SqrSE) / EffectiveN)}
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the statistics are the same as calculated directly from the
+        decayed weights, with and without time-stamps.
+
+        Implements tests: TEST-T-112.
+        Covers the requirements REQ-FUN-111.
+        """
+        for HalfLife in (1, 2.5, random.uniform(10.0, 100.0)):
+            objTest = self.TestClass(HalfLife)
+            self.assertEqual(objTest.HalfLife, HalfLife)
+            self.assertIsNone(objTest.Time)
+            self.assertEqual(objTest.N, 0)
+            self.assertEqual(objTest.EffectiveN, 0)
+            for Value, Time in zip(self.Data, self.Times):
+                objTest.update(Value, Time = Time)
+            TestResult = objTest.snapshot()
+            self.assertIsInstance(TestResult, dict)
+            self.assertCountEqual(TestResult.keys(), self.Names)
+            Check = self.getCheck(self.Times, HalfLife)
+            for Name in self.Names:
+                self.assertAlmostEqual(TestResult[Name], Check[Name],
+                                                places = FLOAT_CHECK_PRECISION)
+                self.assertEqual(getattr(objTest, Name), TestResult[Name])
+            objTest = self.TestClass(HalfLife)
+            for Value in self.Data:
+                objTest.update(Value)
+            TestResult = objTest.snapshot()
+            Check = self.getCheck(list(range(len(self.Data))), HalfLife)
+            for Name in self.Names:
+                self.assertAlmostEqual(TestResult[Name], Check[Name],
+                                                places = FLOAT_CHECK_PRECISION)
+        #very long half-life - the ordinary statistics
+        objTest = self.TestClass(1E300)
+        for Value in self.Data:
+            objTest.update(Value)
+        self.assertAlmostEqual(objTest.Mean, test_module.GetMean(self.Data),
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.Var,
+                                        test_module.GetVarianceP(self.Data),
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.SE, test_module.GetSE(self.Data),
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.FullSE,
+                                            test_module.GetFullSE(self.Data),
+                                                places = FLOAT_CHECK_PRECISION)
+        #single data point and the full decay
+        objTest = self.TestClass(1)
+        objTest.update(MeasuredValue(2.0, 0.5), Time = 10)
+        self.assertEqual(objTest.Mean, 2.0)
+        self.assertEqual(objTest.Var, 0)
+        self.assertEqual(objTest.FullVar, 0.25)
+        objTest.update(5, Time = 1E6)
+        self.assertEqual(objTest.Mean, 5)
+        self.assertEqual(objTest.Var, 0)
+        self.assertEqual(objTest.FullVar, 0)
+        self.assertEqual(objTest.Time, 1E6)
+        self.assertEqual(objTest.N, 2)
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper input data
+        type.
+
+        Implements tests: TEST-T-112.
+        Covers the requirements REQ-FUN-111.
+        """
+        for HalfLife in ('1', [1], None, True, int):
+            with self.assertRaises(TypeError):
+                self.TestClass(HalfLife)
+        objTest = self.TestClass(1)
+        for Value in ('1', [1], None, int):
+            with self.assertRaises(TypeError):
+                objTest.update(Value)
+        for Time in ('1', [1], True, int):
+            with self.assertRaises(TypeError):
+                objTest.update(1, Time = Time)
+        self.assertEqual(objTest.N, 0)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with improper half-life,
+        decreasing time-stamp, or access to the statistics of an empty
+        accumulator.
+
+        Implements tests: TEST-T-112.
+        Covers the requirements REQ-FUN-111.
+        """
+        for HalfLife in (0, -1, 0.0, -2.5, math.inf, math.nan):
+            with self.assertRaises(ValueError):
+                self.TestClass(HalfLife)
+        objTest = self.TestClass(1)
+        for Name in self.Names[3:]:
+            with self.assertRaises(ValueError):
+                getattr(objTest, Name)
+        with self.assertRaises(ValueError):
+            objTest.snapshot()
+        objTest.update(1, Time = 10)
+        with self.assertRaises(ValueError):
+            objTest.update(1, Time = 9.9)
+        self.assertEqual(objTest.N, 1)
+
+class Test_MissingPolicy(unittest.TestCase):
+    """
+    Unit-tests of the missing values policy (keyword argument Missing) of the
+    module functions.
+
+    Implements tests: TEST-T-113
+    Covers the requirements REQ-FUN-112.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Policy = test_module.MissingPolicy
+        Length = random.randrange(20, 100)
+        cls.Clean = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        cls.Other = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        cls.Positions = sorted(random.sample(range(Length), 5))
+        cls.Data = list(cls.Clean)
+        for Index, Position in enumerate(cls.Positions):
+            if Index % 3 == 0:
+                cls.Data[Position] = None
+            elif Index % 3 == 1:
+                cls.Data[Position] = math.nan
+            else:
+                cls.Data[Position] = MeasuredValue(math.nan, 1.0)
+        cls.Kept = [Item for Index, Item in enumerate(cls.Clean)
+                                            if not (Index in cls.Positions)]
+        cls.KeptOther = [Item for Index, Item in enumerate(cls.Other)
+                                            if not (Index in cls.Positions)]
+        cls.Functions = (test_module.GetMean, test_module.GetVarianceP,
+                            test_module.GetStdevP, test_module.GetVarianceS,
+                            test_module.GetStdevS, test_module.GetSE,
+                            test_module.GetMeanSqrSE, test_module.GetFullSE,
+                            test_module.GetSkewnessP, test_module.GetSkewnessS,
+                            test_module.GetKurtosisP, test_module.GetKurtosisS)
+        cls.Functions2 = (test_module.GetCovariance, test_module.GetPearsonR)
+    
+    def test_Skip(self) -> None:
+        """
+        Checks that the missing values are excluded from the data with the SKIP
+        policy, and the entire pairs / sets of values are excluded from the
+        paired and multivariate data.
+
+        Implements tests: TEST-T-113.
+        Covers the requirements REQ-FUN-112.
+        """
+        Skip = self.Policy.SKIP
+        for Function in self.Functions:
+            self.assertAlmostEqual(Function(self.Data, Missing = Skip),
+                                    Function(self.Kept),
+                                                places = FLOAT_CHECK_PRECISION)
+            self.assertEqual(Function(self.Clean, Missing = Skip),
+                                                        Function(self.Clean))
+        self.assertAlmostEqual(
+                        test_module.GetMoment(self.Data, 3, Missing = Skip),
+                        test_module.GetMoment(self.Kept, 3),
+                                                places = FLOAT_CHECK_PRECISION)
+        TestResult = test_module.GetMoments(self.Data, Missing = Skip)
+        CheckResult = test_module.GetMoments(self.Kept)
+        for Power, Value in CheckResult.items():
+            self.assertAlmostEqual(TestResult[Power], Value,
+                                                places = FLOAT_CHECK_PRECISION)
+        for Function in self.Functions2:
+            self.assertAlmostEqual(
+                            Function(self.Data, self.Other, Missing = Skip),
+                            Function(self.Kept, self.KeptOther),
+                                                places = FLOAT_CHECK_PRECISION)
+            self.assertAlmostEqual(
+                            Function(self.Other, self.Data, Missing = Skip),
+                            Function(self.KeptOther, self.Kept),
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(
+                test_module.GetMoment2(self.Data, self.Other, 2, 1,
+                                                            Missing = Skip),
+                test_module.GetMoment2(self.Kept, self.KeptOther, 2, 1),
+                                                places = FLOAT_CHECK_PRECISION)
+        TestResult = test_module.GetMoments2(self.Data, self.Other, 2, 2,
+                                                                Missing = Skip)
+        CheckResult = test_module.GetMoments2(self.Kept, self.KeptOther, 2, 2)
+        for Key, Value in CheckResult.items():
+            self.assertAlmostEqual(TestResult[Key], Value,
+                                                places = FLOAT_CHECK_PRECISION)
+        for Function in (test_module.GetCovarianceMatrix,
+                                                test_module.GetPearsonMatrix):
+            TestResult = Function((self.Other, self.Data, self.Clean),
+                                                                Missing = Skip)
+            CheckResult = Function((self.KeptOther, self.Kept, self.Kept))
+            for TestRow, CheckRow in zip(TestResult, CheckResult):
+                for Value, Check in zip(TestRow, CheckRow):
+                    self.assertAlmostEqual(Value, Check,
+                                                places = FLOAT_CHECK_PRECISION)
+        TestResult = test_module.GetRollingMean(self.Data, 3, Missing = Skip)
+        self.assertEqual(TestResult, test_module.GetRollingMean(self.Kept, 3))
+        if not (np is None):
+            Data = np.array(self.Clean)
+            Data[self.Positions] = np.nan
+            for Function in (test_module.GetMean, test_module.GetVarianceP,
+                                                    test_module.GetKurtosisP):
+                self.assertAlmostEqual(Function(Data, Missing = Skip),
+                                        Function(self.Kept),
+                                                places = FLOAT_CHECK_PRECISION)
+        Data = array.array('d', [math.nan, 1.0, 2.0, math.nan, 3.0])
+        self.assertAlmostEqual(test_module.GetMean(Data, Missing = Skip), 2.0,
+                                                places = FLOAT_CHECK_PRECISION)
+    
+    def test_Propagate(self) -> None:
+        """
+        Checks that the default PROPAGATE policy preserves the legacy behaviour:
+        NaN propagates into the result of every function accepting the policy,
+        and None is rejected as a not real number.
+
+        Implements tests: TEST-T-113.
+        Covers the requirements REQ-FUN-112.
+        """
+        Data = list(self.Clean)
+        Data[self.Positions[0]] = math.nan
+        Propagate = self.Policy.PROPAGATE
+        for Function in self.Functions:
+            if Function is test_module.GetMeanSqrSE: #only uncertainties
+                continue
+            self.assertTrue(math.isnan(Function(Data)))
+            self.assertTrue(math.isnan(Function(Data, Missing = Propagate)))
+        Errors = list(self.Clean)
+        Errors[self.Positions[0]] = MeasuredValue(1.0, math.nan)
+        for Function in (test_module.GetMeanSqrSE, test_module.GetFullSE):
+            self.assertTrue(math.isnan(Function(Errors)))
+            self.assertTrue(math.isnan(Function(Errors, Missing = Propagate)))
+        for Function in self.Functions2:
+            self.assertTrue(math.isnan(Function(Data, self.Other)))
+            self.assertTrue(math.isnan(Function(self.Other, Data,
+                                                        Missing = Propagate)))
+        for Result in (test_module.GetMoment(Data, 3),
+                        test_module.GetMoment2(Data, self.Other, 2, 1),
+                        test_module.GetMoment2(self.Other, Data, 1, 2)):
+            self.assertTrue(math.isnan(Result))
+        Results = [test_module.GetMoments(Data, (1, 2, 3), Missing = Propagate),
+                test_module.GetMoments2(Data, self.Other, 2, 2),
+                test_module.GetMoments2(self.Other, Data, 2, 2)]
+        for Result in Results:
+            for Value in Result.values():
+                self.assertTrue(math.isnan(Value))
+        Results = [test_module.GetAutocovariance(Data, 2),
+                    test_module.GetAutocorrelation(Data, 2),
+                    test_module.GetCrossCovariance(Data, self.Other, 2),
+                    test_module.GetCrossCorrelation(self.Other, Data, 2,
+                                                        Missing = Propagate)]
+        for Result in Results:
+            for Value in Result:
+                self.assertTrue(math.isnan(Value))
+        Position = self.Positions[0]
+        for Function in (test_module.GetRollingMean,
+                            test_module.GetRollingVarianceP,
+                            test_module.GetRollingSkewnessP,
+                            test_module.GetRollingKurtosisP):
+            Result = Function(Data, 3, Missing = Propagate)
+            for Index, Value in enumerate(Result):
+                if Index <= Position < Index + 3:
+                    self.assertTrue(math.isnan(Value))
+                else:
+                    self.assertFalse(math.isnan(Value))
+        for Function in (test_module.GetCovarianceMatrix,
+                                                test_module.GetPearsonMatrix):
+            Result = Function((self.Other, Data, self.Clean),
+                                                        Missing = Propagate)
+            for Row in range(3):
+                for Column in range(3):
+                    self.assertEqual(math.isnan(Result[Row][Column]),
+                                                    1 in (Row, Column))
+        Data[self.Positions[0]] = None
+        for Function in self.Functions:
+            with self.assertRaises(TypeError):
+                Function(Data)
+    
+    def test_Raise(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with the RAISE policy if
+        any value is missing, and with the SKIP policy if all values are
+        missing.
+
+        Implements tests: TEST-T-113.
+        Covers the requirements REQ-FUN-112.
+        """
+        Raise = self.Policy.RAISE
+        for Function in self.Functions:
+            self.assertEqual(Function(self.Clean, Missing = Raise),
+                                                        Function(self.Clean))
+            with self.assertRaises(ValueError):
+                Function(self.Data, Missing = Raise)
+            with self.assertRaises(ValueError):
+                Function([None, math.nan], Missing = self.Policy.SKIP)
+        for Function in self.Functions2:
+            with self.assertRaises(ValueError):
+                Function(self.Other, self.Data, Missing = Raise)
+            with self.assertRaises(ValueError):
+                Function([1, None], [math.nan, 2],
+                                                Missing = self.Policy.SKIP)
+        with self.assertRaises(ValueError):
+            test_module.GetCovarianceMatrix((self.Clean, self.Data),
+                                                            Missing = Raise)
+        if not (np is None):
+            with self.assertRaises(ValueError):
+                test_module.GetMean(np.array([1.0, math.nan]), Missing = Raise)
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper type of the
+        missing values policy.
+
+        Implements tests: TEST-T-113.
+        Covers the requirements REQ-FUN-112.
+        """
+        for Missing in (None, 'skip', 1, True, self.Policy):
+            for Function in self.Functions:
+                with self.assertRaises(TypeError):
+                    Function(self.Clean, Missing = Missing)
+                with self.assertRaises(TypeError):
+                    Function(self.Clean, Missing = Missing, DoCheck = False)
+            for Function in self.Functions2:
+                with self.assertRaises(TypeError):
+                    Function(self.Clean, self.Other, Missing = Missing)
+
+class Test_LaggedStatistics(unittest.TestCase):
+    """
+    Unit-tests of the functions GetAutocovariance(), GetAutocorrelation(),
+    GetCrossCovariance() and GetCrossCorrelation().
+
+    Implements tests: TEST-T-114
+    Covers the requirements REQ-FUN-113.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        Length = random.randrange(50, 300)
+        cls.AllFloat = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        cls.AllInt = [random.randint(-100, 100) for _ in range(Length)]
+        cls.Mixed = [MeasuredValue(Item, 1.0) if random.random() > 0.5
+                                            else Item for Item in cls.AllFloat]
+    
+    @staticmethod
+    def getReference(DataX, DataY, MaxLag):
+        """
+        Calculates the lagged cross-covariance by the direct definition.
+        """
+        Length = len(DataX)
+        MeanX = sum(DataX) / Length
+        MeanY = sum(DataY) / Length
+        return [sum((DataX[Index] - MeanX) * (DataY[Index + Lag] - MeanY)
+                        for Index in range(Length - Lag)) / Length
+                                                for Lag in range(MaxLag + 1)]
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the results are the same as calculated by the definition,
+        using both the direct summation and the FFT, with and without NumPy.
+
+        Implements tests: TEST-T-114.
+        Covers the requirements REQ-FUN-113.
+        """
+        Length = len(self.AllFloat)
+        Lags = (0, 1, random.randint(2, Length - 2), Length - 1)
+        CostFactor = test_module.FFT_COST_FACTOR
+        try:
+            for Factor in (0, 10**9):
+                test_module.FFT_COST_FACTOR = Factor
+                for Data, Other, Values in (
+                                    (self.AllFloat, self.AllInt, self.AllFloat),
+                                    (self.Mixed, self.AllInt, self.AllFloat),
+                                    (self.AllInt, self.AllFloat, self.AllInt)):
+                    SigmaX = math.sqrt(test_module.GetVarianceP(Values))
+                    SigmaY = math.sqrt(test_module.GetVarianceP(Other))
+                    for MaxLag in Lags:
+                        Check = self.getReference(Values, Values, MaxLag)
+                        Result = test_module.GetAutocovariance(Data, MaxLag)
+                        self.assertIsInstance(Result, tuple)
+                        self.assertEqual(len(Result), MaxLag + 1)
+                        for Value, Expected in zip(Result, Check):
+                            self.assertAlmostEqual(Value, Expected,
+                                            places = FLOAT_CHECK_PRECISION)
+                        Result = test_module.GetAutocorrelation(Data, MaxLag)
+                        for Value, Expected in zip(Result, Check):
+                            self.assertAlmostEqual(Value, Expected / Check[0],
+                                            places = FLOAT_CHECK_PRECISION)
+                        Check = self.getReference(Values, Other, MaxLag)
+                        Result = test_module.GetCrossCovariance(Data, Other,
+                                                                        MaxLag)
+                        self.assertEqual(len(Result), MaxLag + 1)
+                        for Value, Expected in zip(Result, Check):
+                            self.assertAlmostEqual(Value, Expected,
+                                            places = FLOAT_CHECK_PRECISION)
+                        Result = test_module.GetCrossCorrelation(Data, Other,
+                                                                        MaxLag)
+                        for Value, Expected in zip(Result, Check):
+                            self.assertAlmostEqual(Value,
+                                            Expected / (SigmaX * SigmaY),
+                                            places = FLOAT_CHECK_PRECISION)
+                        self.assertAlmostEqual(Result[0],
+                                    test_module.GetPearsonR(Data, Other),
+                                            places = FLOAT_CHECK_PRECISION)
+                if not (np is None):
+                    Result = test_module.GetAutocovariance(
+                                            np.array(self.AllFloat), Lags[2])
+                    Check = self.getReference(self.AllFloat, self.AllFloat,
+                                                                    Lags[2])
+                    for Value, Expected in zip(Result, Check):
+                        self.assertAlmostEqual(Value, Expected,
+                                            places = FLOAT_CHECK_PRECISION)
+        finally:
+            test_module.FFT_COST_FACTOR = CostFactor
+        self.assertTupleEqual(test_module.GetAutocorrelation([2, 2, 2], 2),
+                                                                    (1, 1, 1))
+        self.assertTupleEqual(
+                test_module.GetCrossCorrelation([1, 2, 3], [5, 5, 5], 1), (0, 0))
+        self.assertTupleEqual(
+                test_module.GetCrossCorrelation([5, 5, 5], [1, 1, 1], 1), (1, 1))
+    
+    def test_NaN(self) -> None:
+        """
+        Checks that NaN in the data propagates into all lagged statistics,
+        instead of being treated as a constant sequence.
+
+        Implements tests: TEST-T-114.
+        Covers the requirements REQ-FUN-113.
+        """
+        for Data in ([1.0, math.nan, 3.0, 4.0], [math.nan] * 4,
+                                            [1.0, 1.0, 1.0, math.nan]):
+            for Function in (test_module.GetAutocovariance,
+                                                test_module.GetAutocorrelation):
+                TestResult = Function(Data, 2)
+                self.assertEqual(len(TestResult), 3)
+                for Value in TestResult:
+                    self.assertTrue(math.isnan(Value))
+            for Function in (test_module.GetCrossCovariance,
+                                            test_module.GetCrossCorrelation):
+                for TestResult in (Function(Data, [1, 2, 3, 4], 2),
+                                            Function([1, 1, 1, 1], Data, 2)):
+                    for Value in TestResult:
+                        self.assertTrue(math.isnan(Value))
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper type of the
+        data or of the maximum lag.
+
+        Implements tests: TEST-T-114.
+        Covers the requirements REQ-FUN-113.
+        """
+        for MaxLag in (1.0, '1', None, True, [1]):
+            with self.assertRaises(TypeError):
+                test_module.GetAutocovariance(self.AllFloat, MaxLag)
+            with self.assertRaises(TypeError):
+                test_module.GetAutocorrelation(self.AllFloat, MaxLag)
+            with self.assertRaises(TypeError):
+                test_module.GetCrossCovariance(self.AllFloat, self.AllInt,
+                                                                        MaxLag)
+            with self.assertRaises(TypeError):
+                test_module.GetCrossCorrelation(self.AllFloat, self.AllInt,
+                                                                        MaxLag)
+        for Data in (1, [1, '2', 3], {1: 2}):
+            with self.assertRaises(TypeError):
+                test_module.GetAutocorrelation(Data, 0)
+            with self.assertRaises(TypeError):
+                test_module.GetCrossCorrelation(Data, [1, 2, 3], 0)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with empty data, unequal
+        length of X and Y data, or the maximum lag being negative or not less
+        than the length of the data.
+
+        Implements tests: TEST-T-114.
+        Covers the requirements REQ-FUN-113.
+        """
+        Length = len(self.AllFloat)
+        for MaxLag in (-1, Length, Length + 1):
+            with self.assertRaises(ValueError):
+                test_module.GetAutocovariance(self.AllFloat, MaxLag)
+            with self.assertRaises(ValueError):
+                test_module.GetAutocorrelation(self.AllFloat, MaxLag)
+            with self.assertRaises(ValueError):
+                test_module.GetCrossCovariance(self.AllFloat, self.AllInt,
+                                                                        MaxLag)
+            with self.assertRaises(ValueError):
+                test_module.GetCrossCorrelation(self.AllFloat, self.AllInt,
+                                                                        MaxLag)
+        with self.assertRaises(ValueError):
+            test_module.GetAutocorrelation([], 0)
+        with self.assertRaises(ValueError):
+            test_module.GetCrossCorrelation([1, 2, 3], [1, 2], 0)
+
+class Test_CoMomentAccumulator(unittest.TestCase):
+    """
+    Unit-tests of the class CoMomentAccumulator.
+
+    Implements tests: TEST-T-115
+    Covers the requirements REQ-FUN-115.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = test_module.CoMomentAccumulator
+        Length = random.randrange(20, 200)
+        cls.DataX = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        cls.DataY = [2.5 * Item + random.gauss(0.0, 3.0)
+                                                        for Item in cls.DataX]
+        cls.DataX[0] = MeasuredValue(cls.DataX[0], 0.5)
+        cls.DataY[1] = random.randint(-10, 10)
+    
+    def checkValues(self, objTest, DataX, DataY) -> None:
+        """
+        Compares the accumulated statistics with the respective functions.
+        """
+        Values = [getattr(Item, 'Value', Item) for Item in DataX]
+        Check = test_module.GetCovariance(DataX, DataY)
+        Pearson = test_module.GetPearsonR(DataX, DataY)
+        VarX = test_module.GetVarianceP(DataX)
+        VarY = test_module.GetVarianceP(DataY)
+        N = len(DataX)
+        self.assertEqual(objTest.N, N)
+        self.assertAlmostEqual(objTest.MeanX, test_module.GetMean(DataX),
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.MeanY, test_module.GetMean(DataY),
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.VarX, VarX,
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.VarY, VarY,
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.M2X, VarX * N,
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.C2, Check * N,
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.Cov, Check,
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.CovS, Check * N / (N - 1),
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.Pearson, Pearson,
+                                                places = FLOAT_CHECK_PRECISION)
+        Slope = Check / VarX
+        self.assertAlmostEqual(objTest.Slope, Slope,
+                                                places = FLOAT_CHECK_PRECISION)
+        Intercept = test_module.GetMean(DataY) - Slope * statistics.fmean(
+                                                                        Values)
+        self.assertAlmostEqual(objTest.Intercept, Intercept,
+                                                places = FLOAT_CHECK_PRECISION)
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the statistics accumulated pair by pair, by sequences, from
+        a stream or merged from the parts are the same as calculated by the
+        respective functions from the entire data.
+
+        Implements tests: TEST-T-115.
+        Covers the requirements REQ-FUN-115.
+        """
+        objTest = self.TestClass()
+        self.assertEqual(objTest.N, 0)
+        objTest.updateMany([], [])
+        self.assertEqual(objTest.N, 0)
+        for X, Y in zip(self.DataX, self.DataY):
+            objTest.update(X, Y)
+        self.checkValues(objTest, self.DataX, self.DataY)
+        objTest = self.TestClass()
+        objTest.updateMany(self.DataX, self.DataY)
+        self.checkValues(objTest, self.DataX, self.DataY)
+        objTest = self.TestClass()
+        objTest.updateStream(zip(self.DataX, self.DataY), ChunkSize = 7)
+        self.checkValues(objTest, self.DataX, self.DataY)
+        Split = random.randrange(1, len(self.DataX) - 1)
+        objTest = self.TestClass()
+        objTest.updateMany(self.DataX[:Split], self.DataY[:Split])
+        objOther = self.TestClass()
+        objOther.updateMany(self.DataX[Split:], self.DataY[Split:])
+        N = objOther.N
+        objTest.merge(objOther)
+        self.assertEqual(objOther.N, N)
+        self.checkValues(objTest, self.DataX, self.DataY)
+        objOther = self.TestClass()
+        objOther.merge(objTest)
+        objOther.merge(self.TestClass())
+        self.checkValues(objOther, self.DataX, self.DataY)
+        if not (np is None):
+            objTest = self.TestClass()
+            Values = [getattr(Item, 'Value', Item) for Item in self.DataX]
+            objTest.updateMany(np.array(Values), self.DataY)
+            self.checkValues(objTest, self.DataX, self.DataY)
+        #exact line and constant data edge cases
+        objTest = self.TestClass()
+        objTest.updateMany([1, 2, 3, 4], [3, 5, 7, 9])
+        self.assertAlmostEqual(objTest.Slope, 2, places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.Intercept, 1,
+                                                places = FLOAT_CHECK_PRECISION)
+        self.assertAlmostEqual(objTest.Pearson, 1,
+                                                places = FLOAT_CHECK_PRECISION)
+        objTest = self.TestClass()
+        objTest.updateMany([1, 2], [2, 2])
+        self.assertEqual(objTest.Pearson, 0)
+        self.assertEqual(objTest.Slope, 0)
+        objTest = self.TestClass()
+        objTest.update(1, 2)
+        self.assertEqual(objTest.Pearson, 1)
+        self.assertEqual(objTest.Cov, 0)
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper input data
+        type.
+
+        Implements tests: TEST-T-115.
+        Covers the requirements REQ-FUN-115.
+        """
+        objTest = self.TestClass()
+        for Value in ('1', [1], None, int):
+            with self.assertRaises(TypeError):
+                objTest.update(Value, 1)
+            with self.assertRaises(TypeError):
+                objTest.update(1, Value)
+        for Value in (1, '12', [1, '2'], None):
+            with self.assertRaises(TypeError):
+                objTest.updateMany(Value, [1, 2])
+        for Value in (1, None, 'ab'):
+            with self.assertRaises(TypeError):
+                objTest.updateStream(Value)
+        for Value in ([1, 2], [(1, 2), 3], [(1, 2, 3)], [(1, '2')]):
+            with self.assertRaises(TypeError):
+                objTest.updateStream(Value)
+        for ChunkSize in (1.0, '1'):
+            with self.assertRaises(TypeError):
+                objTest.updateStream([(1, 2)], ChunkSize = ChunkSize)
+        for Other in (1, test_module.MomentAccumulator()):
+            with self.assertRaises(TypeError):
+                objTest.merge(Other)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with improper values of
+        the input data or insufficient data.
+
+        Implements tests: TEST-T-115.
+        Covers the requirements REQ-FUN-115.
+        """
+        objTest = self.TestClass()
+        for Name in ('MeanX', 'MeanY', 'VarX', 'VarY', 'Cov', 'CovS',
+                                        'Pearson', 'Slope', 'Intercept'):
+            with self.assertRaises(ValueError):
+                getattr(objTest, Name)
+        with self.assertRaises(ValueError):
+            objTest.updateMany([1, 2], [1, 2, 3])
+        with self.assertRaises(ValueError):
+            objTest.updateStream([(1, 2)], ChunkSize = 0)
+        objTest.update(1, 2)
+        with self.assertRaises(ValueError):
+            objTest.CovS
+        objTest.update(1, 3)
+        for Name in ('Slope', 'Intercept'):
+            with self.assertRaises(ValueError):
+                getattr(objTest, Name)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_GetMean)
+
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_GetVarianceP)
+
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_GetStdevP)
+
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_GetVarianceS)
+
+TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_GetStdevS)
+
+TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_GetSE)
+
+TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(Test_GetMeanSqrSE)
+
+TestSuite8 = unittest.TestLoader().loadTestsFromTestCase(Test_GetFullSE)
+
+TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(Test_GetSkewnessP)
+
+TestSuite10 = unittest.TestLoader().loadTestsFromTestCase(Test_GetSkewnessS)
+
+TestSuite11 = unittest.TestLoader().loadTestsFromTestCase(Test_GetKurtosisP)
+
+TestSuite12 = unittest.TestLoader().loadTestsFromTestCase(Test_GetKurtosisS)
+
+TestSuite13 = unittest.TestLoader().loadTestsFromTestCase(Test_GetMoment)
+
+TestSuite14 = unittest.TestLoader().loadTestsFromTestCase(Test_GetCovariance)
+
+TestSuite15 = unittest.TestLoader().loadTestsFromTestCase(Test_GetPearsonR)
+
+TestSuite16 = unittest.TestLoader().loadTestsFromTestCase(Test_GetMoment2)
+
+TestSuite17 = unittest.TestLoader().loadTestsFromTestCase(Test_BufferInput)
+
+TestSuite18 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_MomentAccumulator)
+
+TestSuite19 = unittest.TestLoader().loadTestsFromTestCase(Test_Workers)
+
+TestSuite20 = unittest.TestLoader().loadTestsFromTestCase(Test_ExtractData)
+
+TestSuite21 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_CorrelationMatrices)
+
+TestSuite22 = unittest.TestLoader().loadTestsFromTestCase(Test_GetMoments)
+
+TestSuite23 = unittest.TestLoader().loadTestsFromTestCase(Test_GetMoments2)
+
+TestSuite24 = unittest.TestLoader().loadTestsFromTestCase(Test_ExactIntegers)
+
+TestSuite25 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_GetStreamSummary)
+
+TestSuite26 = unittest.TestLoader().loadTestsFromTestCase(Test_GetRolling)
+
+TestSuite27 = unittest.TestLoader().loadTestsFromTestCase(Test_EWAccumulator)
+
+TestSuite28 = unittest.TestLoader().loadTestsFromTestCase(Test_MissingPolicy)
+
+TestSuite29 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_LaggedStatistics)
+
+TestSuite30 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_CoMomentAccumulator)
 
 TestSuite = unittest.TestSuite()
 TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4, TestSuite5,
                     TestSuite6, TestSuite7, TestSuite8, TestSuite9, TestSuite10,
                     TestSuite11, TestSuite12, TestSuite13, TestSuite14,
-                    TestSuite15, TestSuite16])
+                    TestSuite15, TestSuite16, TestSuite17, TestSuite18,
+                    TestSuite19, TestSuite20, TestSuite21, TestSuite22,
+                    TestSuite23, TestSuite24, TestSuite25,
+                    TestSuite26, TestSuite27, TestSuite28, TestSuite29,
+                    TestSuite30])
 
 if __name__ == "__main__":
     sys.stdout.write(
@@ -21,6 +21,9 @@ import unittest
 import random
 import statistics
 import math
+import itertools
+import bisect
+import array
 
 #+ custom modules
 
@@ -347,8 +350,10 @@ class Test_GetQuantile(Test_GetFirstQuartile):
     Unit-test class implementing testing of the function GetQuantile() from the
     module statistics_lib.ordered_functions.
 
-    Implements tests: TEST-T-200, TEST-T-201, TEST-T-202 and TEST-T-260.
-    Covers the requirements REQ-FUN-201, REQ-FUN-260, REQ-AWM-200, REQ-AWM-201.
+    Implements tests: TEST-T-200, TEST-T-201, TEST-T-202, TEST-T-260 and
+        TEST-T-261.
+    Covers the requirements REQ-FUN-201, REQ-FUN-260, REQ-FUN-261, REQ-AWM-200,
+        REQ-AWM-201.
     """
     
     @classmethod
@@ -454,6 +459,39 @@ class Test_GetQuantile(Test_GetFirstQuartile):
             for k in [1, 4, 10]:
                 with self.assertRaises(ValueError):
                     self.TestFunction([1, 2, 3], m + k , m)
+    
+    def test_Selection(self) -> None:
+        """
+        Checks that the order statistics found by the selection (not sorted
+        input) on the long sequences, including many ties, are the same as of
+        the sorted sequence, and that the interpolation rule is not changed.
+
+        Implements test TEST-T-261.
+        Covers the requirement REQ-FUN-261.
+        """
+        Length = random.randrange(test_module.SORTING_CUTOFF + 1,
+                                            test_module.SORTING_CUTOFF + 5000)
+        for Data in ([random.uniform(-10.0, 10.0) for _ in range(Length)],
+                        [random.randint(-5, 5) for _ in range(Length)],
+                        [random.choice((random.random(), random.randint(0, 3)))
+                                                    for _ in range(Length)],
+                        [1.5] * Length):
+            Sorted = sorted(Data)
+            N = len(Sorted)
+            Ranks = [0, 1, N // 2, N - 2, N - 1, random.randrange(N)]
+            TestResult = test_module._SelectRanks(Data, Ranks)
+            self.assertEqual(TestResult, [Sorted[Rank] for Rank in Ranks])
+            for k, m in ((1, 4), (1, 2), (3, 4), (1, 100), (99, 100),
+                                                            (0, 7), (7, 7)):
+                TestResult = self.TestFunction(Data, k, m)
+                CheckResult = self.TestFunction(Sorted, k, m, DoCheck = False)
+                self.assertEqual(TestResult, CheckResult)
+            self.assertEqual(test_module.GetMedian(Data),
+                                test_module.GetMedian(Sorted, DoCheck = False))
+            self.assertEqual(test_module.GetFirstQuartile(Data),
+                        test_module.GetFirstQuartile(Sorted, DoCheck = False))
+            self.assertEqual(test_module.GetThirdQuartile(Data),
+                        test_module.GetThirdQuartile(Sorted, DoCheck = False))
 
 class Test_GetHistogram(Test_GetMin):
     """
@@ -472,6 +510,27 @@ class Test_GetHistogram(Test_GetMin):
         super().setUpClass()
         cls.TestFunction = staticmethod(test_module.GetHistogram)
     
+    def checkBin(self, Count, Data, Key, Step) -> None:
+        """
+        Checks the number of the data points in a bin. The values away from
+        the edges of the bin are counted exactly, whereas a value at an edge
+        (e.g. an integer with the integer or half-integer edges) may fall into
+        either of the two neighbouring bins due to the rounding errors of the
+        edge itself.
+        """
+        Low = round(Key - 0.5 * Step, 16)
+        High = round(Key + 0.5 * Step, 16)
+        Tolerance = 10**(-FLOAT_CHECK_PRECISION)
+        N = 0
+        NEdge = 0
+        for Item in Data:
+            if abs(Item - Low) < Tolerance or abs(Item - High) < Tolerance:
+                NEdge += 1
+            elif Low <= round(Item, 16) < High:
+                N += 1
+        self.assertGreaterEqual(Count, N)
+        self.assertLessEqual(Count, N + NEdge)
+    
     def test_TypeError(self) -> None:
         """
         Checks that sub-class of TypeError is raised with improper input data
@@ -538,13 +597,7 @@ class Test_GetHistogram(Test_GetMin):
                 self.assertIsInstance(Key, (int, float))
                 self.assertIsInstance(TestResult[Key], int)
                 self.assertGreaterEqual(TestResult[Key], 0)
-                N = 0
-                for Item in BaseInput:
-                    bCond1 = round(Item, 16) >= round(Key - 0.5 * Step, 16)
-                    bCond2 = round(Item, 16) < round(Key + 0.5 * Step, 16)
-                    if bCond1 and bCond2:
-                        N += 1
-                self.assertEqual(N, TestResult[Key])
+                self.checkBin(TestResult[Key], BaseInput, Key, Step)
 
     def test_OkBins(self) -> None:
         """
@@ -581,13 +634,7 @@ class Test_GetHistogram(Test_GetMin):
                 self.assertIsInstance(Key, (int, float))
                 self.assertIsInstance(TestResult[Key], int)
                 self.assertGreaterEqual(TestResult[Key], 0)
-                N = 0
-                for Item in BaseInput:
-                    bCond1 = round(Item, 16) >= round(Key - 0.5 * Step, 16)
-                    bCond2 = round(Item, 16) < round(Key + 0.5 * Step, 16)
-                    if bCond1 and bCond2:
-                        N += 1
-                self.assertEqual(N, TestResult[Key])
+                self.checkBin(TestResult[Key], BaseInput, Key, Step)
     
     def test_OkBinsSize(self) -> None:
         """
@@ -626,13 +673,7 @@ class Test_GetHistogram(Test_GetMin):
                 self.assertIsInstance(Key, (int, float))
                 self.assertIsInstance(TestResult[Key], int)
                 self.assertGreaterEqual(TestResult[Key], 0)
-                N = 0
-                for Item in BaseInput:
-                    bCond1 = round(Item, 16) >= round(Key - 0.5 * Step, 16)
-                    bCond2 = round(Item, 16) < round(Key + 0.5 * Step, 16)
-                    if bCond1 and bCond2:
-                        N += 1
-                self.assertEqual(N, TestResult[Key])
+                self.checkBin(TestResult[Key], BaseInput, Key, Step)
     
     def test_OkSize(self) -> None:
         """
@@ -672,13 +713,31 @@ class Test_GetHistogram(Test_GetMin):
                 self.assertIsInstance(Key, (int, float))
                 self.assertIsInstance(TestResult[Key], int)
                 self.assertGreaterEqual(TestResult[Key], 0)
-                N = 0
-                for Item in BaseInput:
-                    bCond1 = round(Item, 16) >= round(Key - 0.5 * Step, 16)
-                    bCond2 = round(Item, 16) < round(Key + 0.5 * Step, 16)
-                    if bCond1 and bCond2:
-                        N += 1
-                self.assertEqual(N, TestResult[Key])
+                self.checkBin(TestResult[Key], BaseInput, Key, Step)
+    
+    def test_Buffer(self) -> None:
+        """
+        Checks that a 1D buffer of real numbers passed without the check is
+        binned in the same way as the list of the same values, including the
+        small values in the vicinity of the edges of the bins.
+
+        Implements test TEST-T-200, TEST-T-270.
+        Covers the requirement REQ-FUN-201, REQ-FUN-270.
+        """
+        for _ in range(20):
+            NBins = random.randint(2, 30)
+            Data = [random.uniform(-1.0, 1.0) for _ in range(200)]
+            Start = round(min(Data), 16)
+            Step = round((max(Data) - min(Data)) / (NBins - 1), 16)
+            for Index in range(NBins - 1):
+                Data.append(Start + (Index + 0.5) * Step)
+                Data.append(Start + (Index + 0.5) * Step + 1E-17)
+            Data.extend(random.uniform(-1000.0, 1000.0) for _ in range(200))
+            for Input in (Data[:-200], Data):
+                Buffer = array.array('d', Input)
+                self.assertEqual(self.TestFunction(Buffer, NBins = NBins,
+                                                            DoCheck = False),
+                                    self.TestFunction(Input, NBins = NBins))
     
     def test_EdgeCases(self) -> None:
         """
@@ -906,8 +965,10 @@ class Test_GetKendall(Test_GetSpearman):
     Unit-test class implementing testing of the function GetKendall() from the
     module statistics_lib.ordered_functions.
 
-    Implements tests: TEST-T-200, TEST-T-201, TEST-T-202 and TEST-T-2A0.
-    Covers the requirements REQ-FUN-201, REQ-FUN-2A0, REQ-AWM-200, REQ-AWM-201.
+    Implements tests: TEST-T-200, TEST-T-201, TEST-T-202, TEST-T-2A0 and
+        TEST-T-2A1.
+    Covers the requirements REQ-FUN-201, REQ-FUN-2A0, REQ-FUN-2A1, REQ-AWM-200,
+        REQ-AWM-201.
     """
     
     @classmethod
@@ -971,6 +1032,1120 @@ class Test_GetKendall(Test_GetSpearman):
         CheckResult = 47 / 64
         self.assertAlmostEqual(TestResult, CheckResult,
                                                 places = FLOAT_CHECK_PRECISION)
+    
+    def test_Reference(self) -> None:
+        """
+        Checks that the O(N * log(N)) algorithm of Knight returns exactly the
+        same values as the reference O(N^2) implementation, with and without
+        NumPy, including the X-, Y- and joint ties. The direct comparison cutoff
+        is disabled, so the short sequences are also processed by the algorithm
+        of Knight.
+
+        Implements test TEST-T-2A1.
+        Covers the requirement REQ-FUN-2A1.
+        """
+        Backup = test_module.np
+        Cutoff = test_module.KENDALL_DIRECT_CUTOFF
+        test_module.KENDALL_DIRECT_CUTOFF = 1
+        try:
+            for Module in (Backup, None):
+                test_module.np = Module
+                for _ in range(200):
+                    Length = random.randint(2, 60)
+                    Levels = random.choice((3, 10, Length * 10))
+                    DataX = [random.randrange(Levels) for _ in range(Length)]
+                    DataY = [random.randrange(Levels) for _ in range(Length)]
+                    if random.random() > 0.5:
+                        DataX = [Item + 0.5 for Item in DataX]
+                    if random.random() > 0.5:
+                        DataY = [Item * random.random() for Item in DataY]
+                    TestResult = self.TestFunction(DataX, DataY)
+                    CheckResult = test_module._GetKendallReference(DataX,
+                                                                        DataY)
+                    self.assertEqual(TestResult, CheckResult)
+                DataX = [random.random() for _ in range(2000)]
+                DataY = [Item + random.random() for Item in DataX]
+                self.assertAlmostEqual(self.TestFunction(DataX, DataY),
+                            test_module._GetKendallReference(DataX, DataY),
+                                                places = FLOAT_CHECK_PRECISION)
+                self.assertEqual(self.TestFunction([1, 2, 3], [1, 2, 3]), 1)
+                self.assertEqual(self.TestFunction([1, 2, 3], [3, 2, 1]), -1)
+                self.assertEqual(self.TestFunction([1, 1, 1], [1, 2, 3]), 1)
+                self.assertEqual(self.TestFunction([1, 1], [2, 2]), 1)
+                self.assertEqual(self.TestFunction([3, 2, 1], [10**30, 1, 2]),
+                                                                        1 / 3)
+        finally:
+            test_module.np = Backup
+            test_module.KENDALL_DIRECT_CUTOFF = Cutoff
+    
+    def test_NaN(self) -> None:
+        """
+        Checks that NaN in the not checked data propagates into the result with
+        the default PROPAGATE policy, whereas with the SKIP policy the pairs
+        containing NaN are removed, for the short and long sequences.
+
+        Implements test TEST-T-2A1.
+        Covers the requirement REQ-FUN-2A1.
+        """
+        Skip = test_module.MissingPolicy.SKIP
+        for Length in (10, 3 * test_module.KENDALL_DIRECT_CUTOFF):
+            DataX = [random.random() for _ in range(Length)]
+            DataY = [Item + random.random() for Item in DataX]
+            CheckResult = self.TestFunction(DataX, DataY)
+            NaNX = DataX + [math.nan, 0.5]
+            NaNY = DataY + [0.5, math.nan]
+            self.assertTrue(math.isnan(self.TestFunction(NaNX, NaNY,
+                                                            DoCheck = False)))
+            self.assertTrue(math.isnan(self.TestFunction(NaNX, NaNY)))
+            for Check in (True, False):
+                TestResult = self.TestFunction(NaNX, NaNY, DoCheck = Check,
+                                                                Missing = Skip)
+                self.assertEqual(TestResult, CheckResult)
+
+class Test_MissingPolicy(unittest.TestCase):
+    """
+    Unit-tests of the missing values policy (keyword argument Missing) of the
+    module functions.
+
+    Implements tests: TEST-T-2B0.
+    Covers the requirements REQ-FUN-2B0.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Policy = test_module.MissingPolicy
+        Length = random.randrange(20, 100)
+        cls.Clean = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        cls.Other = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+        Positions = random.sample(range(Length), 4)
+        cls.Data = list(cls.Clean)
+        cls.Data[Positions[0]] = None
+        cls.Data[Positions[1]] = math.nan
+        cls.Data[Positions[2]] = MeasuredValue(math.nan, 1.0)
+        cls.Data[Positions[3]] = MeasuredValue(1.0, math.nan)
+        cls.Kept = [Item for Index, Item in enumerate(cls.Clean)
+                                                if not (Index in Positions)]
+        cls.KeptOther = [Item for Index, Item in enumerate(cls.Other)
+                                                if not (Index in Positions)]
+        cls.Functions = (test_module.GetMin, test_module.GetMax,
+                            test_module.GetMedian, test_module.GetFirstQuartile,
+                            test_module.GetThirdQuartile, test_module.GetModes,
+                            test_module.GetHistogram)
+        cls.Functions2 = (test_module.GetSpearman, test_module.GetKendall)
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the missing values are excluded with the SKIP policy, and
+        the sub-class of ValueError is raised with the RAISE policy.
+
+        Implements tests: TEST-T-2B0.
+        Covers the requirements REQ-FUN-2B0.
+        """
+        Skip = self.Policy.SKIP
+        Raise = self.Policy.RAISE
+        for Function in self.Functions:
+            self.assertEqual(Function(self.Data, Missing = Skip),
+                                                        Function(self.Kept))
+            self.assertEqual(Function(self.Clean, Missing = Raise),
+                                                        Function(self.Clean))
+            with self.assertRaises(ValueError):
+                Function(self.Data, Missing = Raise)
+            with self.assertRaises(ValueError):
+                Function([None, math.nan], Missing = Skip)
+        self.assertEqual(test_module.GetQuantile(self.Data, 3, 10,
+                                                            Missing = Skip),
+                                test_module.GetQuantile(self.Kept, 3, 10))
+        for Function in self.Functions2:
+            self.assertAlmostEqual(
+                            Function(self.Data, self.Other, Missing = Skip),
+                            Function(self.Kept, self.KeptOther), places = 8)
+            self.assertAlmostEqual(
+                            Function(self.Other, self.Data, Missing = Skip),
+                            Function(self.KeptOther, self.Kept), places = 8)
+            with self.assertRaises(ValueError):
+                Function(self.Other, self.Data, Missing = Raise)
+    
+    def test_Propagate(self) -> None:
+        """
+        Checks that with the default PROPAGATE policy NaN propagates into the
+        results of the moment-based statistics of the ordered data, instead of
+        being silently dropped.
+
+        Implements tests: TEST-T-2B0.
+        Covers the requirements REQ-FUN-2B0.
+        """
+        Data = list(self.Clean)
+        Data[random.randrange(len(Data))] = math.nan
+        Propagate = self.Policy.PROPAGATE
+        for Function in (test_module.GetTrimmedMean,
+                            test_module.GetTrimmedVarianceP,
+                            test_module.GetWinsorizedMean,
+                            test_module.GetWinsorizedVarianceP):
+            for Fraction in (0, 0.1, 0.25):
+                self.assertTrue(math.isnan(Function(Data, Fraction)))
+                self.assertTrue(math.isnan(Function(Data, Fraction,
+                                                        Missing = Propagate)))
+                Sorted = sorted(self.Clean) + [math.nan]
+                self.assertTrue(math.isnan(Function(Sorted, Fraction,
+                                                            DoCheck = False)))
+        for Value in test_module.GetLMoments(Data, 3, Missing = Propagate):
+            self.assertTrue(math.isnan(Value))
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper type of the
+        missing values policy, and with None value with the default PROPAGATE
+        policy.
+
+        Implements tests: TEST-T-2B0.
+        Covers the requirements REQ-FUN-2B0.
+        """
+        for Function in self.Functions:
+            with self.assertRaises(TypeError):
+                Function(self.Data)
+            for Missing in (None, 'skip', 1):
+                with self.assertRaises(TypeError):
+                    Function(self.Clean, Missing = Missing)
+        for Function in self.Functions2:
+            with self.assertRaises(TypeError):
+                Function(self.Data, self.Other)
+            with self.assertRaises(TypeError):
+                Function(self.Clean, self.Other, Missing = 'skip')
+
+class Test_TrimmedStatistics(unittest.TestCase):
+    """
+    Unit-tests of the trimmed and winsorized statistics functions GetTrimmedMean
+    (), GetTrimmedVarianceP(), GetWinsorizedMean() and GetWinsorizedVarianceP()
+    from the module statistics_lib.ordered_functions.
+
+    Implements tests: TEST-T-2C0.
+    Covers the requirements REQ-FUN-2C0.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Functions = (test_module.GetTrimmedMean,
+                            test_module.GetTrimmedVarianceP,
+                            test_module.GetWinsorizedMean,
+                            test_module.GetWinsorizedVarianceP)
+        cls.References = (statistics.fmean, statistics.pvariance,
+                            statistics.fmean, statistics.pvariance)
+    
+    @staticmethod
+    def getReferenceData(Data, Fraction, IsWinsorized):
+        """
+        Prepares the trimmed or winsorized data using the full sort.
+        """
+        Sorted = sorted(Data)
+        Length = len(Sorted)
+        Cut = int(Fraction * Length)
+        Result = Sorted[Cut : Length - Cut]
+        if IsWinsorized:
+            Result = [Result[0]] * Cut + Result + [Result[-1]] * Cut
+        return Result
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the results are the same as obtained by the sorting and
+        slicing of the data, including the data with repeating values and
+        already sorted data with DoCheck = False.
+
+        Implements tests: TEST-T-2C0.
+        Covers the requirements REQ-FUN-2C0.
+        """
+        for _ in range(50):
+            Length = random.randrange(1, 300)
+            if random.random() < 0.5:
+                Data = [random.randint(-5, 5) for _ in range(Length)]
+            else:
+                Data = [random.uniform(-10.0, 10.0) for _ in range(Length)]
+            Fraction = random.choice((0, 0.1, 0.25, 0.49,
+                                                    random.uniform(0, 0.49)))
+            for Index, Function in enumerate(self.Functions):
+                Check = self.References[Index](
+                        self.getReferenceData(Data, Fraction, Index > 1))
+                self.assertAlmostEqual(Function(Data, Fraction), Check,
+                                                                    places = 8)
+                self.assertAlmostEqual(Function(sorted(Data), Fraction,
+                                        DoCheck = False), Check, places = 8)
+        Data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 100]
+        self.assertEqual(test_module.GetTrimmedMean(Data, 0.1), 5.5)
+        self.assertEqual(test_module.GetWinsorizedMean(Data, 0.1), 5.5)
+        self.assertEqual(test_module.GetTrimmedMean(Data), 5.5)
+        self.assertAlmostEqual(test_module.GetTrimmedVarianceP(Data, 0.2),
+                                                        35 / 12, places = 8)
+        self.assertAlmostEqual(test_module.GetWinsorizedVarianceP(Data, 0.2),
+                                                            4.25, places = 8)
+        Data = [MeasuredValue(1.0, 0.1), 3, 2.0, MeasuredValue(10, 0.5)]
+        for Function in self.Functions:
+            self.assertEqual(Function(Data, 0.25), Function([1.0, 3, 2.0, 10],
+                                                                        0.25))
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper type of the
+        data or of the trimming fraction.
+
+        Implements tests: TEST-T-2C0.
+        Covers the requirements REQ-FUN-2C0.
+        """
+        for Function in self.Functions:
+            for Fraction in ('0.1', None, True, [0.1]):
+                with self.assertRaises(TypeError):
+                    Function([1, 2, 3], Fraction)
+            for Data in (1, 1.0, [1, '2'], {1: 2}):
+                with self.assertRaises(TypeError):
+                    Function(Data, 0.1)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with empty data or
+        unacceptable value of the trimming fraction.
+
+        Implements tests: TEST-T-2C0.
+        Covers the requirements REQ-FUN-2C0.
+        """
+        for Function in self.Functions:
+            for Fraction in (-0.1, 0.5, 1, 2.0):
+                with self.assertRaises(ValueError):
+                    Function([1, 2, 3], Fraction)
+            with self.assertRaises(ValueError):
+                Function([], 0.1)
+
+class Test_RobustScale(unittest.TestCase):
+    """
+    Unit-tests of the robust scale estimators GetMAD(), GetSn() and GetQn()
+    from the module statistics_lib.ordered_functions.
+
+    Implements tests: TEST-T-2D0.
+    Covers the requirements REQ-FUN-2D0.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Functions = (test_module.GetMAD, test_module.GetSn,
+                                                            test_module.GetQn)
+    
+    @staticmethod
+    def getReferences(Data):
+        """
+        Calculates the reference values by the definitions, using all pairwise
+        distances - O(N^2).
+        """
+        Length = len(Data)
+        Median = statistics.median(Data)
+        MAD = statistics.median([abs(Item - Median) for Item in Data])
+        HighMedians = sorted(sorted(abs(Item - Other) for Other in Data)[
+                                                Length // 2] for Item in Data)
+        Sn = test_module.SN_FACTOR * HighMedians[(Length + 1) // 2 - 1]
+        Half = Length // 2 + 1
+        Distances = sorted(abs(Data[First] - Data[Second])
+                                for First in range(Length)
+                                    for Second in range(First + 1, Length))
+        Qn = test_module.QN_FACTOR * Distances[Half * (Half - 1) // 2 - 1]
+        return MAD, Sn, Qn
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the results are the same as calculated by the definitions
+        for the random data with and without ties, including already sorted data
+        with DoCheck = False.
+
+        Implements tests: TEST-T-2D0.
+        Covers the requirements REQ-FUN-2D0.
+        """
+        for Index in range(60):
+            Length = random.randrange(2, 120)
+            if Index % 3 == 0:
+                Data = [random.randint(-5, 5) for _ in range(Length)]
+            elif Index % 3 == 1:
+                Data = [random.gauss(0.0, 10.0) for _ in range(Length)]
+            else:
+                Data = [random.choice((random.randint(0, 3),
+                            random.uniform(0.0, 3.0))) for _ in range(Length)]
+            Checks = self.getReferences(Data)
+            for Function, Check in zip(self.Functions, Checks):
+                self.assertAlmostEqual(Function(Data), Check,
+                                                places = FLOAT_CHECK_PRECISION)
+                self.assertAlmostEqual(Function(sorted(Data), DoCheck = False),
+                                        Check, places = FLOAT_CHECK_PRECISION)
+        Data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 1000]
+        self.assertEqual(test_module.GetMAD(Data), 2.5)
+        Mixed = [MeasuredValue(Item, 0.5) for Item in Data]
+        for Function in self.Functions:
+            self.assertEqual(Function(Mixed), Function(Data))
+        Data = [random.gauss(0.0, 1.0) for _ in range(5000)]
+        for Function in (test_module.GetSn, test_module.GetQn):
+            self.assertAlmostEqual(Function(Data), 1.0, delta = 0.1)
+        self.assertEqual(test_module.GetMAD([5]), 0)
+        self.assertEqual(test_module.GetSn([5]), 0)
+        self.assertEqual(test_module.GetQn([5, 5, 5]), 0)
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper type of the
+        data.
+
+        Implements tests: TEST-T-2D0.
+        Covers the requirements REQ-FUN-2D0.
+        """
+        for Function in self.Functions:
+            for Data in (1, 1.0, [1, '2'], {1: 2}, None):
+                with self.assertRaises(TypeError):
+                    Function(Data)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with empty data, and with
+        a single element for GetQn().
+
+        Implements tests: TEST-T-2D0.
+        Covers the requirements REQ-FUN-2D0.
+        """
+        for Function in self.Functions:
+            with self.assertRaises(ValueError):
+                Function([])
+        with self.assertRaises(ValueError):
+            test_module.GetQn([1])
+
+class Test_Medcouple(unittest.TestCase):
+    """
+    Unit-tests of the medcouple (robust skewness) function GetMedcouple() from
+    the module statistics_lib.ordered_functions.
+
+    Implements tests: TEST-T-2E0.
+    Covers the requirements REQ-FUN-2E0.
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.GetMedcouple)
+    
+    @staticmethod
+    def getReference(Data):
+        """
+        Calculates the reference value by the definition, using all pairs of the
+        elements above and below the median - O(N^2).
+        """
+        Median = statistics.median(Data)
+        Upper = sorted((Item for Item in Data if Item >= Median),
+                                                            reverse = True)
+        Lower = sorted((Item for Item in Data if Item <= Median),
+                                                            reverse = True)
+        Ties = Data.count(Median)
+        Offset = len(Upper) - Ties
+        Kernels = []
+        for Row, First in enumerate(Upper):
+            for Column, Second in enumerate(Lower):
+                if First == Second:
+                    Value = Ties - 1 - (Row - Offset) - Column
+                    Kernels.append((Value > 0) - (Value < 0))
+                else:
+                    Kernels.append((First + Second - 2 * Median) /
+                                                            (First - Second))
+        return statistics.median(Kernels)
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the results are the same as calculated by the definition
+        for the random data with and without ties, including already sorted data
+        with DoCheck = False.
+
+        Implements tests: TEST-T-2E0.
+        Covers the requirements REQ-FUN-2E0.
+        """
+        for Index in range(60):
+            Length = random.randrange(1, 80)
+            if Index % 3 == 0:
+                Data = [random.randint(-5, 5) for _ in range(Length)]
+            elif Index % 3 == 1:
+                Data = [random.expovariate(1.0) for _ in range(Length)]
+            else:
+                Data = [random.choice((random.randint(0, 3),
+                            random.uniform(0.0, 3.0))) for _ in range(Length)]
+            Check = self.getReference(Data)
+            self.assertAlmostEqual(self.TestFunction(Data), Check,
+                                                places = FLOAT_CHECK_PRECISION)
+            self.assertAlmostEqual(
+                            self.TestFunction(sorted(Data), DoCheck = False),
+                                        Check, places = FLOAT_CHECK_PRECISION)
+        self.assertEqual(self.TestFunction([5]), 0)
+        self.assertEqual(self.TestFunction([5, 5, 5, 5]), 0)
+        self.assertEqual(self.TestFunction([1, 2, 3, 4, 5]), 0)
+        self.assertEqual(self.TestFunction([1, 2, 3, 10, 20]), 0.75)
+        Data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 1000]
+        Mixed = [MeasuredValue(Item, 0.5) for Item in Data]
+        self.assertEqual(self.TestFunction(Mixed), self.TestFunction(Data))
+        self.assertAlmostEqual(self.TestFunction([-Item for Item in Data]),
+                    -self.TestFunction(Data), places = FLOAT_CHECK_PRECISION)
+        Data = [random.gauss(0.0, 1.0) for _ in range(5000)]
+        self.assertAlmostEqual(self.TestFunction(Data), 0.0, delta = 0.1)
+        Data = [random.expovariate(1.0) for _ in range(5000)]
+        self.assertGreater(self.TestFunction(Data), 0.2)
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper type of the
+        data.
+
+        Implements tests: TEST-T-2E0.
+        Covers the requirements REQ-FUN-2E0.
+        """
+        for Data in (1, 1.0, [1, '2'], {1: 2}, None):
+            with self.assertRaises(TypeError):
+                self.TestFunction(Data)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with empty data.
+
+        Implements tests: TEST-T-2E0.
+        Covers the requirements REQ-FUN-2E0.
+        """
+        with self.assertRaises(ValueError):
+            self.TestFunction([])
+
+class Test_LMoments(unittest.TestCase):
+    """
+    Unit-tests of the L-moments functions GetLMoments() and GetLMomentRatios()
+    from the module statistics_lib.ordered_functions.
+
+    Implements tests: TEST-T-2F0.
+    Covers the requirements REQ-FUN-2F0.
+    """
+    
+    @staticmethod
+    def getReference(Data, Order):
+        """
+        Calculates the reference L-moments by the definition, as the averages
+        over all sub-samples of the size r of the alternating sums of the order
+        statistics - O(C(N, r)).
+        """
+        def getBinomial(N, K):
+            return math.factorial(N) // (math.factorial(K) *
+                                                    math.factorial(N - K))
+        
+        Data = sorted(Data)
+        Length = len(Data)
+        Result = []
+        for Size in range(1, Order + 1):
+            Total = 0
+            for Indexes in itertools.combinations(range(Length), Size):
+                Total += sum((-1)**Index * getBinomial(Size - 1, Index) *
+                                Data[Indexes[Size - 1 - Index]]
+                                                for Index in range(Size))
+            Result.append(Total / (Size * getBinomial(Length, Size)))
+        return Result
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the results are the same as calculated by the definition
+        for the random data, including already sorted data with DoCheck = False,
+        and the known values.
+
+        Implements tests: TEST-T-2F0.
+        Covers the requirements REQ-FUN-2F0.
+        """
+        for Index in range(60):
+            Length = random.randrange(1, 11)
+            Order = random.randrange(1, Length + 1)
+            if Index % 3 == 0:
+                Data = [random.randint(-5, 5) for _ in range(Length)]
+            elif Index % 3 == 1:
+                Data = [random.gauss(0.0, 10.0) for _ in range(Length)]
+            else:
+                Data = [random.choice((random.randint(0, 3),
+                            random.uniform(0.0, 3.0))) for _ in range(Length)]
+            Checks = self.getReference(Data, Order)
+            for Function in (test_module.GetLMoments,
+                                            test_module.GetLMomentRatios):
+                Results = (Function(Data, Order),
+                                Function(sorted(Data), Order, DoCheck = False))
+                if Function is test_module.GetLMomentRatios and Order > 2:
+                    if Checks[1]:
+                        Checks[2:] = [Check / Checks[1] for Check in Checks[2:]]
+                    else:
+                        Checks[2:] = [0] * (Order - 2)
+                for Result in Results:
+                    self.assertIsInstance(Result, tuple)
+                    self.assertEqual(len(Result), Order)
+                    for Value, Check in zip(Result, Checks):
+                        self.assertAlmostEqual(Value, Check,
+                                                places = FLOAT_CHECK_PRECISION)
+        Data = [1, 2, 3, 4, 10]
+        self.assertEqual(test_module.GetLMoments(Data), (4, 2, 1, 1))
+        self.assertEqual(test_module.GetLMomentRatios(Data), (4, 2, 0.5, 0.5))
+        self.assertEqual(test_module.GetLMoments(Data, 1), (4, ))
+        Mixed = [MeasuredValue(Item, 0.5) for Item in Data]
+        self.assertEqual(test_module.GetLMoments(Mixed),
+                                                test_module.GetLMoments(Data))
+        self.assertEqual(test_module.GetLMomentRatios([2, 2, 2, 2, 2], 5),
+                                                            (2, 0, 0, 0, 0))
+        Data = [random.uniform(0.0, 1.0) for _ in range(10000)]
+        Result = test_module.GetLMomentRatios(Data)
+        self.assertAlmostEqual(Result[1], 1 / 6, delta = 0.01)
+        self.assertAlmostEqual(Result[2], 0.0, delta = 0.05)
+        self.assertAlmostEqual(Result[3], 0.0, delta = 0.05)
+        Data = [random.expovariate(1.0) for _ in range(10000)]
+        Result = test_module.GetLMomentRatios(Data)
+        self.assertAlmostEqual(Result[2], 1 / 3, delta = 0.05)
+        self.assertAlmostEqual(Result[3], 1 / 6, delta = 0.05)
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper type of the
+        data or the order.
+
+        Implements tests: TEST-T-2F0.
+        Covers the requirements REQ-FUN-2F0.
+        """
+        for Function in (test_module.GetLMoments,
+                                            test_module.GetLMomentRatios):
+            for Data in (1, 1.0, [1, '2'], {1: 2}, None):
+                with self.assertRaises(TypeError):
+                    Function(Data)
+            for Order in (1.0, '2', None, [1]):
+                with self.assertRaises(TypeError):
+                    Function([1, 2, 3, 4, 5], Order)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with empty data, not
+        positive order or the data shorter than the order.
+
+        Implements tests: TEST-T-2F0.
+        Covers the requirements REQ-FUN-2F0.
+        """
+        for Function in (test_module.GetLMoments,
+                                            test_module.GetLMomentRatios):
+            with self.assertRaises(ValueError):
+                Function([])
+            for Order in (0, -1):
+                with self.assertRaises(ValueError):
+                    Function([1, 2, 3, 4, 5], Order)
+            with self.assertRaises(ValueError):
+                Function([1, 2, 3])
+            with self.assertRaises(ValueError):
+                Function([1, 2, 3, 4, 5], 6)
+
+class Test_GetQuantiles(unittest.TestCase):
+    """
+    Unit-tests of the batch quantiles function GetQuantiles() from the module
+    statistics_lib.ordered_functions.
+
+    Implements tests: TEST-T-262.
+    Covers the requirements REQ-FUN-262.
+    """
+    
+    def test_OkOperation(self) -> None:
+        """
+        Checks that the results are the same as calculated by GetQuantile() for
+        the number of quantiles and the (k, m) pairs, and by the interpolation
+        between the elements of the sorted data for the probabilities, with
+        the random data, including already sorted data with DoCheck = False.
+
+        Implements tests: TEST-T-262.
+        Covers the requirements REQ-FUN-262.
+        """
+        for Index in range(60):
+            Length = random.choice((2, 3, 5, 10, 100, 1000,
+                                            test_module.SORTING_CUTOFF + 100))
+            if Index % 3 == 0:
+                Data = [random.randint(-5, 5) for _ in range(Length)]
+            elif Index % 3 == 1:
+                Data = [random.gauss(0.0, 10.0) for _ in range(Length)]
+            else:
+                Data = [random.choice((random.randint(0, 3),
+                                MeasuredValue(random.uniform(0.0, 3.0), 0.1)))
+                                                    for _ in range(Length)]
+            Sorted = sorted(test_module._ExtractMeans(Data))
+            m = random.randint(2, 100)
+            Result = test_module.GetQuantiles(Data, m)
+            self.assertIsInstance(Result, tuple)
+            self.assertEqual(Result, tuple(test_module.GetQuantile(Data, k, m)
+                                                    for k in range(1, m)))
+            Pairs = [(0, 1), (1, 1)]
+            for _ in range(random.randint(1, 5)):
+                m = random.randint(1, 100)
+                Pairs.append((random.randint(0, m), m))
+            Result = test_module.GetQuantiles(Data, Pairs)
+            self.assertEqual(Result, tuple(test_module.GetQuantile(Data, k, m)
+                                                        for k, m in Pairs))
+            self.assertEqual(Result, test_module.GetQuantiles(Sorted, Pairs,
+                                                            DoCheck = False))
+            Probabilities = [0, 1, 0.5, 0.0, 1.0] + [random.random()
+                                                            for _ in range(3)]
+            Result = test_module.GetQuantiles(Data, Probabilities)
+            self.assertEqual(Result, test_module.GetQuantiles(Sorted,
+                                            Probabilities, DoCheck = False))
+            for Probability, Value in zip(Probabilities, Result):
+                Position = (Length - 1) * Probability
+                Lower = int(Position)
+                if Lower == Length - 1:
+                    Check = Sorted[-1]
+                else:
+                    Portion = Position - Lower
+                    Check = (Sorted[Lower] * (1 - Portion)
+                                            + Sorted[Lower + 1] * Portion)
+                self.assertEqual(Value, Check)
+        Data = list(range(101))
+        random.shuffle(Data)
+        self.assertEqual(test_module.GetQuantiles(Data, 100),
+                                                    tuple(range(1, 100)))
+        self.assertEqual(test_module.GetQuantiles(Data, [0.25, (3, 4), 0, 1]),
+                                                            (25, 75, 0, 100))
+        self.assertEqual(test_module.GetQuantiles(Data, 4),
+                            (test_module.GetFirstQuartile(Data),
+                                test_module.GetMedian(Data),
+                                    test_module.GetThirdQuartile(Data)))
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper type of the
+        data or the quantiles specification.
+
+        Implements tests: TEST-T-262.
+        Covers the requirements REQ-FUN-262.
+        """
+        for Data in (1, 1.0, [1, '2'], {1: 2}, None):
+            with self.assertRaises(TypeError):
+                test_module.GetQuantiles(Data, 4)
+        for Quantiles in (4.0, '4', None, True, {1: 2}, [(1, 2), '1'],
+                            [(1, 2, 3)], [(1.0, 2)], [(1, 2.0)], [None],
+                            [True], [(True, 2)]):
+            with self.assertRaises(TypeError):
+                test_module.GetQuantiles([1, 2, 3, 4, 5], Quantiles)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with empty or too short
+        data, and out of range number of quantiles, quantile index or
+        probability.
+
+        Implements tests: TEST-T-262.
+        Covers the requirements REQ-FUN-262.
+        """
+        for Data in ([], [1]):
+            with self.assertRaises(ValueError):
+                test_module.GetQuantiles(Data, 4)
+        for Quantiles in (1, 0, -4, [], (), [(-1, 4)], [(5, 4)], [(0, 0)],
+                                [(1, -4)], [-0.1], [1.1], [2], [0.5, -1]):
+            with self.assertRaises(ValueError):
+                test_module.GetQuantiles([1, 2, 3, 4, 5], Quantiles)
+
+class Test_QuantileSketch(unittest.TestCase):
+    """
+    Unit-tests of the quantile sketch class QuantileSketch from the module
+    statistics_lib.ordered_functions.
+
+    Implements tests: TEST-T-2G0.
+    Covers the requirements REQ-FUN-2G0.
+    """
+    
+    @staticmethod
+    def getRankError(Sorted, Value, Probability):
+        """
+        Calculates the normalized distance of the expected rank of the quantile
+        from the range of the ranks of the value in the sorted data.
+        """
+        Length = len(Sorted)
+        Lower = bisect.bisect_left(Sorted, Value)
+        Upper = bisect.bisect_right(Sorted, Value)
+        Position = Probability * (Length - 1)
+        return max(0, Lower - Position - 1, Position - Upper) / Length
+    
+    def test_Exact(self) -> None:
+        """
+        Checks that the quantiles of a stream shorter than the accuracy
+        parameter are the same as calculated by GetQuantiles(), and that the
+        minimum and maximum are exact.
+
+        Implements tests: TEST-T-2G0.
+        Covers the requirements REQ-FUN-2G0.
+        """
+        for _ in range(50):
+            K = random.randint(8, 300)
+            Length = random.randint(2, K - 1)
+            Data = [random.choice((random.randint(-5, 5),
+                                    random.uniform(-5.0, 5.0)))
+                                                    for _ in range(Length)]
+            objTest = test_module.QuantileSketch(K)
+            for Item in Data:
+                objTest.update(Item)
+            self.assertEqual(objTest.N, Length)
+            self.assertEqual(objTest.Size, Length)
+            self.assertEqual(objTest.Min, min(Data))
+            self.assertEqual(objTest.Max, max(Data))
+            self.assertEqual(objTest.Median, test_module.GetMedian(Data))
+            self.assertEqual(objTest.Q1, test_module.GetFirstQuartile(Data))
+            self.assertEqual(objTest.Q3, test_module.GetThirdQuartile(Data))
+            self.assertEqual(objTest.getQuantiles(100),
+                                        test_module.GetQuantiles(Data, 100))
+            self.assertEqual(objTest.getQuantile(1, 3),
+                                        test_module.GetQuantile(Data, 1, 3))
+            Value = random.choice(Data)
+            self.assertEqual(objTest.getCDF(Value),
+                    sum(1 for Item in Data if Item <= Value) / Length)
+        objTest = test_module.QuantileSketch()
+        objTest.updateMany([MeasuredValue(2, 0.5), 1, MeasuredValue(4, 1)])
+        self.assertEqual(objTest.getQuantiles([0, 0.5, 1]), (1, 2, 4))
+        self.assertEqual(objTest.getCDF(0), 0)
+        self.assertEqual(objTest.getCDF(4.5), 1)
+        objTest.update(3)
+        self.assertEqual(objTest.Median, 2.5)
+        self.assertEqual(objTest.K, test_module.SKETCH_K)
+    
+    def test_Accuracy(self) -> None:
+        """
+        Checks that the rank error of the estimated percentiles and CDF of the
+        long streams added one by one, in batches or by merging of several
+        sketches does not exceed the documented bound, and the number of the
+        kept items is bounded.
+
+        Implements tests: TEST-T-2G0.
+        Covers the requirements REQ-FUN-2G0.
+        """
+        for Index in range(6):
+            K = random.choice((50, 100, 200))
+            Length = random.randint(10000, 30000)
+            Data = [random.gauss(0.0, 1.0) for _ in range(Length)]
+            objTest = test_module.QuantileSketch(K)
+            if Index % 3 == 0:
+                for Item in Data:
+                    objTest.update(Item)
+            elif Index % 3 == 1:
+                for Start in range(0, Length, 1000):
+                    objTest.updateMany(Data[Start : Start + 1000])
+            else:
+                Parts = [test_module.QuantileSketch(K) for _ in range(5)]
+                for Position, Item in enumerate(Data):
+                    Parts[Position % 5].update(Item)
+                for Part in Parts:
+                    objTest.merge(Part)
+            self.assertEqual(objTest.N, Length)
+            self.assertLess(objTest.Size, 4 * K)
+            self.assertEqual(objTest.Min, min(Data))
+            self.assertEqual(objTest.Max, max(Data))
+            Sorted = sorted(Data)
+            Probabilities = [k / 100 for k in range(1, 100)]
+            Results = objTest.getQuantiles(Probabilities)
+            for Probability, Value in zip(Probabilities, Results):
+                self.assertLessEqual(
+                            self.getRankError(Sorted, Value, Probability),
+                                                        objTest.RankError)
+            for Value in Sorted[::1000]:
+                Check = bisect.bisect_right(Sorted, Value) / Length
+                self.assertAlmostEqual(objTest.getCDF(Value), Check,
+                                                delta = objTest.RankError)
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper type of the
+        arguments.
+
+        Implements tests: TEST-T-2G0.
+        Covers the requirements REQ-FUN-2G0.
+        """
+        for Value in (200.0, '200', None, True):
+            with self.assertRaises(TypeError):
+                test_module.QuantileSketch(Value)
+        objTest = test_module.QuantileSketch()
+        for Value in ('1', None, [1], int):
+            with self.assertRaises(TypeError):
+                objTest.update(Value)
+            with self.assertRaises(TypeError):
+                objTest.merge(Value)
+            with self.assertRaises(TypeError):
+                objTest.getCDF(Value)
+        for Value in (1, [1, '2'], {1: 2}, None):
+            with self.assertRaises(TypeError):
+                objTest.updateMany(Value)
+        objTest.update(1)
+        for Value in (1.0, '1', None):
+            with self.assertRaises(TypeError):
+                objTest.getQuantile(Value, 4)
+            with self.assertRaises(TypeError):
+                objTest.getQuantiles(Value)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with too small accuracy
+        parameter, NaN data, out of range quantiles or query of an empty sketch.
+
+        Implements tests: TEST-T-2G0.
+        Covers the requirements REQ-FUN-2G0.
+        """
+        for Value in (7, 0, -200):
+            with self.assertRaises(ValueError):
+                test_module.QuantileSketch(Value)
+        objTest = test_module.QuantileSketch()
+        for Attr in ('Min', 'Max', 'Median', 'Q1', 'Q3'):
+            with self.assertRaises(ValueError):
+                getattr(objTest, Attr)
+        with self.assertRaises(ValueError):
+            objTest.getQuantile(1, 2)
+        with self.assertRaises(ValueError):
+            objTest.getQuantiles(4)
+        with self.assertRaises(ValueError):
+            objTest.getCDF(1)
+        with self.assertRaises(ValueError):
+            objTest.update(math.nan)
+        with self.assertRaises(ValueError):
+            objTest.updateMany([1, math.nan])
+        objTest.update(1)
+        for k, m in ((-1, 4), (5, 4), (0, 0)):
+            with self.assertRaises(ValueError):
+                objTest.getQuantile(k, m)
+        for Value in (1, [], [1.5], [(5, 4)]):
+            with self.assertRaises(ValueError):
+                objTest.getQuantiles(Value)
+
+class Test_HistogramAccumulator(unittest.TestCase):
+    """
+    Unit-tests of the streaming histogram class HistogramAccumulator from the
+    module statistics_lib.ordered_functions.
+
+    Implements tests: TEST-T-2H0.
+    Covers the requirements REQ-FUN-2H0.
+    """
+    
+    @staticmethod
+    def getReference(Edges, Data):
+        """
+        Counts the data points in the bins by bisection of the edges, with the
+        underflow as the first and the overflow as the last element.
+        """
+        Result = [0 for _ in range(len(Edges) + 1)]
+        for Item in Data:
+            Result[bisect.bisect_right(Edges, Item)] += 1
+        return Result
+    
+    @staticmethod
+    def getGridReference(Start, Width, Count, Data):
+        """
+        Counts the data points in the equal width bins centred at Start + i *
+        Width by the index rule of the function GetHistogram(), with the
+        underflow as the first and the overflow as the last element.
+        """
+        Result = [0 for _ in range(Count + 2)]
+        for Item in Data:
+            Position = (round(Item, 16) - Start) / Width + 0.5
+            if Position < 0:
+                Result[0] += 1
+            elif Position >= Count:
+                Result[-1] += 1
+            else:
+                Result[int(Position) + 1] += 1
+        return Result
+    
+    def test_Binning(self) -> None:
+        """
+        Checks that the data points added one by one or as sequences (including
+        the values at the edges and outside the grid) are counted in the proper
+        bins, the underflow and the overflow, for the explicit edges and for the
+        equal width bins.
+
+        Implements tests: TEST-T-2H0.
+        Covers the requirements REQ-FUN-2H0.
+        """
+        for _ in range(20):
+            Edges = sorted(set(random.uniform(-10.0, 10.0)
+                                        for _ in range(random.randint(2, 30))))
+            Data = [random.uniform(-12.0, 12.0) for _ in range(1000)]
+            Data.extend(Edges)
+            Data.append(random.randint(-12, 12))
+            Check = self.getReference(Edges, Data)
+            objTest = test_module.HistogramAccumulator(Edges = Edges)
+            for Item in Data:
+                objTest.update(Item)
+            self.assertEqual(objTest.NBins, len(Edges) - 1)
+            self.assertEqual(objTest.Edges, tuple(Edges))
+            self.assertEqual(objTest.Counts, tuple(Check[1:-1]))
+            self.assertEqual(objTest.Underflow, Check[0])
+            self.assertEqual(objTest.Overflow, Check[-1])
+            self.assertEqual(objTest.N, len(Data))
+            Centres = objTest.Centres
+            self.assertEqual(len(Centres), objTest.NBins)
+            for Index, Centre in enumerate(Centres):
+                self.assertAlmostEqual(Centre, 0.5 * (Edges[Index] +
+                        Edges[Index + 1]), places = FLOAT_CHECK_PRECISION)
+            self.assertEqual(objTest.getHistogram(),
+                                            dict(zip(Centres, Check[1:-1])))
+            Start = random.uniform(-10.0, 10.0)
+            Width = random.choice((random.uniform(0.01, 2.0), 0.1, 1))
+            Count = random.randint(1, 50)
+            objTest = test_module.HistogramAccumulator(Start = Start,
+                                                Width = Width, Count = Count)
+            Edges = list(objTest.Edges)
+            self.assertEqual(len(Edges), Count + 1)
+            self.assertEqual(Edges[0], Start - 0.5 * Width)
+            self.assertEqual(objTest.Centres, tuple(round(Start + Index * Width,
+                                                16) for Index in range(Count)))
+            Data = [random.uniform(Start - 1, Start + (Count + 1) * Width)
+                                                        for _ in range(1000)]
+            Data.extend(Edges)
+            Data.extend(random.uniform(-1.0, 1.0) for _ in range(100))
+            Data.extend([math.inf, -math.inf, MeasuredValue(Start, 0.1)])
+            Check = self.getGridReference(Start, Width, Count,
+                                [getattr(Item, 'Value', Item) for Item in Data])
+            objTest.updateMany(Data[:500])
+            objTest.updateMany(Data[500:])
+            objTest.updateMany([])
+            self.assertEqual(objTest.Counts, tuple(Check[1:-1]))
+            self.assertEqual(objTest.Underflow, Check[0])
+            self.assertEqual(objTest.Overflow, Check[-1])
+            self.assertEqual(objTest.N, len(Data))
+            Buffer = array.array('d', Data[:-1])
+            objTest = test_module.HistogramAccumulator(Start = Start,
+                                                Width = Width, Count = Count)
+            objTest.updateMany(Buffer)
+            objTest.update(Data[-1])
+            self.assertEqual(objTest.Counts, tuple(Check[1:-1]))
+            self.assertEqual(objTest.Underflow, Check[0])
+            self.assertEqual(objTest.Overflow, Check[-1])
+    
+    def test_Merge(self) -> None:
+        """
+        Checks that the histograms of the separate chunks of data merged
+        together are the same as of the whole data set, and the same as
+        calculated by the function GetHistogram() with the same grid, and that
+        the bins defined by the same edges are not merged with the equal width
+        bins.
+
+        Implements tests: TEST-T-2H0.
+        Covers the requirements REQ-FUN-2H0.
+        """
+        for _ in range(20):
+            Length = random.randint(100, 2000)
+            Data = [random.choice((random.randint(-50, 50),
+                                    random.gauss(0.0, 20.0)))
+                                                    for _ in range(Length)]
+            NBins = random.randint(2, 40)
+            Min = min(Data)
+            Max = max(Data)
+            Width = round((Max - Min) / (NBins - 1), 16)
+            Start = round(Min, 16)
+            Check = test_module.GetHistogram(Data, NBins = NBins)
+            objTest = test_module.HistogramAccumulator(Start = Start,
+                                                Width = Width, Count = NBins)
+            Parts = [test_module.HistogramAccumulator(Start = Start,
+                                Width = Width, Count = NBins) for _ in range(4)]
+            Chunk = Length // 4 + 1
+            for Index, Part in enumerate(Parts):
+                Part.updateMany(Data[Index * Chunk : (Index + 1) * Chunk])
+                objTest.merge(Part)
+            self.assertEqual(objTest.N, Length)
+            self.assertEqual(objTest.Underflow, 0)
+            self.assertEqual(objTest.Overflow, 0)
+            self.assertDictEqual(objTest.getHistogram(), Check)
+            self.assertEqual(list(objTest.getHistogram()), list(Check))
+            Buffer = test_module.HistogramAccumulator(Start = Start,
+                                                Width = Width, Count = NBins)
+            Buffer.updateMany(array.array('d', Data))
+            self.assertDictEqual(Buffer.getHistogram(), Check)
+            Whole = test_module.HistogramAccumulator(Start = Start,
+                                                Width = Width, Count = NBins)
+            Whole.updateMany(Data + [Min - Width, Max + Width])
+            Extra = test_module.HistogramAccumulator(Start = Start,
+                                                Width = Width, Count = NBins)
+            Extra.updateMany([Min - Width, Max + Width])
+            with self.assertRaises(ValueError):
+                objTest.merge(test_module.HistogramAccumulator(
+                                                        Edges = objTest.Edges))
+            objTest.merge(Extra)
+            self.assertEqual(objTest.Counts, Whole.Counts)
+            self.assertEqual(objTest.Underflow, 1)
+            self.assertEqual(objTest.Overflow, 1)
+            self.assertEqual(objTest.N, Length + 2)
+    
+    def test_TypeError(self) -> None:
+        """
+        Checks that sub-class of TypeError is raised with improper type of the
+        arguments.
+
+        Implements tests: TEST-T-2H0.
+        Covers the requirements REQ-FUN-2H0.
+        """
+        for Value in (1, '1, 2', [1, '2'], [1, None], (True, 2), {1: 2}):
+            with self.assertRaises(TypeError):
+                test_module.HistogramAccumulator(Edges = Value)
+        for Value in ('1', [1], True):
+            with self.assertRaises(TypeError):
+                test_module.HistogramAccumulator(Start = Value, Width = 1,
+                                                                    Count = 2)
+            with self.assertRaises(TypeError):
+                test_module.HistogramAccumulator(Start = 0, Width = Value,
+                                                                    Count = 2)
+        for Value in ('1', [1], 2.0):
+            with self.assertRaises(TypeError):
+                test_module.HistogramAccumulator(Start = 0, Width = 1,
+                                                                Count = Value)
+        objTest = test_module.HistogramAccumulator(Edges = [0, 1, 2])
+        for Value in ('1', None, [1], int):
+            with self.assertRaises(TypeError):
+                objTest.update(Value)
+            with self.assertRaises(TypeError):
+                objTest.merge(Value)
+        with self.assertRaises(TypeError):
+            objTest.merge(test_module.QuantileSketch())
+        for Value in (1, [1, '2'], {1: 2}, None):
+            with self.assertRaises(TypeError):
+                objTest.updateMany(Value)
+    
+    def test_ValueError(self) -> None:
+        """
+        Checks that sub-class of ValueError is raised with improper grid of the
+        bins, NaN data or merging of the histograms with different bins.
+
+        Implements tests: TEST-T-2H0.
+        Covers the requirements REQ-FUN-2H0.
+        """
+        for Value in ([], [1], [1, 1], [2, 1], [0, 1, 0.5],
+                                                [0, math.inf], [math.nan, 1]):
+            with self.assertRaises(ValueError):
+                test_module.HistogramAccumulator(Edges = Value)
+        with self.assertRaises(ValueError):
+            test_module.HistogramAccumulator()
+        with self.assertRaises(ValueError):
+            test_module.HistogramAccumulator(Start = 0, Width = 1)
+        for Value in (0, -1, -0.5, math.inf, math.nan):
+            with self.assertRaises(ValueError):
+                test_module.HistogramAccumulator(Start = 0, Width = Value,
+                                                                    Count = 2)
+        for Value in (math.inf, -math.inf, math.nan):
+            with self.assertRaises(ValueError):
+                test_module.HistogramAccumulator(Start = Value, Width = 1,
+                                                                    Count = 2)
+        for Value in (0, -1):
+            with self.assertRaises(ValueError):
+                test_module.HistogramAccumulator(Start = 0, Width = 1,
+                                                                Count = Value)
+        objTest = test_module.HistogramAccumulator(Start = 0, Width = 1,
+                                                                    Count = 2)
+        with self.assertRaises(ValueError):
+            objTest.update(math.nan)
+        with self.assertRaises(ValueError):
+            objTest.updateMany([1, math.nan])
+        with self.assertRaises(ValueError):
+            objTest.updateMany(array.array('d', [1, math.nan]))
+        self.assertEqual(objTest.N, 0)
+        for Edges in ([0, 1, 2, 3], [0, 1, 2.5], [-1, 1, 2], [-0.5, 0.5, 1.5]):
+            with self.assertRaises(ValueError):
+                objTest.merge(test_module.HistogramAccumulator(Edges = Edges))
+        objTest.merge(test_module.HistogramAccumulator(Start = 0, Width = 1,
+                                                                    Count = 2))
 
 #+ test suites
 
@@ -994,10 +2169,30 @@ TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(Test_GetSpearman)
 
 TestSuite10 = unittest.TestLoader().loadTestsFromTestCase(Test_GetKendall)
 
+TestSuite11 = unittest.TestLoader().loadTestsFromTestCase(Test_MissingPolicy)
+
+TestSuite12 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_TrimmedStatistics)
+
+TestSuite13 = unittest.TestLoader().loadTestsFromTestCase(Test_RobustScale)
+
+TestSuite14 = unittest.TestLoader().loadTestsFromTestCase(Test_Medcouple)
+
+TestSuite15 = unittest.TestLoader().loadTestsFromTestCase(Test_LMoments)
+
+TestSuite16 = unittest.TestLoader().loadTestsFromTestCase(Test_GetQuantiles)
+
+TestSuite17 = unittest.TestLoader().loadTestsFromTestCase(Test_QuantileSketch)
+
+TestSuite18 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_HistogramAccumulator)
+
 TestSuite = unittest.TestSuite()
 TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4, TestSuite5,
                         TestSuite6, TestSuite7, TestSuite8, TestSuite9,
-                        TestSuite10])
+                        TestSuite10, TestSuite11, TestSuite12,
+                        TestSuite13, TestSuite14, TestSuite15, TestSuite16,
+                        TestSuite17, TestSuite18])
 
 if __name__ == "__main__":
     sys.stdout.write(
@@ -598,6 +598,147 @@ class Test_Statistics1D(unittest.TestCase):
                                                 places = FLOAT_CHECK_PRECISION)
             del objTest
     
+    def test_RobustScale(self):
+        """
+        Checks that the median absolute deviation, Sn and Qn estimators of the
+        stored data set are returned properly, with and without the sorted copy
+        of the data being already cached.
+        
+        Tests ID: TEST-T-319
+        Requirements ID: REQ-FUN-316
+
+        Version 1.0.0.0
+        """
+        for Input in [self.AllInt, self.AllFloat, self.Mixed, self.IntErr,
+                                self.FloatErr, self.MixedErr, self.TotalMixed]:
+            for IsSorted in (False, True):
+                objTest = self.TestClass(Input)
+                if IsSorted:
+                    objTest.Sorted
+                for Attr, Function in (('MAD', of.GetMAD), ('Sn', of.GetSn),
+                                                            ('Qn', of.GetQn)):
+                    Check = Function(Input)
+                    TestResult = getattr(objTest, Attr)
+                    self.assertIsInstance(TestResult, (int, float))
+                    self.assertAlmostEqual(TestResult, Check,
+                                                places = FLOAT_CHECK_PRECISION)
+                    #check the repetitive call!
+                    self.assertEqual(getattr(objTest, Attr), TestResult)
+                del objTest
+        objTest = self.TestClass([1])
+        self.assertEqual(objTest.MAD, 0)
+        self.assertEqual(objTest.Sn, 0)
+        with self.assertRaises(ValueError):
+            objTest.Qn
+    
+    def test_Medcouple(self):
+        """
+        Checks that the medcouple of the stored data set is returned properly.
+        
+        Tests ID: TEST-T-31A
+        Requirements ID: REQ-FUN-317
+
+        Version 1.0.0.0
+        """
+        for Input in [self.AllInt, self.AllFloat, self.Mixed, self.IntErr,
+                                self.FloatErr, self.MixedErr, self.TotalMixed]:
+            objTest = self.TestClass(Input)
+            Check = of.GetMedcouple(Input)
+            TestResult = objTest.Medcouple
+            self.assertIsInstance(TestResult, (int, float))
+            self.assertAlmostEqual(TestResult, Check,
+                                                places = FLOAT_CHECK_PRECISION)
+            #check the repetitive call!
+            self.assertEqual(objTest.Medcouple, TestResult)
+            del objTest
+        objTest = self.TestClass([1])
+        self.assertEqual(objTest.Medcouple, 0)
+    
+    def test_LMoments(self):
+        """
+        Checks that the L-moments and the L-moment ratios of the stored data
+        set are returned properly.
+        
+        Tests ID: TEST-T-31B
+        Requirements ID: REQ-FUN-318
+
+        Version 1.0.0.0
+        """
+        for Input in [self.AllInt, self.AllFloat, self.Mixed, self.IntErr,
+                                self.FloatErr, self.MixedErr, self.TotalMixed]:
+            objTest = self.TestClass(Input)
+            Checks = of.GetLMomentRatios(Input)
+            for Attr, Check in zip(('LLocation', 'LScale', 'LSkew', 'LKurt'),
+                                                                    Checks):
+                TestResult = getattr(objTest, Attr)
+                self.assertIsInstance(TestResult, (int, float))
+                self.assertAlmostEqual(TestResult, Check,
+                                                places = FLOAT_CHECK_PRECISION)
+                #check the repetitive call!
+                self.assertEqual(getattr(objTest, Attr), TestResult)
+            for Order in range(1, min(6, len(Input)) + 1):
+                Checks = of.GetLMoments(Input, Order)
+                TestResult = objTest.getLMoments(Order)
+                self.assertIsInstance(TestResult, tuple)
+                self.assertEqual(len(TestResult), Order)
+                for Value, Check in zip(TestResult, Checks):
+                    self.assertAlmostEqual(Value, Check,
+                                                places = FLOAT_CHECK_PRECISION)
+            with self.assertRaises(TypeError):
+                objTest.getLMoments(1.0)
+            with self.assertRaises(ValueError):
+                objTest.getLMoments(0)
+            with self.assertRaises(ValueError):
+                objTest.getLMoments(len(Input) + 1)
+            del objTest
+        objTest = self.TestClass([1, 2])
+        self.assertEqual(objTest.LLocation, 1.5)
+        self.assertEqual(objTest.LScale, 0.5)
+        with self.assertRaises(ValueError):
+            objTest.LSkew
+        with self.assertRaises(ValueError):
+            objTest.LKurt
+        objTest = self.TestClass([3, 3, 3, 3])
+        self.assertEqual(objTest.LSkew, 0)
+        self.assertEqual(objTest.LKurt, 0)
+    
+    def test_getQuantiles(self):
+        """
+        Checks that the batch of quantiles of the stored data set is returned
+        properly.
+        
+        Tests ID: TEST-T-31C
+        Requirements ID: REQ-FUN-319
+
+        Version 1.0.0.0
+        """
+        for Input in [self.AllInt, self.AllFloat, self.Mixed, self.IntErr,
+                                self.FloatErr, self.MixedErr, self.TotalMixed]:
+            objTest = self.TestClass(Input)
+            for Quantiles in (4, 10, 100, [(0, 1), (1, 1), (1, 3), (7, 9)],
+                                        [0, 1, 0.5, random.random(), (1, 4)]):
+                Check = of.GetQuantiles(Input, Quantiles)
+                TestResult = objTest.getQuantiles(Quantiles)
+                self.assertIsInstance(TestResult, tuple)
+                self.assertEqual(TestResult, Check)
+                #check the repetitive call!
+                self.assertEqual(objTest.getQuantiles(Quantiles), Check)
+            TestResult = objTest.getQuantiles(100)
+            for k, Value in enumerate(TestResult, start = 1):
+                self.assertEqual(Value, objTest.getQuantile(k, 100))
+            with self.assertRaises(TypeError):
+                objTest.getQuantiles(4.0)
+            with self.assertRaises(TypeError):
+                objTest.getQuantiles([(1, '4')])
+            with self.assertRaises(ValueError):
+                objTest.getQuantiles(1)
+            with self.assertRaises(ValueError):
+                objTest.getQuantiles([1.5])
+            del objTest
+        objTest = self.TestClass([1])
+        with self.assertRaises(ValueError):
+            objTest.getQuantiles(4)
+    
     def test_Q1(self):
         """
         Checks that the first quartile of the stored data set is returned
@@ -906,6 +1047,8 @@ class Test_Statistics2D(unittest.TestCase):
                                 ('Pearson', (int, float)),
                                 ('Spearman', (int, float)),
                                 ('Kendall', (int, float)),
+                                ('CovMatrix', tuple),
+                                ('PearsonMatrix', tuple),
                                 ('Summary', str),
                                 ('X', test_module.Statistics1D),
                                 ('Y', test_module.Statistics1D))
@@ -1210,6 +1353,295 @@ class Test_Statistics2D(unittest.TestCase):
             self.assertIsInstance(TestResult, (int, float))
             self.assertEqual(TestResult, Check)
             del objTest
+    
+    def test_CovMatrix(self):
+        """
+        Checks that the covariance matrix of the stored data set is returned
+        properly.
+        
+        Tests ID: TEST-T-324
+        Requirements ID: REQ-FUN-322
+
+        Version 1.0.1.0
+        """
+        for DataX, DataY in [(self.AllIntX, self.AllIntY),
+                                (self.AllFloatX, self.AllFloatY),
+                                (self.MixedX, self.MixedY),
+                                (self.IntErrX, self.IntErrY),
+                                (self.FloatErrX, self.FloatErrY),
+                                (self.MixedErrX, self.MixedErrY),
+                                (self.TotalMixedX, self.TotalMixedY)]:
+            objTest = self.TestClass(DataX, DataY)
+            TestResult = objTest.CovMatrix
+            Check = bf.GetCovarianceMatrix((DataX, DataY))
+            self.assertIsInstance(TestResult, tuple)
+            self.assertTupleEqual(TestResult, Check)
+            self.assertAlmostEqual(TestResult[0][0], objTest.X.Var)
+            self.assertAlmostEqual(TestResult[1][1], objTest.Y.Var)
+            self.assertAlmostEqual(TestResult[0][1], objTest.Cov)
+            if DataX is self.AllIntX: #exact integer arithmetics
+                self.assertEqual(TestResult[0][1], objTest.Cov)
+            #check the repetitive call!
+            TestResult = objTest.CovMatrix
+            self.assertTupleEqual(TestResult, Check)
+            del objTest
+    
+    def test_PearsonMatrix(self):
+        """
+        Checks that the matrix of the Pearson's correlation coefficients of the
+        stored data set is returned properly.
+        
+        Tests ID: TEST-T-324
+        Requirements ID: REQ-FUN-322
+
+        Version 1.0.1.0
+        """
+        for DataX, DataY in [(self.AllIntX, self.AllIntY),
+                                (self.AllFloatX, self.AllFloatY),
+                                (self.MixedX, self.MixedY),
+                                (self.IntErrX, self.IntErrY),
+                                (self.FloatErrX, self.FloatErrY),
+                                (self.MixedErrX, self.MixedErrY),
+                                (self.TotalMixedX, self.TotalMixedY)]:
+            objTest = self.TestClass(DataX, DataY)
+            TestResult = objTest.PearsonMatrix
+            Check = bf.GetPearsonMatrix((DataX, DataY))
+            self.assertIsInstance(TestResult, tuple)
+            self.assertTupleEqual(TestResult, Check)
+            self.assertEqual(TestResult[0][0], 1)
+            self.assertEqual(TestResult[1][1], 1)
+            self.assertAlmostEqual(TestResult[0][1], objTest.Pearson)
+            if DataX is self.AllIntX: #exact integer arithmetics
+                self.assertEqual(TestResult[0][1], objTest.Pearson)
+            #check the repetitive call!
+            TestResult = objTest.PearsonMatrix
+            self.assertTupleEqual(TestResult, Check)
+            del objTest
+    
+    def test_getCrossCorrelation(self):
+        """
+        Checks that the lagged cross-correlation of the stored data set is
+        calculated properly, and the improper maximum lag is rejected.
+        
+        Tests ID: TEST-T-326
+        Requirements ID: REQ-FUN-325
+
+        Version 1.0.0.0
+        """
+        for DataX, DataY in [(self.AllIntX, self.AllIntY),
+                                (self.AllFloatX, self.AllFloatY),
+                                (self.MixedErrX, self.MixedErrY),
+                                (self.TotalMixedX, self.TotalMixedY)]:
+            objTest = self.TestClass(DataX, DataY)
+            MaxLag = random.randrange(objTest.N)
+            TestResult = objTest.getCrossCorrelation(MaxLag)
+            Check = bf.GetCrossCorrelation(DataX, DataY, MaxLag)
+            self.assertIsInstance(TestResult, tuple)
+            self.assertEqual(len(TestResult), MaxLag + 1)
+            for Value, Expected in zip(TestResult, Check):
+                self.assertAlmostEqual(Value, Expected)
+            self.assertAlmostEqual(TestResult[0], objTest.Pearson)
+            for Value in (1.0, '1', None):
+                with self.assertRaises(TypeError):
+                    objTest.getCrossCorrelation(Value)
+            for Value in (-1, objTest.N):
+                with self.assertRaises(ValueError):
+                    objTest.getCrossCorrelation(Value)
+            del objTest
+
+class Test_StreamStatistics1D(unittest.TestCase):
+    """
+    Unit-test class implementing testing of the class StreamStatistics1D() from
+    the module statistics_lib.data_classes.
+
+    Implements tests: TEST-T-330, TEST-T-331, TEST-T-332
+    Covers the requirements: REQ-FUN-330, REQ-FUN-331, REQ-AWM-330
+
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+
+        Version 1.0.0.0
+        """
+        cls.TestClass = test_module.StreamStatistics1D
+        cls.AllInt = [random.randint(-100, 100)
+                                    for _ in range(random.randrange(5, 100))]
+        cls.AllFloat = [random.uniform(-10.0, 10.0)
+                                    for _ in range(random.randrange(5, 100))]
+        cls.MixedErr = [MeasuredValue(Value, random.uniform(0.0, 3.0))
+                                                    for Value in cls.AllFloat]
+        cls.TotalMixed = [Item if random.random() >= 0.6 else Item.Value
+                                                    for Item in cls.MixedErr]
+        cls.BadCases = [1, 2.0, 'asd', [1, '1'], ('b', 2.0), int, float,
+                        {'a':1, 'b':2}, iter([1, [2, 'a']])]
+        cls.Properties = (('N', int), ('Mean', (int, float)),
+                                ('Var', (int, float)), ('Sigma', (int, float)),
+                                ('SE', (int, float)), ('FullVar', (int, float)),
+                                ('FullSigma', (int, float)),
+                                ('FullSE', (int, float)),
+                                ('Skew', (int, float)), ('Kurt', (int, float)),
+                                ('Summary', str))
+        cls.Checks = (('Mean', bf.GetMean), ('Var', bf.GetVarianceP),
+                        ('Sigma', bf.GetStdevP), ('SE', bf.GetSE),
+                        ('FullSE', bf.GetFullSE), ('Skew', bf.GetSkewnessP),
+                        ('Kurt', bf.GetKurtosisP))
+    
+    def test_InitTypeError(self):
+        """
+        Checks that sub-class of TypeError exception is raised with improper
+        argument of the initialization method.
+        
+        Tests ID: TEST-T-331
+        Requirements ID: REQ-AWM-330
+
+        Version 1.0.0.0
+        """
+        for Item in self.BadCases:
+            with self.assertRaises(TypeError):
+                self.TestClass(Item)
+        with self.assertRaises(TypeError):
+            self.TestClass(iter(self.AllInt), ChunkSize = 1.0)
+    
+    def test_InitValueError(self):
+        """
+        Checks that sub-class of ValueError exception is raised if the class is
+        instantiated with an empty iterable.
+        
+        Tests ID: TEST-T-331
+        Requirements ID: REQ-AWM-330
+
+        Version 1.0.0.0
+        """
+        for Item in ([], tuple(), iter([]), (Item for Item in [[], []])):
+            with self.assertRaises(ValueError):
+                self.TestClass(Item)
+        with self.assertRaises(ValueError):
+            self.TestClass(iter(self.AllInt), ChunkSize = 0)
+    
+    def test_AttributeError(self):
+        """
+        Checks that it is not possible to delete properties, or to assign to
+        read-only properties.
+
+        Tests ID: TEST-T-331
+        Requirements ID: REQ-AWM-330
+
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass(iter(self.AllFloat))
+        for Attr, _ in self.Properties:
+            with self.assertRaises(AttributeError):
+                setattr(objTest, Attr, 1)
+            with self.assertRaises(AttributeError):
+                delattr(objTest, Attr)
+        with self.assertRaises(AttributeError):
+            del objTest.Name
+    
+    def test_Properties(self):
+        """
+        Checks that the statistical properties of a data set consumed from an
+        iterator are the same as computed by the respective functions on the
+        stored data.
+
+        Tests ID: TEST-T-330
+        Requirements ID: REQ-FUN-330
+
+        Version 1.0.0.0
+        """
+        for Input in [self.AllInt, self.AllFloat, self.MixedErr,
+                                                            self.TotalMixed]:
+            for ChunkSize in (None, 1, 3):
+                objTest = self.TestClass((Item for Item in Input),
+                                                        ChunkSize = ChunkSize)
+                for Attr, DataType in self.Properties:
+                    self.assertIsInstance(getattr(objTest, Attr), DataType)
+                self.assertEqual(objTest.N, len(Input))
+                for Attr, Function in self.Checks:
+                    self.assertAlmostEqual(getattr(objTest, Attr),
+                                                Function(Input),
+                                                places = FLOAT_CHECK_PRECISION)
+                Check = bf.GetVarianceP(Input) + bf.GetMeanSqrSE(Input)
+                self.assertAlmostEqual(objTest.FullVar, Check,
+                                                places = FLOAT_CHECK_PRECISION)
+                self.assertAlmostEqual(objTest.FullSigma, math.sqrt(Check),
+                                                places = FLOAT_CHECK_PRECISION)
+                self.assertIsNone(objTest.Name)
+                objTest.Name = 1
+                self.assertEqual(objTest.Name, '1')
+                self.assertIn('StreamStatistics1D', repr(objTest))
+                del objTest
+        Blocks = [self.AllFloat[:4], self.AllFloat[4]]
+        Blocks.append(tuple(self.AllFloat[5:]))
+        objTest = self.TestClass(iter(Blocks))
+        self.assertEqual(objTest.N, len(self.AllFloat))
+        self.assertAlmostEqual(objTest.Var, bf.GetVarianceP(self.AllFloat),
+                                                places = FLOAT_CHECK_PRECISION)
+    
+    def test_Sketch(self):
+        """
+        Checks that the order statistics of a data set consumed from an
+        iterator with the quantile sketch are the same as computed by the
+        respective functions on the stored data (shorter than the sketch size),
+        and that they are not available without the sketch.
+
+        Tests ID: TEST-T-332
+        Requirements ID: REQ-FUN-331
+
+        Version 1.0.0.0
+        """
+        Checks = (('Median', of.GetMedian), ('Q1', of.GetFirstQuartile),
+                    ('Q3', of.GetThirdQuartile), ('Min', of.GetMin),
+                    ('Max', of.GetMax))
+        for Input in [self.AllInt, self.AllFloat, self.MixedErr,
+                                                            self.TotalMixed]:
+            for ChunkSize in (None, 1, 3):
+                objTest = self.TestClass((Item for Item in Input),
+                                        ChunkSize = ChunkSize, SketchSize = 200)
+                self.assertIsInstance(objTest.Sketch, of.QuantileSketch)
+                self.assertEqual(objTest.Sketch.N, len(Input))
+                for Attr, Function in Checks:
+                    self.assertEqual(getattr(objTest, Attr), Function(Input))
+                self.assertEqual(objTest.getQuantile(1, 10),
+                                                of.GetQuantile(Input, 1, 10))
+                self.assertEqual(objTest.getQuantiles(100),
+                                                of.GetQuantiles(Input, 100))
+                self.assertIn('Median', objTest.Summary)
+                del objTest
+        Blocks = [self.AllFloat[:4], self.AllFloat[4]]
+        Blocks.append(tuple(self.AllFloat[5:]))
+        objTest = self.TestClass(iter(Blocks), SketchSize = 8)
+        self.assertEqual(objTest.Sketch.N, len(self.AllFloat))
+        self.assertEqual(objTest.Max, max(self.AllFloat))
+        Data = [random.gauss(0.0, 1.0) for _ in range(20000)]
+        objTest = self.TestClass(iter(Data), SketchSize = 100)
+        Sketch = objTest.Sketch
+        self.assertLess(Sketch.Size, 400)
+        self.assertAlmostEqual(Sketch.getCDF(objTest.Median), 0.5,
+                                                    delta = Sketch.RankError)
+        objTest = self.TestClass(iter(self.AllFloat))
+        self.assertIsNone(objTest.Sketch)
+        self.assertNotIn('Median', objTest.Summary)
+        for Attr, _ in Checks:
+            with self.assertRaises(ValueError):
+                getattr(objTest, Attr)
+        with self.assertRaises(ValueError):
+            objTest.getQuantile(1, 4)
+        with self.assertRaises(ValueError):
+            objTest.getQuantiles(4)
+        with self.assertRaises(TypeError):
+            self.TestClass(iter(self.AllFloat), SketchSize = 200.0)
+        with self.assertRaises(ValueError):
+            self.TestClass(iter(self.AllFloat), SketchSize = 4)
+        with self.assertRaises(ValueError):
+            self.TestClass(iter([1.0, math.nan]), SketchSize = 200)
+        for Item in self.BadCases:
+            if not isinstance(Item, c_abc.Iterator): #may be already consumed
+                with self.assertRaises(TypeError):
+                    self.TestClass(Item, SketchSize = 200)
 
 #+ test suites
 
@@ -1217,8 +1649,11 @@ TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Statistics1D)
 
 TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_Statistics2D)
 
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_StreamStatistics1D)
+
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1, TestSuite2])
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3])
 
 if __name__ == "__main__":
     sys.stdout.write(
@@ -16,64 +16,209 @@ have 'S' suffix in their names. The generic moments, standard error, covariance
 and correlation functions assume that the passed data represent the entire
 population.
 
+The variance, skewness, kurtosis and the central moments up to the 4th order
+are derived from a single pass calculation of the length, mean and the sums of
+the 2nd, 3rd and 4th powers of the deviations from the mean (Welford /
+Terriberry on-line update), thus computing of all of them for the same data
+requires only one pass. The variance, standard deviation and error alone are
+calculated by the same single pass update truncated at the 2nd order. The
+generic central (normalized) moments of the higher orders require two passes:
+the first one for the mean (and variance), and the second one for the sums of
+the powers of the deviations from the mean.
+
+If NumPy is installed, the moment-based functions also accept 1D numpy.ndarray,
+array.array and memoryview objects (any buffer of a numeric type). Such input
+is validated once (by the element type) instead of element by element, it is
+converted into a float64 array, and the statistics are calculated with the
+vectorized NumPy reductions. Without NumPy the array.array and memoryview
+objects are treated as any other sequence by the pure Python implementation.
+
+The class MomentAccumulator calculates the same statistics incrementally, and
+its instances filled with different parts of a data set can be merged exactly.
+The function GetStreamSummary() uses it to consume any iterable (generator) of
+the data points and / or blocks of data points once, in constant memory.
+
+The class CoMomentAccumulator does the same for the paired data, providing
+the covariance, Pearson's correlation coefficient and the ordinary least
+squares regression line of a stream of (X, Y) pairs in constant memory.
+
+The class EWAccumulator calculates the exponentially weighted moving mean,
+variance and standard error of a stream of data points in O(1) per update, with
+the weights decaying by the elapsed time.
+
+The rolling (moving window) statistics functions calculate the mean, variance,
+skewness and kurtosis of each window sliding over a sequence, updating the
+moments by removing one element and adding one element per step in O(1).
+
+The serial (lagged) statistics functions calculate the auto-covariance and
+auto-correlation of a sequence, and the cross-covariance and cross-correlation
+of two sequences, treated as time series, for all lags up to the specified
+maximum at once. Depending on the estimated cost, either the direct summation
+or the FFT based correlation is used (with NumPy, if it is installed), so the
+calculation for many lags costs O(N * log(N)) instead of O(N * MaxLag).
+
+The moment-based functions accept the keyword argument Workers. If it is an
+integer > 1, the data is split into chunks (at least MIN_CHUNK_LENGTH elements
+each), which are processed in parallel by a pool of the worker processes, and
+the partial sums / moments are merged exactly. Note that the worker processes
+are created per call, and the data chunks are copied into them.
+
+The missing values - None, NaN or a measurement with uncertainty with NaN (or
+None) value or NaN uncertainty - are treated according to the keyword argument
+Missing (a member of MissingPolicy enumeration) of the Get*() functions: they
+are either passed as they are (PROPAGATE, default - NaN propagates into the
+result, and None is rejected), excluded from the data (SKIP - for the paired
+and multivariate data the entire pair / set of values is excluded), or result
+in an exception (RAISE). A sequence of only real numbers without NaN is
+recognized by a single (fast, built-in) summation, so the policy does not
+require an additional element by element pass for the clean data.
+
+Classes:
+    MissingPolicy
+    MomentAccumulator
+    EWAccumulator
+    CoMomentAccumulator
+
 Functions:
-    GetMean(Data, *, SkipFrames = 1, DoCheck = True)
+    GetMean(Data, *, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetVarianceP(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    GetVarianceP(Data, *, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetStdevP(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    GetStdevP(Data, *, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetVarianceS(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    GetVarianceS(Data, *, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetStdevS(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    GetStdevS(Data, *, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetSE(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    GetSE(Data, *, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetMeanSqrSE(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    GetMeanSqrSE(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetFullSE(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, MissingPolicy/ -> int OR float
+    GetFullSE(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+            bool, MissingPolicy/ -> int OR float
     GetMoment(Data, Power, *, IsCentral = False, IsNormalized = False,
-                                                SkipFrames = 1, DoCheck = True)
+                                SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int > 0/,
-            *, bool, bool, int > 0, bool/ -> int OR float
-    GetSkewnessP(Data, *, SkipFrames = 1, DoCheck = True)
+            *, bool, bool, int > 0, bool, int > 0 OR None, MissingPolicy/
+                -> int OR float
+    GetMoments(Data, Powers = (1, 2, 3, 4), *, IsCentral = False,
+                IsNormalized = False, SkipFrames = 1, DoCheck = True,
+                    Workers = None, Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            seq(int > 0), *, bool, bool, int > 0, bool, int > 0 OR None,
+                MissingPolicy/ -> dict(int > 0 -> int OR float)
+    GetSkewnessP(Data, *, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetSkewnessS(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    GetSkewnessS(Data, *, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetKurtosisP(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    GetKurtosisP(Data, *, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetKurtosisS(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    GetKurtosisS(Data, *, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetCovariance(DataX, DataY, *, SkipFrames = 1, DoCheck = True)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    GetCovariance(DataX, DataY, *, SkipFrames = 1, DoCheck = True,
+                                                                Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
             seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
-                *, int > 0, bool/ -> int OR float
+                *, int > 0, bool, int > 0 OR None, MissingPolicy/
+                    -> int OR float
     GetMoment2(DataX, DataY, PowerX, PowerY, *, IsCentral = False,
-                        IsNormalized = False, SkipFrames = 1, DoCheck = True)
+        IsNormalized = False, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+                int > 0, int > 0/, *, bool, bool, int > 0, bool,
+                    int > 0 OR None, MissingPolicy/ -> int OR float
+    GetMoments2(DataX, DataY, MaxPowerX, MaxPowerY, *, IsCentral = False,
+                IsNormalized = False, SkipFrames = 1, DoCheck = True,
+                    Workers = None, Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
             seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
-                int > 0, int > 0/, *, bool, bool, int > 0, bool/ -> int OR float
-    GetPearsonR(DataX, DataY, *, SkipFrames = 1, DoCheck = True)
+                int > 0, int > 0/, *, bool, bool, int > 0, bool,
+                    int > 0 OR None, MissingPolicy/
+                        -> dict(tuple(int > 0, int > 0)
+                                                            -> int OR float)
+    GetPearsonR(DataX, DataY, *, SkipFrames = 1, DoCheck = True, Workers = None,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
             seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
-                *, int > 0, bool/ -> int OR float
+                *, int > 0, bool, int > 0 OR None, MissingPolicy/
+                    -> int OR float
+    GetCovarianceMatrix(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(seq(int OR float OR phyqus_lib.base_classes.MeasuredValue))/, *,
+            int > 0, bool, MissingPolicy/ -> tuple(tuple(int OR float))
+    GetPearsonMatrix(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(seq(int OR float OR phyqus_lib.base_classes.MeasuredValue))/, *,
+            int > 0, bool, MissingPolicy/ -> tuple(tuple(int OR float))
+    GetStreamSummary(Data, *, ChunkSize = None, SkipFrames = 1)
+        iterable(type A)/, *, int > 0 OR None, int > 0/ -> MomentAccumulator
+    GetRollingMean(Data, Window, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int > 0/,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
+    GetRollingVarianceP(Data, Window, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int > 0/,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
+    GetRollingSkewnessP(Data, Window, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int > 0/,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
+    GetRollingKurtosisP(Data, Window, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int > 0/,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
+    GetAutocovariance(Data, MaxLag, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int >= 0/,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
+    GetAutocorrelation(Data, MaxLag, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int >= 0/,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
+    GetCrossCovariance(DataX, DataY, MaxLag, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+                int >= 0/, *, int > 0, bool, MissingPolicy/
+                    -> tuple(int OR float)
+    GetCrossCorrelation(DataX, DataY, MaxLag, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+                int >= 0/, *, int > 0, bool, MissingPolicy/
+                    -> tuple(int OR float)
 """
 
-__version__= '1.0.1.0'
-__date__ = '01-05-2023'
+__version__= '1.16.0.14'
+__date__ = '17-10-2026'
 __status__ = 'Production'
 
 #imports
@@ -83,9 +228,18 @@ __status__ = 'Production'
 import sys
 import os
 import math
+import cmath
+import array
+import itertools
+import functools
+import operator
 import collections.abc as c_abc
 
-from typing import Any, Sequence, Union, List
+from concurrent.futures import ProcessPoolExecutor
+
+from enum import Enum
+
+from typing import Any, Sequence, Union, List, Tuple, Dict, Optional, Callable
 
 #+ custom modules
 
@@ -102,6 +256,25 @@ from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
 
 from phyqus_lib.base_classes import MeasuredValue
 
+#+ optional dependencies
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+#globals
+
+MIN_CHUNK_LENGTH = 100000 #minimal data length per worker process
+
+STREAM_CHUNK_LENGTH = 10000 #number of the single values per streamed batch
+
+_REAL_TYPES = frozenset((int, float)) #types of a homogeneous sequence of reals
+
+_INTEGER_TYPES = frozenset((int, )) #types of an exact integer sequence
+
+FFT_COST_FACTOR = 16 #FFT cost per element and level relative to one product
+
 #types
 
 TGenericSequence = Sequence[Any]
@@ -110,77 +283,4120 @@ TReal = Union[int, float]
 
 TRealList = List[TReal]
 
-#functions
+TRealSequence = Sequence[TReal]
 
-#+ helper functions - not for usage outside the module
+TRealData = Union[TRealSequence, Any] #including 1D numpy.ndarray of float64
 
-def _CheckPositiveInteger(Value: Any) -> None:
+TRealMatrix = Tuple[Tuple[TReal, ...], ...]
+
+#classes
+
+#+ helper classes - not for usage outside the library
+
+class _MomentsSummary:
     """
-    Raises an exception if the passed argument is not a positive integer.
+    Helper class to store the result of the single pass calculation of the
+    central moments of a sequence of real numbers, i.e. the number of elements,
+    their arithmetic mean and the sums of the 2nd, 3rd and 4th powers of the
+    deviations from the mean. All moment-based 1D statistics are derived from
+    these values. The end-user is not supposed to instantiate this class
+    manually, but only to receive such an instance from the helper function
+    _GetMomentsSummary().
 
-    Signature:
-        type A -> None
+    Properties:
+        N: (read-only) int >= 0; number of the data points
+        Mean: (read-only) int OR float; the arithmetic mean
+        M2: (read-only) int >= 0 OR float >= 0; the sum of the squared
+            deviations from the mean
+        M3: (read-only) int OR float; the sum of the cubed deviations from the
+            mean
+        M4: (read-only) int >= 0 OR float >= 0; the sum of the 4th powers of
+            the deviations from the mean
+        Var: (read-only) int >= 0 OR float >= 0; the population variance
+        VarS: (read-only) int >= 0 OR float >= 0; the sample variance
+        Sigma: (read-only) int >= 0 OR float >= 0; the population standard
+            deviation
+        SE: (read-only) int >= 0 OR float >= 0; the standard error of the mean
+        Skew: (read-only) int OR float; the population skewness
+        SkewS: (read-only) int OR float; the sample skewness
+        Kurt: (read-only) int OR float; the population excess kurtosis
+        KurtS: (read-only) int OR float; the sample excess kurtosis
     
-    Raises:
-        UT_TypeError: the passed argument is not an integer
-        UT_ValueError: the passed argument is an integer but not positive
+    Methods:
+        getCentralMoment(Power, *, IsNormalized = False)
+            int 0 < Power < 5/, *, bool/ -> int OR float
+    
+    Version 1.1.0.0
+    """
+
+    #special methods
+
+    def __init__(self, N: int, Mean: TReal, M2: TReal, M3: TReal,
+                                                            M4: TReal) -> None:
+        """
+        Initialization method. Stores the passed values without any checks.
+
+        Signature:
+            int >= 0, int OR float, int >= 0 OR float >= 0, int OR float,
+                int >= 0 OR float >= 0 -> None
+        
+        Version 1.0.0.0
+        """
+        self._N = N
+        self._Mean = Mean
+        self._M2 = M2
+        self._M3 = M3
+        self._M4 = M4
+    
+    #private methods
+
+    def _checkNotEmpty(self) -> None:
+        """
+        Raises an exception if there are no data points.
+
+        Signature:
+            None -> None
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        if not self._N:
+            raise UT_ValueError(self._N, '> 0 - number of data points',
+                                                                SkipFrames = 2)
+    
+    #public API
+
+    #+ properties
+
+    @property
+    def N(self) -> int:
+        """
+        Read-only property returning the number of the data points.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._N
+    
+    @property
+    def Mean(self) -> TReal:
+        """
+        Read-only property returning the arithmetic mean.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.1.0.0
+        """
+        self._checkNotEmpty()
+        return self._Mean
+    
+    @property
+    def M2(self) -> TReal:
+        """
+        Read-only property returning the sum of the squared deviations from the
+        mean.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._M2
+    
+    @property
+    def M3(self) -> TReal:
+        """
+        Read-only property returning the sum of the cubed deviations from the
+        mean.
+
+        Signature:
+            None -> int OR float
+        
+        Version 1.0.0.0
+        """
+        return self._M3
+    
+    @property
+    def M4(self) -> TReal:
+        """
+        Read-only property returning the sum of the 4th powers of the
+        deviations from the mean.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._M4
+    
+    @property
+    def Var(self) -> TReal:
+        """
+        Read-only property returning the population variance.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.1.0.0
+        """
+        self._checkNotEmpty()
+        return self._M2 / self._N
+    
+    @property
+    def VarS(self) -> TReal:
+        """
+        Read-only property returning the sample variance.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: less than 2 data points
+        
+        Version 1.0.0.0
+        """
+        if self._N < 2:
+            raise UT_ValueError(self._N, '> 1 - sequence length',
+                                                                SkipFrames = 1)
+        return self._M2 / (self._N - 1)
+    
+    @property
+    def Sigma(self) -> TReal:
+        """
+        Read-only property returning the population standard deviation.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.1.0.0
+        """
+        self._checkNotEmpty()
+        return math.sqrt(self._M2 / self._N)
+    
+    @property
+    def SE(self) -> TReal:
+        """
+        Read-only property returning the standard error of the mean.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.1.0.0
+        """
+        self._checkNotEmpty()
+        return math.sqrt(self._M2) / self._N
+    
+    @property
+    def Skew(self) -> TReal:
+        """
+        Read-only property returning the population skewness, which is zero
+        for a constant sequence, and NaN if the data contains NaN.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.2.0.0
+        """
+        self._checkNotEmpty()
+        if self._M2 > 0:
+            Result = math.sqrt(self._N) * self._M3 / pow(self._M2, 1.5)
+        elif self._M2 != self._M2: #NaN propagates
+            Result = math.nan
+        else:
+            Result = 0
+        return Result
+    
+    @property
+    def SkewS(self) -> TReal:
+        """
+        Read-only property returning the sample skewness.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: less than 3 data points
+        
+        Version 1.0.0.0
+        """
+        Length = self._N
+        if Length < 3:
+            raise UT_ValueError(Length, '> 2 - sequence length', SkipFrames = 1)
+        return math.sqrt(Length * (Length - 1)) * self.Skew / (Length - 2)
+    
+    @property
+    def Kurt(self) -> TReal:
+        """
+        Read-only property returning the population excess kurtosis, which is
+        -3 for a constant sequence, and NaN if the data contains NaN.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.2.0.0
+        """
+        self._checkNotEmpty()
+        if self._M2 > 0:
+            Result = self._N * self._M4 / (self._M2 * self._M2) - 3
+        elif self._M2 != self._M2: #NaN propagates
+            Result = math.nan
+        else:
+            Result = -3
+        return Result
+    
+    @property
+    def KurtS(self) -> TReal:
+        """
+        Read-only property returning the sample excess kurtosis.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: less than 4 data points
+        
+        Version 1.0.0.0
+        """
+        Length = self._N
+        if Length < 4:
+            raise UT_ValueError(Length, '> 3 - sequence length', SkipFrames = 1)
+        Temp = (Length - 1) * ((Length + 1) * self.Kurt  + 6)
+        return Temp / ((Length - 2) * (Length - 3))
+    
+    #+ methods
+
+    def getCentralMoment(self, Power: int, *,
+                                        IsNormalized: bool = False) -> TReal:
+        """
+        Returns the central moment of the order 1 to 4, normalized or not. The
+        normalized moments of a constant sequence are zeroes. The power is not
+        checked.
+
+        Signature:
+            int 0 < Power < 5/, *, bool/ -> int OR float
+        
+        Args:
+            Power: int 0 < Power < 5; the moment power
+            IsNormalized: (keyword) bool; is the normalized moment is to be
+                calculated, defaults to False
+        
+        Returns:
+            int OR float: the calculated moment value
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.1.0.0
+        """
+        self._checkNotEmpty()
+        if Power == 1:
+            Result = 0
+        else:
+            Sum = (self._M2, self._M3, self._M4)[Power - 2]
+            if not IsNormalized:
+                Result = Sum / self._N
+            elif self._M2 > 0:
+                Result = Sum / (self._N * pow(self._M2 / self._N, Power / 2))
+            else:
+                Result = 0
+        return Result
+
+class _ExactMomentsSummary(_MomentsSummary):
+    """
+    Helper class to store the result of the calculation of the central moments
+    of a sequence of only integer numbers from the exact (integer) sums of the
+    1st to 4th powers of the elements. The variance, standard deviation and
+    error of the mean, skewness and kurtosis are calculated from the exact
+    integer numerators with a single division, i.e. they are correctly rounded.
+    The end-user is not supposed to instantiate this class manually, but only
+    to receive such an instance from the helper function _GetMomentsSummary().
+
+    Properties:
+        N: (read-only) int > 0; number of the data points
+        Mean: (read-only) int OR float; the arithmetic mean
+        M2: (read-only) int >= 0 OR float >= 0; the sum of the squared
+            deviations from the mean
+        M3: (read-only) int OR float; the sum of the cubed deviations from the
+            mean
+        M4: (read-only) int >= 0 OR float >= 0; the sum of the 4th powers of
+            the deviations from the mean
+        Var: (read-only) int >= 0 OR float >= 0; the population variance
+        VarS: (read-only) int >= 0 OR float >= 0; the sample variance
+        Sigma: (read-only) int >= 0 OR float >= 0; the population standard
+            deviation
+        SE: (read-only) int >= 0 OR float >= 0; the standard error of the mean
+        Skew: (read-only) int OR float; the population skewness
+        SkewS: (read-only) int OR float; the sample skewness
+        Kurt: (read-only) int OR float; the population excess kurtosis
+        KurtS: (read-only) int OR float; the sample excess kurtosis
+    
+    Methods:
+        getCentralMoment(Power, *, IsNormalized = False)
+            int 0 < Power < 5/, *, bool/ -> int OR float
+    
+    Version 1.0.0.0
+    """
+
+    #special methods
+
+    def __init__(self, N: int, Sum1: int, Sum2: int, Sum3: int,
+                                                        Sum4: int) -> None:
+        """
+        Initialization method. Calculates the exact integer numerators of the
+        central moments sums, i.e. N * M2, N^2 * M3 and N^3 * M4.
+
+        Signature:
+            int > 0, int, int >= 0, int, int >= 0 -> None
+        
+        Args:
+            N: int > 0; number of the data points
+            Sum1: int; the sum of the elements
+            Sum2: int >= 0; the sum of the squared elements
+            Sum3: int; the sum of the cubed elements
+            Sum4: int >= 0; the sum of the 4th powers of the elements
+        
+        Version 1.0.0.0
+        """
+        Square = Sum1 * Sum1
+        self._D2 = N * Sum2 - Square
+        self._D3 = N * (N * Sum3 - 3 * Sum1 * Sum2) + 2 * Square * Sum1
+        self._D4 = (N * (N * (N * Sum4 - 4 * Sum1 * Sum3) + 6 * Square * Sum2)
+                                                        - 3 * Square * Square)
+        super().__init__(N, Sum1 / N, self._D2 / N, self._D3 / (N * N),
+                                                        self._D4 / (N * N * N))
+    
+    #public API
+
+    #+ properties
+
+    @property
+    def Var(self) -> TReal:
+        """
+        Read-only property returning the population variance.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._D2 / (self._N * self._N)
+    
+    @property
+    def VarS(self) -> TReal:
+        """
+        Read-only property returning the sample variance.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: less than 2 data points
+        
+        Version 1.0.0.0
+        """
+        if self._N < 2:
+            raise UT_ValueError(self._N, '> 1 - sequence length',
+                                                                SkipFrames = 1)
+        return self._D2 / (self._N * (self._N - 1))
+    
+    @property
+    def Sigma(self) -> TReal:
+        """
+        Read-only property returning the population standard deviation.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return math.sqrt(self._D2 / (self._N * self._N))
+    
+    @property
+    def SE(self) -> TReal:
+        """
+        Read-only property returning the standard error of the mean.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return math.sqrt(self._D2 / (self._N * self._N * self._N))
+    
+    @property
+    def Skew(self) -> TReal:
+        """
+        Read-only property returning the population skewness.
+
+        Signature:
+            None -> int OR float
+        
+        Version 1.0.0.0
+        """
+        if self._D2 > 0:
+            Result = self._D3 / pow(self._D2, 1.5)
+        else:
+            Result = 0
+        return Result
+    
+    @property
+    def Kurt(self) -> TReal:
+        """
+        Read-only property returning the population excess kurtosis.
+
+        Signature:
+            None -> int OR float
+        
+        Version 1.0.0.0
+        """
+        if self._D2 > 0:
+            Result = self._D4 / (self._D2 * self._D2) - 3
+        else:
+            Result = -3
+        return Result
+
+class _IntegerList(list):
+    """
+    Helper class marking a list of only integer numbers (not bool), as detected
+    by the data extraction, so the moment-based statistics can be calculated
+    using the exact integer arithmetics. It is a plain list in all other
+    respects.
+
+    Version 1.0.0.0
+    """
+    
+    pass
+
+#+ public classes
+
+class MissingPolicy(Enum):
+    """
+    Enumeration class for the selection of the treatment of the missing values
+    - None, NaN or a measurement with uncertainty having NaN (or None) value or
+    NaN uncertainty - in the input data of the functions:
+
+    * PROPAGATE - no special treatment, i.e. NaN propagates into the result,
+        and None is not acceptable as a not real number (default behaviour)
+    * SKIP - the missing values are excluded from the data; for the paired /
+        multivariate data the entire pair / set of values is excluded
+    * RAISE - a missing value results in an exception (sub-class of
+        ValueError)
+    
+    Version 1.0.0.0
+    """
+    PROPAGATE = 'propagate'
+    SKIP = 'skip'
+    RAISE = 'raise'
+
+class MomentAccumulator(_MomentsSummary):
+    """
+    Mergeable accumulator of the moment-based 1D statistics. The data points -
+    real numbers and / or measurements with uncertainty - can be added one by
+    one or as sequences, and two accumulators (e.g. filled with separate files
+    or in separate processes) can be merged exactly using the pairwise update
+    formulas by Chan et al. Thus, the statistics of a partitioned data set are
+    calculated without the need to concatenate the partitions.
+
+    Properties:
+        N: (read-only) int >= 0; number of the data points
+        Mean: (read-only) int OR float; the arithmetic mean
+        M2: (read-only) int >= 0 OR float >= 0; the sum of the squared
+            deviations from the mean
+        M3: (read-only) int OR float; the sum of the cubed deviations from the
+            mean
+        M4: (read-only) int >= 0 OR float >= 0; the sum of the 4th powers of
+            the deviations from the mean
+        Var: (read-only) int >= 0 OR float >= 0; the population variance
+        VarS: (read-only) int >= 0 OR float >= 0; the sample variance
+        Sigma: (read-only) int >= 0 OR float >= 0; the population standard
+            deviation
+        SE: (read-only) int >= 0 OR float >= 0; the standard error of the mean
+        Skew: (read-only) int OR float; the population skewness
+        SkewS: (read-only) int OR float; the sample skewness
+        Kurt: (read-only) int OR float; the population excess kurtosis
+        KurtS: (read-only) int OR float; the sample excess kurtosis
+        MeanSqrSE: (read-only) int >= 0 OR float >= 0; the mean of the squared
+            measurement uncertainties
+        FullVar: (read-only) int >= 0 OR float >= 0; the full variance,
+            including the contribution of the measurement uncertainties
+        FullSigma: (read-only) int >= 0 OR float >= 0; the full standard
+            deviation, including the contribution of the measurement
+            uncertainties
+        FullSE: (read-only) int >= 0 OR float >= 0; the full standard error of
+            the mean, including the contribution of the measurement
+            uncertainties
+    
+    Methods:
+        update(Value)
+            int OR float OR phyqus_lib.base_classes.MeasuredValue -> None
+        updateMany(Data)
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) -> None
+        updateStream(Data, *, ChunkSize = None)
+            iterable(type A)/, *, int > 0 OR None/ -> None
+        merge(Other)
+            MomentAccumulator -> None
+        getCentralMoment(Power, *, IsNormalized = False)
+            int 0 < Power < 5/, *, bool/ -> int OR float
+    
+    Version 1.1.0.0
+    """
+
+    #special methods
+
+    def __init__(self) -> None:
+        """
+        Initialization method. Creates an empty accumulator.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        super().__init__(0, 0, 0, 0, 0)
+        self._SqrSE = 0
+    
+    #private methods
+
+    def _combine(self, N: int, Mean: TReal, M2: TReal, M3: TReal, M4: TReal,
+                                                        SqrSE: TReal) -> None:
+        """
+        Merges the summary of another (not empty) set of data points into the
+        accumulated values using the pairwise update formulas by Chan et al.
+
+        Signature:
+            int > 0, int OR float, int >= 0 OR float >= 0, int OR float,
+                int >= 0 OR float >= 0, int >= 0 OR float >= 0 -> None
+        
+        Args:
+            N: int > 0; number of the data points to be merged
+            Mean: int OR float; their mean
+            M2: int >= 0 OR float >= 0; their sum of the squared deviations
+            M3: int OR float; their sum of the cubed deviations
+            M4: int >= 0 OR float >= 0; their sum of the 4th powers of the
+                deviations
+            SqrSE: int >= 0 OR float >= 0; their sum of the squared measurement
+                uncertainties
+        
+        Version 1.0.0.0
+        """
+        NA = self._N
+        if not NA:
+            self._N = N
+            self._Mean = Mean
+            self._M2 = M2
+            self._M3 = M3
+            self._M4 = M4
+            self._SqrSE = SqrSE
+            return
+        Total = NA + N
+        Delta = Mean - self._Mean
+        DeltaN = Delta / Total
+        DeltaN2 = DeltaN * DeltaN
+        Term = Delta * DeltaN * NA * N
+        M2A = self._M2
+        M3A = self._M3
+        self._M4 += (M4 + Term * DeltaN2 * (NA * NA - NA * N + N * N)
+                        + 6 * DeltaN2 * (NA * NA * M2 + N * N * M2A)
+                                            + 4 * DeltaN * (NA * M3 - N * M3A))
+        self._M3 += (M3 + Term * DeltaN * (NA - N)
+                                            + 3 * DeltaN * (NA * M2 - N * M2A))
+        self._M2 += M2 + Term
+        self._Mean += DeltaN * N
+        self._N = Total
+        self._SqrSE += SqrSE
+    
+    #public API
+
+    #+ properties
+
+    @property
+    def MeanSqrSE(self) -> TReal:
+        """
+        Read-only property returning the mean of the squared measurement
+        uncertainties, where the real numbers are treated as having zero
+        uncertainty.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._SqrSE / self._N
+    
+    @property
+    def FullVar(self) -> TReal:
+        """
+        Read-only property returning the full variance, including the
+        contribution of the measurement uncertainties.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return (self._M2 + self._SqrSE) / self._N
+    
+    @property
+    def FullSigma(self) -> TReal:
+        """
+        Read-only property returning the full standard deviation, including the
+        contribution of the measurement uncertainties.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return math.sqrt((self._M2 + self._SqrSE) / self._N)
+    
+    @property
+    def FullSE(self) -> TReal:
+        """
+        Read-only property returning the full standard error of the mean,
+        including the contribution of the measurement uncertainties.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return math.sqrt(self._M2 + self._SqrSE) / self._N
+    
+    #+ methods
+
+    def update(self, Value: Any) -> None:
+        """
+        Adds a single data point - a real number or a measurement with
+        uncertainty.
+
+        Signature:
+            int OR float OR phyqus_lib.base_classes.MeasuredValue -> None
+        
+        Args:
+            Value: int OR float OR phyqus_lib.base_classes.MeasuredValue; the
+                data point to be added
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a
+                measurement with uncertainty
+        
+        Version 1.0.0.0
+        """
+        if isinstance(Value, (int, float)):
+            self._combine(1, Value, 0, 0, 0, 0)
+        elif hasattr(Value, 'Value') and hasattr(Value, 'SE'):
+            self._combine(1, Value.Value, 0, 0, 0, Value.SE * Value.SE)
+        else:
+            raise UT_TypeError(Value, (int, float, MeasuredValue),
+                                                                SkipFrames = 1)
+    
+    def updateMany(self, Data: TGenericSequence) -> None:
+        """
+        Adds a sequence of real numbers and / or measurements with uncertainty,
+        or a 1D buffer of real numbers (see module description). The passed
+        data is summarized in a single pass and merged into the accumulated
+        values. An empty sequence is ignored.
+
+        Signature:
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) -> None
+        
+        Args:
+            Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) OR
+                numpy.ndarray OR array.array OR memoryview; the data points to
+                be added
+        
+        Raises:
+            UT_TypeError: the argument is not a sequence of real numbers or
+                measurements with uncertainty
+        
+        Version 1.0.1.0
+        """
+        if isinstance(Data, c_abc.Sized) and not len(Data):
+            return
+        _Data = _ExtractArray(Data, SkipFrames = 2)
+        SqrSE = 0
+        if _Data is None:
+            _Data, Errors = _ExtractData(Data, SkipFrames = 2)
+            if Errors is not None:
+                SqrSE = sum(Item * Item for Item in Errors)
+        Summary = _GetMomentsSummary(_Data)
+        self._combine(Summary.N, Summary.Mean, Summary.M2, Summary.M3,
+                                                        Summary.M4, SqrSE)
+    
+    def updateStream(self, Data: Any, *,
+                                    ChunkSize: Optional[int] = None) -> None:
+        """
+        Adds the data points from any iterable (e.g. a generator or a file
+        reader) consuming it only once, in constant memory. The iterable can
+        yield the single data points - real numbers and / or measurements with
+        uncertainty - which are collected into batches of ChunkSize elements,
+        and / or blocks of data points - sequences or 1D buffers of real numbers
+        - which are added as they are (see updateMany()). If an improper item is
+        encountered, the data points preceding it remain added.
+
+        Signature:
+            iterable(type A)/, *, int > 0 OR None/ -> None
+        
+        Args:
+            Data: iterable(int OR float OR
+                phyqus_lib.base_classes.MeasuredValue OR seq(int OR float OR
+                phyqus_lib.base_classes.MeasuredValue) OR numpy.ndarray OR
+                array.array OR memoryview); the data points or blocks of them
+            ChunkSize: (keyword) int > 0 OR None; the number of the single data
+                points per batch, defaults to None, i.e. STREAM_CHUNK_LENGTH
+                (module's global constant)
+        
+        Raises:
+            UT_TypeError: the argument is not an iterable of real numbers,
+                measurements with uncertainty or sequences of those, OR the
+                keyword argument is of improper type
+            UT_ValueError: the keyword argument is of the proper type but
+                unacceptable value
+        
+        Version 1.0.0.0
+        """
+        if ChunkSize is None:
+            ChunkSize = STREAM_CHUNK_LENGTH
+        else:
+            _CheckPositiveInteger(ChunkSize)
+        if ((not isinstance(Data, c_abc.Iterable))
+                                            or isinstance(Data, (str, bytes))):
+            raise UT_TypeError(Data, c_abc.Iterable, SkipFrames = 1)
+        Batch = []
+        for Item in Data:
+            IsBlock = _IsArray(Item) or isinstance(Item, c_abc.Sequence)
+            if (type(Item) in _REAL_TYPES) or (not IsBlock):
+                Batch.append(Item)
+                if len(Batch) >= ChunkSize:
+                    self.updateMany(Batch)
+                    Batch = []
+            else: #a block of the data points
+                if Batch:
+                    self.updateMany(Batch)
+                    Batch = []
+                self.updateMany(Item)
+        if Batch:
+            self.updateMany(Batch)
+    
+    def merge(self, Other: 'MomentAccumulator') -> None:
+        """
+        Merges the data points accumulated by another instance into this one.
+        The other instance is not changed.
+
+        Signature:
+            MomentAccumulator -> None
+        
+        Args:
+            Other: MomentAccumulator; another accumulator
+        
+        Raises:
+            UT_TypeError: the argument is not an instance of MomentAccumulator
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Other, MomentAccumulator):
+            raise UT_TypeError(Other, MomentAccumulator, SkipFrames = 1)
+        if Other.N:
+            self._combine(Other.N, Other.Mean, Other.M2, Other.M3, Other.M4,
+                                                                Other._SqrSE)
+
+class EWAccumulator:
+    """
+    Accumulator of the exponentially weighted moving mean, variance and
+    standard error of the mean of a stream of data points - real numbers and /
+    or measurements with uncertainty - updated per data point in O(1). The
+    weight of each data point decays by the factor of 2 per HalfLife of the
+    time elapsed since it was added. The time-stamps of the data points are
+    optional: without them each data point advances the time by 1, i.e. the
+    half-life is measured in the number of data points. The weighted sum of the
+    squared measurement uncertainties decays in the same way, thus the 'full'
+    variance and standard error are also available, as in MomentAccumulator.
+
+    The standard error of the mean is calculated using the effective number of
+    the data points (Kish), i.e. the squared sum of the weights divided by the
+    sum of their squares.
+
+    Properties:
+        HalfLife: (read-only) int > 0 OR float > 0; the half-life of the
+            weights of the data points
+        Time: (read-only) int OR float OR None; the time-stamp of the last added
+            data point, None if no data points are added yet
+        N: (read-only) int >= 0; the total number of the added data points
+        Weight: (read-only) int >= 0 OR float >= 0; the sum of the current
+            weights of the data points
+        EffectiveN: (read-only) int >= 0 OR float >= 0; the effective number of
+            the data points
+        Mean: (read-only) int OR float; the weighted mean
+        Var: (read-only) int >= 0 OR float >= 0; the weighted variance
+        Sigma: (read-only) int >= 0 OR float >= 0; the weighted standard
+            deviation
+        SE: (read-only) int >= 0 OR float >= 0; the standard error of the
+            weighted mean
+        MeanSqrSE: (read-only) int >= 0 OR float >= 0; the weighted mean of the
+            squared measurement uncertainties
+        FullVar: (read-only) int >= 0 OR float >= 0; the weighted full
+            variance, including the contribution of the measurement
+            uncertainties
+        FullSigma: (read-only) int >= 0 OR float >= 0; the weighted full
+            standard deviation, including the contribution of the measurement
+            uncertainties
+        FullSE: (read-only) int >= 0 OR float >= 0; the full standard error of
+            the weighted mean, including the contribution of the measurement
+            uncertainties
+    
+    Methods:
+        update(Value, *, Time = None)
+            int OR float OR phyqus_lib.base_classes.MeasuredValue/, *,
+                int OR float OR None/ -> None
+        snapshot()
+            None -> dict(str -> int OR float)
+    
+    Version 1.0.0.0
+    """
+
+    #special methods
+
+    def __init__(self, HalfLife: TReal) -> None:
+        """
+        Initialization method. Creates an empty accumulator.
+
+        Signature:
+            int > 0 OR float > 0 -> None
+        
+        Args:
+            HalfLife: int > 0 OR float > 0; the time, during which the weight of
+                a data point decays by the factor of 2
+        
+        Raises:
+            UT_TypeError: the argument is not a real number
+            UT_ValueError: the argument is not positive
+        
+        Version 1.0.0.0
+        """
+        if (not isinstance(HalfLife, (int, float))) or isinstance(HalfLife,
+                                                                        bool):
+            raise UT_TypeError(HalfLife, (int, float), SkipFrames = 1)
+        if not (0 < HalfLife < math.inf):
+            raise UT_ValueError(HalfLife, '> 0 - half-life', SkipFrames = 1)
+        self._HalfLife = HalfLife
+        self._Time = None
+        self._N = 0
+        self._Weight = 0
+        self._Weight2 = 0
+        self._Mean = 0
+        self._M2 = 0
+        self._SqrSE = 0
+    
+    #private methods
+
+    def _checkNotEmpty(self) -> None:
+        """
+        Raises an exception if there are no data points.
+
+        Signature:
+            None -> None
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        if not self._N:
+            raise UT_ValueError(0, '> 0 - number of data points',
+                                                                SkipFrames = 2)
+    
+    #public API
+
+    #+ properties
+
+    @property
+    def HalfLife(self) -> TReal:
+        """
+        Read-only property returning the half-life of the weights.
+
+        Signature:
+            None -> int > 0 OR float > 0
+        
+        Version 1.0.0.0
+        """
+        return self._HalfLife
+    
+    @property
+    def Time(self) -> Union[TReal, None]:
+        """
+        Read-only property returning the time-stamp of the last added data
+        point, or None if no data points are added yet.
+
+        Signature:
+            None -> int OR float OR None
+        
+        Version 1.0.0.0
+        """
+        return self._Time
+    
+    @property
+    def N(self) -> int:
+        """
+        Read-only property returning the total number of the added data points.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._N
+    
+    @property
+    def Weight(self) -> TReal:
+        """
+        Read-only property returning the sum of the current weights of the data
+        points, the weight of the last added one being 1.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Weight
+    
+    @property
+    def EffectiveN(self) -> TReal:
+        """
+        Read-only property returning the effective number of the data points,
+        i.e. the squared sum of the weights divided by the sum of their squares.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        if self._N:
+            Result = self._Weight * self._Weight / self._Weight2
+        else:
+            Result = 0
+        return Result
+    
+    @property
+    def Mean(self) -> TReal:
+        """
+        Read-only property returning the weighted mean.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._Mean
+    
+    @property
+    def Var(self) -> TReal:
+        """
+        Read-only property returning the weighted variance.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._M2 / self._Weight
+    
+    @property
+    def Sigma(self) -> TReal:
+        """
+        Read-only property returning the weighted standard deviation.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return math.sqrt(self._M2 / self._Weight)
+    
+    @property
+    def SE(self) -> TReal:
+        """
+        Read-only property returning the standard error of the weighted mean,
+        i.e. the weighted standard deviation divided by the square root of the
+        effective number of the data points.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return math.sqrt(self._M2 * self._Weight2 / self._Weight) / self._Weight
+    
+    @property
+    def MeanSqrSE(self) -> TReal:
+        """
+        Read-only property returning the weighted mean of the squared
+        measurement uncertainties, where the real numbers are treated as having
+        zero uncertainty.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._SqrSE / self._Weight
+    
+    @property
+    def FullVar(self) -> TReal:
+        """
+        Read-only property returning the weighted full variance, including the
+        contribution of the measurement uncertainties.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return (self._M2 + self._SqrSE) / self._Weight
+    
+    @property
+    def FullSigma(self) -> TReal:
+        """
+        Read-only property returning the weighted full standard deviation,
+        including the contribution of the measurement uncertainties.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return math.sqrt((self._M2 + self._SqrSE) / self._Weight)
+    
+    @property
+    def FullSE(self) -> TReal:
+        """
+        Read-only property returning the full standard error of the weighted
+        mean, including the contribution of the measurement uncertainties.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        Weight = self._Weight
+        return (math.sqrt((self._M2 + self._SqrSE) * self._Weight2 / Weight)
+                                                                    / Weight)
+    
+    #+ methods
+
+    def update(self, Value: Any, *, Time: Optional[TReal] = None) -> None:
+        """
+        Adds a single data point - a real number or a measurement with
+        uncertainty - with the weight 1, whereas the weights of the already
+        added data points decay according to the time elapsed since the
+        previous data point.
+
+        Signature:
+            int OR float OR phyqus_lib.base_classes.MeasuredValue/, *,
+                int OR float OR None/ -> None
+        
+        Args:
+            Value: int OR float OR phyqus_lib.base_classes.MeasuredValue; the
+                data point to be added
+            Time: (keyword) int OR float OR None; the time-stamp of the data
+                point, not less than of the previous one, defaults to None,
+                i.e. 1 time unit after the previous data point
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a
+                measurement with uncertainty, OR the time-stamp is neither a
+                real number nor None
+            UT_ValueError: the time-stamp is less than of the previous data
+                point
+        
+        Version 1.0.0.0
+        """
+        if isinstance(Value, (int, float)):
+            SqrSE = 0
+        elif hasattr(Value, 'Value') and hasattr(Value, 'SE'):
+            SqrSE = Value.SE * Value.SE
+            Value = Value.Value
+        else:
+            raise UT_TypeError(Value, (int, float, MeasuredValue),
+                                                                SkipFrames = 1)
+        if Time is None:
+            if self._Time is None:
+                Time = 0
+            else:
+                Time = self._Time + 1
+        elif (not isinstance(Time, (int, float))) or isinstance(Time, bool):
+            raise UT_TypeError(Time, (int, float), SkipFrames = 1)
+        elif (self._Time is not None) and (Time < self._Time):
+            raise UT_ValueError(Time, '>= {} - time-stamp'.format(self._Time),
+                                                                SkipFrames = 1)
+        if self._N:
+            Decay = 0.5 ** ((Time - self._Time) / self._HalfLife)
+            self._Weight *= Decay
+            self._Weight2 *= Decay * Decay
+            self._M2 *= Decay
+            self._SqrSE *= Decay
+        self._Time = Time
+        self._N += 1
+        self._Weight += 1
+        self._Weight2 += 1
+        Delta = Value - self._Mean
+        self._Mean += Delta / self._Weight
+        self._M2 += Delta * (Value - self._Mean)
+        self._SqrSE += SqrSE
+    
+    def snapshot(self) -> Dict[str, TReal]:
+        """
+        Returns the current values of all statistics at once.
+
+        Signature:
+            None -> dict(str -> int OR float)
+        
+        Returns:
+            dict(str -> int OR float): the values of the properties 'Time', 'N',
+                'EffectiveN', 'Mean', 'Var', 'Sigma', 'SE', 'FullVar',
+                'FullSigma' and 'FullSE' by their names
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        Result = dict()
+        for Name in ('Time', 'N', 'EffectiveN', 'Mean', 'Var', 'Sigma', 'SE',
+                                            'FullVar', 'FullSigma', 'FullSE'):
+            Result[Name] = getattr(self, Name)
+        return Result
+
+class CoMomentAccumulator:
+    """
+    Mergeable accumulator of the cross-moment based 2D statistics of the paired
+    data points - real numbers and / or measurements with uncertainty, of which
+    only the 'mean' values are used. The pairs can be added one by one, as two
+    same length sequences or from an iterable of pairs, and two accumulators
+    (e.g. filled with separate shards of the data) can be merged exactly using
+    the pairwise update formulas by Chan et al. Only the number of the pairs,
+    both means, both sums of the squared deviations and the sum of the products
+    of the paired deviations (co-moment) are stored, thus the covariance,
+    Pearson's correlation coefficient and the ordinary least squares regression
+    line are available at any time in constant memory.
+
+    Properties:
+        N: (read-only) int >= 0; number of the data pairs
+        MeanX: (read-only) int OR float; the arithmetic mean of X data
+        MeanY: (read-only) int OR float; the arithmetic mean of Y data
+        M2X: (read-only) int >= 0 OR float >= 0; the sum of the squared
+            deviations of X data from its mean
+        M2Y: (read-only) int >= 0 OR float >= 0; the sum of the squared
+            deviations of Y data from its mean
+        C2: (read-only) int OR float; the sum of the products of the paired
+            deviations from the means (co-moment)
+        VarX: (read-only) int >= 0 OR float >= 0; the population variance of X
+        VarY: (read-only) int >= 0 OR float >= 0; the population variance of Y
+        Cov: (read-only) int OR float; the population covariance
+        CovS: (read-only) int OR float; the sample covariance
+        Pearson: (read-only) int OR float; Pearson's correlation coefficient
+        Slope: (read-only) int OR float; the slope of the ordinary least
+            squares regression line Y = Slope * X + Intercept
+        Intercept: (read-only) int OR float; the intercept of the same line
+    
+    Methods:
+        update(X, Y)
+            int OR float OR phyqus_lib.base_classes.MeasuredValue,
+                int OR float OR phyqus_lib.base_classes.MeasuredValue -> None
+        updateMany(DataX, DataY)
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+                seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)
+                    -> None
+        updateStream(Data, *, ChunkSize = None)
+            iterable(seq(type A))/, *, int > 0 OR None/ -> None
+        merge(Other)
+            CoMomentAccumulator -> None
+    
+    Version 1.0.0.0
+    """
+
+    #special methods
+
+    def __init__(self) -> None:
+        """
+        Initialization method. Creates an empty accumulator.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        self._N = 0
+        self._MeanX = 0
+        self._MeanY = 0
+        self._M2X = 0
+        self._M2Y = 0
+        self._C2 = 0
+    
+    #private methods
+
+    def _checkNotEmpty(self, Minimum: int = 1) -> None:
+        """
+        Raises an exception if there are less data pairs than required.
+
+        Signature:
+            /int > 0/ -> None
+        
+        Args:
+            Minimum: int > 0; the minimal required number of the data pairs,
+                defaults to 1
+        
+        Raises:
+            UT_ValueError: not enough data pairs
+        
+        Version 1.0.0.0
+        """
+        if self._N < Minimum:
+            raise UT_ValueError(self._N,
+                                '> {} - number of data pairs'.format(
+                                                Minimum - 1), SkipFrames = 2)
+    
+    def _combine(self, N: int, MeanX: TReal, MeanY: TReal, M2X: TReal,
+                                            M2Y: TReal, C2: TReal) -> None:
+        """
+        Merges the summary of another (not empty) set of data pairs into the
+        accumulated values using the pairwise update formulas by Chan et al.
+
+        Signature:
+            int > 0, int OR float, int OR float, int >= 0 OR float >= 0,
+                int >= 0 OR float >= 0, int OR float -> None
+        
+        Args:
+            N: int > 0; number of the data pairs to be merged
+            MeanX: int OR float; their mean of X
+            MeanY: int OR float; their mean of Y
+            M2X: int >= 0 OR float >= 0; their sum of the squared deviations of
+                X
+            M2Y: int >= 0 OR float >= 0; their sum of the squared deviations of
+                Y
+            C2: int OR float; their sum of the products of the paired
+                deviations
+        
+        Version 1.0.0.0
+        """
+        NA = self._N
+        if not NA:
+            self._N = N
+            self._MeanX = MeanX
+            self._MeanY = MeanY
+            self._M2X = M2X
+            self._M2Y = M2Y
+            self._C2 = C2
+            return
+        Total = NA + N
+        DeltaX = MeanX - self._MeanX
+        DeltaY = MeanY - self._MeanY
+        Factor = NA * N / Total
+        self._M2X += M2X + DeltaX * DeltaX * Factor
+        self._M2Y += M2Y + DeltaY * DeltaY * Factor
+        self._C2 += C2 + DeltaX * DeltaY * Factor
+        self._MeanX += DeltaX * N / Total
+        self._MeanY += DeltaY * N / Total
+        self._N = Total
+    
+    #public API
+
+    #+ properties
+
+    @property
+    def N(self) -> int:
+        """
+        Read-only property returning the number of the data pairs.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._N
+    
+    @property
+    def MeanX(self) -> TReal:
+        """
+        Read-only property returning the arithmetic mean of X data.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data pairs
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._MeanX
+    
+    @property
+    def MeanY(self) -> TReal:
+        """
+        Read-only property returning the arithmetic mean of Y data.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data pairs
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._MeanY
+    
+    @property
+    def M2X(self) -> TReal:
+        """
+        Read-only property returning the sum of the squared deviations of X
+        data from its mean.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._M2X
+    
+    @property
+    def M2Y(self) -> TReal:
+        """
+        Read-only property returning the sum of the squared deviations of Y
+        data from its mean.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._M2Y
+    
+    @property
+    def C2(self) -> TReal:
+        """
+        Read-only property returning the sum of the products of the paired
+        deviations from the means (co-moment).
+
+        Signature:
+            None -> int OR float
+        
+        Version 1.0.0.0
+        """
+        return self._C2
+    
+    @property
+    def VarX(self) -> TReal:
+        """
+        Read-only property returning the population variance of X data.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data pairs
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._M2X / self._N
+    
+    @property
+    def VarY(self) -> TReal:
+        """
+        Read-only property returning the population variance of Y data.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: no data pairs
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._M2Y / self._N
+    
+    @property
+    def Cov(self) -> TReal:
+        """
+        Read-only property returning the population covariance, as calculated
+        by the function GetCovariance().
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data pairs
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._C2 / self._N
+    
+    @property
+    def CovS(self) -> TReal:
+        """
+        Read-only property returning the sample covariance (with the Bessel
+        correction).
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: less than 2 data pairs
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty(2)
+        return self._C2 / (self._N - 1)
+    
+    @property
+    def Pearson(self) -> TReal:
+        """
+        Read-only property returning Pearson's correlation coefficient, as
+        calculated by the function GetPearsonR(), i.e. 0 if only one of X and Y
+        data is constant, and 1 if both are constant.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data pairs
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        if self._M2X > 0 and self._M2Y > 0:
+            Result = self._C2 / math.sqrt(self._M2X * self._M2Y)
+        elif (self._M2X > 0) or (self._M2Y > 0): #one sequence is constant
+            Result = 0
+        else: #both sequences are constants
+            Result = 1
+        return Result
+    
+    @property
+    def Slope(self) -> TReal:
+        """
+        Read-only property returning the slope of the ordinary least squares
+        regression line Y = Slope * X + Intercept.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data pairs, OR X data is constant
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        if not self._M2X > 0:
+            raise UT_ValueError(self._M2X, '> 0 - variance of X data',
+                                                                SkipFrames = 1)
+        return self._C2 / self._M2X
+    
+    @property
+    def Intercept(self) -> TReal:
+        """
+        Read-only property returning the intercept of the ordinary least
+        squares regression line Y = Slope * X + Intercept.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data pairs, OR X data is constant
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        if not self._M2X > 0:
+            raise UT_ValueError(self._M2X, '> 0 - variance of X data',
+                                                                SkipFrames = 1)
+        return self._MeanY - self._MeanX * self._C2 / self._M2X
+    
+    #+ methods
+
+    def update(self, X: Any, Y: Any) -> None:
+        """
+        Adds a single data pair - real numbers or measurements with
+        uncertainty.
+
+        Signature:
+            int OR float OR phyqus_lib.base_classes.MeasuredValue,
+                int OR float OR phyqus_lib.base_classes.MeasuredValue -> None
+        
+        Args:
+            X: int OR float OR phyqus_lib.base_classes.MeasuredValue; the X
+                value of the data pair to be added
+            Y: int OR float OR phyqus_lib.base_classes.MeasuredValue; the Y
+                value of the data pair to be added
+        
+        Raises:
+            UT_TypeError: any of the arguments is neither a real number nor a
+                measurement with uncertainty
+        
+        Version 1.0.0.0
+        """
+        Values = []
+        for Value in (X, Y):
+            if isinstance(Value, (int, float)):
+                Values.append(Value)
+            elif hasattr(Value, 'Value') and hasattr(Value, 'SE'):
+                Values.append(Value.Value)
+            else:
+                raise UT_TypeError(Value, (int, float, MeasuredValue),
+                                                                SkipFrames = 1)
+        self._combine(1, Values[0], Values[1], 0, 0, 0)
+    
+    def updateMany(self, DataX: TGenericSequence,
+                                            DataY: TGenericSequence) -> None:
+        """
+        Adds the data pairs from two same length sequences of real numbers
+        and / or measurements with uncertainty, or 1D buffers of real numbers
+        (see module description). The passed data is summarized in a single
+        pass and merged into the accumulated values. Empty sequences are
+        ignored.
+
+        Signature:
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+                seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)
+                    -> None
+        
+        Args:
+            DataX: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)
+                OR numpy.ndarray OR array.array OR memoryview; X data
+            DataY: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)
+                OR numpy.ndarray OR array.array OR memoryview; Y data
+        
+        Raises:
+            UT_TypeError: any of the arguments is not a sequence of real numbers
+                or measurements with uncertainty
+            UT_ValueError: X and Y sequences are of different length
+        
+        Version 1.0.0.0
+        """
+        if (isinstance(DataX, c_abc.Sized) and isinstance(DataY, c_abc.Sized)
+                                    and not len(DataX) and not len(DataY)):
+            return
+        _DataX, _DataY = _ExtractPairedValues(DataX, DataY, SkipFrames = 2)
+        self._combine(*_GetBivariateSummary(_DataX, _DataY))
+    
+    def updateStream(self, Data: Any, *,
+                                    ChunkSize: Optional[int] = None) -> None:
+        """
+        Adds the data pairs from any iterable (e.g. a generator or a file
+        reader) of 2-element sequences (X, Y) consuming it only once, in
+        constant memory. The pairs are collected into batches of ChunkSize
+        elements, which are added as by updateMany(). If an improper item is
+        encountered, the data pairs preceding it remain added.
+
+        Signature:
+            iterable(seq(type A))/, *, int > 0 OR None/ -> None
+        
+        Args:
+            Data: iterable(seq(int OR float OR
+                phyqus_lib.base_classes.MeasuredValue)); the data pairs
+            ChunkSize: (keyword) int > 0 OR None; the number of the data pairs
+                per batch, defaults to None, i.e. STREAM_CHUNK_LENGTH (module's
+                global constant)
+        
+        Raises:
+            UT_TypeError: the argument is not an iterable of pairs of real
+                numbers or measurements with uncertainty, OR the keyword
+                argument is of improper type
+            UT_ValueError: the keyword argument is of the proper type but
+                unacceptable value
+        
+        Version 1.0.0.0
+        """
+        if ChunkSize is None:
+            ChunkSize = STREAM_CHUNK_LENGTH
+        else:
+            _CheckPositiveInteger(ChunkSize)
+        if ((not isinstance(Data, c_abc.Iterable))
+                                            or isinstance(Data, (str, bytes))):
+            raise UT_TypeError(Data, c_abc.Iterable, SkipFrames = 1)
+        BatchX = []
+        BatchY = []
+        for Item in Data:
+            if ((not isinstance(Item, c_abc.Sequence)) or len(Item) != 2
+                                    or isinstance(Item, (str, bytes))):
+                if BatchX:
+                    self.updateMany(BatchX, BatchY)
+                raise UT_TypeError(Item, tuple, SkipFrames = 1)
+            BatchX.append(Item[0])
+            BatchY.append(Item[1])
+            if len(BatchX) >= ChunkSize:
+                self.updateMany(BatchX, BatchY)
+                BatchX = []
+                BatchY = []
+        if BatchX:
+            self.updateMany(BatchX, BatchY)
+    
+    def merge(self, Other: 'CoMomentAccumulator') -> None:
+        """
+        Merges the data pairs accumulated by another instance into this one.
+        The other instance is not changed.
+
+        Signature:
+            CoMomentAccumulator -> None
+        
+        Args:
+            Other: CoMomentAccumulator; another accumulator
+        
+        Raises:
+            UT_TypeError: the argument is not an instance of
+                CoMomentAccumulator
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Other, CoMomentAccumulator):
+            raise UT_TypeError(Other, CoMomentAccumulator, SkipFrames = 1)
+        if Other.N:
+            self._combine(Other.N, Other._MeanX, Other._MeanY, Other.M2X,
+                                                        Other.M2Y, Other.C2)
+
+#functions
+
+#+ helper functions - not for usage outside the module
+
+def _CheckPositiveInteger(Value: Any) -> None:
+    """
+    Raises an exception if the passed argument is not a positive integer.
+
+    Signature:
+        type A -> None
+    
+    Raises:
+        UT_TypeError: the passed argument is not an integer
+        UT_ValueError: the passed argument is an integer but not positive
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Value, int):
+        raise UT_TypeError(Value, int, SkipFrames = 2)
+    elif Value < 1:
+        raise UT_ValueError(Value, '> 0 integer', SkipFrames = 2)
+
+def _CheckSequence(Data: Any, *, SkipFrames: int = 1) -> None:
+    """
+    Checks if the passed argument is a not empty sequence, but not a string.
+    The elements are not checked.
+
+    Signature:
+        type A/, * , int > 0/ -> None
+    
+    Args:
+        Data: type A; any type to be checked, should be a not empty sequence
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence
+        UT_ValueError: passed mandatory sequence is empty
+
+    Version 1.0.0.0
+    """
+    if ((not isinstance(Data, c_abc.Sequence))
+                                or (isinstance(Data, (str, bytes, bytearray)))):
+        raise UT_TypeError(Data, (list, tuple), SkipFrames = SkipFrames)
+    if not Data:
+        raise UT_ValueError(len(Data), '> 0 - length of the sequence',
+                                                        SkipFrames = SkipFrames)
+
+def _CheckInput(Data: Any, *, SkipFrames: int = 1) -> None:
+    """
+    Checks if the passed argument is a sequence of real numbers or measurements
+    with uncertainty.
+
+    Signature:
+        type A/, * , int > 0/ -> None
+    
+    Args:
+        Data: type A; any type to be checked, should be a sequence of real
+            numbers or 'measurements with uncertainty' to avoid an exception
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value
+
+    Version 1.1.0.0
+    """
+    _CheckPositiveInteger(SkipFrames)
+    _CheckSequence(Data, SkipFrames = SkipFrames + 1)
+    for Index, Element in enumerate(Data):
+        if not isinstance(Element, (int, float)):
+            if not (hasattr(Element, 'Value') and hasattr(Element, 'SE')):
+                err = UT_TypeError(Element, (int, float, MeasuredValue),
+                                                        SkipFrames = SkipFrames)
+                err.appendMessage(f'at position {Index} in sequence')
+                raise err
+    
+
+def _CheckMissingPolicy(Value: Any, *, SkipFrames: int = 1) -> None:
+    """
+    Raises an exception if the passed argument is not a member of the
+    MissingPolicy enumeration.
+
+    Signature:
+        type A/, *, int > 0/ -> None
+    
+    Raises:
+        UT_TypeError: the passed argument is not a MissingPolicy member
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Value, MissingPolicy):
+        raise UT_TypeError(Value, MissingPolicy, SkipFrames = SkipFrames)
+
+def _CheckKeywords(SkipFrames: Any, *, Workers: Any = None,
+                            Missing: Any = MissingPolicy.PROPAGATE) -> None:
+    """
+    Validates the common keyword arguments of a public function at once, so
+    the private helpers and kernels called afterwards do not need to re-check
+    them. Must be called directly from the public function, since the hidden
+    traceback frames are counted from it: all errors hide the caller's
+    SkipFrames frames plus this function, or only the default single frame if
+    SkipFrames itself is invalid.
+
+    Signature:
+        type A/, *, type B, type C/ -> None
+    
+    Args:
+        SkipFrames: type A; the value of the SkipFrames keyword argument of the
+            public function, should be a positive integer
+        Workers: (keyword) type B; the value of the Workers keyword argument,
+            should be None or a positive integer, defaults to None
+        Missing: (keyword) type C; the value of the Missing keyword argument,
+            should be a MissingPolicy member, defaults to
+            MissingPolicy.PROPAGATE
+
+    Raises:
+        UT_TypeError: any of the arguments is of improper type
+        UT_ValueError: any of the arguments is of the proper type but
+            unacceptable value
+
+    Version 1.0.1.0
+    """
+    IsValid = isinstance(SkipFrames, int) and SkipFrames >= 1
+    Hidden = (SkipFrames if IsValid else 1) + 1
+    if not isinstance(SkipFrames, int):
+        raise UT_TypeError(SkipFrames, int, SkipFrames = Hidden)
+    elif SkipFrames < 1:
+        raise UT_ValueError(SkipFrames, '> 0 integer', SkipFrames = Hidden)
+    if Workers is not None:
+        if not isinstance(Workers, int):
+            raise UT_TypeError(Workers, (int, type(None)), SkipFrames = Hidden)
+        elif Workers < 1:
+            raise UT_ValueError(Workers, '> 0 integer OR None',
+                                                        SkipFrames = Hidden)
+    if not isinstance(Missing, MissingPolicy):
+        raise UT_TypeError(Missing, MissingPolicy, SkipFrames = Hidden)
+
+def _IsMissing(Item: Any) -> bool:
+    """
+    Checks if the passed data point is a missing value, i.e. None, NaN or a
+    measurement with uncertainty with NaN or None value, or NaN uncertainty.
+    Any other object is not considered to be a missing value.
+
+    Signature:
+        type A -> bool
+    
+    Version 1.0.0.0
+    """
+    if Item is None:
+        return True
+    if isinstance(Item, (int, float)):
+        return Item != Item
+    try:
+        Value = Item.Value
+        Error = Item.SE
+    except AttributeError:
+        return False
+    return (Value is None) or (Value != Value) or (Error != Error)
+
+def _FindMissing(Data: Any) -> List[int]:
+    """
+    Finds the positions of the missing values (see _IsMissing()) in a sequence
+    or a 1D NumPy array. A homogeneous sequence of real numbers is checked by
+    the (fast, built-in) summation first, and it is scanned element by element
+    only if the sum is NaN. Any other argument is not checked, and an empty
+    list is returned for it.
+
+    Signature:
+        type A -> list(int >= 0)
+    
+    Args:
+        Data: type A; the data to be checked
+    
+    Returns:
+        list(int >= 0): the indexes of the missing values in the ascending order
+
+    Version 1.0.0.0
+    """
+    if _IsArray(Data):
+        if Data.dtype.kind != 'f':
+            return []
+        return np.flatnonzero(np.isnan(Data)).tolist()
+    if ((not isinstance(Data, c_abc.Sequence))
+                                or (isinstance(Data, (str, bytes, bytearray)))):
+        return []
+    Types = set(map(type, Data))
+    if Types <= _REAL_TYPES:
+        if not (float in Types):
+            return []
+        try:
+            Total = sum(Data)
+        except OverflowError: #huge integers
+            Total = math.nan
+        if Total == Total:
+            return []
+        return [Index for Index, Item in enumerate(Data) if Item != Item]
+    return [Index for Index, Item in enumerate(Data) if _IsMissing(Item)]
+
+def _DropMissing(Data: Sequence[Any], Missing: MissingPolicy, *,
+                                        SkipFrames: int = 1) -> List[Any]:
+    """
+    Applies the missing values policy to one or more (paired) data sequences.
+    With the SKIP policy the positions of the missing values in any of the
+    sequences are excluded from all of them (listwise deletion); with the RAISE
+    policy the first missing value found results in an exception; and with the
+    PROPAGATE policy the data is not checked at all. The sequences with no
+    missing values are returned as they are, and the data of improper types or
+    of different lengths is not processed, but left to the subsequent data
+    extraction to be rejected. The keyword arguments are not checked, this is
+    done once by the calling public function, see _CheckKeywords().
+
+    Signature:
+        seq(type A), MissingPolicy/, *, int > 0/ -> list(type A)
+    
+    Args:
+        Data: seq(type A); the data sequences (columns)
+        Missing: MissingPolicy; the missing values policy
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+    
+    Returns:
+        list(type A): the data sequences without the missing values (SKIP) or
+            as they are
+    
+    Raises:
+        UT_ValueError: a missing value is found with the RAISE policy, OR all
+            values are missing with the SKIP policy
+
+    Version 1.1.0.0
+    """
+    Result = list(Data)
+    if Missing is MissingPolicy.PROPAGATE:
+        return Result
+    Positions = set()
+    for Column in Result:
+        Found = _FindMissing(Column)
+        if Found and (Missing is MissingPolicy.RAISE):
+            err = UT_ValueError(Column[Found[0]], 'not None / NaN value',
+                                                        SkipFrames = SkipFrames)
+            err.appendMessage(f'at position {Found[0]} in sequence')
+            raise err
+        Positions.update(Found)
+    if not Positions:
+        return Result
+    try:
+        Length = len(Result[0])
+        if any(len(Column) != Length for Column in Result):
+            return Result
+    except TypeError: #not sized - to be rejected by the extraction
+        return Result
+    if len(Positions) == Length:
+        raise UT_ValueError(0, '> 0 - number of not missing values',
+                                                        SkipFrames = SkipFrames)
+    Kept = [Index for Index in range(Length) if not (Index in Positions)]
+    for Index, Column in enumerate(Result):
+        if _IsArray(Column):
+            Result[Index] = Column[Kept]
+        else:
+            Result[Index] = [Column[Position] for Position in Kept]
+    return Result
+
+def _ExtractData(Data: TGenericSequence, *, SkipFrames: int = 1,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                    ) -> Tuple[TRealList, Optional[TRealList]]:
+    """
+    Checks a mixed sequence of real numbers and the measurements with
+    uncertainty and splits it into the 'mean' values and the 'errors' values,
+    where the real numbers are treated as having zero uncertainty, all in a
+    single pass. A homogeneous sequence of only int and / or float numbers is
+    detected by the types of the elements without the per-element checks, in
+    which case None is returned instead of the list of the 'errors' - i.e. no
+    uncertainties present. A sequence of only int numbers is returned as an
+    instance of _IntegerList class, enabling the exact integer calculations.
+
+    The missing values policy (other than PROPAGATE) is applied in the same
+    pass: the missing values (see _IsMissing()) are either skipped or result in
+    an exception. A homogeneous sequence of real numbers is checked by the
+    (fast, built-in) summation instead, and it is filtered element by element
+    only if the sum is NaN. The keyword arguments are not checked, this is done
+    once by the calling public function, see _CheckKeywords().
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            MissingPolicy/ -> tuple(list(int OR float), list(int OR float)
+                                                                        OR None)
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        Missing: (keyword) MissingPolicy; the treatment of the missing values,
+            defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        tuple(list(int OR float), list(int OR float) OR None): the extracted
+            'mean' values and the 'error' values, or None instead of the later
+            for a sequence of only real numbers
+
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
+
+    Version 1.3.0.0
+    """
+    _CheckSequence(Data, SkipFrames = SkipFrames + 1)
+    IsChecked = not (Missing is MissingPolicy.PROPAGATE)
+    Types = set(map(type, Data))
+    if Types == _INTEGER_TYPES:
+        return _IntegerList(Data), None
+    if Types <= _REAL_TYPES:
+        if IsChecked:
+            try:
+                Total = sum(Data)
+            except OverflowError: #huge integers
+                Total = math.nan
+            IsChecked = Total != Total
+        if not IsChecked:
+            return list(Data), None
+    IsMeasured = False
+    Values = []
+    Errors = []
+    for Index, Item in enumerate(Data):
+        if isinstance(Item, (int, float)):
+            Value = Item
+            Error = 0
+        elif IsChecked and (Item is None):
+            Value = None
+            Error = 0
+        else:
+            try:
+                Value = Item.Value
+                Error = Item.SE
+            except AttributeError:
+                break
+            IsMeasured = True
+        if IsChecked and ((Value is None) or (Value != Value)
+                                                        or (Error != Error)):
+            if Missing is MissingPolicy.RAISE:
+                err = UT_ValueError(Item, 'not None / NaN value',
+                                                        SkipFrames = SkipFrames)
+                err.appendMessage(f'at position {Index} in sequence')
+                raise err
+            continue
+        Values.append(Value)
+        Errors.append(Error)
+    else:
+        if not Values:
+            raise UT_ValueError(0, '> 0 - number of not missing values',
+                                                        SkipFrames = SkipFrames)
+        if IsMeasured or ((len(Values) == len(Data))
+                                            and not (Types <= _REAL_TYPES)):
+            return Values, Errors
+        #only real numbers are left after removal of the missing values
+        if set(map(type, Values)) == _INTEGER_TYPES:
+            Values = _IntegerList(Values)
+        return Values, None
+    err = UT_TypeError(Item, (int, float, MeasuredValue),
+                                                        SkipFrames = SkipFrames)
+    err.appendMessage(f'at position {Index} in sequence')
+    raise err
+
+def _ExtractMeans(Data: TGenericSequence, *, SkipFrames: int = 1,
+                    DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                            ) -> TRealList:
+    """
+    Extracts all 'mean' values from a mixed sequence of real numbers and the
+    measurements with uncertainty, where the real numbers are treated as having
+    zero uncertainty. The missing values policy is applied only with the data
+    sanity check. The keyword arguments are not checked, this is done once by
+    the calling public function, see _CheckKeywords().
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> list(int OR float)
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, defautls to True
+        Missing: (keyword) MissingPolicy; the treatment of the missing values,
+            defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        list(int OR float): the extracted 'mean' values
+
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value
+
+    Version 1.2.1.0
+    """
+    if DoCheck:
+        Result = _ExtractData(Data, SkipFrames = SkipFrames + 1,
+                                                        Missing = Missing)[0]
+    else:
+        Result = []
+        for Item in Data:
+            if isinstance(Item, (int, float)):
+                Result.append(Item)
+            else:
+                Result.append(Item.Value)
+    return Result
+
+def _ExtractErrors(Data: TGenericSequence, *, SkipFrames: int = 1,
+                                            DoCheck: bool = True) -> TRealList:
+    """
+    Extracts all 'errors' values from a mixed sequence of real numbers and the
+    measurements with uncertainty, where the real numbers are treated as having
+    zero uncertainty. The keyword arguments are not checked, this is done once
+    by the calling public function, see _CheckKeywords().
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool/ -> list(int OR float)
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, defaults to True
+    
+    Returns:
+        list(int OR float): the extracted 'error' values
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value
+
+    Version 1.1.0.0
+    """
+    if DoCheck:
+        _CheckInput(Data, SkipFrames = SkipFrames + 1)
+    Result = []
+    for Item in Data:
+        if isinstance(Item, (int, float)):
+            Result.append(0)
+        else:
+            Result.append(Item.SE)
+    return Result
+
+def _IsArray(Data: Any) -> bool:
+    """
+    Checks if the passed argument is a NumPy array. Always returns False if
+    NumPy is not installed.
+
+    Signature:
+        type A -> bool
+    
+    Version 1.0.0.0
+    """
+    return (np is not None) and isinstance(Data, np.ndarray)
+
+def _ExtractArray(Data: Any, *, SkipFrames: int = 1) -> Any:
+    """
+    Converts a 1D buffer of real numbers (numpy.ndarray, array.array or
+    memoryview) into a float64 NumPy array, checking only the type of the
+    elements and the shape of the buffer instead of each element. Returns None
+    if NumPy is not installed or the passed argument is not such a buffer, so
+    the caller can fall back onto the pure Python implementation.
+
+    Signature:
+        type A/, *, int > 0/ -> numpy.ndarray OR None
+    
+    Args:
+        Data: type A; any type to be checked and converted
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+    
+    Returns:
+        numpy.ndarray: 1D array of float64, if the input is a proper buffer
+        None: NumPy is not installed or the input is not an array / buffer
+    
+    Raises:
+        UT_TypeError: the passed buffer is not 1D, OR it contains not real
+            numbers
+        UT_ValueError: the passed buffer is empty
+
+    Version 1.0.0.0
+    """
+    if np is None:
+        return None
+    if isinstance(Data, np.ndarray):
+        Result = Data
+    elif isinstance(Data, (array.array, memoryview)):
+        try:
+            Result = np.asarray(Data)
+        except (TypeError, ValueError): #not convertible buffer format
+            return None
+    else:
+        return None
+    if Result.ndim != 1:
+        err = UT_TypeError(Data, (list, tuple), SkipFrames = SkipFrames)
+        err.appendMessage(f'- {Result.ndim}D array instead of 1D')
+        raise err
+    if Result.dtype.kind not in 'biuf':
+        err = UT_TypeError(Data, (list, tuple), SkipFrames = SkipFrames)
+        err.appendMessage(f'- elements of the type {Result.dtype}')
+        raise err
+    if not Result.size:
+        raise UT_ValueError(0, '> 0 - length of the sequence',
+                                                        SkipFrames = SkipFrames)
+    return Result.astype(np.float64, copy = False)
+
+def _ExtractValues(Data: Any, *, SkipFrames: int = 1, DoCheck: bool = True,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TRealData:
+    """
+    Prepares the data for the calculation of the moment-based statistics. A
+    buffer of real numbers is converted into a float64 NumPy array (if NumPy is
+    installed), otherwise the 'mean' values are extracted from a mixed sequence
+    of real numbers and the measurements with uncertainty. The missing values
+    policy is applied to a buffer always, and to a sequence - only with the data
+    sanity check. The keyword arguments are not checked, this is done once by
+    the calling public function, see _CheckKeywords().
+
+    Signature:
+        type A/, *, int > 0, bool, MissingPolicy/
+            -> numpy.ndarray OR seq(int OR float)
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) OR
+            numpy.ndarray OR array.array OR memoryview; a sequence of real
+            numbers or 'measurements with uncertainty', or a buffer of reals
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check for a sequence (not a buffer), defaults to True
+        Missing: (keyword) MissingPolicy; the treatment of the missing values,
+            defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        numpy.ndarray: 1D array of float64 for a buffer input
+        seq(int OR float): the extracted 'mean' values or the input as it is
+
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value
+
+    Version 1.1.0.0
+    """
+    Result = _ExtractArray(Data, SkipFrames = SkipFrames + 1)
+    if Result is None:
+        if DoCheck:
+            Result = _ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing)
+        else:
+            Result = Data
+    elif not (Missing is MissingPolicy.PROPAGATE):
+        Result = _DropMissing((Result, ), Missing,
+                                            SkipFrames = SkipFrames + 1)[0]
+    return Result
+
+def _ExtractPairedValues(DataX: Any, DataY: Any, *, SkipFrames: int = 1,
+                        DoCheck: bool = True,
+                        Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                            ) -> Tuple[TRealData, TRealData]:
+    """
+    Prepares the paired X and Y data for the calculation of the cross-moment
+    based statistics, see _ExtractValues(). If any of them is converted into a
+    NumPy array, the other one is also converted, thus both are either NumPy
+    arrays or sequences of real numbers. Also checks that X and Y data are of
+    the same length. With the SKIP missing values policy the pairs with, at
+    least, one missing value are excluded. The keyword arguments are not
+    checked, this is done once by the calling public function, see
+    _CheckKeywords().
+
+    Signature:
+        type A, type B/, *, int > 0, bool, MissingPolicy/
+            -> tuple(numpy.ndarray OR seq(int OR float),
+                                            numpy.ndarray OR seq(int OR float))
+    
+    Args:
+        DataX: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) OR
+            numpy.ndarray OR array.array OR memoryview; X data
+        DataY: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) OR
+            numpy.ndarray OR array.array OR memoryview; Y data
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check for a sequence (not a buffer), defaults to True
+        Missing: (keyword) MissingPolicy; the treatment of the missing values,
+            defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        tuple(numpy.ndarray OR seq(int OR float),
+            numpy.ndarray OR seq(int OR float)): the prepared X and Y data
+    
+    Raises:
+        UT_TypeError: any of mandatory data arguments is not a sequence of real
+            numbers or measurements with uncertainty, OR any keyword argument is
+            of improper type
+        UT_ValueError: any of the passed mandatory sequence is empty, OR any
+            keyword argument is of the proper type but unacceptable value, OR
+            the X and Y sequences are of different length
+
+    Version 1.1.0.0
+    """
+    if DoCheck or _IsArray(DataX) or _IsArray(DataY):
+        DataX, DataY = _DropMissing((DataX, DataY), Missing,
+                                                SkipFrames = SkipFrames + 1)
+    _DataX = _ExtractValues(DataX, SkipFrames = SkipFrames + 1,
+                                                            DoCheck = DoCheck)
+    _DataY = _ExtractValues(DataY, SkipFrames = SkipFrames + 1,
+                                                            DoCheck = DoCheck)
+    if len(_DataX) != len(_DataY):
+        raise UT_ValueError(
+                len(_DataX), '== {} - X and Y data length'.format(len(_DataY)),
+                                                        SkipFrames = SkipFrames)
+    if _IsArray(_DataX) and not _IsArray(_DataY):
+        _DataY = np.asarray(_DataY, dtype = np.float64)
+    elif _IsArray(_DataY) and not _IsArray(_DataX):
+        _DataX = np.asarray(_DataX, dtype = np.float64)
+    return _DataX, _DataY
+
+def _GetMomentsSummary(Data: TRealData, *,
+                            Workers: Optional[int] = None) -> _MomentsSummary:
+    """
+    Calculates the length, the arithmetic mean and the sums of the 2nd, 3rd and
+    4th powers of the deviations from the mean of a sequence of real numbers
+    in a single pass using the numerically stable on-line update formulas
+    (Welford / Terriberry). The returned mean is calculated as the sum of the
+    elements divided by their number, exactly as in GetMean(). The input data
+    is not checked.
+
+    A NumPy array is processed by the vectorized reductions instead, with the
+    deviations being calculated from the first element first, so a constant
+    array results in exactly zero central sums.
+
+    With several worker processes the data is split into chunks, which are
+    summarized in parallel, and the partial results are merged exactly using
+    the pairwise update formulas by Chan et al. (see MomentAccumulator).
+
+    A sequence of only integers marked by the data extraction (_IntegerList)
+    is summarized by the exact integer sums of the powers of the elements
+    instead, see _ExactMomentsSummary.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray/, *, int > 0 OR None/
+            -> _MomentsSummary
+    
+    Args:
+        Data: seq(int OR float) OR numpy.ndarray; a sequence of real numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes,
+            defaults to None
+    
+    Returns:
+        _MomentsSummary: the calculated moments summary
+
+    Version 1.3.0.0
+    """
+    if isinstance(Data, _IntegerList):
+        Sums = _GetPowerSums(Data, 4, Workers = Workers)
+        return _ExactMomentsSummary(len(Data), *Sums)
+    if (Workers is not None) and (Workers > 1):
+        Parts = _MapChunks(_GetMomentsSummary, Data, Workers = Workers)
+        if len(Parts) == 1:
+            return Parts[0]
+        Result = MomentAccumulator()
+        for Part in Parts:
+            Result._combine(Part.N, Part.Mean, Part.M2, Part.M3, Part.M4, 0)
+        return Result
+    if _IsArray(Data):
+        N = Data.size
+        Mean = float(Data.sum()) / N #the same rounding as in GetMean()
+        Deviations = Data - Data[0]
+        Deviations -= float(Deviations.sum()) / N
+        Squares = Deviations * Deviations
+        M2 = float(Squares.sum())
+        M3 = float(np.dot(Squares, Deviations))
+        M4 = float(np.dot(Squares, Squares))
+        return _MomentsSummary(N, Mean, M2, M3, M4)
+    N = 0
+    Sum = 0
+    Mean = 0
+    M2 = 0
+    M3 = 0
+    M4 = 0
+    for Item in Data:
+        Sum += Item
+        Previous = N
+        N += 1
+        Delta = Item - Mean
+        DeltaN = Delta / N
+        DeltaN2 = DeltaN * DeltaN
+        Term = Delta * DeltaN * Previous
+        Mean += DeltaN
+        M4 += (Term * DeltaN2 * (N * N - 3 * N + 3) + 6 * DeltaN2 * M2
+                                                            - 4 * DeltaN * M3)
+        M3 += Term * DeltaN * (N - 2) - 3 * DeltaN * M2
+        M2 += Term
+    if N:
+        Mean = Sum / N #the same rounding as in GetMean()
+    return _MomentsSummary(N, Mean, M2, M3, M4)
+
+def _GetRollingSummaries(Data: TRealData,
+                                    Window: int) -> List[_MomentsSummary]:
+    """
+    Calculates the moments summaries of all windows of the fixed width sliding
+    over a sequence of real numbers or a NumPy array with the step of one
+    element. Each next summary is obtained from the previous one in O(1) by
+    removing the leaving element (the inverse Welford / Terriberry update) and
+    adding the entering one. In order to prevent the accumulation of the
+    rounding errors, the summary is re-calculated from scratch each Window-th
+    step, which doubles the amortized cost only, as well as when the sum of the
+    4th powers of the deviations drops by more than 2^20 times since the last
+    re-calculation (e.g. an outlier has left the window), since the relative
+    error of the updated sums grows as much. A sequence of only integers
+    marked by the data extraction (_IntegerList) is processed by updating the
+    exact integer sums of the powers of the elements instead, without any
+    rounding errors. Any window containing NaN or infinity, as well as the
+    first window after such an element has left, is re-calculated from
+    scratch, since the updated sums cannot recover from the non-finite values.
+    The input data is not checked.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray, int > 0 -> list(_MomentsSummary)
+    
+    Args:
+        Data: seq(int OR float) OR numpy.ndarray; the data
+        Window: int > 0; the width of the window, not greater than the length
+            of the data
+    
+    Returns:
+        list(_MomentsSummary): the summaries of the consecutive windows, i.e.
+            len(Data) - Window + 1 elements
+
+    Version 1.0.1.0
+    """
+    if isinstance(Data, _IntegerList):
+        Sums = _GetPowerSums(Data[:Window], 4)
+        Result = [_ExactMomentsSummary(Window, *Sums)]
+        for Old, New in zip(Data, Data[Window:]):
+            OldSquare = Old * Old
+            NewSquare = New * New
+            Sums[0] += New - Old
+            Sums[1] += NewSquare - OldSquare
+            Sums[2] += NewSquare * New - OldSquare * Old
+            Sums[3] += NewSquare * NewSquare - OldSquare * OldSquare
+            Result.append(_ExactMomentsSummary(Window, *Sums))
+        return Result
+    if _IsArray(Data):
+        Data = Data.tolist()
+    Summary = _GetMomentsSummary(Data[:Window])
+    Result = [Summary]
+    N = Window
+    Previous = N - 1
+    Factor4 = N * N - 3 * N + 3
+    Mean = Summary.Mean
+    M2 = Summary.M2
+    M3 = Summary.M3
+    M4 = Summary.M4
+    Peak = M4
+    LastBad = -1
+    for Index, Item in enumerate(Data[:Window]):
+        if Item - Item: #NaN or infinity
+            LastBad = Index
+    for Index in range(Window, len(Data)):
+        Item = Data[Index]
+        if Item - Item: #NaN or infinity
+            LastBad = Index
+        if (not (Index % Window)) or LastBad >= Index - Window:
+            Summary = _GetMomentsSummary(Data[Index - Window + 1 : Index + 1])
+            Mean = Summary.Mean
+            M2 = Summary.M2
+            M3 = Summary.M3
+            M4 = Summary.M4
+            Peak = M4
+            Result.append(Summary)
+            continue
+        #removal of the leaving element - inverse of the update below
+        Item = Data[Index - Window]
+        Mean -= (Item - Mean) / Previous
+        Delta = Item - Mean
+        DeltaN = Delta / N
+        DeltaN2 = DeltaN * DeltaN
+        Term = Delta * DeltaN * Previous
+        M2 -= Term
+        M3 += 3 * DeltaN * M2 - Term * DeltaN * (N - 2)
+        M4 += (4 * DeltaN * M3 - 6 * DeltaN2 * M2
+                                            - Term * DeltaN2 * Factor4)
+        #addition of the entering element
+        Item = Data[Index]
+        Delta = Item - Mean
+        DeltaN = Delta / N
+        DeltaN2 = DeltaN * DeltaN
+        Term = Delta * DeltaN * Previous
+        Mean += DeltaN
+        M4 += (Term * DeltaN2 * Factor4 + 6 * DeltaN2 * M2
+                                                            - 4 * DeltaN * M3)
+        M3 += Term * DeltaN * (N - 2) - 3 * DeltaN * M2
+        M2 += Term
+        if M4 > Peak:
+            Peak = M4
+        elif M4 * 1048576 < Peak: #loss of 20 bits of precision
+            Summary = _GetMomentsSummary(Data[Index - Window + 1 : Index + 1])
+            Mean = Summary.Mean
+            M2 = Summary.M2
+            M3 = Summary.M3
+            M4 = Summary.M4
+            Peak = M4
+            Result.append(Summary)
+            continue
+        if M2 < 0: #rounding errors
+            M2 = 0
+        if M4 < 0:
+            M4 = 0
+        Result.append(_MomentsSummary(N, Mean, M2, M3, M4))
+    return Result
+
+def _SplitData(Data: TRealData, Number: int) -> List[TRealData]:
+    """
+    Splits a sequence of real numbers or a NumPy array into the specified
+    number of (almost) equal length consecutive chunks.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray, int > 0
+            -> list(seq(int OR float) OR numpy.ndarray)
+
+    Version 1.0.0.0
+    """
+    Length = len(Data)
+    Size = -(-Length // Number)
+    return [Data[Start : Start + Size] for Start in range(0, Length, Size)]
+
+def _MapChunks(Function: Callable, *Data: TRealData,
+                                    Workers: Optional[int] = None) -> List[Any]:
+    """
+    Applies the passed function to the consecutive chunks of the data, which
+    are processed in parallel by a pool of the worker processes. The passed
+    sequences (e.g. X and Y data) are split in the same way, and the function
+    receives the respective chunks as the positional arguments. If the number
+    of the workers is None or 1, or the data is too short (less than 2 *
+    MIN_CHUNK_LENGTH elements), the function is applied to the entire data in
+    the current process, thus the returned list contains a single result.
+
+    The function must be defined at the top level of a module, so it can be
+    sent to the worker processes.
+
+    Signature:
+        callable, *seq(int OR float) OR numpy.ndarray/, *, int > 0 OR None/
+            -> list(type A)
+    
+    Args:
+        Function: callable; function to be applied to the chunks of the data
+        *Data: seq(int OR float) OR numpy.ndarray; the same length sequences
+            of real numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes,
+            defaults to None
+    
+    Returns:
+        list(type A): the results of the function per chunk, in order
+
+    Version 1.0.0.0
+    """
+    Length = len(Data[0])
+    if Workers is not None:
+        Workers = min(Workers, Length // MIN_CHUNK_LENGTH)
+    if (Workers is None) or (Workers < 2):
+        Result = [Function(*Data)]
+    else:
+        Chunks = [_SplitData(Item, Workers) for Item in Data]
+        with ProcessPoolExecutor(max_workers = Workers) as Pool:
+            Result = list(Pool.map(Function, *Chunks))
+    return Result
+
+def _GetSum(Data: TRealData) -> TReal:
+    """
+    Calculates the sum of a sequence of real numbers or a NumPy array. The
+    input data is not checked.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray -> int OR float
+
+    Version 1.1.0.0
+    """
+    if _IsArray(Data):
+        Result = float(Data.sum())
+    else:
+        Result = sum(Data)
+    return Result
+
+def _GetVariance(Data: TRealData, *, IsSample: bool = False,
+                                    Workers: Optional[int] = None) -> TReal:
+    """
+    Calculates the population or sample variance of a sequence of real numbers
+    or a NumPy array. A plain sequence of floats processed in the current
+    process is handled in a single pass by the Welford on-line update up to
+    the 2nd order, which is cheaper than the full moments summary up to the
+    4th order, and a sequence of only integers (_IntegerList) - by the exact
+    integer sums of the 1st and 2nd powers. Any other case is delegated to
+    _GetMomentsSummary(). The input data is not checked.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray/, *, bool, int > 0 OR None/
+            -> int OR float
+    
+    Args:
+        Data: seq(int OR float) OR numpy.ndarray; a non-empty sequence of real
+            numbers, at least 2 elements long for the sample variance
+        IsSample: (keyword) bool; flag if to calculate the sample (N - 1) or
+            the population (N) variance, defaults to False
+        Workers: (keyword) int > 0 OR None; number of the worker processes,
+            defaults to None
+    
+    Returns:
+        int OR float: the calculated variance
+
+    Version 1.0.1.0
+    """
+    if (_IsArray(Data) or ((Workers is not None) and (Workers > 1)
+                                and (len(Data) >= 2 * MIN_CHUNK_LENGTH))):
+        Summary = _GetMomentsSummary(Data, Workers = Workers)
+        return Summary.VarS if IsSample else Summary.Var
+    N = len(Data)
+    Dof = N - 1 if IsSample else N
+    if isinstance(Data, _IntegerList):
+        Sum1 = sum(Data)
+        Sum2 = sum(Item * Item for Item in Data)
+        return (N * Sum2 - Sum1 * Sum1) / (N * Dof)
+    Count = 0
+    Mean = 0
+    M2 = 0
+    for Item in Data:
+        Count += 1
+        Delta = Item - Mean
+        Mean += Delta / Count
+        M2 += Delta * (Item - Mean)
+    return M2 / Dof
+
+def _GetPowerSum(Data: TRealData, Power: int, *, Shift: TReal = 0,
+                    Scale: TReal = 1, Workers: Optional[int] = None) -> TReal:
+    """
+    Calculates the sum of the specified power of the shifted and scaled
+    elements of a sequence of real numbers or a NumPy array, optionally split
+    between several worker processes. The input data is not checked.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray, int > 0/, *, int OR float,
+            int > 0 OR float > 0, int > 0 OR None/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float) OR numpy.ndarray; the data
+        Power: int > 0; the power
+        Shift: (keyword) int OR float; value to be subtracted from each
+            element, defaults to 0
+        Scale: (keyword) int > 0 OR float > 0; value to divide each shifted
+            element by, defaults to 1
+        Workers: (keyword) int > 0 OR None; number of the worker processes,
+            defaults to None
+    
+    Returns:
+        int OR float: the sum of the (Item - Shift) / Scale to the power
+
+    Version 1.0.0.0
+    """
+    if (Workers is not None) and (Workers > 1):
+        Function = functools.partial(_GetPowerSum, Power = Power,
+                                                Shift = Shift, Scale = Scale)
+        return sum(_MapChunks(Function, Data, Workers = Workers))
+    IsPlain = (Shift == 0) and (Scale == 1)
+    if _IsArray(Data):
+        if IsPlain:
+            Result = float(np.power(Data, Power).sum())
+        else:
+            Result = float(np.power((Data - Shift) / Scale, Power).sum())
+    elif IsPlain:
+        Result = sum(pow(Item, Power) for Item in Data)
+    else:
+        Result = sum(pow((Item - Shift) / Scale, Power) for Item in Data)
+    return Result
+
+def _GetPowerSums(Data: TRealData, MaxPower: int, *, Shift: TReal = 0,
+                            Workers: Optional[int] = None) -> List[TReal]:
+    """
+    Calculates the sums of all powers from 1 to the specified one of the
+    shifted elements of a sequence of real numbers or a NumPy array, optionally
+    split between several worker processes, in a single pass over the data.
+    Each next power of an element is obtained by the multiplication of the
+    previous one by the shifted element, i.e. without pow() calls, and it is
+    added to the respective sum at once, so no intermediate sequences are
+    created. A NumPy array is processed in blocks of STREAM_CHUNK_LENGTH
+    elements: the powers of the block's elements are obtained by the
+    vectorized multiplication and summed per power, thus the extra memory is
+    bounded by MaxPower blocks. The input data is not checked.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray, int > 0/, *, int OR float,
+            int > 0 OR None/ -> list(int OR float)
+    
+    Args:
+        Data: seq(int OR float) OR numpy.ndarray; the data
+        MaxPower: int > 0; the highest power
+        Shift: (keyword) int OR float; value to be subtracted from each
+            element, defaults to 0
+        Workers: (keyword) int > 0 OR None; number of the worker processes,
+            defaults to None
+    
+    Returns:
+        list(int OR float): the sums of (Item - Shift) to the powers 1 to
+            MaxPower, in this order
+
+    Version 1.1.0.0
+    """
+    if (Workers is not None) and (Workers > 1):
+        Function = functools.partial(_GetPowerSums, MaxPower = MaxPower,
+                                                                Shift = Shift)
+        Chunks = _MapChunks(Function, Data, Workers = Workers)
+        return [sum(Items) for Items in zip(*Chunks)]
+    if _IsArray(Data):
+        Result = [0.0] * MaxPower
+        for Start in range(0, len(Data), STREAM_CHUNK_LENGTH):
+            Base = Data[Start : Start + STREAM_CHUNK_LENGTH]
+            if Shift:
+                Base = Base - Shift
+            Powers = np.empty((MaxPower, len(Base)))
+            Powers[0] = Base
+            for Index in range(1, MaxPower):
+                np.multiply(Powers[Index - 1], Base, out = Powers[Index])
+            for Index, Sum in enumerate(Powers.sum(axis = 1).tolist()):
+                Result[Index] += Sum
+    else:
+        Result = [0] * MaxPower
+        Indexes = range(1, MaxPower)
+        for Item in Data:
+            Base = Item - Shift
+            Product = Base
+            Result[0] += Base
+            for Index in Indexes:
+                Product *= Base
+                Result[Index] += Product
+    return Result
+
+def _ShiftPowerSums(Sums: List[TReal], Shift: TReal) -> List[TReal]:
+    """
+    Converts the sums of the powers 0 to K of the deviations of the data from
+    some value A into the sums of the same powers of the deviations from the
+    value A - Shift using the binomial expansion, i.e. sum((X - A + Shift)^k) =
+    sum(C(k, i) * Shift^(k - i) * sum((X - A)^i)) over 0 <= i <= k. The input
+    data is not checked.
+
+    Signature:
+        list(int OR float), int OR float -> list(int OR float)
+    
+    Args:
+        Sums: list(int OR float); the sums of the powers 0 to K, starting with
+            the sum of the zero powers, e.g. the length of the data
+        Shift: int OR float; the value to be added to each deviation
+    
+    Returns:
+        list(int OR float): the sums of the powers 0 to K of the shifted
+            deviations
+
+    Version 1.0.0.0
+    """
+    Result = [Sums[0]]
+    Coefficients = [1]
+    for Power in range(1, len(Sums)):
+        Coefficients = [1] + [Coefficients[Index - 1] + Coefficients[Index]
+                                        for Index in range(1, Power)] + [1]
+        Result.append(sum(Coefficient * pow(Shift, Power - Index) * Sums[Index]
+                            for Index, Coefficient in enumerate(Coefficients)))
+    return Result
+
+def _GetShiftedMean(Data: TRealData, *,
+                                    Workers: Optional[int] = None) -> TReal:
+    """
+    Calculates the arithmetic mean of a sequence of real numbers or a NumPy
+    array as the first element plus the mean deviation from it, so the mean of
+    a constant sequence is exactly its element. The input data is not checked.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray/, *, int > 0 OR None/
+            -> int OR float
+    
+    Args:
+        Data: seq(int OR float) OR numpy.ndarray; the data
+        Workers: (keyword) int > 0 OR None; number of the worker processes,
+            defaults to None
+    
+    Returns:
+        int OR float: the mean value
+
+    Version 1.0.0.0
+    """
+    First = Data[0]
+    Sum = _GetPowerSums(Data, 1, Shift = First, Workers = Workers)[0]
+    return First + Sum / len(Data)
+
+def _GetCrossPowerSums(DataX: TRealData, DataY: TRealData, MaxPowerX: int,
+                        MaxPowerY: int, *, ShiftX: TReal = 0, ShiftY: TReal = 0,
+                        Workers: Optional[int] = None) -> List[List[TReal]]:
+    """
+    Calculates the sums of the products of all powers from 0 to the specified
+    ones of the shifted elements of the paired sequences of real numbers or
+    NumPy arrays, optionally split between several worker processes. The
+    whole grid of the sums, including the sums of the powers of each sequence
+    alone (the zero power of the other one), is accumulated in a single pass
+    over the data in blocks of STREAM_CHUNK_LENGTH elements: the powers of the
+    block's elements are obtained by the incremental element-wise
+    multiplication, and the block's grid of sums consists of the dot products
+    of these powers. Thus each pair of elements is read only once, and the
+    extra memory is bounded by (MaxPowerX + MaxPowerY) blocks, regardless of
+    the data length. The input data is not checked.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray, seq(int OR float) OR numpy.ndarray,
+            int >= 0, int >= 0/, *, int OR float, int OR float,
+                int > 0 OR None/ -> list(list(int OR float))
+    
+    Args:
+        DataX: seq(int OR float) OR numpy.ndarray; the X data
+        DataY: seq(int OR float) OR numpy.ndarray; the Y data
+        MaxPowerX: int >= 0; the highest power of X
+        MaxPowerY: int >= 0; the highest power of Y
+        ShiftX: (keyword) int OR float; value to be subtracted from each
+            element of X, defaults to 0
+        ShiftY: (keyword) int OR float; value to be subtracted from each
+            element of Y, defaults to 0
+        Workers: (keyword) int > 0 OR None; number of the worker processes,
+            defaults to None
+    
+    Returns:
+        list(list(int OR float)): the sums of (X - ShiftX)^p * (Y - ShiftY)^q
+            with the p being the index of the outer list, and q - of the
+            nested lists; the element [0][0] is the length of the data
+
+    Version 1.2.0.0
+    """
+    if (Workers is not None) and (Workers > 1):
+        Function = functools.partial(_GetCrossPowerSums,
+                        MaxPowerX = MaxPowerX, MaxPowerY = MaxPowerY,
+                                            ShiftX = ShiftX, ShiftY = ShiftY)
+        Chunks = _MapChunks(Function, DataX, DataY, Workers = Workers)
+        return [[sum(Items) for Items in zip(*Rows)]
+                                                for Rows in zip(*Chunks)]
+    if _IsArray(DataX):
+        Result = np.zeros((MaxPowerX + 1, MaxPowerY + 1))
+        for Start in range(0, len(DataX), STREAM_CHUNK_LENGTH):
+            BaseX = DataX[Start : Start + STREAM_CHUNK_LENGTH] - ShiftX
+            BaseY = DataY[Start : Start + STREAM_CHUNK_LENGTH] - ShiftY
+            PowersX = np.ones((MaxPowerX + 1, len(BaseX)))
+            for Index in range(1, MaxPowerX + 1):
+                np.multiply(PowersX[Index - 1], BaseX, out = PowersX[Index])
+            PowersY = np.ones((MaxPowerY + 1, len(BaseY)))
+            for Index in range(1, MaxPowerY + 1):
+                np.multiply(PowersY[Index - 1], BaseY, out = PowersY[Index])
+            Result += PowersX @ PowersY.T
+        Result = Result.tolist()
+    else:
+        Result = [[0] * (MaxPowerY + 1) for _ in range(MaxPowerX + 1)]
+        for Start in range(0, len(DataX), STREAM_CHUNK_LENGTH):
+            BlockX = DataX[Start : Start + STREAM_CHUNK_LENGTH]
+            BlockY = DataY[Start : Start + STREAM_CHUNK_LENGTH]
+            BaseX = [Item - ShiftX for Item in BlockX] if ShiftX else BlockX
+            BaseY = [Item - ShiftY for Item in BlockY] if ShiftY else BlockY
+            PowersX = [BaseX]
+            for _ in range(1, MaxPowerX):
+                PowersX.append(list(map(operator.mul, PowersX[-1], BaseX)))
+            PowersY = [BaseY]
+            for _ in range(1, MaxPowerY):
+                PowersY.append(list(map(operator.mul, PowersY[-1], BaseY)))
+            Row = Result[0]
+            for Index, ItemY in enumerate(PowersY[:MaxPowerY], start = 1):
+                Row[Index] += sum(ItemY)
+            for Row, ItemX in zip(Result[1:], PowersX[:MaxPowerX]):
+                Row[0] += sum(ItemX)
+                for Index, ItemY in enumerate(PowersY[:MaxPowerY], start = 1):
+                    Row[Index] += sum(map(operator.mul, ItemX, ItemY))
+    Result[0][0] = len(DataX)
+    return Result
+
+def _GetCrossMoments(DataX: TRealData, DataY: TRealData, MaxPowerX: int,
+                        MaxPowerY: int, *, IsCentral: bool = False,
+                                IsNormalized: bool = False,
+                                Workers: Optional[int] = None
+                                            ) -> Optional[List[List[TReal]]]:
+    """
+    Calculates the grid of the generic p-th / q-th cross-moments of the paired
+    sequences of real numbers or NumPy arrays for all 0 <= p <= MaxPowerX and
+    0 <= q <= MaxPowerY, which can be central or non-central, normalized or
+    not normalized. The non-central not normalized moments take a single pass
+    over the data, see _GetCrossPowerSums(). Otherwise, the first pass finds
+    the means - relative to the first elements, so a constant sequence results
+    in exactly zero deviations - and the second one - the grid of the sums of
+    the products of the powers of the deviations from the means, including the
+    sums of the squared deviations, which give the standard deviations. The
+    non-central normalized moments are derived from these central sums by the
+    binomial expansion. The input data is not checked.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray, seq(int OR float) OR numpy.ndarray,
+            int >= 0, int >= 0/, *, bool, bool, int > 0 OR None/
+                -> list(list(int OR float)) OR None
+    
+    Args:
+        DataX: seq(int OR float) OR numpy.ndarray; the X data
+        DataY: seq(int OR float) OR numpy.ndarray; the Y data
+        MaxPowerX: int >= 0; the highest power of X
+        MaxPowerY: int >= 0; the highest power of Y
+        IsCentral: (keyword) bool; are the central moments to be calculated,
+            defaults to False
+        IsNormalized: (keyword) bool; are the normalized moments to be
+            calculated, defaults to False
+        Workers: (keyword) int > 0 OR None; number of the worker processes,
+            defaults to None
+    
+    Returns:
+        list(list(int OR float)): the moments with the power p of X being the
+            index of the outer list, and the power q of Y - of the nested
+            lists, all NaN if NaN is found in the central / normalized case
+        None: the central or normalized moments are requested, and, at least,
+            one of the sequences is constant
+
+    Version 1.0.0.0
+    """
+    Length = len(DataX)
+    if not (IsCentral or IsNormalized):
+        Sums = _GetCrossPowerSums(DataX, DataY, MaxPowerX, MaxPowerY,
+                                                            Workers = Workers)
+        return [[Sum / Length for Sum in Row] for Row in Sums]
+    FirstX = DataX[0]
+    FirstY = DataY[0]
+    Sums = _GetCrossPowerSums(DataX, DataY, 1, 1, ShiftX = FirstX,
+                                            ShiftY = FirstY, Workers = Workers)
+    MeanX = FirstX + Sums[1][0] / Length
+    MeanY = FirstY + Sums[0][1] / Length
+    Sums = _GetCrossPowerSums(DataX, DataY, max(MaxPowerX, 2),
+                                max(MaxPowerY, 2), ShiftX = MeanX,
+                                            ShiftY = MeanY, Workers = Workers)
+    VarX = Sums[2][0] / Length
+    VarY = Sums[0][2] / Length
+    if (VarX != VarX) or (VarY != VarY): #NaN in the data - propagates
+        return [[math.nan] * (MaxPowerY + 1) for _ in range(MaxPowerX + 1)]
+    if (not VarX > 0) or (not VarY > 0): #all items are the same!!!
+        return None
+    if not IsCentral:
+        Sums = [_ShiftPowerSums(Row, MeanY) for Row in Sums]
+        Sums = list(zip(*(_ShiftPowerSums(list(Column), MeanX)
+                                                    for Column in zip(*Sums))))
+    SigmaX = math.sqrt(VarX) if IsNormalized else 1
+    SigmaY = math.sqrt(VarY) if IsNormalized else 1
+    Result = []
+    for PowerX in range(MaxPowerX + 1):
+        ScaleX = Length * pow(SigmaX, PowerX)
+        Result.append([Sums[PowerX][PowerY] / (ScaleX * pow(SigmaY, PowerY))
+                                        for PowerY in range(MaxPowerY + 1)])
+    return Result
+
+def _GetCoMomentSummary(DataX: TRealData, DataY: TRealData, *,
+        Workers: Optional[int] = None) -> Tuple[int, TReal, TReal, TReal]:
+    """
+    Calculates the length, the means of X and Y data and the sum of the
+    products of the paired deviations from the respective means of two same
+    length sequences of real numbers or NumPy arrays. With several worker
+    processes the results per chunk are merged exactly using the pairwise
+    update formula by Chan et al. The input data is not checked.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray, seq(int OR float) OR numpy.ndarray
+            /, *, int > 0 OR None/ -> tuple(int, int OR float, int OR float,
+                                                                int OR float)
+    
+    Args:
+        DataX: seq(int OR float) OR numpy.ndarray; the X data
+        DataY: seq(int OR float) OR numpy.ndarray; the Y data
+        Workers: (keyword) int > 0 OR None; number of the worker processes,
+            defaults to None
+    
+    Returns:
+        tuple(int, int OR float, int OR float, int OR float): the length, mean
+            of X, mean of Y and the sum of the co-deviations
+
+    Version 1.0.0.0
+    """
+    if (Workers is not None) and (Workers > 1):
+        Parts = _MapChunks(_GetCoMomentSummary, DataX, DataY, Workers = Workers)
+        N, MeanX, MeanY, CoMoment = Parts[0]
+        for NB, MeanXB, MeanYB, CoMomentB in Parts[1:]:
+            Total = N + NB
+            DeltaX = MeanXB - MeanX
+            DeltaY = MeanYB - MeanY
+            CoMoment += CoMomentB + DeltaX * DeltaY * N * NB / Total
+            MeanX += DeltaX * NB / Total
+            MeanY += DeltaY * NB / Total
+            N = Total
+        return N, MeanX, MeanY, CoMoment
+    N = len(DataX)
+    MeanX = _GetSum(DataX) / N
+    MeanY = _GetSum(DataY) / N
+    if _IsArray(DataX):
+        CoMoment = float(np.dot(DataX - MeanX, DataY - MeanY))
+    else:
+        CoMoment = sum((Item - MeanX) * (DataY[Index] - MeanY)
+                                        for Index, Item in enumerate(DataX))
+    return N, MeanX, MeanY, CoMoment
+
+def _GetBivariateSummary(DataX: TRealData, DataY: TRealData, *,
+                            Workers: Optional[int] = None
+                            ) -> Tuple[int, TReal, TReal, TReal, TReal, TReal]:
+    """
+    Calculates the length, the means of X and Y data, the sums of their
+    squared deviations from the means and the sum of the products of the
+    paired deviations of two same length sequences of real numbers or NumPy
+    arrays in two passes. With several worker processes the results per chunk
+    are merged exactly using the pairwise update formulas by Chan et al. The
+    input data is not checked.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray, seq(int OR float) OR numpy.ndarray
+            /, *, int > 0 OR None/ -> tuple(int, int OR float, int OR float,
+                                    int OR float, int OR float, int OR float)
+    
+    Args:
+        DataX: seq(int OR float) OR numpy.ndarray; the X data
+        DataY: seq(int OR float) OR numpy.ndarray; the Y data
+        Workers: (keyword) int > 0 OR None; number of the worker processes,
+            defaults to None
+    
+    Returns:
+        tuple(int, int OR float, int OR float, int OR float, int OR float,
+            int OR float): the length, mean of X, mean of Y, sum of the squared
+            deviations of X and Y, and the sum of the co-deviations
+
+    Version 1.1.0.0
+    """
+    if (Workers is not None) and (Workers > 1):
+        Parts = _MapChunks(_GetBivariateSummary, DataX, DataY,
+                                                            Workers = Workers)
+        N, MeanX, MeanY, M2X, M2Y, C2 = Parts[0]
+        for NB, MeanXB, MeanYB, M2XB, M2YB, C2B in Parts[1:]:
+            Total = N + NB
+            DeltaX = MeanXB - MeanX
+            DeltaY = MeanYB - MeanY
+            Factor = N * NB / Total
+            M2X += M2XB + DeltaX * DeltaX * Factor
+            M2Y += M2YB + DeltaY * DeltaY * Factor
+            C2 += C2B + DeltaX * DeltaY * Factor
+            MeanX += DeltaX * NB / Total
+            MeanY += DeltaY * NB / Total
+            N = Total
+        return N, MeanX, MeanY, M2X, M2Y, C2
+    N = len(DataX)
+    MeanX = _GetSum(DataX) / N
+    MeanY = _GetSum(DataY) / N
+    if _IsArray(DataX):
+        DeviationsX = DataX - MeanX
+        DeviationsY = DataY - MeanY
+        M2X = float(np.dot(DeviationsX, DeviationsX))
+        M2Y = float(np.dot(DeviationsY, DeviationsY))
+        C2 = float(np.dot(DeviationsX, DeviationsY))
+    else:
+        M2X = 0
+        M2Y = 0
+        C2 = 0
+        for ItemX, ItemY in zip(DataX, DataY):
+            DeviationX = ItemX - MeanX
+            DeviationY = ItemY - MeanY
+            M2X += DeviationX * DeviationX
+            M2Y += DeviationY * DeviationY
+            C2 += DeviationX * DeviationY
+    return N, MeanX, MeanY, M2X, M2Y, C2
+
+def _GetIntegerPairSums(DataX: TRealData, DataY: TRealData
+                                    ) -> Tuple[int, int, int, int, int, int]:
+    """
+    Calculates the length and the integer sums of the elements, of their
+    squares and of the paired products of two same length sequences of only
+    integer numbers in a single pass over the pairs. The input data is not
+    checked.
+
+    Signature:
+        seq(int), seq(int) -> tuple(int, int, int, int, int, int)
+    
+    Args:
+        DataX: seq(int); the X data
+        DataY: seq(int); the Y data
+    
+    Returns:
+        tuple(int, int, int, int, int, int): the length, the sums of X, Y,
+            X^2, Y^2 and X * Y
+
+    Version 1.0.0.0
+    """
+    Length = 0
+    SumX = 0
+    SumY = 0
+    SumXX = 0
+    SumYY = 0
+    SumXY = 0
+    for ItemX, ItemY in zip(DataX, DataY):
+        Length += 1
+        SumX += ItemX
+        SumY += ItemY
+        SumXX += ItemX * ItemX
+        SumYY += ItemY * ItemY
+        SumXY += ItemX * ItemY
+    return Length, SumX, SumY, SumXX, SumYY, SumXY
+
+def _GetExactCoMoments(DataX: TRealData, DataY: TRealData, *,
+                    Workers: Optional[int] = None) -> Tuple[int, int, int, int]:
+    """
+    Calculates the length and the exact integer numerators of the sums of the
+    squared deviations of X and Y data and of the products of the paired
+    deviations (N * sum((X - <X>)^2) etc.) of two same length sequences of only
+    integer numbers from the integer sums of the elements, squares and
+    products, which are accumulated in a single pass over the pairs (per chunk
+    with several worker processes). The input data is not checked.
+
+    Signature:
+        seq(int), seq(int)/, *, int > 0 OR None/ -> tuple(int, int, int, int)
+    
+    Args:
+        DataX: seq(int); the X data
+        DataY: seq(int); the Y data
+        Workers: (keyword) int > 0 OR None; number of the worker processes,
+            defaults to None
+    
+    Returns:
+        tuple(int, int, int, int): the length and the numerators for X, Y and
+            their products
+
+    Version 1.1.0.0
+    """
+    Parts = _MapChunks(_GetIntegerPairSums, DataX, DataY, Workers = Workers)
+    Length, SumX, SumY, SumXX, SumYY, SumXY = (sum(Items)
+                                                    for Items in zip(*Parts))
+    return (Length, Length * SumXX - SumX * SumX, Length * SumYY - SumY * SumY,
+                                                Length * SumXY - SumX * SumY)
+
+def _ExtractColumns(Data: Any, *, SkipFrames: int = 1, DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                        ) -> List[TRealData]:
+    """
+    Prepares a multivariate data set - a sequence of the same length sequences
+    (columns), one per variable - for the calculation of the co-moments based
+    statistics, see _ExtractValues(). If any of the columns is converted into a
+    NumPy array, all other columns are converted as well. A 2D NumPy array is
+    treated as a sequence of its rows, i.e. one row per variable. With the SKIP
+    missing values policy the sets of values with, at least, one missing value
+    are excluded from all columns. The keyword arguments are not checked, this
+    is done once by the calling public function, see _CheckKeywords().
+
+    Signature:
+        seq(type A) OR numpy.ndarray/, *, int > 0, bool, MissingPolicy/
+            -> list(numpy.ndarray OR seq(int OR float))
+    
+    Args:
+        Data: seq(seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)
+            OR numpy.ndarray OR array.array OR memoryview) OR numpy.ndarray; a
+            sequence of the same length sequences of real numbers or
+            'measurements with uncertainty', or of the buffers of reals
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check for a sequence (not a buffer), defaults to True
+        Missing: (keyword) MissingPolicy; the treatment of the missing values,
+            defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        list(numpy.ndarray OR seq(int OR float)): the prepared columns
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of sequences of real
+            numbers or measurements with uncertainty, OR any keyword argument is
+            of improper type
+        UT_ValueError: mandatory argument is an empty sequence, OR any of the
+            nested sequences is empty, OR they are of different length, OR any
+            keyword argument is of the proper type but unacceptable value
+
+    Version 1.1.0.0
+    """
+    if not _IsArray(Data):
+        _CheckSequence(Data, SkipFrames = SkipFrames + 1)
+    elif not len(Data):
+        raise UT_ValueError(0, '> 0 - number of the variables',
+                                                        SkipFrames = SkipFrames)
+    if DoCheck or _IsArray(Data):
+        Data = _DropMissing(Data, Missing, SkipFrames = SkipFrames + 1)
+    Result = [_ExtractValues(Column, SkipFrames = SkipFrames + 1,
+                                        DoCheck = DoCheck) for Column in Data]
+    Length = len(Result[0])
+    for Index, Column in enumerate(Result):
+        if len(Column) != Length:
+            err = UT_ValueError(len(Column), f'== {Length} - length of data',
+                                                        SkipFrames = SkipFrames)
+            err.appendMessage(f'for the variable at position {Index}')
+            raise err
+    if any(_IsArray(Column) for Column in Result):
+        Result = [np.asarray(Column, dtype = np.float64) for Column in Result]
+    return Result
+
+def _GetCoMomentMatrix(Columns: List[TRealData]
+                                        ) -> Tuple[int, List[List[TReal]]]:
+    """
+    Calculates the matrix of the sums of the products of the paired deviations
+    from the respective means for all pairs of the same length sequences of
+    real numbers or NumPy arrays. Each column is centered only once, and the
+    deviations are calculated from the first element first, so a constant
+    column results in exactly zero sums. If all columns are sequences of only
+    integers (_IntegerList), the exact integer numerators N * sum((X - <X>) *
+    (Y - <Y>)) are calculated instead from the integer sums of the elements
+    and their products, as in _GetExactCoMoments(). The input data is not
+    checked.
+
+    Signature:
+        list(seq(int OR float) OR numpy.ndarray)
+            -> tuple(int > 0, list(list(int OR float)))
+    
+    Args:
+        Columns: list(seq(int OR float) OR numpy.ndarray); the data per
+            variable, either all NumPy arrays or all sequences
+    
+    Returns:
+        tuple(int > 0, list(list(int OR float))): the scale factor (1 or the
+            length of the data for the exact integer numerators) and the
+            symmetric matrix of the co-moments sums multiplied by it
+
+    Version 1.1.0.0
+    """
+    Length = len(Columns[0])
+    Size = len(Columns)
+    if _IsArray(Columns[0]):
+        Deviations = np.vstack(Columns)
+        Deviations -= Deviations[:, :1]
+        Deviations -= Deviations.sum(axis = 1, keepdims = True) / Length
+        return 1, (Deviations @ Deviations.T).tolist()
+    if all(isinstance(Column, _IntegerList) for Column in Columns):
+        Sums = [sum(Column) for Column in Columns]
+        Result = [[0] * Size for _ in range(Size)]
+        for Row in range(Size):
+            for Column in range(Row, Size):
+                Sum = (Length * sum(map(operator.mul, Columns[Row],
+                                    Columns[Column])) - Sums[Row] * Sums[Column])
+                Result[Row][Column] = Sum
+                Result[Column][Row] = Sum
+        return Length, Result
+    Deviations = []
+    for Column in Columns:
+        First = Column[0]
+        Shifted = [Item - First for Item in Column]
+        Mean = sum(Shifted) / Length
+        Deviations.append([Item - Mean for Item in Shifted])
+    Result = [[0] * Size for _ in range(Size)]
+    for Row in range(Size):
+        for Column in range(Row, Size):
+            Sum = sum(map(operator.mul, Deviations[Row], Deviations[Column]))
+            Result[Row][Column] = Sum
+            Result[Column][Row] = Sum
+    return 1, Result
+
+def _CheckMaxLag(Value: Any, Length: int, *, SkipFrames: int = 1) -> None:
+    """
+    Raises an exception if the passed maximum lag is not a non-negative integer
+    less than the length of the data.
+
+    Signature:
+        type A, int > 0/, *, int > 0/ -> None
+    
+    Raises:
+        UT_TypeError: the passed value is not an integer
+        UT_ValueError: the passed value is negative, or it is not less than the
+            length of the data
+
+    Version 1.0.0.0
+    """
+    if (not isinstance(Value, int)) or isinstance(Value, bool):
+        raise UT_TypeError(Value, int, SkipFrames = SkipFrames)
+    if Value < 0:
+        raise UT_ValueError(Value, '>= 0 - maximum lag',
+                                                        SkipFrames = SkipFrames)
+    if Value >= Length:
+        raise UT_ValueError(Value, '< {} - data length'.format(Length),
+                                                        SkipFrames = SkipFrames)
+
+def _GetFFT(Data: Sequence[complex], *,
+                                    IsInverse: bool = False) -> List[complex]:
+    """
+    Calculates the discrete Fourier transformation (or the inverse one) of a
+    sequence of complex numbers using the iterative radix-2 Cooley-Tukey
+    algorithm. The length of the data must be a power of 2. The input data is
+    not checked.
+
+    Signature:
+        seq(int OR float OR complex)/, *, bool/ -> list(complex)
+    
+    Args:
+        Data: seq(int OR float OR complex); the data of the length 2^n
+        IsInverse: (keyword) bool; flag if the inverse transformation (scaled
+            by 1 / N) is to be calculated, defaults to False
+    
+    Returns:
+        list(complex): the calculated transformation
+
+    Version 1.0.0.0
+    """
+    Size = len(Data)
+    Result = list(Data)
+    Index = 0
+    for Position in range(1, Size): #bit-reversal permutation
+        Bit = Size >> 1
+        while Index & Bit:
+            Index ^= Bit
+            Bit >>= 1
+        Index |= Bit
+        if Position < Index:
+            Result[Position], Result[Index] = Result[Index], Result[Position]
+    Half = 1
+    Sign = 1 if IsInverse else -1
+    while Half < Size:
+        Step = Sign * math.pi / Half
+        Twiddles = [cmath.exp(1j * Step * Power) for Power in range(Half)]
+        for Start in range(0, Size, 2 * Half):
+            Middle = Start + Half
+            End = Middle + Half
+            Lower = Result[Start : Middle]
+            Upper = list(map(operator.mul, Result[Middle : End], Twiddles))
+            Result[Start : Middle] = map(operator.add, Lower, Upper)
+            Result[Middle : End] = map(operator.sub, Lower, Upper)
+        Half *= 2
+    if IsInverse:
+        Result = [Item / Size for Item in Result]
+    return Result
+
+def _GetLaggedSums(DataX: TRealData, DataY: TRealData, MaxLag: int, *,
+            WithSquares: bool = False
+                    ) -> Union[List[TReal], Tuple[List[TReal], TReal, TReal]]:
+    """
+    Calculates the sums of the products of the deviations from the respective
+    means of X[t] and Y[t + k] for all lags k from 0 to MaxLag. Either the
+    direct summation, costing O(N * MaxLag), or the FFT based calculation of
+    the correlation, costing O(N * log(N)), is used depending on the estimated
+    costs. If NumPy is installed, the data is converted into float64 arrays,
+    and the NumPy vectorized products or FFT are used. The input data is not
+    checked. The same object can be passed as X and Y for the auto-covariance.
+    Optionally, the sums of the squared deviations of X and Y are calculated
+    from the same deviations and returned as well, so the normalization of the
+    cross-correlation does not require additional passes over the data.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray, seq(int OR float) OR numpy.ndarray,
+            int >= 0/, *, bool/ -> list(int OR float)
+                OR tuple(list(int OR float), int OR float, int OR float)
+    
+    Args:
+        DataX: seq(int OR float) OR numpy.ndarray; the X data
+        DataY: seq(int OR float) OR numpy.ndarray; the Y data of the same length
+        MaxLag: int >= 0; the maximum lag, less than the data length
+        WithSquares: (keyword) bool; flag if to return the sums of the squared
+            deviations of X and Y as well, defaults to False
+    
+    Returns:
+        list(int OR float): the sums for the lags 0 to MaxLag
+        tuple(list(int OR float), int OR float, int OR float): the sums for the
+            lags 0 to MaxLag, and the sums of the squared deviations of X and Y
+            - with WithSquares = True
+
+    Version 1.1.0.0
+    """
+    IsAuto = DataX is DataY
+    Length = len(DataX)
+    Size = 1 << (Length + MaxLag - 1).bit_length() #no circular overlap
+    IsDirect = ((MaxLag + 1) * Length <=
+                            FFT_COST_FACTOR * Size * (Size.bit_length() - 1))
+    if np is not None:
+        Deviations = []
+        for Data in ((DataX, ) if IsAuto else (DataX, DataY)):
+            Deviation = np.array(Data, dtype = np.float64)
+            Deviation -= Deviation[0]
+            Deviation -= Deviation.sum() / Length
+            Deviations.append(Deviation)
+        DevX, DevY = Deviations[0], Deviations[-1]
+        if IsDirect:
+            Result = [float(np.dot(DevX[: Length - Lag], DevY[Lag :]))
+                                                for Lag in range(MaxLag + 1)]
+        else:
+            SpectrumX = np.fft.rfft(DevX, Size)
+            if IsAuto:
+                Product = SpectrumX.real**2 + SpectrumX.imag**2
+            else:
+                Product = SpectrumX.conj() * np.fft.rfft(DevY, Size)
+            Result = np.fft.irfft(Product, Size)[: MaxLag + 1].tolist()
+        if WithSquares:
+            SumX = float(np.dot(DevX, DevX))
+            SumY = SumX if IsAuto else float(np.dot(DevY, DevY))
+            Result = Result, SumX, SumY
+        return Result
+    Deviations = []
+    for Data in ((DataX, ) if IsAuto else (DataX, DataY)):
+        First = Data[0]
+        Shifted = [Item - First for Item in Data]
+        Mean = sum(Shifted) / Length
+        Deviations.append([Item - Mean for Item in Shifted])
+    DevX, DevY = Deviations[0], Deviations[-1]
+    if IsDirect:
+        Result = [sum(map(operator.mul, DevX, itertools.islice(DevY, Lag,
+                                        None))) for Lag in range(MaxLag + 1)]
+    else:
+        Padding = [0] * (Size - Length)
+        SpectrumX = _GetFFT(DevX + Padding)
+        if IsAuto:
+            Product = [Item.real * Item.real + Item.imag * Item.imag
+                                                        for Item in SpectrumX]
+        else:
+            SpectrumY = _GetFFT(DevY + Padding)
+            Product = [ItemX.conjugate() * ItemY
+                                for ItemX, ItemY in zip(SpectrumX, SpectrumY)]
+        Result = [Item.real for Item in
+                    _GetFFT(Product, IsInverse = True)[: MaxLag + 1]]
+    if WithSquares:
+        SumX = sum(map(operator.mul, DevX, DevX))
+        SumY = SumX if IsAuto else sum(map(operator.mul, DevY, DevY))
+        Result = Result, SumX, SumY
+    return Result
+
+#+ 'public' functions to be available for everyone
+
+#++ 1D statistics
+
+def GetMean(Data: TGenericSequence, *, SkipFrames: int = 1,
+                DoCheck: bool = True, Workers: Optional[int] = None,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the arithmetic mean of a mixed sequence of real numbers and the
+    measurements with uncertainty.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated mean value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
+
+    Version 1.5.0.0
+    """
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Length = len(_Data)
+    if Workers is None:
+        Sum = _GetSum(_Data)
+    else:
+        Sum = sum(_MapChunks(_GetSum, _Data, Workers = Workers))
+    Result = Sum / Length
+    return Result
+
+def GetVarianceP(Data: TGenericSequence, *, SkipFrames: int = 1,
+                DoCheck: bool = True, Workers: Optional[int] = None,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the population variance of a mixed sequence of real numbers and
+    the measurements with uncertainty.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated variance value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
+
+    Version 1.5.0.0
+    """
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Result = _GetVariance(_Data, Workers = Workers)
+    return Result
+
+def GetStdevP(Data: TGenericSequence, *, SkipFrames: int = 1,
+                DoCheck: bool = True, Workers: Optional[int] = None,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the population standard deviation of a mixed sequence of real
+    numbers and the measurements with uncertainty.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated standard deviation value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
+
+    Version 1.5.0.0
+    """
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Result = math.sqrt(_GetVariance(_Data, Workers = Workers))
+    return Result
+
+def GetVarianceS(Data: TGenericSequence, *, SkipFrames: int = 1,
+                DoCheck: bool = True, Workers: Optional[int] = None,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the sample variance of a mixed sequence of real numbers and
+    the measurements with uncertainty.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated variance value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is less than 2 elements long,
+            OR any keyword argument is of the proper type but unacceptable
+            value, OR a missing value is found with the RAISE policy, OR all
+            values are missing with the SKIP policy
+
+    Version 1.5.0.0
+    """
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Length = len(_Data)
+    if Length < 2:
+        raise UT_ValueError(Length, '> 1 - sequence length',
+                                                        SkipFrames = SkipFrames)
+    Result = _GetVariance(_Data, IsSample = True, Workers = Workers)
+    return Result
+
+def GetStdevS(Data: TGenericSequence, *, SkipFrames: int = 1,
+                DoCheck: bool = True, Workers: Optional[int] = None,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the sample standard deviation of a mixed sequence of real
+    numbers and the measurements with uncertainty.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated standard deviation value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is less than 2 elements long,
+            OR any keyword argument is of the proper type but unacceptable
+            value, OR a missing value is found with the RAISE policy, OR all
+            values are missing with the SKIP policy
+
+    Version 1.5.0.0
+    """
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Length = len(_Data)
+    if Length < 2:
+        raise UT_ValueError(Length, '> 1 - sequence length',
+                                                        SkipFrames = SkipFrames)
+    Result = math.sqrt(_GetVariance(_Data, IsSample = True,
+                                                            Workers = Workers))
+    return Result
+
+def GetSE(Data: TGenericSequence, *, SkipFrames: int = 1,
+                DoCheck: bool = True, Workers: Optional[int] = None,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the standard error of the mean of a mixed sequence of real
+    numbers and the measurements with uncertainty.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated standard error of the mean value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
+
+    Version 1.5.0.0
+    """
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Result = math.sqrt(_GetVariance(_Data, Workers = Workers) / len(_Data))
+    return Result
+
+def GetMeanSqrSE(Data: TGenericSequence, *, SkipFrames: int = 1,
+                                            DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the mean squared uncertainty of a mixed sequence of real
+    numbers and the measurements with uncertainty.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated mean squared uncertainty value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
+
+    Version 1.2.1.0
+    """
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    if DoCheck:
+        Values, _Data = _ExtractData(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing)
+        Length = len(Values)
+    else:
+        _Data = _ExtractErrors(Data, DoCheck = False)
+        Length = len(Data)
+    if _Data is None: #no uncertainties present
+        Sum = 0
+    else:
+        Sum = sum(pow(Item, 2) for Item in _Data)
+    Result = Sum / Length
+    return Result
+
+def GetFullSE(Data: TGenericSequence, *, SkipFrames: int = 1,
+                                            DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the full uncertainty of the mean of a mixed sequence of real
+    numbers and the measurements with uncertainty.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated full uncertainty of the mean value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
+
+    Version 1.3.1.0
+    """
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    if DoCheck:
+        _Data, Errors = _ExtractData(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing)
+    else:
+        _Data = _ExtractMeans(Data, DoCheck = False)
+        Errors = _ExtractErrors(Data, DoCheck = False)
+    Length = len(_Data)
+    Variance = _GetMomentsSummary(_Data).Var
+    if Errors is None: #no uncertainties present
+        MSSE = 0
+    else:
+        MSSE = sum(pow(Item, 2) for Item in Errors) / Length
+    Result = math.sqrt((Variance + MSSE) / Length)
+    return Result
+
+def GetMoment(Data: TGenericSequence, Power: int, *, IsCentral: bool = False,
+                IsNormalized: bool = False, SkipFrames: int = 1,
+                DoCheck: bool = True, Workers: Optional[int] = None,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the generic N-th moment of a mixed sequence of real numbers and
+    the measurements with uncertainty, which can be central or non-central,
+    normailized or not normalized, depending on the values of the keyword
+    arguments.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int > 0/,
+            *, bool, bool, int > 0, bool, int > 0 OR None, MissingPolicy/
+                -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        Power: int > 0; the moment power
+        IsCentral: (keyword) bool; is the central moment is to be calculated,
+            defaults to False
+        IsNormalized: (keyword) bool; is the normalized moment is to be
+            calculated, defaults to False
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated moment value
+    
+    Raises:
+        UT_TypeError: the mandatory data argument is not a sequence of real
+            numbers or measurements with uncertainty, OR the moment power is not
+            an integer number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the moment power
+            is zero or negative integer, OR any keyword argument is of the
+            proper type but unacceptable value, OR a missing value is found with
+            the RAISE policy, OR all values are missing with the SKIP policy
+
+    Version 1.4.1.0
+    """
+    _CheckPositiveInteger(Power)
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Length = len(_Data)
+    if (not IsCentral) and (not IsNormalized):
+        Result = _GetPowerSum(_Data, Power, Workers = Workers) / Length
+    else:
+        Summary = _GetMomentsSummary(_Data, Workers = Workers)
+        if Summary.M2 != Summary.M2: #NaN in the data - propagates
+            Result = math.nan
+        elif Summary.M2 > 0:
+            if IsCentral and Power < 5:
+                Result = Summary.getCentralMoment(Power,
+                                                    IsNormalized = IsNormalized)
+            else:
+                if IsCentral:
+                    Mean = Summary.Mean
+                else:
+                    Mean = 0
+                if IsNormalized:
+                    Sigma = Summary.Sigma
+                else:
+                    Sigma = 1
+                Sum = _GetPowerSum(_Data, Power, Shift = Mean, Scale = Sigma,
+                                                            Workers = Workers)
+                Result = Sum / Length
+        else: #all elements are the same!!!!
+            if not IsCentral:
+                raise UT_ValueError(0, '!= 0 - variance of the data',
+                                                        SkipFrames = SkipFrames)
+            Result = 0
+    return Result
+
+def GetMoments(Data: TGenericSequence,
+                    Powers: Sequence[int] = (1, 2, 3, 4), *,
+                    IsCentral: bool = False, IsNormalized: bool = False,
+                    SkipFrames: int = 1, DoCheck: bool = True,
+                    Workers: Optional[int] = None,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                         ) -> Dict[int, TReal]:
+    """
+    Calculates several generic moments of a mixed sequence of real numbers and
+    the measurements with uncertainty at once, which can be central or
+    non-central, normailized or not normalized, depending on the values of the
+    keyword arguments. The sums of all powers up to the highest requested one
+    are obtained by the incremental multiplication per element, thus the data
+    is processed in one pass for all requested non-central not normalized
+    moments, and in two passes otherwise: the first one finds the mean, and
+    the second one - the sums of the powers of the deviations from it. The
+    non-central normalized moments are derived from the same central sums by
+    the binomial expansion. No intermediate copies of the data are created
+    (see GetMoment()).
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            seq(int > 0), *, bool, bool, int > 0, bool, int > 0 OR None,
+                MissingPolicy/ -> dict(int > 0 -> int OR float)
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        Powers: (optional) seq(int > 0); the moments powers, defaults to
+            (1, 2, 3, 4)
+        IsCentral: (keyword) bool; are the central moments to be calculated,
+            defaults to False
+        IsNormalized: (keyword) bool; are the normalized moments to be
+            calculated, defaults to False
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        dict(int > 0 -> int OR float): the calculated moments values per
+            requested power
+    
+    Raises:
+        UT_TypeError: the mandatory data argument is not a sequence of real
+            numbers or measurements with uncertainty, OR the moments powers are
+            not a sequence of integer numbers, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the sequence of
+            the powers is empty or contains zero or negative integer, OR the
+            variance of the data is zero for the normalized non-central moments,
+            OR any keyword argument is of the proper type but unacceptable
+            value, OR a missing value is found with the RAISE policy, OR all
+            values are missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.1.2.0
     """
-    if not isinstance(Value, int):
-        raise UT_TypeError(Value, int, SkipFrames = 2)
-    elif Value < 1:
-        raise UT_ValueError(Value, '> 0 integer', SkipFrames = 2)
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _CheckSequence(Powers, SkipFrames = SkipFrames + 1)
+    for Index, Power in enumerate(Powers):
+        if (not isinstance(Power, int)) or isinstance(Power, bool):
+            err = UT_TypeError(Power, int, SkipFrames = SkipFrames)
+            err.appendMessage(f'at position {Index} in the powers')
+            raise err
+        if Power < 1:
+            err = UT_ValueError(Power, '> 0 integer', SkipFrames = SkipFrames)
+            err.appendMessage(f'at position {Index} in the powers')
+            raise err
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Length = len(_Data)
+    MaxPower = max(Powers)
+    if (not IsCentral) and (not IsNormalized):
+        Sums = _GetPowerSums(_Data, MaxPower, Workers = Workers)
+        return {Power : Sums[Power - 1] / Length for Power in Powers}
+    #the mean is calculated relative to the first element, so a constant
+    #+ sequence results in exactly zero deviations
+    Mean = _GetShiftedMean(_Data, Workers = Workers)
+    Sums = _GetPowerSums(_Data, max(MaxPower, 2), Shift = Mean,
+                                                            Workers = Workers)
+    Variance = Sums[1] / Length
+    if Variance != Variance: #NaN in the data - propagates
+        return {Power : math.nan for Power in Powers}
+    if not Variance > 0: #all elements are the same!!!!
+        if not IsCentral:
+            raise UT_ValueError(0, '!= 0 - variance of the data',
+                                                        SkipFrames = SkipFrames)
+        return {Power : 0 for Power in Powers}
+    if not IsCentral:
+        Sums = _ShiftPowerSums([Length] + Sums, Mean)[1:]
+    Sigma = math.sqrt(Variance) if IsNormalized else 1
+    Result = {Power : Sums[Power - 1] / (Length * pow(Sigma, Power))
+                                                        for Power in Powers}
+    return Result
 
-def _CheckInput(Data: Any, *, SkipFrames: int = 1) -> None:
+def GetSkewnessP(Data: TGenericSequence, *, SkipFrames: int = 1,
+                DoCheck: bool = True, Workers: Optional[int] = None,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
     """
-    Checks if the passed argument is a sequence of real numbers or measurements
-    with uncertainty.
+    Calculates the population skewness of a mixed sequence of real numbers and
+    the measurements with uncertainty.
 
     Signature:
-        type A/, * , int > 0/ -> None
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
     
     Args:
-        Data: type A; any type to be checked, should be a sequence of real
-            numbers or 'measurements with uncertainty' to avoid an exception
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
         SkipFrames: (keyword) int > 0; how many frames to hide in the
-            exception traceback
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated skewness value
     
     Raises:
         UT_TypeError: mandatory argument is not a sequence of real numbers or
             measurements with uncertainty, OR any keyword argument is of
             improper type
         UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
 
-    Version 1.0.1.0
+    Version 1.4.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if ((not isinstance(Data, c_abc.Sequence))
-                                or (isinstance(Data, (str, bytes, bytearray)))):
-        raise UT_TypeError(Data, (list, tuple), SkipFrames = SkipFrames)
-    if not Data:
-        raise UT_ValueError(len(Data), '> 0 - length of the sequence',
-                                                        SkipFrames = SkipFrames)
-    for Index, Element in enumerate(Data):
-        if not isinstance(Element, (int, float)):
-            if not (hasattr(Element, 'Value') and hasattr(Element, 'SE')):
-                err = UT_TypeError(Element, (int, float, MeasuredValue),
-                                                        SkipFrames = SkipFrames)
-                err.appendMessage(f'at position {Index} in sequence')
-                raise err
-    
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Result = _GetMomentsSummary(_Data, Workers = Workers).Skew
+    return Result
 
-def _ExtractMeans(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TRealList:
+def GetSkewnessS(Data: TGenericSequence, *, SkipFrames: int = 1,
+                DoCheck: bool = True, Workers: Optional[int] = None,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
     """
-    Extracts all 'mean' values from a mixed sequence of real numbers and the
-    measurements with uncertainty, where the real numbers are treated as having
-    zero uncertainty.
+    Calculates the sample skewness of a mixed sequence of real numbers and the
+    measurements with uncertainty.
 
     Signature:
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> list(int OR float)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
@@ -188,41 +4404,48 @@ def _ExtractMeans(Data: TGenericSequence, *, SkipFrames: int = 1,
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
-            check, defautls to True
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        list(int OR float): the extracted 'mean' values
-
+        int OR float: the calculated skewness value
+    
     Raises:
         UT_TypeError: mandatory argument is not a sequence of real numbers or
             measurements with uncertainty, OR any keyword argument is of
             improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_ValueError: passed mandatory sequence is less than 3 elements long,
+            OR any keyword argument is of the proper type but unacceptable
+            value, OR a missing value is found with the RAISE policy, OR all
+            values are missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.4.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _CheckInput(Data, SkipFrames = SkipFrames + 1)
-    Result = []
-    for Item in Data:
-        if isinstance(Item, (int, float)):
-            Result.append(Item)
-        else:
-            Result.append(Item.Value)
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Length = len(_Data)
+    if Length < 3:
+        raise UT_ValueError(Length, '> 2 - sequence length',
+                                                        SkipFrames = SkipFrames)
+    Result = _GetMomentsSummary(_Data, Workers = Workers).SkewS
     return Result
 
-def _ExtractErrors(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TRealList:
+def GetKurtosisP(Data: TGenericSequence, *, SkipFrames: int = 1,
+                DoCheck: bool = True, Workers: Optional[int] = None,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
     """
-    Extracts all 'errors' values from a mixed sequence of real numbers and the
-    measurements with uncertainty, where the real numbers are treated as having
-    zero uncertainty.
+    Calculates the population excess kurtosis of a mixed sequence of real
+    numbers and the measurements with uncertainty.
 
     Signature:
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> list(int OR float)
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
@@ -230,44 +4453,44 @@ def _ExtractErrors(Data: TGenericSequence, *, SkipFrames: int = 1,
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
-            check, defaults to True
+            check and convert the mixed sequence into a list of only real
+            numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        list(int OR float): the extracted 'error' values
+        int OR float: the calculated excess kurtosis value
     
     Raises:
         UT_TypeError: mandatory argument is not a sequence of real numbers or
             measurements with uncertainty, OR any keyword argument is of
             improper type
         UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.4.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _CheckInput(Data, SkipFrames = SkipFrames + 1)
-    Result = []
-    for Item in Data:
-        if isinstance(Item, (int, float)):
-            Result.append(0)
-        else:
-            Result.append(Item.SE)
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Result = _GetMomentsSummary(_Data, Workers = Workers).Kurt
     return Result
 
-#+ 'public' functions to be available for everyone
-
-#++ 1D statistics
-
-def GetMean(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetKurtosisS(Data: TGenericSequence, *, SkipFrames: int = 1,
+                DoCheck: bool = True, Workers: Optional[int] = None,
+                Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
     """
-    Calculates the arithmetic mean of a mixed sequence of real numbers and the
-    measurements with uncertainty.
+    Calculates the sample excess kurtosis of a mixed sequence of real numbers
+    and the measurements with uncertainty.
 
     Signature:
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+            bool, int > 0 OR None, MissingPolicy/ -> int OR float
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
@@ -277,741 +4500,984 @@ def GetMean(Data: TGenericSequence, *, SkipFrames: int = 1,
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated mean value
+        int OR float: the calculated skewness value
     
     Raises:
         UT_TypeError: mandatory argument is not a sequence of real numbers or
             measurements with uncertainty, OR any keyword argument is of
             improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_ValueError: passed mandatory sequence is less than 4 elements long,
+            OR any keyword argument is of the proper type but unacceptable
+            value, OR a missing value is found with the RAISE policy, OR all
+            values are missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.4.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
-    else:
-        _Data = Data
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
     Length = len(_Data)
-    Sum = sum(Item for Item in _Data)
-    Result = Sum / Length
+    if Length < 4:
+        raise UT_ValueError(Length, '> 3 - sequence length',
+                                                        SkipFrames = SkipFrames)
+    Result = _GetMomentsSummary(_Data, Workers = Workers).KurtS
     return Result
 
-def GetVarianceP(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+#++ 2D statistics
+
+def GetCovariance(DataX: TGenericSequence, DataY: TGenericSequence, *,
+                            SkipFrames: int = 1, DoCheck: bool = True,
+                                    Workers: Optional[int] = None,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
     """
-    Calculates the population variance of a mixed sequence of real numbers and
+    Calculates the covariance of the paired  mixed sequences of real numbers and
     the measurements with uncertainty.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+                *, int > 0, bool, int > 0 OR None, MissingPolicy/
+                    -> int OR float
     
     Args:
-        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
-            sequence of real numbers or 'measurements with uncertainty'
+        DataX: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty' as X
+        DataY: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty' as Y
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated variance value
+        int OR float: the calculated covariance value
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_TypeError: any of mandatory data arguments is not a sequence of real
+            numbers or measurements with uncertainty, OR any keyword argument is
+            of improper type
+        UT_ValueError: any of the passed mandatory sequence is empty, OR any
+            keyword argument is of the proper type but unacceptable value, OR
+            the X and Y sequences are of different length, OR a missing value is
+            found with the RAISE policy, OR all values are missing with the SKIP
+            policy
 
-    Version 1.0.0.0
+    Version 1.5.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _DataX, _DataY = _ExtractPairedValues(DataX, DataY,
+                            SkipFrames = SkipFrames + 1, DoCheck = DoCheck,
+                                                            Missing = Missing)
+    if isinstance(_DataX, _IntegerList) and isinstance(_DataY, _IntegerList):
+        Length, _, _, Sum = _GetExactCoMoments(_DataX, _DataY,
+                                                            Workers = Workers)
+        Result = Sum / (Length * Length)
     else:
-        _Data = Data
-    Length = len(_Data)
-    Mean = GetMean(_Data, SkipFrames = SkipFrames + 1, DoCheck = False)
-    Sum = sum(pow(Item - Mean, 2) for Item in _Data)
-    Result = Sum / Length
+        Length, _, _, Sum = _GetCoMomentSummary(_DataX, _DataY,
+                                                            Workers = Workers)
+        Result = Sum / Length
     return Result
 
-def GetStdevP(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetMoment2(DataX: TGenericSequence, DataY: TGenericSequence, PowerX: int,
+                    PowerY: int, *, IsCentral: bool = False,
+                        IsNormalized: bool = False, SkipFrames: int = 1,
+                            DoCheck: bool = True,
+                                    Workers: Optional[int] = None,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
     """
-    Calculates the population standard deviation of a mixed sequence of real
-    numbers and the measurements with uncertainty.
+    Calculates the generic N-th / M-th moment of the paired mixed sequences of
+    real numbers and the measurements with uncertainty, which can be central or
+    non-central, normailized or not normalized, depending on the values of the
+    keyword arguments. The central and normalized moments take two passes over
+    the data: for the means and for the sums of the powers of the deviations
+    from them, including the squared deviations for the normalization (see
+    GetMoments2()).
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+                int > 0, int > 0/, *, bool, bool, int > 0, bool,
+                    int > 0 OR None, MissingPolicy/ -> int OR float
     
     Args:
-        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
-            sequence of real numbers or 'measurements with uncertainty'
+        DataX: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty' as X
+        DataY: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty' as Y
+        PowerX: int > 0; the moment power of X
+        PowerY: int > 0; the moment power of Y
+        IsCentral: (keyword) bool; is the central moment is to be calculated,
+            defaults to False
+        IsNormalized: (keyword) bool; is the normalized moment is to be
+            calculated, defaults to False
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated standard deviation value
+        int OR float: the calculated moment value
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_TypeError: any of mandatory data arguments is not a sequence of real
+            numbers or measurements with uncertainty, OR any moment power is
+            not an integer number, OR any keyword argument is of improper type
+        UT_ValueError: any of the passed mandatory sequence is empty, OR any
+            moment power is zero or negative integer, OR any keyword argument is
+            of the proper type but unacceptable value, OR the X and Y sequences
+            are of different length, OR a missing value is found with the RAISE
+            policy, OR all values are missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.4.1.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
-    else:
-        _Data = Data
-    Variance = GetVarianceP(_Data, SkipFrames = SkipFrames + 1,  DoCheck= False)
-    Result = math.sqrt(Variance)
+    _CheckPositiveInteger(PowerX)
+    _CheckPositiveInteger(PowerY)
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _DataX, _DataY = _ExtractPairedValues(DataX, DataY,
+                            SkipFrames = SkipFrames + 1, DoCheck = DoCheck,
+                                                            Missing = Missing)
+    Moments = _GetCrossMoments(_DataX, _DataY, PowerX, PowerY,
+                                IsCentral = IsCentral,
+                            IsNormalized = IsNormalized, Workers = Workers)
+    if Moments is not None:
+        Result = Moments[PowerX][PowerY]
+    else: #at least, in one sequence all items are the same!!!
+        if not IsCentral:
+            raise UT_ValueError(0, '!= 0 - variance of the data',
+                                                        SkipFrames = SkipFrames)
+        Result = 0 # any central moment
     return Result
 
-def GetVarianceS(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetMoments2(DataX: TGenericSequence, DataY: TGenericSequence,
+                    MaxPowerX: int, MaxPowerY: int, *,
+                    IsCentral: bool = False, IsNormalized: bool = False,
+                    SkipFrames: int = 1, DoCheck: bool = True,
+                    Workers: Optional[int] = None,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                        ) -> Dict[Tuple[int, int], TReal]:
     """
-    Calculates the sample variance of a mixed sequence of real numbers and
-    the measurements with uncertainty.
+    Calculates the entire grid of the generic p-th / q-th moments of the paired
+    mixed sequences of real numbers and the measurements with uncertainty for
+    all 1 <= p <= MaxPowerX and 1 <= q <= MaxPowerY at once, which can be
+    central or non-central, normailized or not normalized, depending on the
+    values of the keyword arguments. The powers of each sequence are obtained
+    by the incremental multiplication, and the entire grid is accumulated in
+    one pass over the paired data in blocks of STREAM_CHUNK_LENGTH elements.
+    The non-central not normalized moments take this single pass, and all
+    other cases take two passes: the first one finds the means, and the second
+    one - the grid of the sums of the powers of the deviations from them,
+    which also includes the squared deviations for the normalization. The
+    non-central normalized moments are derived from these central sums by the
+    binomial expansion (see GetMoment2()).
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+                int > 0, int > 0/, *, bool, bool, int > 0, bool,
+                    int > 0 OR None, MissingPolicy/
+                        -> dict(tuple(int > 0, int > 0)
+                                                            -> int OR float)
     
     Args:
-        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
-            sequence of real numbers or 'measurements with uncertainty'
+        DataX: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty' as X
+        DataY: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty' as Y
+        MaxPowerX: int > 0; the highest moment power of X
+        MaxPowerY: int > 0; the highest moment power of Y
+        IsCentral: (keyword) bool; are the central moments to be calculated,
+            defaults to False
+        IsNormalized: (keyword) bool; are the normalized moments to be
+            calculated, defaults to False
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated variance value
+        dict(tuple(int > 0, int > 0) -> int OR float): the calculated moments
+            values per pair of powers (p, q)
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is less than 2 elements long,
-            OR any keyword argument is of the proper type but unacceptable value
+        UT_TypeError: any of mandatory data arguments is not a sequence of real
+            numbers or measurements with uncertainty, OR any moment power is
+            not an integer number, OR any keyword argument is of improper type
+        UT_ValueError: any of the passed mandatory sequence is empty, OR any
+            moment power is zero or negative integer, OR any keyword argument is
+            of the proper type but unacceptable value, OR the X and Y sequences
+            are of different length, OR the variance of any sequence is zero for
+            the normalized non-central moments, OR a missing value is found with
+            the RAISE policy, OR all values are missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.1.2.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
-    else:
-        _Data = Data
-    Length = len(_Data)
-    if Length < 2:
-        raise UT_ValueError(Length, '> 1 - sequence length',
+    _CheckPositiveInteger(MaxPowerX)
+    _CheckPositiveInteger(MaxPowerY)
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _DataX, _DataY = _ExtractPairedValues(DataX, DataY,
+                            SkipFrames = SkipFrames + 1, DoCheck = DoCheck,
+                                                            Missing = Missing)
+    Moments = _GetCrossMoments(_DataX, _DataY, MaxPowerX, MaxPowerY,
+                                IsCentral = IsCentral,
+                            IsNormalized = IsNormalized, Workers = Workers)
+    if Moments is None: #all items are the same!!!
+        if not IsCentral:
+            raise UT_ValueError(0, '!= 0 - variance of the data',
                                                         SkipFrames = SkipFrames)
-    Mean = GetMean(_Data, SkipFrames = SkipFrames + 1, DoCheck = False)
-    Sum = sum(pow(Item - Mean, 2) for Item in _Data)
-    Result = Sum / (Length - 1)
+        return {(PowerX, PowerY) : 0 for PowerX in range(1, MaxPowerX + 1)
+                                        for PowerY in range(1, MaxPowerY + 1)}
+    Result = {(PowerX, PowerY) : Moments[PowerX][PowerY]
+                                    for PowerX in range(1, MaxPowerX + 1)
+                                        for PowerY in range(1, MaxPowerY + 1)}
     return Result
 
-def GetStdevS(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetPearsonR(DataX: TGenericSequence, DataY: TGenericSequence, *,
+                            SkipFrames: int = 1, DoCheck: bool = True,
+                                    Workers: Optional[int] = None,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
     """
-    Calculates the sample standard deviation of a mixed sequence of real
-    numbers and the measurements with uncertainty.
+    Calculates the Pearson`s correlation coefficient r of the paired  mixed
+    sequences of real numbers and the measurements with uncertainty.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+                *, int > 0, bool, int > 0 OR None, MissingPolicy/
+                    -> int OR float
     
     Args:
-        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
-            sequence of real numbers or 'measurements with uncertainty'
+        DataX: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty' as X
+        DataY: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty' as Y
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Workers: (keyword) int > 0 OR None; number of the worker processes
+            to split the calculations between, defaults to None (in the
+            current process)
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated standard deviation value
+        int OR float: the correlation value
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is less than 2 elements long,
-            OR any keyword argument is of the proper type but unacceptable value
+        UT_TypeError: any of mandatory data arguments is not a sequence of real
+            numbers or measurements with uncertainty, OR any keyword argument is
+            of improper type
+        UT_ValueError: any of the passed mandatory sequence is empty, OR any
+            keyword argument is of the proper type but unacceptable value, OR
+            the X and Y sequences are of different length, OR a missing value is
+            found with the RAISE policy, OR all values are missing with the SKIP
+            policy
 
-    Version 1.0.0.0
+    Version 1.5.2.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
+    _CheckKeywords(SkipFrames, Workers = Workers, Missing = Missing)
+    _DataX, _DataY = _ExtractPairedValues(DataX, DataY,
+                            SkipFrames = SkipFrames + 1, DoCheck = DoCheck,
+                                                            Missing = Missing)
+    if isinstance(_DataX, _IntegerList) and isinstance(_DataY, _IntegerList):
+        #all values are scaled by N^2, which cancels out in the ratio
+        _, VarX, VarY, Covariance = _GetExactCoMoments(_DataX, _DataY,
+                                                            Workers = Workers)
+        SigmaX = math.sqrt(VarX)
+        SigmaY = math.sqrt(VarY)
     else:
-        _Data = Data
-    Variance = GetVarianceS(_Data, SkipFrames = SkipFrames + 1,  DoCheck= False)
-    Result = math.sqrt(Variance)
+        #all values are scaled by N, which cancels out in the ratio
+        _, _, _, VarX, VarY, Covariance = _GetBivariateSummary(_DataX, _DataY,
+                                                            Workers = Workers)
+        SigmaX = math.sqrt(VarX)
+        SigmaY = math.sqrt(VarY)
+    if SigmaX != SigmaX or SigmaY != SigmaY: #NaN in the data - propagates
+        Result = math.nan
+    elif SigmaX > 0 and SigmaY > 0:
+        Result = Covariance / (SigmaX * SigmaY)
+    elif (SigmaX > 0)  or (SigmaY > 0): #one sequence is constant
+        Result = 0
+    else: #both sequences are constants
+        Result = 1
     return Result
 
-def GetSE(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+#++ multivariate statistics
+
+def GetCovarianceMatrix(Data: Any, *, SkipFrames: int = 1,
+                                        DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                              ) -> TRealMatrix:
     """
-    Calculates the standard error of the mean of a mixed sequence of real
-    numbers and the measurements with uncertainty.
+    Calculates the covariance matrix of a multivariate data set passed as a
+    sequence of the same length mixed sequences of real numbers and the
+    measurements with uncertainty (or buffers of reals) - one sequence per
+    variable. Each variable is extracted and centered only once.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(seq(int OR float OR phyqus_lib.base_classes.MeasuredValue))/, *,
+            int > 0, bool, MissingPolicy/ -> tuple(tuple(int OR float))
     
     Args:
-        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
-            sequence of real numbers or 'measurements with uncertainty'
+        Data: seq(seq(int OR float OR phyqus_lib.base_classes.MeasuredValue));
+            a sequence of sequences of real numbers or 'measurements with
+            uncertainty', one per variable
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
-            check and convert the mixed sequence into a list of only real
+            check and convert the mixed sequences into lists of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated standard error of the mean value
+        tuple(tuple(int OR float)): the symmetric K x K covariance matrix, where
+            K is the number of the variables
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_TypeError: mandatory argument is not a sequence of sequences of real
+            numbers or measurements with uncertainty, OR any keyword argument is
+            of improper type
+        UT_ValueError: mandatory argument is an empty sequence, OR any of the
+            nested sequences is empty, OR they are of different length, OR any
+            keyword argument is of the proper type but unacceptable value, OR a
+            missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.1.1.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
-    else:
-        _Data = Data
-    Variance = GetVarianceP(_Data, SkipFrames = SkipFrames + 1,  DoCheck= False)
-    Result = math.sqrt(Variance / len(_Data))
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    Columns = _ExtractColumns(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Length = len(Columns[0])
+    Scale, CoMoments = _GetCoMomentMatrix(Columns)
+    Length *= Scale
+    Result = tuple(tuple(Item / Length for Item in Row) for Row in CoMoments)
     return Result
 
-def GetMeanSqrSE(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetPearsonMatrix(Data: Any, *, SkipFrames: int = 1,
+                                        DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                              ) -> TRealMatrix:
     """
-    Calculates the mean squared uncertainty of a mixed sequence of real
-    numbers and the measurements with uncertainty.
+    Calculates the matrix of the Pearson`s correlation coefficients r of a
+    multivariate data set passed as a sequence of the same length mixed
+    sequences of real numbers and the measurements with uncertainty (or
+    buffers of reals) - one sequence per variable. Each variable is extracted
+    and centered only once. The edge cases of the constant sequences are
+    treated in the same manner as by GetPearsonR(), and the diagonal elements
+    are always exactly 1.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(seq(int OR float OR phyqus_lib.base_classes.MeasuredValue))/, *,
+            int > 0, bool, MissingPolicy/ -> tuple(tuple(int OR float))
     
     Args:
-        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
-            sequence of real numbers or 'measurements with uncertainty'
+        Data: seq(seq(int OR float OR phyqus_lib.base_classes.MeasuredValue));
+            a sequence of sequences of real numbers or 'measurements with
+            uncertainty', one per variable
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
-            check and convert the mixed sequence into a list of only real
+            check and convert the mixed sequences into lists of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated mean squared uncertainty value
+        tuple(tuple(int OR float)): the symmetric K x K correlation matrix,
+            where K is the number of the variables
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_TypeError: mandatory argument is not a sequence of sequences of real
+            numbers or measurements with uncertainty, OR any keyword argument is
+            of improper type
+        UT_ValueError: mandatory argument is an empty sequence, OR any of the
+            nested sequences is empty, OR they are of different length, OR any
+            keyword argument is of the proper type but unacceptable value, OR a
+            missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.1.2.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    _Data = _ExtractErrors(Data, SkipFrames = SkipFrames + 1, DoCheck = DoCheck)
-    Length = len(_Data)
-    Sum = sum(pow(Item, 2) for Item in _Data)
-    Result = Sum / Length
-    return Result
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    Columns = _ExtractColumns(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    #the scale factor cancels out in the ratio
+    _, CoMoments = _GetCoMomentMatrix(Columns)
+    Sigmas = [math.sqrt(CoMoments[Index][Index])
+                                        for Index in range(len(CoMoments))]
+    Result = []
+    for Row, SigmaX in enumerate(Sigmas):
+        Line = []
+        for Column, SigmaY in enumerate(Sigmas):
+            if SigmaX != SigmaX or SigmaY != SigmaY: #NaN - propagates
+                Line.append(math.nan)
+            elif Row == Column: #exactly, without the rounding errors
+                Line.append(1)
+            elif SigmaX > 0 and SigmaY > 0:
+                Line.append(CoMoments[Row][Column] / (SigmaX * SigmaY))
+            elif (SigmaX > 0)  or (SigmaY > 0): #one sequence is constant
+                Line.append(0)
+            else: #both sequences are constants
+                Line.append(1)
+        Result.append(tuple(Line))
+    return tuple(Result)
 
-def GetFullSE(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+#++ streaming statistics
+
+def GetStreamSummary(Data: Any, *, ChunkSize: Optional[int] = None,
+                                SkipFrames: int = 1) -> MomentAccumulator:
     """
-    Calculates the full uncertainty of the mean of a mixed sequence of real
-    numbers and the measurements with uncertainty.
+    Calculates all moment-based 1D statistics of the data points from any
+    iterable (e.g. a generator or a file reader), which is consumed only once,
+    in constant memory. The iterable can yield the single data points - real
+    numbers and / or measurements with uncertainty - and / or blocks of them -
+    sequences or 1D buffers of real numbers. The statistics are available as
+    the properties of the returned accumulator, which can be updated or merged
+    further.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        iterable(type A)/, *, int > 0 OR None, int > 0/ -> MomentAccumulator
     
     Args:
-        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
-            sequence of real numbers or 'measurements with uncertainty'
+        Data: iterable(int OR float OR phyqus_lib.base_classes.MeasuredValue OR
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) OR
+            numpy.ndarray OR array.array OR memoryview); the data points or
+            blocks of them
+        ChunkSize: (keyword) int > 0 OR None; the number of the single data
+            points per batch update, defaults to None, i.e. STREAM_CHUNK_LENGTH
+            (module's global constant)
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
-        DoCheck: (keyword) bool; flag if to perform the input data sanity
-            check and convert the mixed sequence into a list of only real
-            numbers
     
     Returns:
-        int OR float: the calculated full uncertainty of the mean value
+        MomentAccumulator: the accumulated statistics, see the class
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_TypeError: mandatory argument is not an iterable of real numbers,
+            measurements with uncertainty or sequences of those, OR any keyword
+            argument is of improper type
+        UT_ValueError: no data points are yielded by the iterable, OR any
+            keyword argument is of the proper type but unacceptable value
 
     Version 1.0.0.0
     """
     _CheckPositiveInteger(SkipFrames)
-    Variance = GetVarianceP(Data, SkipFrames = SkipFrames + 1, DoCheck= DoCheck)
-    MSSE = GetMeanSqrSE(Data, SkipFrames = SkipFrames + 1, DoCheck = False)
-    Result = math.sqrt((Variance + MSSE) / len(Data))
+    if ChunkSize is not None:
+        _CheckPositiveInteger(ChunkSize)
+    if (not isinstance(Data, c_abc.Iterable)) or isinstance(Data, (str, bytes)):
+        raise UT_TypeError(Data, c_abc.Iterable, SkipFrames = SkipFrames)
+    Result = MomentAccumulator()
+    Result.updateStream(Data, ChunkSize = ChunkSize)
+    if not Result.N:
+        raise UT_ValueError(0, '> 0 - number of data points',
+                                                        SkipFrames = SkipFrames)
     return Result
 
-def GetMoment(Data: TGenericSequence, Power: int, *, IsCentral: bool = False,
-                IsNormalized: bool = False, SkipFrames: int = 1,
-                    DoCheck: bool = True) -> TReal:
+#++ rolling (moving window) statistics
+
+def GetRollingMean(Data: TGenericSequence, Window: int, *,
+                                SkipFrames: int = 1,
+                                DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                        ) -> Tuple[TReal, ...]:
     """
-    Calculates the generic N-th moment of a mixed sequence of real numbers and
-    the measurements with uncertainty, which can be central or non-central,
-    normailized or not normalized, depending on the values of the keyword
-    arguments.
+    Calculates the arithmetic mean of each window of the fixed width sliding
+    over a mixed sequence of real numbers and the measurements with uncertainty
+    with the step of one element. Each next value is obtained by the O(1)
+    update, so the total cost does not depend on the width of the window.
 
     Signature:
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int > 0/,
-            *, bool, bool, int > 0, bool/ -> int OR float
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty'
-        Power: int > 0; the moment power
-        IsCentral: (keyword) bool; is the central moment is to be calculated,
-            defaults to False
-        IsNormalized: (keyword) bool; is the normalized moment is to be
-            calculated, defaults to False
+        Window: int > 0; the width of the window, not greater than the length
+            of the sequence
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated moment value
+        tuple(int OR float): the mean values of the consecutive windows,
+            starting with the elements 0 to Window - 1, i.e. len(Data) - Window
+            + 1 values
     
     Raises:
         UT_TypeError: the mandatory data argument is not a sequence of real
-            numbers or measurements with uncertainty, OR the moment power is not
-            an integer number, OR any keyword argument is of improper type
-        UT_ValueError: passed mandatory sequence is empty, OR the moment power
-            is zero or negative integer, OR any keyword argument is of the
-            proper type but unacceptable value
+            numbers or measurements with uncertainty, OR the window width is
+            not an integer number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the window width
+            is not positive or greater than the length of the sequence, OR any
+            keyword argument is of the proper type but unacceptable value, OR a
+            missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
 
-    Version 1.0.0.1
+    Version 1.1.0.0
     """
-    _CheckPositiveInteger(Power)
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
-    else:
-        _Data = Data
-    if IsCentral:
-        Mean = GetMean(_Data, SkipFrames = SkipFrames + 1, DoCheck = False)
-    else:
-        Mean = 0
-    if IsNormalized:
-        Sigma = GetStdevP(_Data, SkipFrames = SkipFrames + 1, DoCheck = False)
-    else:
-        Sigma = 1
+    _CheckPositiveInteger(Window)
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
     Length = len(_Data)
-    Eps = sys.float_info.epsilon
-    First = _Data[0]
-    CheckIfSameValues = any(map(lambda x: abs(x - First) > Eps, _Data))
-    if CheckIfSameValues:
-        Sum = sum(pow((Item - Mean) / Sigma, Power) for Item in _Data)
-        Result = Sum / Length
-    else: #all elements are the same!!!!
-        if IsNormalized and (not IsCentral):
-            raise UT_ValueError(Sigma, '!= 0 - variance of the data',
+    if Window > Length:
+        raise UT_ValueError(Window, '<= {} - data length'.format(Length),
                                                         SkipFrames = SkipFrames)
-        elif (not IsNormalized) and (not IsCentral):
-            Result = sum(pow(Item, Power) for Item in _Data) / Length
-        else:
-            Result = 0
+    Result = tuple(Summary.Mean
+                        for Summary in _GetRollingSummaries(_Data, Window))
     return Result
 
-def GetSkewnessP(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetRollingVarianceP(Data: TGenericSequence, Window: int, *,
+                                SkipFrames: int = 1,
+                                DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                        ) -> Tuple[TReal, ...]:
     """
-    Calculates the population skewness of a mixed sequence of real numbers and
-    the measurements with uncertainty.
+    Calculates the population variance of each window of the fixed width sliding
+    over a mixed sequence of real numbers and the measurements with uncertainty
+    with the step of one element. Each next value is obtained by the O(1)
+    update, so the total cost does not depend on the width of the window.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int > 0/,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty'
+        Window: int > 0; the width of the window, not greater than the length
+            of the sequence
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated skewness value
+        tuple(int OR float): the variance values of the consecutive windows,
+            starting with the elements 0 to Window - 1, i.e. len(Data) - Window
+            + 1 values
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_TypeError: the mandatory data argument is not a sequence of real
+            numbers or measurements with uncertainty, OR the window width is
+            not an integer number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the window width
+            is not positive or greater than the length of the sequence, OR any
+            keyword argument is of the proper type but unacceptable value, OR a
+            missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    Result = GetMoment(Data, 3, IsCentral = True, IsNormalized = True,
-                                SkipFrames = SkipFrames + 1, DoCheck= DoCheck)
+    _CheckPositiveInteger(Window)
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Length = len(_Data)
+    if Window > Length:
+        raise UT_ValueError(Window, '<= {} - data length'.format(Length),
+                                                        SkipFrames = SkipFrames)
+    Result = tuple(Summary.Var
+                        for Summary in _GetRollingSummaries(_Data, Window))
     return Result
 
-def GetSkewnessS(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetRollingSkewnessP(Data: TGenericSequence, Window: int, *,
+                                SkipFrames: int = 1,
+                                DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                        ) -> Tuple[TReal, ...]:
     """
-    Calculates the sample skewness of a mixed sequence of real numbers and the
-    measurements with uncertainty.
+    Calculates the population skewness of each window of the fixed width sliding
+    over a mixed sequence of real numbers and the measurements with uncertainty
+    with the step of one element. Each next value is obtained by the O(1)
+    update, so the total cost does not depend on the width of the window.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int > 0/,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty'
+        Window: int > 0; the width of the window, not greater than the length
+            of the sequence
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated skewness value
+        tuple(int OR float): the skewness values of the consecutive windows,
+            starting with the elements 0 to Window - 1, i.e. len(Data) - Window
+            + 1 values
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is less than 3 elements long,
-            OR any keyword argument is of the proper type but unacceptable value
+        UT_TypeError: the mandatory data argument is not a sequence of real
+            numbers or measurements with uncertainty, OR the window width is
+            not an integer number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the window width
+            is not positive or greater than the length of the sequence, OR any
+            keyword argument is of the proper type but unacceptable value, OR a
+            missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
-    else:
-        _Data = Data
+    _CheckPositiveInteger(Window)
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
     Length = len(_Data)
-    if Length < 3:
-        raise UT_ValueError(Length, '> 2 - sequence length',
+    if Window > Length:
+        raise UT_ValueError(Window, '<= {} - data length'.format(Length),
                                                         SkipFrames = SkipFrames)
-    Skew = GetSkewnessP(_Data, SkipFrames = SkipFrames + 1, DoCheck= False)
-    Result = math.sqrt(Length * (Length - 1)) * Skew / (Length - 2)
+    Result = tuple(Summary.Skew
+                        for Summary in _GetRollingSummaries(_Data, Window))
     return Result
 
-def GetKurtosisP(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetRollingKurtosisP(Data: TGenericSequence, Window: int, *,
+                                SkipFrames: int = 1,
+                                DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                        ) -> Tuple[TReal, ...]:
     """
-    Calculates the population excess kurtosis of a mixed sequence of real
-    numbers and the measurements with uncertainty.
+    Calculates the population excess kurtosis of each window of the fixed width
+    sliding over a mixed sequence of real numbers and the measurements with
+    uncertainty with the step of one element. Each next value is obtained by the
+    O(1) update, so the total cost does not depend on the width of the window.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int > 0/,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty'
+        Window: int > 0; the width of the window, not greater than the length
+            of the sequence
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated excess kurtosis value
+        tuple(int OR float): the kurtosis values of the consecutive windows,
+            starting with the elements 0 to Window - 1, i.e. len(Data) - Window
+            + 1 values
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_TypeError: the mandatory data argument is not a sequence of real
+            numbers or measurements with uncertainty, OR the window width is
+            not an integer number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the window width
+            is not positive or greater than the length of the sequence, OR any
+            keyword argument is of the proper type but unacceptable value, OR a
+            missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    Result = GetMoment(Data, 4, IsCentral = True, IsNormalized = True,
-                            SkipFrames = SkipFrames + 1, DoCheck= DoCheck) - 3
+    _CheckPositiveInteger(Window)
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Length = len(_Data)
+    if Window > Length:
+        raise UT_ValueError(Window, '<= {} - data length'.format(Length),
+                                                        SkipFrames = SkipFrames)
+    Result = tuple(Summary.Kurt
+                        for Summary in _GetRollingSummaries(_Data, Window))
     return Result
 
-def GetKurtosisS(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+#++ serial (lagged) statistics
+
+def GetAutocovariance(Data: TGenericSequence, MaxLag: int, *,
+                                SkipFrames: int = 1,
+                                DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                        ) -> Tuple[TReal, ...]:
     """
-    Calculates the sample excess kurtosis of a mixed sequence of real numbers
-    and the measurements with uncertainty.
+    Calculates the auto-covariance of a mixed sequence of real numbers and the
+    measurements with uncertainty, treated as a time series, for all lags k
+    from 0 to MaxLag, i.e. the sum of the products of the deviations from the
+    mean of the elements t and t + k divided by the length of the sequence N.
+    The direct summation (O(N * MaxLag)) or the FFT based calculation
+    (O(N * log(N))) is selected by the estimated cost, and the NumPy vectorized
+    implementation is used, if NumPy is installed.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int >= 0/,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty'
+        MaxLag: int >= 0; the maximum lag, less than the length of the sequence
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated skewness value
+        tuple(int OR float): the auto-covariance values for the lags 0 to
+            MaxLag, the first being the population variance
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is less than 4 elements long,
-            OR any keyword argument is of the proper type but unacceptable value
+        UT_TypeError: the mandatory data argument is not a sequence of real
+            numbers or measurements with uncertainty, OR the maximum lag is not
+            an integer number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the maximum lag
+            is negative or not less than the length of the sequence, OR any
+            keyword argument is of the proper type but unacceptable value, OR a
+            missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
 
     Version 1.0.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
-    else:
-        _Data = Data
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
     Length = len(_Data)
-    if Length < 4:
-        raise UT_ValueError(Length, '> 3 - sequence length',
-                                                        SkipFrames = SkipFrames)
-    Kurt = GetKurtosisP(_Data, SkipFrames = SkipFrames + 1, DoCheck= False)
-    Temp = (Length - 1) * ((Length + 1) * Kurt  + 6)
-    Result = Temp / ((Length - 2) * (Length - 3))
+    _CheckMaxLag(MaxLag, Length, SkipFrames = SkipFrames + 1)
+    Sums = _GetLaggedSums(_Data, _Data, MaxLag)
+    Result = tuple(Sum / Length for Sum in Sums)
     return Result
 
-#++ 2D statistics
-
-def GetCovariance(DataX: TGenericSequence, DataY: TGenericSequence, *,
-                            SkipFrames: int = 1, DoCheck: bool = True) -> TReal:
+def GetAutocorrelation(Data: TGenericSequence, MaxLag: int, *,
+                                SkipFrames: int = 1,
+                                DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                        ) -> Tuple[TReal, ...]:
     """
-    Calculates the covariance of the paired  mixed sequences of real numbers and
-    the measurements with uncertainty.
+    Calculates the auto-correlation of a mixed sequence of real numbers and the
+    measurements with uncertainty, treated as a time series, for all lags k
+    from 0 to MaxLag, i.e. the auto-covariance normalized by the variance.
+    The direct summation (O(N * MaxLag)) or the FFT based calculation
+    (O(N * log(N))) is selected by the estimated cost, and the NumPy vectorized
+    implementation is used, if NumPy is installed.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
-            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
-                *, int > 0, bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue), int >= 0/,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
     
     Args:
-        DataX: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
-            sequence of real numbers or 'measurements with uncertainty' as X
-        DataY: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
-            sequence of real numbers or 'measurements with uncertainty' as Y
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        MaxLag: int >= 0; the maximum lag, less than the length of the sequence
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated covariance value
+        tuple(int OR float): the auto-correlation values for the lags 0 to
+            MaxLag, all equal to 1 for a constant sequence
     
     Raises:
-        UT_TypeError: any of mandatory data arguments is not a sequence of real
-            numbers or measurements with uncertainty, OR any keyword argument is
-            of improper type
-        UT_ValueError: any of the passed mandatory sequence is empty, OR any
-            keyword argument is of the proper type but unacceptable value, OR
-            the X and Y sequences are of different length
+        UT_TypeError: the mandatory data argument is not a sequence of real
+            numbers or measurements with uncertainty, OR the maximum lag is not
+            an integer number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the maximum lag
+            is negative or not less than the length of the sequence, OR any
+            keyword argument is of the proper type but unacceptable value, OR a
+            missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.0.1.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _DataX = _ExtractMeans(DataX, SkipFrames = SkipFrames + 1)
-        _DataY = _ExtractMeans(DataY, SkipFrames = SkipFrames + 1)
-    else:
-        _DataX = DataX
-        _DataY = DataY
-    if len(_DataX) != len(_DataY):
-        raise UT_ValueError(
-                len(_DataX), '== {} - X and Y data length'.format(len(_DataY)),
-                                                    SkipFrames = SkipFrames)
-    MeanX = GetMean(_DataX, SkipFrames = SkipFrames + 1, DoCheck = False)
-    MeanY = GetMean(_DataY, SkipFrames = SkipFrames + 1, DoCheck = False)
-    Length = len(_DataX)
-    Sum = sum((Item - MeanX) * (_DataY[Index] - MeanY)
-                                        for Index, Item in enumerate(_DataX))
-    Result = Sum / Length
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    _Data = _ExtractValues(Data, SkipFrames = SkipFrames + 1,
+                                         DoCheck = DoCheck, Missing = Missing)
+    Length = len(_Data)
+    _CheckMaxLag(MaxLag, Length, SkipFrames = SkipFrames + 1)
+    Sums = _GetLaggedSums(_Data, _Data, MaxLag)
+    if Sums[0] != Sums[0]: #NaN in the data - propagates
+        Result = (math.nan, ) * (MaxLag + 1)
+    elif Sums[0] > 0:
+        Result = tuple(Sum / Sums[0] for Sum in Sums)
+    else: #constant sequence
+        Result = (1, ) * (MaxLag + 1)
     return Result
 
-def GetMoment2(DataX: TGenericSequence, DataY: TGenericSequence, PowerX: int,
-                    PowerY: int, *, IsCentral: bool = False,
-                        IsNormalized: bool = False, SkipFrames: int = 1,
-                            DoCheck: bool = True) -> TReal:
+def GetCrossCovariance(DataX: TGenericSequence, DataY: TGenericSequence,
+                                MaxLag: int, *, SkipFrames: int = 1,
+                                DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                        ) -> Tuple[TReal, ...]:
     """
-    Calculates the generic N-th / M-th moment of the paired mixed sequences of
-    real numbers and the measurements with uncertainty, which can be central or
-    non-central, normailized or not normalized, depending on the values of the
-    keyword arguments.
+    Calculates the lagged cross-covariance of the paired mixed sequences of
+    real numbers and the measurements with uncertainty, treated as time series,
+    for all lags k from 0 to MaxLag, i.e. the sum of the products of the
+    deviations from the respective means of X[t] and Y[t + k] divided by the
+    length of the sequences N. The negative lags are obtained by swapping X and
+    Y. The direct summation (O(N * MaxLag)) or the FFT based calculation
+    (O(N * log(N))) is selected by the estimated cost, and the NumPy vectorized
+    implementation is used, if NumPy is installed.
 
     Signature:
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
             seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
-                int > 0, int > 0/, *, bool, bool, int > 0, bool/ -> int OR float
+                int >= 0/, *, int > 0, bool, MissingPolicy/
+                    -> tuple(int OR float)
     
     Args:
         DataX: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty' as X
         DataY: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty' as Y
-        PowerX: int > 0; the moment power of X
-        PowerY: int > 0; the moment power of Y
-        IsCentral: (keyword) bool; is the central moment is to be calculated,
-            defaults to False
-        IsNormalized: (keyword) bool; is the normalized moment is to be
-            calculated, defaults to False
+        MaxLag: int >= 0; the maximum lag, less than the length of the
+            sequences
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated moment value
+        tuple(int OR float): the cross-covariance values for the lags 0 to
+            MaxLag, the first being the covariance
     
     Raises:
         UT_TypeError: any of mandatory data arguments is not a sequence of real
-            numbers or measurements with uncertainty, OR any moment power is
-            not an integer number, OR any keyword argument is of improper type
-        UT_ValueError: any of the passed mandatory sequence is empty, OR any
-            moment power is zero or negative integer, OR any keyword argument is
-            of the proper type but unacceptable value, OR the X and Y sequences
-            are of different length
+            numbers or measurements with uncertainty, OR the maximum lag is not
+            an integer number, OR any keyword argument is of improper type
+        UT_ValueError: any of the passed mandatory sequence is empty, OR the X
+            and Y sequences are of different length, OR the maximum lag is
+            negative or not less than the length of the sequences, OR any
+            keyword argument is of the proper type but unacceptable value, OR a
+            missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
 
-    Version 1.0.0.1
+    Version 1.0.0.0
     """
-    _CheckPositiveInteger(PowerX)
-    _CheckPositiveInteger(PowerY)
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _DataX = _ExtractMeans(DataX, SkipFrames = SkipFrames + 1)
-        _DataY = _ExtractMeans(DataY, SkipFrames = SkipFrames + 1)
-    else:
-        _DataX = DataX
-        _DataY = DataY
-    if len(_DataX) != len(_DataY):
-        raise UT_ValueError(
-                len(_DataX), '== {} - X and Y data length'.format(len(_DataY)))
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    _DataX, _DataY = _ExtractPairedValues(DataX, DataY,
+                            SkipFrames = SkipFrames + 1, DoCheck = DoCheck,
+                                                            Missing = Missing)
     Length = len(_DataX)
-    if IsCentral:
-        MeanX = GetMean(_DataX, SkipFrames = SkipFrames + 1, DoCheck = False)
-        MeanY = GetMean(_DataY, SkipFrames = SkipFrames + 1, DoCheck = False)
-    else:
-        MeanX = 0
-        MeanY = 0
-    if IsNormalized:
-        SigmaX = GetStdevP(_DataX, SkipFrames = SkipFrames + 1, DoCheck = False)
-        SigmaY = GetStdevP(_DataY, SkipFrames = SkipFrames + 1, DoCheck = False)
-    else:
-        SigmaX = 1
-        SigmaY = 1
-    Eps = sys.float_info.epsilon
-    First = _DataX[0]
-    AreSameXs = any(map(lambda x: abs(x - First) > Eps, _DataX))
-    First = _DataY[0]
-    AreSameYs = any(map(lambda x: abs(x - First) > Eps, _DataY))
-    if AreSameXs and AreSameYs:
-        Sum = sum((pow((Item - MeanX) / SigmaX, PowerX) *
-                pow((_DataY[Index] - MeanY) / SigmaY, PowerY))
-                                        for Index, Item in enumerate(_DataX))
-        Result = Sum / Length
-    else: #at least, in one sequence all items are the same!!!
-        if IsNormalized and (not IsCentral):
-            raise UT_ValueError((SigmaX, SigmaY), '!= 0 - variance of the data',
-                                                        SkipFrames = SkipFrames)
-        elif (not IsNormalized) and (not IsCentral):
-            Result = sum(pow(Item, PowerX) * pow(_DataY[Index], PowerY)
-                                for Index, Item in enumerate(_DataX)) / Length
-        else: # any central moment
-            Result = 0
+    _CheckMaxLag(MaxLag, Length, SkipFrames = SkipFrames + 1)
+    Sums = _GetLaggedSums(_DataX, _DataY, MaxLag)
+    Result = tuple(Sum / Length for Sum in Sums)
     return Result
 
-def GetPearsonR(DataX: TGenericSequence, DataY: TGenericSequence, *,
-                            SkipFrames: int = 1, DoCheck: bool = True) -> TReal:
+def GetCrossCorrelation(DataX: TGenericSequence, DataY: TGenericSequence,
+                                MaxLag: int, *, SkipFrames: int = 1,
+                                DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                        ) -> Tuple[TReal, ...]:
     """
-    Calculates the Pearson`s correlation coefficient r of the paired  mixed
-    sequences of real numbers and the measurements with uncertainty.
+    Calculates the lagged cross-correlation of the paired mixed sequences of
+    real numbers and the measurements with uncertainty, treated as time series,
+    for all lags k from 0 to MaxLag, i.e. the lagged cross-covariance of X[t]
+    and Y[t + k] normalized by the product of the standard deviations of X and
+    Y, with the value at the lag 0 being the Pearson's correlation coefficient.
+    The negative lags are obtained by swapping X and Y. The direct summation
+    (O(N * MaxLag)) or the FFT based calculation (O(N * log(N))) is selected by
+    the estimated cost, and the NumPy vectorized implementation is used, if
+    NumPy is installed.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
-            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
-                *, int > 0, bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+                int >= 0/, *, int > 0, bool, MissingPolicy/
+                    -> tuple(int OR float)
     
     Args:
         DataX: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty' as X
         DataY: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty' as Y
+        MaxLag: int >= 0; the maximum lag, less than the length of the
+            sequences
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the correlation value
+        tuple(int OR float): the cross-correlation values for the lags 0 to
+            MaxLag
     
     Raises:
         UT_TypeError: any of mandatory data arguments is not a sequence of real
-            numbers or measurements with uncertainty, OR any keyword argument is
-            of improper type
-        UT_ValueError: any of the passed mandatory sequence is empty, OR any
-            keyword argument is of the proper type but unacceptable value, OR
-            the X and Y sequences are of different length
+            numbers or measurements with uncertainty, OR the maximum lag is not
+            an integer number, OR any keyword argument is of improper type
+        UT_ValueError: any of the passed mandatory sequence is empty, OR the X
+            and Y sequences are of different length, OR the maximum lag is
+            negative or not less than the length of the sequences, OR any
+            keyword argument is of the proper type but unacceptable value, OR a
+            missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
 
-    Version 1.0.0.0
+    Version 1.0.2.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _DataX = _ExtractMeans(DataX, SkipFrames = SkipFrames + 1)
-        _DataY = _ExtractMeans(DataY, SkipFrames = SkipFrames + 1)
-    else:
-        _DataX = DataX
-        _DataY = DataY
-    Covariance = GetCovariance(_DataX, _DataY, SkipFrames = SkipFrames + 1,
-                                                                DoCheck = False)
-    SigmaX = GetStdevP(_DataX, SkipFrames = SkipFrames + 1, DoCheck = False)
-    SigmaY = GetStdevP(_DataY, SkipFrames = SkipFrames + 1, DoCheck = False)
-    if SigmaX > 0 and SigmaY > 0:
-        Result = Covariance / (SigmaX * SigmaY)
-    elif (SigmaX > 0)  or (SigmaY > 0): #one sequence is constant
-        Result = 0
+    _CheckKeywords(SkipFrames, Missing = Missing)
+    _DataX, _DataY = _ExtractPairedValues(DataX, DataY,
+                            SkipFrames = SkipFrames + 1, DoCheck = DoCheck,
+                                                            Missing = Missing)
+    Length = len(_DataX)
+    _CheckMaxLag(MaxLag, Length, SkipFrames = SkipFrames + 1)
+    Sums, SumX, SumY = _GetLaggedSums(_DataX, _DataY, MaxLag,
+                                                        WithSquares = True)
+    if SumX != SumX or SumY != SumY: #NaN in the data - propagates
+        Result = (math.nan, ) * (MaxLag + 1)
+    elif SumX > 0 and SumY > 0:
+        Norm = math.sqrt(SumX) * math.sqrt(SumY)
+        Result = tuple(Sum / Norm for Sum in Sums)
+    elif (SumX > 0)  or (SumY > 0): #one sequence is constant
+        Result = (0, ) * (MaxLag + 1)
     else: #both sequences are constants
-        Result = 1
-    return Result
\ No newline at end of file
+        Result = (1, ) * (MaxLag + 1)
+    return Result
@@ -11,10 +11,11 @@ calculated and returned on demand.
 Classes:
     Statistics1D
     Statistics2D
+    StreamStatistics1D
 """
 
-__version__= '1.0.1.0'
-__date__ = '01-05-2023'
+__version__= '1.11.0.3'
+__date__ = '17-10-2026'
 __status__ = 'Production'
 
 #imports
@@ -24,8 +25,9 @@ __status__ = 'Production'
 import sys
 import os
 import math
+import collections.abc as c_abc
 
-from typing import Optional, Union, Any, Tuple
+from typing import Optional, Union, Any, Tuple, Iterator
 
 #+ custom modules
 
@@ -95,17 +97,38 @@ class Statistics1D:
             data
         Kurt: (read-only) int OR float; the (population) excess kurtosis of the
             stored data
+        MAD: (read-only) int >= 0 OR float >= 0; the median absolute deviation
+            of the stored data
+        Sn: (read-only) int >= 0 OR float >= 0; the Rousseeuw-Croux Sn robust
+            scale estimator of the stored data
+        Qn: (read-only) int >= 0 OR float >= 0; the Rousseeuw-Croux Qn robust
+            scale estimator of the stored data
+        Medcouple: (read-only) int OR float; the medcouple (robust skewness) of
+            the stored data
+        LLocation: (read-only) int OR float; the L-location (L-moment of the
+            order 1) of the stored data
+        LScale: (read-only) int >= 0 OR float >= 0; the L-scale (L-moment of
+            the order 2) of the stored data
+        LSkew: (read-only) int OR float; the L-skewness (L-moment ratio of the
+            order 3) of the stored data
+        LKurt: (read-only) int OR float; the L-kurtosis (L-moment ratio of the
+            order 4) of the stored data
         Summary: (read-only) str; the summary of the statistical properties of
             the data set
     
     Methods:
         getQuantile(k, m)
             0<= int k <= int m -> int OR float
+        getQuantiles(Quantiles)
+            int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR float >= 0)
+                -> tuple(int OR float)
+        getLMoments(Order)
+            int > 0 -> tuple(int OR float)
         getHistogram(*, NBins = None, BinSize = None)
             /*, int > 0 OR None, int > 0 OR float > 0 OR None/
                 -> tuple(tuple(int OR float, int >= 0))
     
-    Version 1.0.1.0
+    Version 1.6.0.0
     """
     
     #special methods
@@ -114,7 +137,9 @@ class Statistics1D:
         """
         Initialization method. Perfroms the input data sanity check, extaction
         of the 'means' and uncertainties of the measurements, and encapsulation
-        of the data.
+        of the data - all in a single pass. For a sequence of only real numbers
+        the zero uncertainties are not stored, but generated on demand. A
+        sequence of only integers is flagged for the exact calculations.
 
         Signature:
             seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) -> None
@@ -128,17 +153,25 @@ class Statistics1D:
                 measurements with uncertainty
             UT_ValueError: passed sequence is empty
         
-        Version 1.0.0.0
+        Version 1.3.3.0
         """
-        Temp = bf._ExtractMeans(Data, SkipFrames = 2)
+        Values, Errors = bf._ExtractData(Data, SkipFrames = 2)
         self._Data = dict()
-        self._Data['Values'] = tuple(Temp)
-        self._Data['Errors'] = tuple(bf._ExtractErrors(Data, DoCheck = False))
+        self._Data['Values'] = tuple(Values)
+        self._Data['IsInteger'] = isinstance(Values, bf._IntegerList)
+        if Errors is None: #no uncertainties present
+            self._Data['Errors'] = None
+        else:
+            self._Data['Errors'] = tuple(Errors)
         self._Data['Sorted'] =  None
+        self._Data['Moments'] = None
+        self._Data['LMoments'] = None
         self._Properties = {Key : None for Key in ['N', 'Mean', 'Median', 'Q1',
                                     'Q3', 'Min', 'Max', 'Var', 'Sigma', 'SE',
                                         'Skew', 'Kurt', 'FullVar', 'FullSigma',
-                                                            'FullSE', 'Name']}
+                                        'FullSE', 'MAD', 'Sn', 'Qn',
+                                        'Medcouple', 'LLocation', 'LScale',
+                                                'LSkew', 'LKurt', 'Name']}
     
     def __str__(self) -> str:
         """
@@ -165,6 +198,69 @@ class Statistics1D:
         IdHex = hex(id(self))
         return f'<{self.__class__.__name__}({self.Name}) at {IdHex}>'
     
+    #private methods
+
+    def _getValues(self) -> bf.TRealSequence:
+        """
+        Returns the stored values prepared for the moment-based calculations,
+        i.e. marked as a sequence of only integers (if it is the case) to enable
+        the exact integer arithmetics.
+
+        Signature:
+            None -> seq(int OR float)
+        
+        Version 1.0.0.0
+        """
+        if self._Data['IsInteger']:
+            Result = bf._IntegerList(self._Data['Values'])
+        else:
+            Result = self._Data['Values']
+        return Result
+
+    def _getMoments(self) -> bf._MomentsSummary:
+        """
+        Calculates (on the first call) and returns the cached summary of the
+        central moments of the stored data set, from which the mean, variance,
+        skewness and kurtosis are derived - all in a single pass over the data.
+
+        Signature:
+            None -> statistics_lib.base_functions._MomentsSummary
+        
+        Version 1.1.0.0
+        """
+        if self._Data['Moments'] is None:
+            self._Data['Moments'] = bf._GetMomentsSummary(self._getValues())
+        return self._Data['Moments']
+    
+    def _getLMoments(self, Order: int) -> TRealTuple:
+        """
+        Calculates (on the first call) and returns the cached L-moments of the
+        orders 1 to 4 (or up to the length of the data set, if it is shorter)
+        of the stored data set - all in a single pass over the (cached) sorted
+        copy of the stored data.
+
+        Signature:
+            int > 0 -> tuple(int OR float)
+        
+        Args:
+            Order: int > 0; the highest order of the L-moments required by the
+                caller
+        
+        Raises:
+            UT_ValueError: the stored sequence is shorter than the required
+                order
+        
+        Version 1.0.0.0
+        """
+        if self._Data['LMoments'] is None:
+            self._Data['LMoments'] = of.GetLMoments(self.Sorted,
+                                    min(4, len(self.Sorted)), DoCheck = False)
+        if Order > len(self._Data['LMoments']):
+            raise UT_ValueError(len(self.Sorted),
+                    '>= {} - length of the sequence'.format(Order),
+                                                                SkipFrames = 2)
+        return self._Data['LMoments']
+
     #public API
 
     #+ properties
@@ -217,8 +313,10 @@ class Statistics1D:
         Signature:
             None -> tuple(int >= 0 OR float >= 0)
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
+        if self._Data['Errors'] is None: #only real numbers are stored
+            self._Data['Errors'] = (0, ) * len(self._Data['Values'])
         return self._Data['Errors']
     
     @property
@@ -259,10 +357,10 @@ class Statistics1D:
         Signature:
             None -> int OR float
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if self._Properties['Mean'] is None:
-            self._Properties['Mean'] = bf.GetMean(self.Values, DoCheck = False)
+            self._Properties['Mean'] = self._getMoments().Mean
         return self._Properties['Mean']
     
     @property
@@ -346,11 +444,10 @@ class Statistics1D:
         Signature:
             None -> int >= 0 OR float >= 0
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if self._Properties['Var'] is None:
-            self._Properties['Var'] = bf.GetVarianceP(self.Values,
-                                                                DoCheck = False)
+            self._Properties['Var'] = self._getMoments().Var
         return self._Properties['Var']
     
     @property
@@ -392,10 +489,13 @@ class Statistics1D:
         Signature:
             None -> int >= 0 OR float >= 0
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if self._Properties['FullVar'] is None:
-            MSSE = sum(pow(Item, 2) for Item in self.Errors) / self.N
+            if self._Data['Errors'] is None: #no uncertainties present
+                MSSE = 0
+            else:
+                MSSE = sum(pow(Item, 2) for Item in self.Errors) / self.N
             self._Properties['FullVar']= self.Var + MSSE
         return self._Properties['FullVar']
     
@@ -438,11 +538,10 @@ class Statistics1D:
         Signature:
             None -> int OR float
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if self._Properties['Skew'] is None:
-            self._Properties['Skew'] = bf.GetSkewnessP(self.Values,
-                                                                DoCheck = False)
+            self._Properties['Skew'] = self._getMoments().Skew
         return self._Properties['Skew']
     
     @property
@@ -453,13 +552,165 @@ class Statistics1D:
         Signature:
             None -> int OR float
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if self._Properties['Kurt'] is None:
-            self._Properties['Kurt'] = bf.GetKurtosisP(self.Values,
-                                                                DoCheck = False)
+            self._Properties['Kurt'] = self._getMoments().Kurt
         return self._Properties['Kurt']
     
+    @property
+    def MAD(self) -> bf.TReal:
+        """
+        Read-only property returning the median absolute deviation of the
+        stored data set. If the sorted copy of the stored data has been already
+        accessed, it is used (O(log(N))), otherwise the medians are found by the
+        selection (O(N)) without sorting. The stored data is already checked, so
+        the check is not repeated in either case.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.1.0
+        """
+        if self._Properties['MAD'] is None:
+            if self._Data['Sorted'] is None:
+                #GetMAD(DoCheck = False) expects a sorted sequence
+                self._Properties['MAD'] = of._GetMAD(self.Values)
+            else:
+                self._Properties['MAD'] = of.GetMAD(self.Sorted,
+                                                                DoCheck = False)
+        return self._Properties['MAD']
+    
+    @property
+    def Sn(self) -> bf.TReal:
+        """
+        Read-only property returning the Rousseeuw-Croux Sn robust scale
+        estimator of the stored data set, calculated on the (cached) sorted
+        copy of the stored data.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        if self._Properties['Sn'] is None:
+            self._Properties['Sn'] = of.GetSn(self.Sorted, DoCheck = False)
+        return self._Properties['Sn']
+    
+    @property
+    def Qn(self) -> bf.TReal:
+        """
+        Read-only property returning the Rousseeuw-Croux Qn robust scale
+        estimator of the stored data set, calculated on the (cached) sorted
+        copy of the stored data.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: the stored sequence is of length 1
+
+        Version 1.0.0.0
+        """
+        if self._Properties['Qn'] is None:
+            self._Properties['Qn'] = of.GetQn(self.Sorted, SkipFrames = 2,
+                                                                DoCheck = False)
+        return self._Properties['Qn']
+    
+    @property
+    def Medcouple(self) -> bf.TReal:
+        """
+        Read-only property returning the medcouple (robust skewness) of the
+        stored data set, calculated on the (cached) sorted copy of the stored
+        data in O(N*log(N)).
+
+        Signature:
+            None -> int OR float
+        
+        Version 1.0.0.0
+        """
+        if self._Properties['Medcouple'] is None:
+            self._Properties['Medcouple'] = of.GetMedcouple(self.Sorted,
+                                                                DoCheck = False)
+        return self._Properties['Medcouple']
+    
+    @property
+    def LLocation(self) -> bf.TReal:
+        """
+        Read-only property returning the L-location (L-moment of the order 1)
+        of the stored data set, which equals the arithmetic mean.
+
+        Signature:
+            None -> int OR float
+        
+        Version 1.0.0.0
+        """
+        if self._Properties['LLocation'] is None:
+            self._Properties['LLocation'] = self._getLMoments(1)[0]
+        return self._Properties['LLocation']
+    
+    @property
+    def LScale(self) -> bf.TReal:
+        """
+        Read-only property returning the L-scale (L-moment of the order 2) of
+        the stored data set.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Raises:
+            UT_ValueError: the stored sequence is of length 1
+        
+        Version 1.0.0.0
+        """
+        if self._Properties['LScale'] is None:
+            self._Properties['LScale'] = self._getLMoments(2)[1]
+        return self._Properties['LScale']
+    
+    @property
+    def LSkew(self) -> bf.TReal:
+        """
+        Read-only property returning the L-skewness (L-moment ratio of the order
+        3) of the stored data set, which is zero for a constant data set.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: the stored sequence is shorter than 3 elements
+        
+        Version 1.0.0.0
+        """
+        if self._Properties['LSkew'] is None:
+            Moments = self._getLMoments(3)
+            if Moments[1]:
+                self._Properties['LSkew'] = Moments[2] / Moments[1]
+            else:
+                self._Properties['LSkew'] = 0
+        return self._Properties['LSkew']
+    
+    @property
+    def LKurt(self) -> bf.TReal:
+        """
+        Read-only property returning the L-kurtosis (L-moment ratio of the order
+        4) of the stored data set, which is zero for a constant data set.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: the stored sequence is shorter than 4 elements
+        
+        Version 1.0.0.0
+        """
+        if self._Properties['LKurt'] is None:
+            Moments = self._getLMoments(4)
+            if Moments[1]:
+                self._Properties['LKurt'] = Moments[3] / Moments[1]
+            else:
+                self._Properties['LKurt'] = 0
+        return self._Properties['LKurt']
+    
     @property
     def Summary(self) -> str:
         """
@@ -515,6 +766,73 @@ class Statistics1D:
                                                                 DoCheck = False)
         return Result
     
+    def getQuantiles(self, Quantiles: Any) -> TRealTuple:
+        """
+        Calculates a batch of quantiles of the stored data set in a single call:
+        either all k-th of m-quantiles (0 < k < m) for the given number of
+        quantiles m, e.g. 10 for the deciles or 100 for the percentiles, or the
+        quantiles from a sequence of the (k, m) pairs and / or probabilities
+        between 0 and 1. The arguments are checked only once, and the values
+        are taken from the (cached) sorted copy of the stored data, thus the
+        computation speed is O(N*log(N)), if the sorted copy haven't been
+        accessed yet, otherwise - O(1) per quantile.
+
+        Signature:
+            int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR float >= 0)
+                -> tuple(int OR float)
+        
+        Args:
+            Quantiles: int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR
+                float >= 0); the number of quantiles m, OR the requested
+                quantiles as (k, m) pairs with 0 <= k <= m and / or
+                probabilities between 0 and 1 inclusively
+        
+        Returns:
+            tuple(int OR float): the calculated quantile values, in the same
+                order as requested (k = 1 to m - 1 for the number of quantiles)
+        
+        Raises:
+            UT_TypeError: the quantiles are neither an integer nor a sequence
+                of the pairs of integers and / or real numbers
+            UT_ValueError: the number of quantiles is less than 2, OR the
+                sequence of the quantiles is empty, OR any quantile index or
+                total number of quantiles or probability is out of the range,
+                OR the stored sequence is of length 1
+
+        Version 1.0.0.0
+        """
+        Result = of.GetQuantiles(self.Sorted, Quantiles, SkipFrames = 2,
+                                                                DoCheck = False)
+        return Result
+    
+    def getLMoments(self, Order: int) -> TRealTuple:
+        """
+        Calculates the L-moments of the stored data set of the orders 1 to the
+        requested order in a single pass over the (cached) sorted copy of the
+        stored data. The L-moments up to the order 4 are cached, so they are
+        returned in O(1) on the consequent calls.
+
+        Signature:
+            int > 0 -> tuple(int OR float)
+        
+        Args:
+            Order: int > 0; the highest order of the L-moments, not greater than
+                the length of the data set
+        
+        Raises:
+            UT_TypeError: the order is not an integer
+            UT_ValueError: the order is negative integer or zero, OR it is
+                greater than the length of the stored sequence
+
+        Version 1.0.0.0
+        """
+        if isinstance(Order, int) and 0 < Order <= 4:
+            Result = self._getLMoments(Order)[:Order]
+        else:
+            Result = of.GetLMoments(self.Sorted, Order, SkipFrames = 2,
+                                                                DoCheck = False)
+        return Result
+    
     def getHistogram(self, *, NBins: Optional[int] = None,
                                 BinSize: Optional[bf.TReal]= None) -> Tuple[
                                                     Tuple[bf.TReal, int], ...]:
@@ -523,7 +841,10 @@ class Statistics1D:
         belonging to the respective bins for the data sample. Either total
         number of bins OR the desired bin width can be specified, where number
         of bins takes the precedence. When neither value is defined, the default
-        number of bins is 20. Computation speed is always O(N).
+        number of bins is 20. Computation speed is always O(N). The counting is
+        done by the function GetHistogram() through the class
+        HistogramAccumulator, so the histogram is the same as of an accumulator
+        on the same grid.
 
         Signature:
             /*, int > 0 OR None, int > 0 OR float > 0 OR None/
@@ -544,7 +865,7 @@ class Statistics1D:
             UT_ValueError: any keyword argument is of the proper type but
                 unacceptable value
 
-        Version 1.0.0.1
+        Version 1.0.1.0
         """
         Temp = of.GetHistogram(self.Values, NBins = NBins, BinSize= BinSize,
                                                 SkipFrames = 2, DoCheck = False)
@@ -573,10 +894,18 @@ class Statistics2D:
             coefficient rho of the data set
         Kendall: (read-only) int OR float; Kendall rank correlation coefficient
             tau-b of the data set
+        CovMatrix: (read-only) tuple(tuple(int OR float)); 2 x 2 covariance
+            matrix of the data set
+        PearsonMatrix: (read-only) tuple(tuple(int OR float)); 2 x 2 matrix of
+            the Pearson's correlation coefficients of the data set
         Summary: (read-only) str; the summary of the statistical properties of
             the data set
     
-    Version 1.0.1.0
+    Methods:
+        getCrossCorrelation(MaxLag)
+            int >= 0 -> tuple(int OR float)
+    
+    Version 1.2.0.0
     """
     
     #special methods
@@ -636,7 +965,7 @@ class Statistics2D:
             raise UT_ValueError(LengthX, f'== {LengthY} - sequences length',
                                                                 SkipFrames = 1)
         self._Properties = {Key : None for Key in ['Cov', 'Pearson', 'Spearman',
-                                                            'Kendall', 'Name']}
+                            'Kendall', 'CovMatrix', 'PearsonMatrix', 'Name']}
     
     def __str__(self) -> str:
         """
@@ -737,11 +1066,11 @@ class Statistics2D:
         Signature:
             None -> int OR float
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if self._Properties['Cov'] is None:
-            self._Properties['Cov'] = bf.GetCovariance(self.X.Values,
-                                                self.Y.Values, DoCheck = False)
+            self._Properties['Cov'] = bf.GetCovariance(self.X._getValues(),
+                                        self.Y._getValues(), DoCheck = False)
         return self._Properties['Cov']
     
     @property
@@ -753,11 +1082,11 @@ class Statistics2D:
         Signature:
             None -> int OR float
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if self._Properties['Pearson'] is None:
-            self._Properties['Pearson'] = bf.GetPearsonR(self.X.Values,
-                                                self.Y.Values, DoCheck = False)
+            self._Properties['Pearson'] = bf.GetPearsonR(self.X._getValues(),
+                                        self.Y._getValues(), DoCheck = False)
         return self._Properties['Pearson']
     
     @property
@@ -792,6 +1121,41 @@ class Statistics2D:
                                                 self.Y.Values, DoCheck = False)
         return self._Properties['Kendall']
     
+    @property
+    def CovMatrix(self) -> bf.TRealMatrix:
+        """
+        Read-only property returning the 2 x 2 covariance matrix of the stored
+        data set, i.e. ((X.Var, Cov), (Cov, Y.Var)).
+
+        Signature:
+            None -> tuple(tuple(int OR float))
+        
+        Version 1.0.1.0
+        """
+        if self._Properties['CovMatrix'] is None:
+            self._Properties['CovMatrix'] = bf.GetCovarianceMatrix(
+                            (self.X._getValues(), self.Y._getValues()),
+                                                            DoCheck = False)
+        return self._Properties['CovMatrix']
+    
+    @property
+    def PearsonMatrix(self) -> bf.TRealMatrix:
+        """
+        Read-only property returning the 2 x 2 matrix of the Pearson's
+        coefficients of correlation of the stored data set, i.e.
+        ((1, Pearson), (Pearson, 1)).
+
+        Signature:
+            None -> tuple(tuple(int OR float))
+        
+        Version 1.0.1.0
+        """
+        if self._Properties['PearsonMatrix'] is None:
+            self._Properties['PearsonMatrix'] = bf.GetPearsonMatrix(
+                            (self.X._getValues(), self.Y._getValues()),
+                                                            DoCheck = False)
+        return self._Properties['PearsonMatrix']
+    
     @property
     def Summary(self) -> str:
         """
@@ -814,4 +1178,561 @@ class Statistics2D:
                         ['Cov', 'Pearson', 'Spearman', 'Kendall',]),
                             'X data sub-set', self.X.Summary,
                                 'Y data sub-set', self.Y.Summary, Separator])
-        return Result
\ No newline at end of file
+        return Result
+    
+    #+ methods
+
+    def getCrossCorrelation(self, MaxLag: int) -> Tuple[bf.TReal, ...]:
+        """
+        Calculates the lagged cross-correlation of the stored X and Y data,
+        treated as time series, for all lags k from 0 to MaxLag, i.e. the
+        correlation of X[t] and Y[t + k]. The value at the lag 0 is the
+        Pearson's correlation coefficient. Computation speed is O(N * MaxLag)
+        or O(N * log(N)), whichever is estimated to be less.
+
+        Signature:
+            int >= 0 -> tuple(int OR float)
+        
+        Args:
+            MaxLag: int >= 0; the maximum lag, less than the length of the data
+        
+        Returns:
+            tuple(int OR float): the cross-correlation values for the lags 0 to
+                MaxLag
+        
+        Raises:
+            UT_TypeError: the maximum lag is not an integer
+            UT_ValueError: the maximum lag is negative or not less than the
+                length of the stored data set
+
+        Version 1.0.0.0
+        """
+        Result = bf.GetCrossCorrelation(self.X._getValues(),
+                                        self.Y._getValues(), MaxLag,
+                                        SkipFrames = 2, DoCheck = False)
+        return Result
+
+class StreamStatistics1D:
+    """
+    Summary class of a 1D data set passed as any iterable (e.g. a generator or
+    a file reader), which is consumed only once upon instantiation, in constant
+    memory. The data is not stored, only the moment-based statistical
+    properties are accumulated and interfaced via read-only properties
+    (attributes), with the same names as in the class Statistics1D.
+
+    Optionally (keyword argument SketchSize), the data is also fed into a
+    quantile sketch (see ordered_functions.QuantileSketch), which provides the
+    order statistics - Min and Max (exact), Median, Q1, Q3 and the generic
+    quantiles (estimated with the bounded rank error) - in a memory depending
+    only logarithmically on the length of the data. Without the sketch these
+    properties and methods raise an exception.
+
+    Must be instantiated with an iterable of (a mix of) real numbers or
+    instances of classes implementing 'measurements with uncertainty', and / or
+    of blocks of them - sequences or 1D buffers of real numbers.
+
+    Properties:
+        Name: str; arbitrary identifier of the data set
+        N: (read-only) int > 0; the length of the data set (number of points)
+        Mean: (read-only) int OR float; the arithmetic mean of the data
+        Var: (read-only) int >= 0 OR float >= 0; the (population) variance of
+            the data set
+        Sigma: (read-only) int >= 0 OR float >= 0; the (population) standard
+            deviation of the data set
+        SE: (read-only) int >= 0 OR float >= 0; the (population) standard
+            error of the mean of the data set
+        FullVar: (read-only) int >= 0 OR float >= 0; the (population) full
+            variance of the data set, including the contribution of the
+            measurements uncertainties
+        FullSigma: (read-only) int >= 0 OR float >= 0; the (population) full
+            standard deviation of the data set, including the contribution of
+            the measurements uncertainties
+        FullSE: (read-only) int >= 0 OR float >= 0; the (population) full
+            standard error of the mean of the data set, including the
+            contribution of the measurements uncertainties
+        Skew: (read-only) int OR float; the (population) skewness of the data
+        Kurt: (read-only) int OR float; the (population) excess kurtosis of the
+            data
+        Sketch: (read-only) ordered_functions.QuantileSketch OR None; the
+            quantile sketch of the data, if requested
+        Min: (read-only) int OR float; the minimum value of the data
+        Max: (read-only) int OR float; the maximum value of the data
+        Median: (read-only) int OR float; the estimated median of the data
+        Q1: (read-only) int OR float; the estimated first quartile of the data
+        Q3: (read-only) int OR float; the estimated third quartile of the data
+        Summary: (read-only) str; the summary of the statistical properties of
+            the data set
+    
+    Methods:
+        getQuantile(k, m)
+            0<= int k <= int m -> int OR float
+        getQuantiles(Quantiles)
+            int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR float >= 0)
+                -> tuple(int OR float)
+    
+    Version 1.1.0.0
+    """
+    
+    #special methods
+
+    def __init__(self, Data: Any, *, ChunkSize: Optional[int] = None,
+                                    SketchSize: Optional[int] = None) -> None:
+        """
+        Initialization method. Consumes the passed iterable, performing the
+        input data sanity check and accumulating the statistics in batches.
+        If the sketch size is specified, the same batches are also added to the
+        quantile sketch.
+
+        Signature:
+            iterable(type A)/, *, int > 0 OR None, int >= 8 OR None/ -> None
+
+        Args:
+            Data: iterable(int OR float OR
+                phyqus_lib.base_classes.MeasuredValue OR seq(int OR float OR
+                phyqus_lib.base_classes.MeasuredValue) OR numpy.ndarray OR
+                array.array OR memoryview); the data points or blocks of them
+            ChunkSize: (keyword) int > 0 OR None; the number of the single data
+                points per batch update, defaults to None, i.e. the global
+                constant STREAM_CHUNK_LENGTH of the module base_functions
+            SketchSize: (keyword) int >= 8 OR None; the accuracy parameter K of
+                the quantile sketch, defaults to None, i.e. no sketch
+
+        Raises:
+            UT_TypeError: argument is not an iterable of real numbers,
+                measurements with uncertainty or sequences of those, OR any
+                keyword argument is of improper type
+            UT_ValueError: no data points are yielded by the iterable, OR any
+                keyword argument is of the proper type but unacceptable value,
+                OR NaN value is found with the quantile sketch
+        
+        Version 1.1.0.0
+        """
+        if SketchSize is None:
+            self._Sketch = None
+        else:
+            self._Sketch = of.QuantileSketch(SketchSize)
+            if ((not isinstance(Data, c_abc.Iterable))
+                                            or isinstance(Data, (str, bytes))):
+                raise UT_TypeError(Data, c_abc.Iterable, SkipFrames = 1)
+            if ChunkSize is None:
+                ChunkSize = bf.STREAM_CHUNK_LENGTH
+            else:
+                bf._CheckPositiveInteger(ChunkSize)
+            Data = self._feedSketch(Data, ChunkSize)
+        self._Data = bf.GetStreamSummary(Data, ChunkSize = ChunkSize,
+                                                                SkipFrames = 2)
+        self._Properties = {'Name' : None}
+    
+    def __str__(self) -> str:
+        """
+        'Magic' method returning the string representaton of the instance as
+        the string '{class name}({value of Name property})'.
+        
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        return f'{self.__class__.__name__}({self.Name})'
+    
+    def __repr__(self) -> str:
+        """
+        'Magic' method returning the string representaton of the instance as
+        the string '<{class name}({value of Name property}) at {id}>'.
+        
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        IdHex = hex(id(self))
+        return f'<{self.__class__.__name__}({self.Name}) at {IdHex}>'
+    
+    #private methods
+
+    def _feedSketch(self, Data: Any, ChunkSize: int) -> Iterator[Any]:
+        """
+        Generator passing through the items of the iterable, which adds the
+        single data points in batches of ChunkSize elements, and the blocks of
+        the data points as they are, to the quantile sketch.
+
+        Signature:
+            iterable(type A), int > 0 -> iterator(type A)
+        
+        Version 1.0.0.0
+        """
+        Batch = []
+        for Item in Data:
+            IsBlock = bf._IsArray(Item) or isinstance(Item, c_abc.Sequence)
+            if isinstance(Item, (int, float)) or (not IsBlock):
+                Batch.append(Item)
+                if len(Batch) >= ChunkSize:
+                    self._Sketch.updateMany(Batch)
+                    Batch = []
+            else: #a block of the data points
+                if Batch:
+                    self._Sketch.updateMany(Batch)
+                    Batch = []
+                self._Sketch.updateMany(Item)
+            yield Item
+        if Batch:
+            self._Sketch.updateMany(Batch)
+    
+    def _checkSketch(self) -> None:
+        """
+        Raises an exception if the quantile sketch was not requested.
+
+        Signature:
+            None -> None
+        
+        Raises:
+            UT_ValueError: no quantile sketch
+        
+        Version 1.0.0.0
+        """
+        if self._Sketch is None:
+            raise UT_ValueError(None, 'int >= 8 - SketchSize at instantiation',
+                                                                SkipFrames = 2)
+    
+    #public API
+
+    #+ properties
+
+    @property
+    def Name(self) -> Union[str, None]:
+        """
+        Getter property to access the string identificator assigned to the data
+        set. The defualt (initial) value is None.
+
+        Signature:
+            None -> str OR None
+        
+        Version 1.0.0.0
+        """
+        return self._Properties['Name']
+    
+    @Name.setter
+    def Name(self, Value: Any) -> None:
+        """
+        Setter property for the string identificator of the data set. Any passed
+        value is converted into a string.
+
+        Singature:
+            type A -> None
+        
+        Version 1.0.0.0
+        """
+        self._Properties['Name'] = str(Value)
+    
+    @property
+    def N(self) -> int:
+        """
+        Read-only property returning the length of the data set.
+
+        Signature:
+            None -> int > 0
+        
+        Version 1.0.0.0
+        """
+        return self._Data.N
+    
+    @property
+    def Mean(self) -> bf.TReal:
+        """
+        Read-only property returning the arithmetic mean of the data set.
+
+        Signature:
+            None -> int OR float
+        
+        Version 1.0.0.0
+        """
+        return self._Data.Mean
+    
+    @property
+    def Var(self) -> bf.TReal:
+        """
+        Read-only property returning the (population) variance of the data set.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Data.Var
+    
+    @property
+    def Sigma(self) -> bf.TReal:
+        """
+        Read-only property returning the (population) standard deviation of the
+        data set.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Data.Sigma
+    
+    @property
+    def SE(self) -> bf.TReal:
+        """
+        Read-only property returning the (population) standard error of the
+        mean of the data set.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Data.SE
+    
+    @property
+    def FullVar(self) -> bf.TReal:
+        """
+        Read-only property returning the (population) full variance of the data
+        set, including the contribution of the measurements uncertainties.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Data.FullVar
+    
+    @property
+    def FullSigma(self) -> bf.TReal:
+        """
+        Read-only property returning the (population) full standard deviation
+        of the data set, including the contribution of the measurements
+        uncertainties.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Data.FullSigma
+    
+    @property
+    def FullSE(self) -> bf.TReal:
+        """
+        Read-only property returning the (population) full standard error of
+        the mean of the data set, including the contribution of the
+        measurements uncertainties.
+
+        Signature:
+            None -> int >= 0 OR float >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Data.FullSE
+    
+    @property
+    def Skew(self) -> bf.TReal:
+        """
+        Read-only property returning the (population) skewness of the data set.
+
+        Signature:
+            None -> int OR float
+        
+        Version 1.0.0.0
+        """
+        return self._Data.Skew
+    
+    @property
+    def Kurt(self) -> bf.TReal:
+        """
+        Read-only property returning the (population) excess kurtosis of the
+        data set.
+
+        Signature:
+            None -> int OR float
+        
+        Version 1.0.0.0
+        """
+        return self._Data.Kurt
+    
+    @property
+    def Sketch(self) -> Union[of.QuantileSketch, None]:
+        """
+        Read-only property returning the quantile sketch of the data set, e.g.
+        to be merged with the sketches of the other parts of the data, or None,
+        if the sketch was not requested at the instantiation.
+
+        Signature:
+            None -> ordered_functions.QuantileSketch OR None
+        
+        Version 1.0.0.0
+        """
+        return self._Sketch
+    
+    @property
+    def Min(self) -> bf.TReal:
+        """
+        Read-only property returning the minimum value of the data set.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no quantile sketch
+        
+        Version 1.0.0.0
+        """
+        self._checkSketch()
+        return self._Sketch.Min
+    
+    @property
+    def Max(self) -> bf.TReal:
+        """
+        Read-only property returning the maximum value of the data set.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no quantile sketch
+        
+        Version 1.0.0.0
+        """
+        self._checkSketch()
+        return self._Sketch.Max
+    
+    @property
+    def Median(self) -> bf.TReal:
+        """
+        Read-only property returning the estimated median of the data set.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no quantile sketch
+        
+        Version 1.0.0.0
+        """
+        self._checkSketch()
+        return self._Sketch.Median
+    
+    @property
+    def Q1(self) -> bf.TReal:
+        """
+        Read-only property returning the estimated first quartile of the data
+        set.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no quantile sketch
+        
+        Version 1.0.0.0
+        """
+        self._checkSketch()
+        return self._Sketch.Q1
+    
+    @property
+    def Q3(self) -> bf.TReal:
+        """
+        Read-only property returning the estimated third quartile of the data
+        set.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no quantile sketch
+        
+        Version 1.0.0.0
+        """
+        self._checkSketch()
+        return self._Sketch.Q3
+    
+    @property
+    def Summary(self) -> str:
+        """
+        Read-only property to generate human-reaadble, multi-line, TSV format
+        tabulated report listing all available statistical properties of the
+        data set (as entire population), including the order statistics, if
+        the quantile sketch is present.
+
+        Signature:
+            None -> str
+        
+        Version 1.1.0.0
+        """
+        Separator = '----------------------------------------------------------'
+        if self.Name is None:
+            Result = Separator
+        else:
+            Result = f'{Separator}\nName:\t{self.Name}'
+        Keys = ['N', 'Mean', 'Var', 'FullVar', 'Skew', 'Kurt']
+        if self._Sketch is not None:
+            Keys.extend(['Median', 'Q1', 'Q3', 'Min', 'Max'])
+        Result = '\n'.join([Result,
+                        '\n'.join(f'{Key}:\t{getattr(self, Key)}'
+                                                for Key in Keys), Separator])
+        return Result
+    
+    #+ methods
+
+    def getQuantile(self, k: int, m: int) -> bf.TReal:
+        """
+        Estimates the k-th of m-quantile value of the data set using the
+        quantile sketch. The proper relations are:
+            * 0<= k <=m
+            * m > 0
+
+        Signature:
+            int >= 0, int > 0 -> int OR float
+        
+        Args:
+            k: int >= 0; the quantile index, between 0 and m inclusively
+            m: int > 0; the total number of quantiles
+        
+        Raises:
+            UT_TypeError: quantile index is not an integer, OR the total
+                number of quantiles is not an integer
+            UT_ValueError: the total number of quantilies is negative integer or
+                zero, OR the quantile index is negative integer or integer
+                greater than the total number of quantiles, OR no quantile
+                sketch
+
+        Version 1.0.0.0
+        """
+        self._checkSketch()
+        return self._Sketch.getQuantile(k, m)
+    
+    def getQuantiles(self, Quantiles: Any) -> TRealTuple:
+        """
+        Estimates a batch of quantiles of the data set using the quantile
+        sketch: either all k-th of m-quantiles (0 < k < m) for the given number
+        of quantiles m, or the quantiles from a sequence of the (k, m) pairs
+        and / or probabilities between 0 and 1.
+
+        Signature:
+            int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR float >= 0)
+                -> tuple(int OR float)
+        
+        Args:
+            Quantiles: int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR
+                float >= 0); the number of quantiles m, OR the requested
+                quantiles as (k, m) pairs with 0 <= k <= m and / or
+                probabilities between 0 and 1 inclusively
+        
+        Returns:
+            tuple(int OR float): the estimated quantile values, in the same
+                order as requested
+        
+        Raises:
+            UT_TypeError: the quantiles are neither an integer nor a sequence
+                of the pairs of integers and / or real numbers
+            UT_ValueError: the number of quantiles is less than 2, OR the
+                sequence of the quantiles is empty, OR any quantile index or
+                total number of quantiles or probability is out of the range,
+                OR no quantile sketch
+
+        Version 1.0.0.0
+        """
+        self._checkSketch()
+        return self._Sketch.getQuantiles(Quantiles)
\ No newline at end of file
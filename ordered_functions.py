@@ -9,44 +9,116 @@ of a class implementing 'measurements with uncertainty'.
 
 The input data (sample) is treated as the entire population.
 
+The class QuantileSketch is a mergeable KLL sketch (Karnin, Lang and Liberty)
+of a data stream, which estimates the quantiles and the cumulative
+distribution function of an unbounded stream in a memory depending only on
+the accuracy parameter K (and logarithmically on the length of the stream),
+with the rank error bounded by the property RankError. The class
+HistogramAccumulator is a mergeable histogram on a fixed grid of bins, which
+produces exactly the same histogram as the function GetHistogram() for the same
+grid, since the function uses this class.
+
+Classes:
+    QuantileSketch
+    HistogramAccumulator
+
 Functions:
-    GetMin(Data, *, SkipFrames = 1, DoCheck = True)
+    GetMin(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetMax(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, MissingPolicy/ -> int OR float
+    GetMax(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetMedian(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, MissingPolicy/ -> int OR float
+    GetMedian(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetFirstQuartle(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, MissingPolicy/ -> int OR float
+    GetFirstQuartile(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetThirdQuartle(Data, *, SkipFrames = 1, DoCheck = True)
+            bool, MissingPolicy/ -> int OR float
+    GetThirdQuartile(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
-    GetQuantile(Data, k, m, *, SkipFrames = 1, DoCheck = True)
+            bool, MissingPolicy/ -> int OR float
+    GetQuantile(Data, k, m, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
-            int >= 0, int > 0/, *, int > 0, bool/ -> int OR float
-    GetHistogram(Data, *, NBins=None, BinSize=None, SkipFrames=1, DoCheck=True)
+            int >= 0, int > 0/, *, int > 0, bool, MissingPolicy/ -> int OR float
+    GetQuantiles(Data, Quantiles, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+            int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR float >= 0)
+                /, *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
+    GetHistogram(Data, *, NBins=None, BinSize=None, SkipFrames=1, DoCheck=True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *,
-            int > 0 OR None, int > 0 OR float > 0 OR None, int > 0, bool/
-                -> dict(int OR float -> int >=0)
-    GetModes(Data, *, SkipFrames = 1, DoCheck = True)
+            int > 0 OR None, int > 0 OR float > 0 OR None, int > 0, bool,
+                MissingPolicy/ -> dict(int OR float -> int >= 0)
+    GetModes(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> list(int OR float)
-    GetSpearman(DataX, DataY, *, SkipFrames = 1, DoCheck = True)
+            bool, MissingPolicy/ -> list(int OR float)
+    GetTrimmedMean(Data, Fraction = 0.1, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            int >= 0 OR float >= 0, *, int > 0, bool, MissingPolicy/
+                -> int OR float
+    GetTrimmedVarianceP(Data, Fraction = 0.1, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            int >= 0 OR float >= 0, *, int > 0, bool, MissingPolicy/
+                -> int OR float
+    GetWinsorizedMean(Data, Fraction = 0.1, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            int >= 0 OR float >= 0, *, int > 0, bool, MissingPolicy/
+                -> int OR float
+    GetWinsorizedVarianceP(Data, Fraction = 0.1, *, SkipFrames = 1,
+                DoCheck = True, Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            int >= 0 OR float >= 0, *, int > 0, bool, MissingPolicy/
+                -> int OR float
+    GetMAD(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int >= 0 OR float >= 0
+    GetSn(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int >= 0 OR float >= 0
+    GetQn(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int >= 0 OR float >= 0
+    GetMedcouple(Data, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int OR float
+    GetLMoments(Data, Order = 4, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, int > 0,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
+    GetLMomentRatios(Data, Order = 4, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, int > 0,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
+    GetSpearman(DataX, DataY, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
             seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
-                *, int > 0, bool/ -> int OR float
-    GetKendall(DataX, DataY, *, SkipFrames = 1, DoCheck = True)
+                *, int > 0, bool, MissingPolicy/ -> int OR float
+    GetKendall(DataX, DataY, *, SkipFrames = 1, DoCheck = True,
+                Missing = MissingPolicy.PROPAGATE)
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
             seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
-                *, int > 0, bool/ -> int OR float
+                *, int > 0, bool, MissingPolicy/ -> int OR float
 """
 
-__version__= '1.0.1.0'
-__date__ = '01-05-2023'
+__version__= '1.10.0.8'
+__date__ = '17-10-2026'
 __status__ = 'Production'
 
 #imports
@@ -56,8 +128,13 @@ __status__ = 'Production'
 import sys
 import os
 import math
+import random
+import bisect
+import itertools
+import operator
+import collections.abc as c_abc
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Sequence, Callable, Tuple, List, Any
 
 #+ custom modules
 
@@ -72,167 +149,3049 @@ if not (ROOT_FOLDER in sys.path):
 
 from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
 
+from phyqus_lib.base_classes import MeasuredValue
+
 from .base_functions import TGenericSequence, TReal, TRealList, GetMean
 from .base_functions import GetPearsonR, _ExtractMeans, _CheckPositiveInteger
+from .base_functions import MissingPolicy, _CheckMissingPolicy, _DropMissing
+from .base_functions import _GetMomentsSummary, _ExtractArray
+
+#+ optional dependencies
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+#globals
+
+SELECTION_CUTOFF = 16 #sub-sequence length to be sorted instead of partitioned
+
+SAMPLING_CUTOFF = 600 #min. length for the sampling pivots (Floyd-Rivest)
+
+SORTING_CUTOFF = 20000 #max. length to be sorted instead of the selection
+
+MAX_SELECTED_RANKS = 4 #max. number of the order statistics to be selected
+
+QN_FACTOR = 2.2219 #consistency factor of Qn for the normal distribution
+
+SN_FACTOR = 1.1926 #consistency factor of Sn for the normal distribution
+
+KENDALL_DIRECT_CUTOFF = 50 #max. length for the direct comparison of pairs
+
+QN_INTEGER_LIMIT = 2**62 #max. abs. integer value for the vectorized Qn
+
+SKETCH_MIN_CAPACITY = 8 #min. capacity of a level of the quantile sketch
+
+SKETCH_K = 200 #default accuracy parameter of the quantile sketch
+
+_RANDOM = random.Random() #private generator, global random state is not used
+
+#classes
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile sketch (KLL by Karnin, Lang and Liberty). The
+    data points - real numbers and / or measurements with uncertainty (only the
+    'mean' values are used) - are added one by one or as sequences, and two
+    sketches (e.g. filled in separate processes or on separate hosts) can be
+    merged. The sketch keeps a hierarchy of levels, the items at the level h
+    representing 2^h data points each. When the total number of the kept items
+    reaches the capacity, the lowest full level is sorted and every other item
+    (with a random offset) is promoted to the next level. The capacity of the
+    top level is K, and it decreases by the factor 2/3 per level down to the
+    minimum of SKETCH_MIN_CAPACITY, so only about 3 * K + 8 * log2(N / K) items
+    are kept for N data points.
+
+    The quantiles are estimated by the same linear interpolation rule as in the
+    function GetQuantile() from the weighted ranks of the kept items; they are
+    exact until the first compaction, i.e. for the short streams. The minimum
+    and the maximum values are always exact. The error of the estimated
+    normalized rank (the fraction of the data points less than or equal to the
+    returned value) does not exceed RankError = 2.446 / K^0.9433 (e.g. 1.7% for
+    the default K = 200, 0.5% for K = 800) for all queries simultaneously with
+    the confidence of 99% (the empirical bound of the KLL sketch). The missing
+    values (NaN) cannot be ranked, thus they are not accepted.
+
+    Properties:
+        K: (read-only) int >= SKETCH_MIN_CAPACITY; the accuracy parameter
+        N: (read-only) int >= 0; number of the added data points
+        Size: (read-only) int >= 0; number of the kept items
+        RankError: (read-only) float > 0; the normalized rank error bound
+        Min: (read-only) int OR float; the minimum value
+        Max: (read-only) int OR float; the maximum value
+        Median: (read-only) int OR float; the estimated median
+        Q1: (read-only) int OR float; the estimated first quartile
+        Q3: (read-only) int OR float; the estimated third quartile
+    
+    Methods:
+        update(Value)
+            int OR float OR phyqus_lib.base_classes.MeasuredValue -> None
+        updateMany(Data)
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) -> None
+        merge(Other)
+            QuantileSketch -> None
+        getQuantile(k, m)
+            0<= int k <= int m -> int OR float
+        getQuantiles(Quantiles)
+            int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR float >= 0)
+                -> tuple(int OR float)
+        getCDF(Value)
+            int OR float -> float >= 0
+    
+    Version 1.0.0.0
+    """
+
+    #special methods
+
+    def __init__(self, K: int = SKETCH_K) -> None:
+        """
+        Initialization method. Creates an empty sketch.
+
+        Signature:
+            /int >= SKETCH_MIN_CAPACITY/ -> None
+        
+        Args:
+            K: (optional) int >= SKETCH_MIN_CAPACITY; the accuracy parameter,
+                i.e. the capacity of the top level, defaults to SKETCH_K
+                (module's global constant)
+        
+        Raises:
+            UT_TypeError: the argument is not an integer
+            UT_ValueError: the argument is less than SKETCH_MIN_CAPACITY
+        
+        Version 1.0.0.0
+        """
+        if (not isinstance(K, int)) or isinstance(K, bool):
+            raise UT_TypeError(K, int, SkipFrames = 1)
+        if K < SKETCH_MIN_CAPACITY:
+            raise UT_ValueError(K, f'>= {SKETCH_MIN_CAPACITY} - parameter K',
+                                                                SkipFrames = 1)
+        self._K = K
+        self._N = 0
+        self._Min = None
+        self._Max = None
+        self._Levels = [[]]
+        self._Size = 0
+        self._Capacity = self._getCapacity(0)
+        self._Sorted = None
+    
+    #private methods
+
+    def _getCapacity(self, Level: int) -> int:
+        """
+        Calculates the capacity of a level for the current number of levels.
+
+        Signature:
+            int >= 0 -> int >= SKETCH_MIN_CAPACITY
+        
+        Version 1.0.0.0
+        """
+        Depth = len(self._Levels) - Level - 1
+        return max(SKETCH_MIN_CAPACITY, math.ceil(self._K * (2 / 3)**Depth))
+    
+    def _compress(self) -> None:
+        """
+        Compacts the lowest full levels until the total number of the kept
+        items is below the total capacity. The items of a level are sorted,
+        and every other item starting from the randomly chosen first or second
+        one is promoted to the next level (with the double weight); if the
+        number of items is odd, the smallest one remains at the level. The
+        offset is chosen by the module's private random generator.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.1
+        """
+        while self._Size >= self._Capacity:
+            for Level, Items in enumerate(self._Levels):
+                if len(Items) >= self._getCapacity(Level):
+                    break
+            if Level + 1 == len(self._Levels):
+                self._Levels.append([])
+                self._Capacity = sum(self._getCapacity(Index)
+                                    for Index in range(len(self._Levels)))
+            Items.sort()
+            Odd = len(Items) % 2
+            Promoted = Items[Odd + _RANDOM.getrandbits(1)::2]
+            self._Levels[Level + 1].extend(Promoted)
+            self._Levels[Level] = Items[:Odd]
+            self._Size -= len(Promoted)
+    
+    def _addValues(self, Values: TRealList) -> None:
+        """
+        Adds already checked real numbers.
+
+        Signature:
+            list(int OR float) -> None
+        
+        Raises:
+            UT_ValueError: any of the values is NaN
+        
+        Version 1.0.0.0
+        """
+        for Value in Values:
+            if Value != Value: #NaN
+                raise UT_ValueError(Value, 'not NaN - value', SkipFrames = 2)
+        Low = min(Values)
+        High = max(Values)
+        if self._N:
+            self._Min = min(self._Min, Low)
+            self._Max = max(self._Max, High)
+        else:
+            self._Min = Low
+            self._Max = High
+        self._N += len(Values)
+        self._Levels[0].extend(Values)
+        self._Size += len(Values)
+        self._Sorted = None
+        self._compress()
+    
+    def _checkNotEmpty(self) -> None:
+        """
+        Raises an exception if there are no data points.
+
+        Signature:
+            None -> None
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        if not self._N:
+            raise UT_ValueError(self._N, '> 0 - number of data points',
+                                                                SkipFrames = 2)
+    
+    def _getSorted(self) -> Tuple[TRealList, List[int]]:
+        """
+        Returns the kept items sorted in the ascending order together with
+        their cumulative weights (the ranks of the next items), which are
+        cached until the next update.
+
+        Signature:
+            None -> tuple(list(int OR float), list(int > 0))
+        
+        Version 1.0.0.0
+        """
+        if self._Sorted is None:
+            Pairs = sorted((Value, 1 << Level)
+                                for Level, Items in enumerate(self._Levels)
+                                                        for Value in Items)
+            Values = [Value for Value, _ in Pairs]
+            Weights = list(itertools.accumulate(Weight for _, Weight in Pairs))
+            self._Sorted = (Values, Weights)
+        return self._Sorted
+    
+    def _getQuantiles(self, Quantiles: List[Tuple[int, int, TReal]]
+                                                        ) -> Tuple[TReal, ...]:
+        """
+        Estimates the quantiles from the normalized specification, see the
+        function _CheckQuantiles(), using the same interpolation rule as the
+        function GetQuantiles().
+
+        Signature:
+            list(tuple(int >= 0, int > 0, int OR float)) -> tuple(int OR float)
+        
+        Version 1.0.0.0
+        """
+        Values, Weights = self._getSorted()
+        N = self._N
+        Result = []
+        for k, m, Probability in Quantiles:
+            if m:
+                Index, Remainder = divmod((N - 1) * k, m)
+                Portion = Remainder / m
+            else:
+                Position = (N - 1) * Probability
+                Index = int(Position)
+                Portion = Position - Index
+            if Index >= N - 1:
+                Result.append(self._Max)
+            elif not Probability:
+                Result.append(self._Min)
+            else:
+                Lower = Values[bisect.bisect_right(Weights, Index)]
+                Upper = Values[bisect.bisect_right(Weights, Index + 1)]
+                Result.append(Lower * (1 - Portion) + Upper * Portion)
+        return tuple(Result)
+    
+    #public API
+
+    #+ properties
+
+    @property
+    def K(self) -> int:
+        """
+        Read-only property returning the accuracy parameter of the sketch.
+
+        Signature:
+            None -> int >= SKETCH_MIN_CAPACITY
+        
+        Version 1.0.0.0
+        """
+        return self._K
+    
+    @property
+    def N(self) -> int:
+        """
+        Read-only property returning the number of the added data points.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._N
+    
+    @property
+    def Size(self) -> int:
+        """
+        Read-only property returning the number of the kept items, i.e. the
+        memory footprint of the sketch.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Size
+    
+    @property
+    def RankError(self) -> float:
+        """
+        Read-only property returning the bound of the error of the normalized
+        rank of the estimated quantiles (for all queries with the confidence
+        of 99%), which depends only on the accuracy parameter K.
+
+        Signature:
+            None -> float > 0
+        
+        Version 1.0.0.0
+        """
+        return 2.446 / self._K**0.9433
+    
+    @property
+    def Min(self) -> TReal:
+        """
+        Read-only property returning the exact minimum value.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._Min
+    
+    @property
+    def Max(self) -> TReal:
+        """
+        Read-only property returning the exact maximum value.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._Max
+    
+    @property
+    def Median(self) -> TReal:
+        """
+        Read-only property returning the estimated median.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._getQuantiles([(1, 2, 0.5)])[0]
+    
+    @property
+    def Q1(self) -> TReal:
+        """
+        Read-only property returning the estimated first quartile.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._getQuantiles([(1, 4, 0.25)])[0]
+    
+    @property
+    def Q3(self) -> TReal:
+        """
+        Read-only property returning the estimated third quartile.
+
+        Signature:
+            None -> int OR float
+        
+        Raises:
+            UT_ValueError: no data points
+        
+        Version 1.0.0.0
+        """
+        self._checkNotEmpty()
+        return self._getQuantiles([(3, 4, 0.75)])[0]
+    
+    #+ methods
+
+    def update(self, Value: Any) -> None:
+        """
+        Adds a single data point - a real number or a measurement with
+        uncertainty.
+
+        Signature:
+            int OR float OR phyqus_lib.base_classes.MeasuredValue -> None
+        
+        Args:
+            Value: int OR float OR phyqus_lib.base_classes.MeasuredValue; the
+                data point to be added
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a
+                measurement with uncertainty
+            UT_ValueError: the value is NaN
+        
+        Version 1.0.0.0
+        """
+        if isinstance(Value, (int, float)) and not isinstance(Value, bool):
+            _Value = Value
+        elif hasattr(Value, 'Value') and hasattr(Value, 'SE'):
+            _Value = Value.Value
+        else:
+            raise UT_TypeError(Value, (int, float, MeasuredValue),
+                                                                SkipFrames = 1)
+        if _Value != _Value: #NaN
+            raise UT_ValueError(_Value, 'not NaN - value', SkipFrames = 1)
+        if self._N:
+            if _Value < self._Min:
+                self._Min = _Value
+            elif _Value > self._Max:
+                self._Max = _Value
+        else:
+            self._Min = _Value
+            self._Max = _Value
+        self._N += 1
+        self._Levels[0].append(_Value)
+        self._Size += 1
+        self._Sorted = None
+        if self._Size >= self._Capacity:
+            self._compress()
+    
+    def updateMany(self, Data: TGenericSequence) -> None:
+        """
+        Adds a sequence of real numbers and / or measurements with uncertainty,
+        or a 1D buffer of real numbers (if NumPy is installed). The whole
+        sequence is added to the lowest level at once, which is then compacted
+        by sorting, so the batch update is much faster than the updates one by
+        one. An empty sequence is ignored.
+
+        Signature:
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) -> None
+        
+        Args:
+            Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) OR
+                numpy.ndarray OR array.array OR memoryview; the data points to
+                be added
+        
+        Raises:
+            UT_TypeError: the argument is not a sequence of real numbers or
+                measurements with uncertainty
+            UT_ValueError: any of the values is NaN
+        
+        Version 1.0.0.0
+        """
+        if isinstance(Data, c_abc.Sized) and not len(Data):
+            return
+        _Data = _ExtractArray(Data, SkipFrames = 2)
+        if _Data is None:
+            _Data = _ExtractMeans(Data, SkipFrames = 2)
+        else:
+            _Data = _Data.tolist()
+        self._addValues(_Data)
+    
+    def merge(self, Other: 'QuantileSketch') -> None:
+        """
+        Merges the items kept by another sketch into this one, level by level,
+        and compacts the result. The other instance is not changed. The
+        accuracy parameter of this sketch is retained.
+
+        Signature:
+            QuantileSketch -> None
+        
+        Args:
+            Other: QuantileSketch; another sketch
+        
+        Raises:
+            UT_TypeError: the argument is not an instance of QuantileSketch
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Other, QuantileSketch):
+            raise UT_TypeError(Other, QuantileSketch, SkipFrames = 1)
+        if not Other.N:
+            return
+        if self._N:
+            self._Min = min(self._Min, Other._Min)
+            self._Max = max(self._Max, Other._Max)
+        else:
+            self._Min = Other._Min
+            self._Max = Other._Max
+        self._N += Other._N
+        while len(self._Levels) < len(Other._Levels):
+            self._Levels.append([])
+        for Level, Items in enumerate(Other._Levels):
+            self._Levels[Level].extend(Items)
+        self._Size += Other._Size
+        self._Capacity = sum(self._getCapacity(Index)
+                                    for Index in range(len(self._Levels)))
+        self._Sorted = None
+        self._compress()
+    
+    def getQuantile(self, k: int, m: int) -> TReal:
+        """
+        Estimates the k-th of m-quantile value of the added data points. The
+        0-th and m-th quantiles are the exact minimum and maximum values.
+
+        Signature:
+            int >= 0, int > 0 -> int OR float
+        
+        Args:
+            k: int >= 0; the quantile index, between 0 and m inclusively
+            m: int > 0; the total number of quantiles
+        
+        Raises:
+            UT_TypeError: quantile index is not an integer, OR the total
+                number of quantiles is not an integer
+            UT_ValueError: the total number of quantilies is negative integer or
+                zero, OR the quantile index is negative integer or integer
+                greater than the total number of quantiles, OR no data points
+
+        Version 1.0.0.0
+        """
+        _Quantiles = _CheckQuantiles([(k, m)], SkipFrames = 2)
+        self._checkNotEmpty()
+        return self._getQuantiles(_Quantiles)[0]
+    
+    def getQuantiles(self, Quantiles: Any) -> Tuple[TReal, ...]:
+        """
+        Estimates a batch of quantiles of the added data points in a single
+        call, specified in the same manner as for the function GetQuantiles():
+        either the number of quantiles m (all k-th of m-quantiles with
+        0 < k < m), or a sequence of the (k, m) pairs and / or probabilities
+        between 0 and 1.
+
+        Signature:
+            int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR float >= 0)
+                -> tuple(int OR float)
+        
+        Args:
+            Quantiles: int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR
+                float >= 0); the number of quantiles m, OR the requested
+                quantiles as (k, m) pairs with 0 <= k <= m and / or
+                probabilities between 0 and 1 inclusively
+        
+        Returns:
+            tuple(int OR float): the estimated quantile values, in the same
+                order as requested (k = 1 to m - 1 for the number of quantiles)
+        
+        Raises:
+            UT_TypeError: the quantiles are neither an integer nor a sequence
+                of the pairs of integers and / or real numbers
+            UT_ValueError: the number of quantiles is less than 2, OR the
+                sequence of the quantiles is empty, OR any quantile index or
+                total number of quantiles or probability is out of the range,
+                OR no data points
+
+        Version 1.0.0.0
+        """
+        _Quantiles = _CheckQuantiles(Quantiles, SkipFrames = 2)
+        self._checkNotEmpty()
+        return self._getQuantiles(_Quantiles)
+    
+    def getCDF(self, Value: TReal) -> float:
+        """
+        Estimates the cumulative distribution function at the given value, i.e.
+        the fraction of the added data points less than or equal to it.
+
+        Signature:
+            int OR float -> float >= 0
+        
+        Args:
+            Value: int OR float; the value, at which the CDF is estimated
+        
+        Raises:
+            UT_TypeError: the argument is not a real number
+            UT_ValueError: no data points
+
+        Version 1.0.0.0
+        """
+        if (not isinstance(Value, (int, float))) or isinstance(Value, bool):
+            raise UT_TypeError(Value, (int, float), SkipFrames = 1)
+        self._checkNotEmpty()
+        Values, Weights = self._getSorted()
+        Index = bisect.bisect_right(Values, Value)
+        Result = Weights[Index - 1] / self._N if Index else 0.0
+        return Result
+
+class HistogramAccumulator:
+    """
+    Mergeable streaming histogram with a fixed grid of bins. The bins are
+    defined either by the explicit sequence of the edges, or by the central
+    value of the first bin, the bin width and the number of bins. The data
+    points - real numbers and / or measurements with uncertainty (only the
+    'mean' values are used) - are added one by one or as sequences, whereas the
+    values outside the grid are counted separately as the underflow and the
+    overflow. With the explicit edges each bin includes its left edge but not
+    its right edge, and a bin is found by the bisection of the edges, i.e. in
+    O(log(NBins)) time. The equal width bins form the same grid as used by the
+    function GetHistogram(): the bins are centred at round(Start + i * Width,
+    16), and the bin of a value x is found in O(1) time by the same index
+    int((round(x, 16) - Start) / Width + 0.5), so the accumulator instantiated
+    with the same Start, Width and number of bins produces exactly the same
+    histogram of the same data (the function itself uses this class). A 1D
+    buffer of real numbers is binned in a vectorized manner (if NumPy is
+    installed) with the same result. Since the grid does not depend on the
+    data, the histograms of the separate chunks of data (e.g. filled in
+    separate processes or on separate hosts) are combined exactly by merging.
+
+    The histogram is returned as the same mapping (central value of a bin ->
+    number of the data points in it) as by the function GetHistogram(). The
+    missing values (NaN) cannot be placed into a bin, thus they are not
+    accepted.
+
+    Properties:
+        NBins: (read-only) int > 0; number of the bins
+        Edges: (read-only) tuple(int OR float); the edges of the bins
+        Centres: (read-only) tuple(int OR float); the central values of the
+            bins
+        Counts: (read-only) tuple(int >= 0); number of the data points in
+            each bin
+        Underflow: (read-only) int >= 0; number of the data points less than
+            the left edge of the first bin
+        Overflow: (read-only) int >= 0; number of the data points greater than
+            or equal to the right edge of the last bin
+        N: (read-only) int >= 0; total number of the added data points,
+            including the underflow and overflow
+    
+    Methods:
+        update(Value)
+            int OR float OR phyqus_lib.base_classes.MeasuredValue -> None
+        updateMany(Data)
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) -> None
+        merge(Other)
+            HistogramAccumulator -> None
+        getHistogram()
+            None -> dict(int OR float -> int >= 0)
+    
+    Version 1.1.0.0
+    """
+
+    #special methods
+
+    def __init__(self, *, Edges: Optional[Sequence[TReal]] = None,
+                    Start: Optional[TReal] = None,
+                    Width: Optional[TReal] = None,
+                    Count: Optional[int] = None) -> None:
+        """
+        Initialization method. Creates an empty histogram with the bins defined
+        either by the edges, or by the central value of the first bin, the
+        width and the number of the bins; the edges take the precedence.
+
+        Signature:
+            /*, seq(int OR float) OR None, int OR float OR None,
+                int > 0 OR float > 0 OR None, int > 0 OR None/ -> None
+        
+        Args:
+            Edges: (keyword) seq(int OR float) OR None; strictly increasing
+                edges of the bins, at least 2
+            Start: (keyword) int OR float OR None; the central value of the
+                first bin, required if the edges are not passed
+            Width: (keyword) int > 0 OR float > 0 OR None; the width of the
+                bins, required if the edges are not passed
+            Count: (keyword) int > 0 OR None; the number of the bins, required
+                if the edges are not passed
+        
+        Raises:
+            UT_TypeError: the edges are not a sequence of real numbers, OR
+                the start or the width is not a real number, OR the number of
+                the bins is not an integer
+            UT_ValueError: less than 2 edges, or they are not finite or not
+                strictly increasing, OR the start is not finite, OR the width
+                is not positive, OR the number of the bins is not positive, OR
+                neither the edges nor all of the start, the width and the
+                number of the bins are passed
+        
+        Version 1.1.0.0
+        """
+        if not (Edges is None):
+            if ((not isinstance(Edges, c_abc.Sequence))
+                                or isinstance(Edges, (str, bytes, bytearray))):
+                raise UT_TypeError(Edges, (list, tuple), SkipFrames = 1)
+            for Item in Edges:
+                if ((not isinstance(Item, (int, float)))
+                                                or isinstance(Item, bool)):
+                    raise UT_TypeError(Item, (int, float), SkipFrames = 1)
+            if len(Edges) < 2:
+                raise UT_ValueError(len(Edges), '>= 2 - number of edges',
+                                                                SkipFrames = 1)
+            for Item in Edges:
+                if not math.isfinite(Item):
+                    raise UT_ValueError(Item, 'finite - edge', SkipFrames = 1)
+            for Left, Right in zip(Edges, Edges[1:]):
+                if Right <= Left:
+                    raise UT_ValueError(Right, f'> {Left} - next edge',
+                                                                SkipFrames = 1)
+            self._Edges = tuple(Edges)
+            self._Grid = None
+        else:
+            if (Start is None) or (Width is None) or (Count is None):
+                raise UT_ValueError(None,
+                        'not None - Start, Width and Count without Edges',
+                                                                SkipFrames = 1)
+            for Item in (Start, Width):
+                if ((not isinstance(Item, (int, float)))
+                                                or isinstance(Item, bool)):
+                    raise UT_TypeError(Item, (int, float), SkipFrames = 1)
+            if not math.isfinite(Start):
+                raise UT_ValueError(Start, 'finite - start', SkipFrames = 1)
+            if not (0 < Width < math.inf):
+                raise UT_ValueError(Width, '> 0 - bin width', SkipFrames = 1)
+            _CheckPositiveInteger(Count)
+            self._Edges = tuple(Start + (Index - 0.5) * Width
+                                                for Index in range(Count + 1))
+            self._Grid = (Start, Width)
+        #underflow, bins, overflow
+        self._Counts = [0 for _ in range(len(self._Edges) + 1)]
+    
+    #private methods
+
+    def _addValues(self, Data: Any) -> None:
+        """
+        Adds the already checked values (without NaN): a sequence of real
+        numbers, or a 1D NumPy array of float64 values, which is binned in a
+        vectorized manner. For the equal width bins the index of a value x is
+        int((round(x, 16) - Start) / Width + 0.5); the rounding changes only
+        the values less than 1 in magnitude by less than 1E-16, thus for an
+        array it is applied only to such values in the vicinity of the edges.
+
+        Signature:
+            seq(int OR float) OR numpy.ndarray -> None
+        
+        Version 1.0.0.0
+        """
+        Counts = self._Counts
+        NBins = len(Counts) - 2
+        if (np is None) or not isinstance(Data, np.ndarray):
+            if self._Grid is None:
+                Edges = self._Edges
+                for Value in Data:
+                    Counts[bisect.bisect_right(Edges, Value)] += 1
+            else:
+                Start, Width = self._Grid
+                for Value in Data:
+                    Position = (round(Value, 16) - Start) / Width + 0.5
+                    if Position < 0:
+                        Counts[0] += 1
+                    elif Position >= NBins:
+                        Counts[-1] += 1
+                    else:
+                        Counts[int(Position) + 1] += 1
+            return
+        if self._Grid is None:
+            Indexes = np.searchsorted(self._Edges, Data, side = 'right')
+        else:
+            Start, Width = self._Grid
+            Positions = (Data - Start) / Width + 0.5
+            Lower = np.floor((Data - 1E-16 - Start) / Width + 0.5)
+            Upper = np.floor((Data + 1E-16 - Start) / Width + 0.5)
+            for Index in np.flatnonzero((Lower != Upper)
+                                            & (np.abs(Data) < 1)).tolist():
+                Item = round(Data[Index].item(), 16)
+                Positions[Index] = (Item - Start) / Width + 0.5
+            Indexes = np.clip(np.floor(Positions), -1, NBins)
+            Indexes = Indexes.astype(np.int64) + 1
+        Temp = np.bincount(Indexes, minlength = NBins + 2)
+        self._Counts = [Left + Right for Left, Right in zip(Counts,
+                                                                Temp.tolist())]
+    
+    #public API
+
+    #+ properties
+
+    @property
+    def NBins(self) -> int:
+        """
+        Read-only property returning the number of the bins.
+
+        Signature:
+            None -> int > 0
+        
+        Version 1.0.0.0
+        """
+        return len(self._Edges) - 1
+    
+    @property
+    def Edges(self) -> Tuple[TReal, ...]:
+        """
+        Read-only property returning the edges of the bins; for the equal width
+        bins - half-way between the central values, which define the grid.
+
+        Signature:
+            None -> tuple(int OR float)
+        
+        Version 1.0.1.0
+        """
+        return self._Edges
+    
+    @property
+    def Centres(self) -> Tuple[TReal, ...]:
+        """
+        Read-only property returning the central values of the bins, i.e. the
+        keys of the histogram: round(Start + i * Width, 16) for the equal width
+        bins, the same as by the function GetHistogram().
+
+        Signature:
+            None -> tuple(int OR float)
+        
+        Version 1.1.0.0
+        """
+        if self._Grid is None:
+            Edges = self._Edges
+            return tuple(round(0.5 * (Left + Right), 16)
+                                    for Left, Right in zip(Edges, Edges[1:]))
+        Start, Width = self._Grid
+        return tuple(round(Start + Index * Width, 16)
+                                            for Index in range(self.NBins))
+    
+    @property
+    def Counts(self) -> Tuple[int, ...]:
+        """
+        Read-only property returning the number of the data points in each bin.
+
+        Signature:
+            None -> tuple(int >= 0)
+        
+        Version 1.0.0.0
+        """
+        return tuple(self._Counts[1:-1])
+    
+    @property
+    def Underflow(self) -> int:
+        """
+        Read-only property returning the number of the data points less than
+        the left edge of the first bin.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Counts[0]
+    
+    @property
+    def Overflow(self) -> int:
+        """
+        Read-only property returning the number of the data points greater than
+        or equal to the right edge of the last bin.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Counts[-1]
+    
+    @property
+    def N(self) -> int:
+        """
+        Read-only property returning the total number of the added data points,
+        including the underflow and overflow.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return sum(self._Counts)
+    
+    #+ methods
+
+    def update(self, Value: Any) -> None:
+        """
+        Adds a single data point - a real number or a measurement with
+        uncertainty.
+
+        Signature:
+            int OR float OR phyqus_lib.base_classes.MeasuredValue -> None
+        
+        Args:
+            Value: int OR float OR phyqus_lib.base_classes.MeasuredValue; the
+                data point to be added
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a
+                measurement with uncertainty
+            UT_ValueError: the value is NaN
+        
+        Version 1.0.1.0
+        """
+        if isinstance(Value, (int, float)) and not isinstance(Value, bool):
+            _Value = Value
+        elif hasattr(Value, 'Value') and hasattr(Value, 'SE'):
+            _Value = Value.Value
+        else:
+            raise UT_TypeError(Value, (int, float, MeasuredValue),
+                                                                SkipFrames = 1)
+        if _Value != _Value: #NaN
+            raise UT_ValueError(_Value, 'not NaN - value', SkipFrames = 1)
+        self._addValues((_Value, ))
+    
+    def updateMany(self, Data: TGenericSequence) -> None:
+        """
+        Adds a sequence of real numbers and / or measurements with uncertainty,
+        or a 1D buffer of real numbers. A buffer is binned in a vectorized
+        manner (if NumPy is installed). An empty sequence is ignored.
+
+        Signature:
+            seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) -> None
+        
+        Args:
+            Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue) OR
+                numpy.ndarray OR array.array OR memoryview; the data points to
+                be added
+        
+        Raises:
+            UT_TypeError: the argument is not a sequence of real numbers or
+                measurements with uncertainty
+            UT_ValueError: any of the values is NaN
+        
+        Version 1.0.1.0
+        """
+        if isinstance(Data, c_abc.Sized) and not len(Data):
+            return
+        _Data = _ExtractArray(Data, SkipFrames = 2)
+        if _Data is None:
+            _Data = _ExtractMeans(Data, SkipFrames = 2)
+            for Value in _Data:
+                if Value != Value: #NaN
+                    raise UT_ValueError(Value, 'not NaN - value',
+                                                                SkipFrames = 1)
+        elif np.isnan(_Data).any():
+            raise UT_ValueError(math.nan, 'not NaN - value', SkipFrames = 1)
+        self._addValues(_Data)
+    
+    def merge(self, Other: 'HistogramAccumulator') -> None:
+        """
+        Adds the counts of another histogram with the same bins into this one,
+        including the underflow and overflow. The other instance is not changed.
+        The bins defined by the edges and the equal width bins are not the same
+        even with the same edges, since the values are binned differently.
+
+        Signature:
+            HistogramAccumulator -> None
+        
+        Args:
+            Other: HistogramAccumulator; another histogram with the same edges
+        
+        Raises:
+            UT_TypeError: the argument is not an instance of
+                HistogramAccumulator
+            UT_ValueError: the edges of the bins are not the same
+        
+        Version 1.0.1.0
+        """
+        if not isinstance(Other, HistogramAccumulator):
+            raise UT_TypeError(Other, HistogramAccumulator, SkipFrames = 1)
+        if (Other._Edges != self._Edges) or (Other._Grid != self._Grid):
+            raise UT_ValueError(Other._Edges, f'{self._Edges} - bin edges',
+                                                                SkipFrames = 1)
+        self._Counts = [Left + Right
+                            for Left, Right in zip(self._Counts, Other._Counts)]
+    
+    def getHistogram(self) -> Dict[TReal, int]:
+        """
+        Returns the histogram as the mapping of the central values of the bins
+        to the number of the data points in them, in the ascending order of
+        the bins, see the function GetHistogram(). The underflow and overflow
+        are not included.
+
+        Signature:
+            None -> dict(int OR float -> int >= 0)
+        
+        Version 1.0.0.0
+        """
+        return dict(zip(self.Centres, self._Counts[1:-1]))
 
 #functions
 
-#+ helper functions - not for usage outside the module
+#+ helper functions - not for usage outside the module
+
+def _GetRanks(Data: TGenericSequence, *, SkipFrames: int = 1,
+                                            DoCheck: bool = True) -> TRealList:
+    """
+    Calculates the fractional ranks of the elements of a mixed sequence of real
+    numbers and the measurements with uncertainty. Computation speed is always
+    O(N*log(N)).
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool/ -> list(int OR float)
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers
+            and sort the values
+    
+    Returns:
+        list(int OR float): the calculated ranks, in the same order as the
+            initial sequence
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value
+
+    Version 1.0.0.1
+    """
+    _CheckPositiveInteger(SkipFrames)
+    if DoCheck:
+        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
+    else:
+        _Data = Data
+    _DataSorted = sorted(_Data)
+    Frequencies = dict()
+    for Item in _DataSorted:
+        Frequencies[Item] = Frequencies.get(Item, 0) + 1
+    Ranks = dict()
+    Last = 0
+    if sys.version_info[0] >= 3 and sys.version_info[1] >= 7:
+        Keys = Frequencies.keys()
+    else:
+        Keys = sorted(Frequencies.keys())
+    for Key in Keys:
+        Value = Frequencies[Key]
+        if Value == 1:
+            Ranks[Key] = Last + 1
+        else:
+            Ranks[Key] = Last + (Value + 1) / 2
+        Last += Value
+    Result = [Ranks[Key] for Key in _Data]
+    return Result
+
+def _SelectRanks(Data: TRealList, Ranks: Sequence[int]) -> TRealList:
+    """
+    Finds the elements of a sequence of real numbers, which would be at the
+    specified positions (ranks) in the sorted sequence, without sorting of the
+    entire sequence (quickselect with a random median of three pivot). All
+    ranks are found in the same process, i.e. the sub-sequences not containing
+    any of the requested ranks are discarded. The expected computation speed is
+    O(N) for a fixed number of the ranks. The input data is not checked.
+
+    If the requested ranks within a long (> SAMPLING_CUTOFF) sub-sequence are
+    close to each other (e.g. one quantile), the Floyd-Rivest step is tried
+    first: two pivots bracketing the ranks are taken from a sorted random
+    sample of N^(2/3) elements, and only the elements between the pivots
+    (O(N^(2/3)) expected) are kept, so a single pass reduces the problem size
+    dramatically. If the ranks happen to be outside the bracket (unlikely), the
+    ordinary quickselect partitioning is done instead. The random choices are
+    made by the module's private generator, so the state of the global one is
+    not affected.
+
+    Signature:
+        seq(int OR float), seq(int >= 0)/ -> list(int OR float)
+    
+    Args:
+        Data: seq(int OR float); a sequence of real numbers
+        Ranks: seq(int >= 0); the requested positions in the sorted sequence,
+            all must be less than the length of the data
+    
+    Returns:
+        list(int OR float): the elements at the requested positions in the
+            sorted sequence, in the same order as the ranks
+
+    Version 1.1.0.1
+    """
+    Found = dict()
+    Stack = [(Data, 0, sorted(set(Ranks)))]
+    while Stack:
+        Part, Offset, Wanted = Stack.pop()
+        Length = len(Part)
+        if Length <= SELECTION_CUTOFF:
+            Sorted = sorted(Part)
+            for Rank in Wanted:
+                Found[Rank] = Sorted[Rank - Offset]
+            continue
+        Low = Wanted[0] - Offset
+        High = Wanted[-1] - Offset
+        if Length > SAMPLING_CUTOFF and (High - Low) * 8 < Length:
+            Size = int(Length ** (2 / 3))
+            Sample = sorted(_RANDOM.sample(Part, Size))
+            Gap = 2 * int(math.sqrt(Size))
+            LowIndex = Low * Size // Length - Gap
+            HighIndex = (High + 1) * Size // Length + Gap
+            if LowIndex < 0: #no lower pivot - bracket from the minimum
+                PivotHigh = Sample[HighIndex]
+                Below = 0
+                Middle = [Item for Item in Part if Item <= PivotHigh]
+            elif HighIndex >= Size: #no upper pivot - bracket to the maximum
+                PivotLow = Sample[LowIndex]
+                Middle = [Item for Item in Part if Item >= PivotLow]
+                Below = Length - len(Middle)
+            else:
+                PivotLow = Sample[LowIndex]
+                PivotHigh = Sample[HighIndex]
+                Below = sum(map(operator.lt, Part, itertools.repeat(PivotLow)))
+                Middle = [Item for Item in Part
+                                            if PivotLow <= Item <= PivotHigh]
+            if (Below <= Low and Below + len(Middle) > High
+                                                and len(Middle) < Length):
+                Stack.append((Middle, Offset + Below, Wanted))
+                continue
+        Pivot = sorted(Part[_RANDOM.randrange(Length)] for _ in range(3))[1]
+        Lower = [Item for Item in Part if Item < Pivot]
+        Upper = [Item for Item in Part if Item > Pivot]
+        LowerEnd = Offset + len(Lower)
+        UpperStart = Offset + Length - len(Upper)
+        WantedLower = []
+        WantedUpper = []
+        for Rank in Wanted:
+            if Rank < LowerEnd:
+                WantedLower.append(Rank)
+            elif Rank >= UpperStart:
+                WantedUpper.append(Rank)
+            else:
+                Found[Rank] = Pivot
+        if WantedLower:
+            Stack.append((Lower, Offset, WantedLower))
+        if WantedUpper:
+            Stack.append((Upper, UpperStart, WantedUpper))
+    Result = [Found[Rank] for Rank in Ranks]
+    return Result
+
+def _GetOrderStatistics(Data: TRealList, Ranks: Sequence[int], *,
+                                        IsSorted: bool = False) -> TRealList:
+    """
+    Returns the elements of a sequence of real numbers, which are (or would be)
+    at the specified positions (ranks) in the sorted sequence. The already
+    sorted data is accessed directly. Otherwise the selection is used (see
+    _SelectRanks()) for the long (> SORTING_CUTOFF) sequences and a few (not
+    more than MAX_SELECTED_RANKS) different ranks; for the shorter sequences
+    or more ranks a single sorting (in C) is faster than the selection (in
+    pure Python). The input data is not checked.
+
+    Signature:
+        seq(int OR float), seq(int >= 0)/, *, bool/ -> list(int OR float)
+    
+    Args:
+        Data: seq(int OR float); a sequence of real numbers
+        Ranks: seq(int >= 0); the requested positions in the sorted sequence,
+            all must be less than the length of the data
+        IsSorted: (keyword) bool; flag if the data is already sorted in the
+            ascending order, defaults to False
+    
+    Returns:
+        list(int OR float): the elements at the requested positions in the
+            sorted sequence, in the same order as the ranks
+
+    Version 1.1.0.0
+    """
+    if IsSorted:
+        Result = [Data[Rank] for Rank in Ranks]
+    elif (len(Data) > SORTING_CUTOFF
+                                and len(set(Ranks)) <= MAX_SELECTED_RANKS):
+        Result = _SelectRanks(Data, Ranks)
+    else:
+        Sorted = sorted(Data)
+        Result = [Sorted[Rank] for Rank in Ranks]
+    return Result
+
+def _CheckQuantiles(Quantiles: Any, *,
+                        SkipFrames: int = 1) -> List[Tuple[int, int, TReal]]:
+    """
+    Checks and normalizes the specification of a batch of quantiles: either a
+    number of quantiles m (all k-th of m-quantiles with 0 < k < m, e.g. 10 for
+    the deciles or 100 for the percentiles) or a sequence of the (k, m) pairs
+    and / or probabilities between 0 and 1 inclusively.
+
+    Signature:
+        int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR float >= 0)/, *,
+            int > 0/ -> list(tuple(int >= 0, int > 0, int OR float))
+    
+    Args:
+        Quantiles: int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR
+            float >= 0); the number of quantiles or the requested quantiles
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+    
+    Returns:
+        list(tuple(int >= 0, int > 0, int OR float)): the normalized quantiles
+            as (k, m, probability) tuples, where k and m are zeroes for the
+            quantiles specified as the probability
+    
+    Raises:
+        UT_TypeError: the argument is neither an integer nor a sequence, OR
+            any element of the sequence is neither a pair of integers nor a
+            real number
+        UT_ValueError: the number of quantiles is less than 2, OR the sequence
+            is empty, OR the quantile index is negative or greater than the
+            total number of quantiles, OR the total number of quantiles is not
+            positive, OR the probability is not between 0 and 1
+
+    Version 1.0.0.0
+    """
+    if isinstance(Quantiles, int) and not isinstance(Quantiles, bool):
+        if Quantiles < 2:
+            raise UT_ValueError(Quantiles, '>= 2 - number of quantiles',
+                                                        SkipFrames = SkipFrames)
+        Result = [(k, Quantiles, k / Quantiles) for k in range(1, Quantiles)]
+        return Result
+    if ((not isinstance(Quantiles, c_abc.Sequence))
+                        or isinstance(Quantiles, (str, bytes, bytearray))):
+        raise UT_TypeError(Quantiles, (int, list, tuple),
+                                                        SkipFrames = SkipFrames)
+    if not Quantiles:
+        raise UT_ValueError(len(Quantiles), '> 0 - number of quantiles',
+                                                        SkipFrames = SkipFrames)
+    Result = []
+    for Item in Quantiles:
+        if isinstance(Item, (int, float)) and not isinstance(Item, bool):
+            if not (0 <= Item <= 1):
+                raise UT_ValueError(Item, '>= 0 and <= 1 - probability',
+                                                        SkipFrames = SkipFrames)
+            Result.append((0, 0, Item))
+            continue
+        if ((not isinstance(Item, c_abc.Sequence)) or len(Item) != 2
+                            or isinstance(Item, (str, bytes, bytearray))):
+            raise UT_TypeError(Item, (tuple, float), SkipFrames = SkipFrames)
+        k, m = Item
+        for Value in (k, m):
+            if (not isinstance(Value, int)) or isinstance(Value, bool):
+                raise UT_TypeError(Value, int, SkipFrames = SkipFrames)
+        if m < 1:
+            raise UT_ValueError(m, '> 0 - total number of quantiles',
+                                                        SkipFrames = SkipFrames)
+        if (k < 0) or (k > m):
+            raise UT_ValueError(k, '>= 0 and <= {} - quantile index'.format(m),
+                                                        SkipFrames = SkipFrames)
+        Result.append((k, m, k / m))
+    return Result
+
+def _GetTrimmedData(Data: TGenericSequence, Fraction: TReal, *,
+                    IsWinsorized: bool = False, SkipFrames: int = 1,
+                    DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                            ) -> TRealList:
+    """
+    Prepares the trimmed or winsorized values of a mixed sequence of real
+    numbers and the measurements with uncertainty. With N elements g =
+    floor(Fraction * N) lowest and g highest values are removed (trimming) or
+    replaced by the lowest / highest remaining value (winsorizing). The two cut
+    points are found by the selection (see _SelectRanks()), and the values are
+    then obtained in a single pass, i.e. the computation speed is O(N), unless
+    the passed sequence is already sorted in ascending order sequence of real
+    numbers, which is indicated by the keyword argument DoCheck = False, in
+    which case the cut points are found in O(1). The data containing NaN
+    cannot be ranked, thus it is returned as it is, so that NaN propagates
+    into the calculated statistics.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+            int >= 0 OR float >= 0/, *, bool, int > 0, bool, MissingPolicy/
+                -> list(int OR float)
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        Fraction: int >= 0 OR float >= 0; the fraction of the values to be
+            trimmed / winsorized at each end, must be less than 0.5
+        IsWinsorized: (keyword) bool; flag if the extreme values are to be
+            replaced instead of removed, defaults to False
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        list(int OR float): the trimmed or winsorized values, not in the
+            original order
+    
+    Raises:
+        UT_TypeError: mandatory data argument is not a sequence of real numbers
+            or measurements with uncertainty, OR the fraction is not a real
+            number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the fraction is
+            negative or not less than 0.5, OR any keyword argument is of the
+            proper type but unacceptable value, OR a missing value is found
+            with the RAISE policy, OR all values are missing with the SKIP
+            policy
+
+    Version 1.0.1.0
+    """
+    _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    if (not isinstance(Fraction, (int, float))) or isinstance(Fraction, bool):
+        raise UT_TypeError(Fraction, (int, float), SkipFrames = SkipFrames)
+    if not (0 <= Fraction < 0.5):
+        raise UT_ValueError(Fraction, '>= 0 and < 0.5 - trimming fraction',
+                                                        SkipFrames = SkipFrames)
+    if DoCheck:
+        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing)
+    else:
+        _Data = Data
+    Length = len(_Data)
+    Cut = int(Fraction * Length)
+    if not Cut:
+        return list(_Data)
+    Total = sum(_Data)
+    if Total != Total and any(Item != Item for Item in _Data):
+        return list(_Data) #NaN cannot be ranked - propagates into the result
+    if DoCheck:
+        Low, High = _SelectRanks(_Data, (Cut, Length - 1 - Cut))
+    else:
+        Low = _Data[Cut]
+        High = _Data[Length - 1 - Cut]
+    if Low == High:
+        Kept = Length if IsWinsorized else Length - 2 * Cut
+        return [Low] * Kept
+    Result = [Item for Item in _Data if Low < Item < High]
+    #copies of the cut points within the ranks Cut to Length - 1 - Cut
+    NLow = sum(1 for Item in _Data if Item <= Low) - Cut
+    NHigh = sum(1 for Item in _Data if Item >= High) - Cut
+    if IsWinsorized:
+        NLow += Cut
+        NHigh += Cut
+    Result.extend([Low] * NLow)
+    Result.extend([High] * NHigh)
+    return Result
+
+def _SelectFromTwo(GetFirst: Callable[[int], TReal], LengthFirst: int,
+                    GetSecond: Callable[[int], TReal], LengthSecond: int,
+                                                        Rank: int) -> TReal:
+    """
+    Finds the element at the specified position (rank) in the union of two
+    sequences of real numbers, each sorted in the ascending order, without
+    merging them, using the binary search - in O(log(N)). The sequences are
+    accessed by the index via the passed functions, so they can be defined
+    implicitly. The input data is not checked.
+
+    Signature:
+        func(int >= 0 -> int OR float), int >= 0,
+            func(int >= 0 -> int OR float), int >= 0, int >= 0 -> int OR float
+    
+    Args:
+        GetFirst: func(int >= 0 -> int OR float); access to the elements of the
+            first sequence by index
+        LengthFirst: int >= 0; length of the first sequence
+        GetSecond: func(int >= 0 -> int OR float); access to the elements of
+            the second sequence by index
+        LengthSecond: int >= 0; length of the second sequence
+        Rank: int >= 0; the position in the merged sorted sequence, less than
+            the total length
+    
+    Returns:
+        int OR float: the found element
+
+    Version 1.0.0.0
+    """
+    Count = Rank + 1
+    Low = max(0, Count - LengthSecond)
+    High = min(Count, LengthFirst)
+    while Low < High: #number of the elements taken from the first sequence
+        Middle = (Low + High) // 2
+        if GetFirst(Middle) < GetSecond(Count - Middle - 1):
+            Low = Middle + 1
+        else:
+            High = Middle
+    if not Low:
+        Result = GetSecond(Count - 1)
+    elif Low == Count:
+        Result = GetFirst(Count - 1)
+    else:
+        Result = max(GetFirst(Low - 1), GetSecond(Count - Low - 1))
+    return Result
+
+def _GetMAD(Data: TRealList, *, IsSorted: bool = False) -> TReal:
+    """
+    Calculates the median absolute deviation from the median of a sequence of
+    real numbers. If the sequence is sorted in the ascending order, the
+    absolute deviations form two sorted sub-sequences (below and above the
+    median), and their median is found by the binary search in O(log(N)).
+    Otherwise both medians are found by the selection in O(N). The input data
+    is not checked.
+
+    Signature:
+        seq(int OR float)/, *, bool/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float); a sequence of real numbers
+        IsSorted: (keyword) bool; flag if the sequence is sorted in the
+            ascending order, defaults to False
+    
+    Returns:
+        int OR float: the median absolute deviation
+
+    Version 1.0.0.0
+    """
+    Length = len(Data)
+    Ranks = ((Length - 1) // 2, Length // 2)
+    if IsSorted:
+        Median = (Data[Ranks[0]] + Data[Ranks[1]]) / 2
+        Split = bisect.bisect_right(Data, Median)
+        Values = [_SelectFromTwo(lambda Index: Median - Data[Split - 1 - Index],
+                            Split, lambda Index: Data[Split + Index] - Median,
+                                            Length - Split, Rank)
+                                                            for Rank in Ranks]
+    else:
+        Median = sum(_SelectRanks(Data, Ranks)) / 2
+        Values = _SelectRanks([abs(Item - Median) for Item in Data], Ranks)
+    Result = (Values[0] + Values[1]) / 2
+    return Result
+
+def _GetSn(Data: TRealList) -> TReal:
+    """
+    Calculates the not scaled Rousseeuw-Croux Sn scale estimator of a sequence
+    of real numbers sorted in the ascending order, i.e. the low median over
+    all elements of the high median of the distances from the element to all
+    elements (including itself). The high median of the distances from the
+    element is the distance to its (N // 2 + 1)-th nearest neighbour in a
+    window of the consecutive sorted elements, which only moves to the right
+    for each next element, so all of them are found in O(N). The low median
+    is found by the selection in O(N). The input data is not checked.
+
+    Signature:
+        seq(int OR float) -> int OR float
+    
+    Args:
+        Data: seq(int OR float); a sequence of real numbers sorted in the
+            ascending order
+    
+    Returns:
+        int OR float: the not scaled Sn estimator
+
+    Version 1.0.0.0
+    """
+    Length = len(Data)
+    Size = Length // 2 + 1 #number of the nearest elements in the window
+    Start = 0
+    Distances = []
+    for Item in Data:
+        while (Start + Size < Length and
+                    Data[Start + Size] - Item < Item - Data[Start]):
+            Start += 1
+        Distances.append(max(Item - Data[Start],
+                                            Data[Start + Size - 1] - Item))
+    Result = _SelectRanks(Distances, ((Length + 1) // 2 - 1, ))[0]
+    return Result
+
+def _GetWeightedHighMedian(Data: TRealList, Weights: Sequence[int]) -> TReal:
+    """
+    Calculates the weighted high median of a sequence of real numbers, i.e.
+    the smallest element, for which the total weight of the elements less than
+    or equal to it exceeds the half of the total weight. The input data is not
+    checked.
+
+    Signature:
+        seq(int OR float), seq(int > 0) -> int OR float
+    
+    Args:
+        Data: seq(int OR float); a sequence of real numbers
+        Weights: seq(int > 0); the weights of the elements
+    
+    Returns:
+        int OR float: the weighted high median
+
+    Version 1.0.0.0
+    """
+    Total = sum(Weights)
+    Cumulative = 0
+    for Index in sorted(range(len(Data)), key = Data.__getitem__):
+        Cumulative += Weights[Index]
+        if 2 * Cumulative > Total:
+            break
+    return Data[Index]
+
+def _GetQnCounts(Data: TRealList,
+                        Trial: TReal) -> Tuple[List[int], List[int]]:
+    """
+    Calculates for each element x[i] of a sequence of real numbers sorted in
+    the ascending order the number of the elements x[j], for which x[i] - x[j]
+    is less than the trial value, and the number of the elements, for which it
+    is not greater than the trial value. The positions are found by the
+    bisection of the sorted sequence and then corrected using the differences
+    calculated exactly as the candidate values, so the counts are consistent
+    with the rounding of the differences. The input data is not checked.
+
+    Signature:
+        seq(int OR float), int OR float -> tuple(list(int >= 0),
+                                                            list(int >= 0))
+    
+    Args:
+        Data: seq(int OR float); a sequence of real numbers sorted in the
+            ascending order
+        Trial: int OR float; the trial value
+    
+    Returns:
+        tuple(list(int >= 0), list(int >= 0)): the numbers of the differences
+            less than and not greater than the trial value per element
+
+    Version 1.0.0.0
+    """
+    Length = len(Data)
+    Bounds = [Item - Trial for Item in Data]
+    Less = list(map(bisect.bisect_right, itertools.repeat(Data), Bounds))
+    NotGreater = list(map(bisect.bisect_left, itertools.repeat(Data), Bounds))
+    for Row, Index in enumerate(Less):
+        Item = Data[Row]
+        if ((Index and Item - Data[Index - 1] < Trial) or
+                (Index < Length and not (Item - Data[Index] < Trial))):
+            while Index and Item - Data[Index - 1] < Trial:
+                Index -= 1
+            while Index < Length and not (Item - Data[Index] < Trial):
+                Index += 1
+            Less[Row] = Index
+    for Row, Index in enumerate(NotGreater):
+        Item = Data[Row]
+        if ((Index and not (Item - Data[Index - 1] > Trial)) or
+                (Index < Length and Item - Data[Index] > Trial)):
+            while Index and not (Item - Data[Index - 1] > Trial):
+                Index -= 1
+            while Index < Length and Item - Data[Index] > Trial:
+                Index += 1
+            NotGreater[Row] = Index
+    Less = [Length - Index for Index in Less]
+    NotGreater = [Length - Index for Index in NotGreater]
+    return Less, NotGreater
+
+def _GetQnArray(Data: Any, Target: int) -> TReal:
+    """
+    Vectorized (NumPy) version of the search of the k-th smallest element of
+    the matrix of the differences x[i] - x[n - 1 - j], see _GetQn(). The input
+    data is not checked.
+
+    Signature:
+        numpy.ndarray, int > 0 -> int OR float
+    
+    Args:
+        Data: numpy.ndarray; 1D array of real numbers sorted in the ascending
+            order, at least, 2 elements long
+        Target: int > 0; the position (from 1) of the element in the sorted
+            matrix of the differences
+    
+    Returns:
+        int OR float: the found element
+
+    Version 1.0.0.0
+    """
+    Length = len(Data)
+    Reversed = Data[::-1]
+    Left = Length - np.arange(Length)
+    Right = np.full(Length, Length - 1)
+    Below = Length * (Length + 1) // 2
+    Above = Length * Length
+    while Above - Below > Length:
+        Rows = np.flatnonzero(Left <= Right)
+        Weights = Right[Rows] - Left[Rows] + 1
+        Candidates = Data[Rows] - Reversed[Left[Rows] + Weights // 2]
+        Order = np.argsort(Candidates, kind = 'stable')
+        Cumulative = np.cumsum(Weights[Order])
+        Trial = Candidates[Order[np.argmax(2 * Cumulative > Cumulative[-1])]]
+        Bounds = Data - Trial
+        Less = np.searchsorted(Data, Bounds, side = 'right')
+        NotGreater = np.searchsorted(Data, Bounds, side = 'left')
+        for Index, Condition in ((Less, np.less), (NotGreater, np.less_equal)):
+            while True: #correction of the positions, see _GetQnCounts()
+                Mask = (Index > 0) & Condition(
+                            Data - Data[np.maximum(Index - 1, 0)], Trial)
+                if not Mask.any():
+                    break
+                Index[Mask] -= 1
+            while True:
+                Mask = (Index < Length) & ~Condition(
+                        Data - Data[np.minimum(Index, Length - 1)], Trial)
+                if not Mask.any():
+                    break
+                Index[Mask] += 1
+        Less = Length - Less
+        NotGreater = Length - NotGreater
+        SumLess = int(Less.sum())
+        SumNotGreater = int(NotGreater.sum())
+        if Target <= SumLess:
+            Right = Less - 1
+            Above = SumLess
+        elif Target > SumNotGreater:
+            Left = NotGreater
+            Below = SumNotGreater
+        else: #the trial value is the answer
+            return Trial.item()
+    Rows = np.flatnonzero(Left <= Right)
+    Weights = Right[Rows] - Left[Rows] + 1
+    Starts = np.cumsum(Weights) - Weights
+    Columns = (np.repeat(Left[Rows] - Starts, Weights) +
+                                                    np.arange(Weights.sum()))
+    Candidates = np.repeat(Data[Rows], Weights) - Reversed[Columns]
+    Rank = Target - Below - 1
+    Result = np.partition(Candidates, Rank)[Rank].item()
+    return Result
+
+def _GetQn(Data: TRealList) -> TReal:
+    """
+    Calculates the not scaled Rousseeuw-Croux Qn scale estimator of a sequence
+    of real numbers sorted in the ascending order, i.e. the k-th smallest of
+    the pairwise distances between the elements with k = h * (h - 1) / 2 and
+    h = N // 2 + 1. Implements the O(N * log(N)) algorithm of Croux and
+    Rousseeuw (1992): the differences x[i] - x[N - 1 - j] form a matrix with
+    the sorted rows and columns, and the range of the candidate columns in
+    each row is narrowed down using the weighted median of the row medians as
+    the trial value, until the trial value is the answer, or only O(N)
+    candidates remain. If NumPy is installed, the vectorized implementation is
+    used (except for the integers beyond the int64 range). The input data is
+    not checked, it must be, at least, 2 elements long.
+
+    Signature:
+        seq(int OR float) -> int OR float
+    
+    Args:
+        Data: seq(int OR float); a sequence of real numbers sorted in the
+            ascending order, at least, 2 elements long
+    
+    Returns:
+        int OR float: the not scaled Qn estimator
+
+    Version 1.0.0.0
+    """
+    Length = len(Data)
+    Half = Length // 2 + 1
+    #the matrix also includes N * (N + 1) / 2 not positive differences (j <= i)
+    Below = Length * (Length + 1) // 2
+    Target = Half * (Half - 1) // 2 + Below
+    if np is not None:
+        Array = np.array(Data)
+        if Array.dtype.kind == 'f' or (Array.dtype.kind == 'i' and
+                                    max(-Data[0], Data[-1]) < QN_INTEGER_LIMIT):
+            return _GetQnArray(Array, Target)
+    #the candidates in the row i are x[i] - x[N - 1 - j], j = Left to Right
+    Left = [Length - Row for Row in range(Length)]
+    Right = [Length - 1] * Length
+    Above = Length * Length
+    while Above - Below > Length:
+        Candidates = []
+        Weights = []
+        for Row, Start in enumerate(Left):
+            if Start <= Right[Row]:
+                Weight = Right[Row] - Start + 1
+                Candidates.append(Data[Row] -
+                                        Data[Length - 1 - Start - Weight // 2])
+                Weights.append(Weight)
+        Trial = _GetWeightedHighMedian(Candidates, Weights)
+        Less, NotGreater = _GetQnCounts(Data, Trial)
+        SumLess = sum(Less)
+        SumNotGreater = sum(NotGreater)
+        if Target <= SumLess:
+            Right = [Count - 1 for Count in Less]
+            Above = SumLess
+        elif Target > SumNotGreater:
+            Left = NotGreater
+            Below = SumNotGreater
+        else: #the trial value is the answer
+            return Trial
+    Candidates = [Data[Row] - Data[Length - 1 - Column]
+                    for Row, Start in enumerate(Left)
+                        for Column in range(Start, Right[Row] + 1)]
+    Result = _SelectRanks(Candidates, (Target - Below - 1, ))[0]
+    return Result
+
+def _GetMedcoupleCounts(Kernel: Callable[[int, int], TReal],
+                        Left: Sequence[int], Right: Sequence[int],
+                            Trial: TReal) -> Tuple[List[int], List[int]]:
+    """
+    Calculates for each row of an implicitly defined matrix, which elements
+    are not increasing along each row and along each column, the number of the
+    elements greater than the trial value, and the number of the elements not
+    less than the trial value, considering only the columns within the
+    specified ranges. The counts do not decrease from a row to the previous
+    one, so all of them are found by a single sweep over the rows from the
+    last one in O(NRows + NColumns). The input data is not checked.
+
+    Signature:
+        func(int >= 0, int >= 0 -> int OR float), seq(int >= 0),
+            seq(int >= 0), int OR float -> tuple(list(int >= 0),
+                                                            list(int >= 0))
+    
+    Args:
+        Kernel: func(int >= 0, int >= 0 -> int OR float); access to the
+            elements of the matrix by the row and column indexes
+        Left: seq(int >= 0); the first column of the range per row
+        Right: seq(int >= 0); the column after the last one of the range per
+            row
+        Trial: int OR float; the trial value
+    
+    Returns:
+        tuple(list(int >= 0), list(int >= 0)): the column indexes bounding
+            the elements greater than and not less than the trial value per row
+
+    Version 1.0.0.0
+    """
+    NRows = len(Left)
+    Greater = [0] * NRows
+    NotLess = [0] * NRows
+    LastGreater = 0
+    LastNotLess = 0
+    for Row in range(NRows - 1, -1, -1):
+        Column = max(Left[Row], LastGreater)
+        while Column < Right[Row] and Kernel(Row, Column) > Trial:
+            Column += 1
+        Greater[Row] = LastGreater = Column
+        Column = max(Column, LastNotLess)
+        while Column < Right[Row] and not (Kernel(Row, Column) < Trial):
+            Column += 1
+        NotLess[Row] = LastNotLess = Column
+    return Greater, NotLess
+
+def _GetMedcoupleLargest(Kernel: Callable[[int, int], TReal], NRows: int,
+                                        NColumns: int, Rank: int) -> TReal:
+    """
+    Finds the element at the specified position (from 1) counting from the
+    largest one in an implicitly defined matrix, which elements are not
+    increasing along each row and along each column, see _GetMedcouple().
+    Implements the O((NRows + NColumns) * log(NRows * NColumns)) algorithm of
+    Johnson and Mizoguchi (1978): the range of the candidate columns in each
+    row is narrowed down using the weighted median of the row medians as the
+    trial value, whilst the numbers of the elements greater than the trial
+    value per row are found by a single sweep over the rows, see
+    _GetMedcoupleCounts(). The input data is not checked.
+
+    Signature:
+        func(int >= 0, int >= 0 -> int OR float), int > 0, int > 0, int > 0
+            -> int OR float
+    
+    Args:
+        Kernel: func(int >= 0, int >= 0 -> int OR float); access to the
+            elements of the matrix by the row and column indexes
+        NRows: int > 0; number of the rows of the matrix
+        NColumns: int > 0; number of the columns of the matrix
+        Rank: int > 0; the position (from 1) of the element counting from the
+            largest one, not greater than the total number of the elements
+    
+    Returns:
+        int OR float: the found element
+
+    Version 1.0.0.0
+    """
+    #the candidates in the row i are the columns from Left[i] to Right[i] - 1
+    Left = [0] * NRows
+    Right = [NColumns] * NRows
+    Above = 0 #number of the elements before the candidates
+    Active = NRows * NColumns
+    while Active > NRows + NColumns:
+        Candidates = []
+        Weights = []
+        for Row, Start in enumerate(Left):
+            if Start < Right[Row]:
+                Candidates.append(Kernel(Row, (Start + Right[Row]) // 2))
+                Weights.append(Right[Row] - Start)
+        Trial = _GetWeightedHighMedian(Candidates, Weights)
+        Greater, NotLess = _GetMedcoupleCounts(Kernel, Left, Right, Trial)
+        SumGreater = sum(Greater)
+        SumNotLess = sum(NotLess)
+        if Rank <= SumGreater:
+            Right = Greater
+        elif Rank > SumNotLess:
+            Left = NotLess
+            Above = SumNotLess
+        else: #the trial value is the answer
+            return Trial
+        Remaining = sum(Right) - sum(Left)
+        if Remaining >= Active: #no progress due to the rounding errors
+            break
+        Active = Remaining
+    Candidates = [Kernel(Row, Column) for Row, Start in enumerate(Left)
+                                    for Column in range(Start, Right[Row])]
+    Result = _SelectRanks(Candidates, (len(Candidates) - Rank + Above, ))[0]
+    return Result
+
+def _GetMedcouple(Data: TRealList) -> TReal:
+    """
+    Calculates the medcouple (robust skewness) of a sequence of real numbers
+    sorted in the ascending order, i.e. the median of the kernel values
+    (x[i] + x[j] - 2 * m) / (x[i] - x[j]) over all pairs x[i] >= m >= x[j],
+    where m is the median, with the special sign kernel for the pairs of the
+    elements equal to the median. The matrix of the kernel values has
+    the not increasing rows and columns, thus the median is found by the fast
+    algorithm of Brys, Hubert and Struyf (2004) in O(N * log(N)) instead of
+    the O(N^2) enumeration of all pairs. With the even number of the kernel
+    values the second middle value is found by one more sweep, as the largest
+    value not greater than the first one. The input data is not checked.
+
+    Signature:
+        seq(int OR float) -> int OR float
+    
+    Args:
+        Data: seq(int OR float); a not empty sequence of real numbers sorted
+            in the ascending order
+    
+    Returns:
+        int OR float: the medcouple, between -1 and 1 inclusively
+
+    Version 1.0.0.0
+    """
+    Length = len(Data)
+    Median = (Data[(Length - 1) // 2] + Data[Length // 2]) / 2
+    Split = bisect.bisect_left(Data, Median)
+    Ties = bisect.bisect_right(Data, Median) - Split
+    #both sequences of the deviations are in the descending order
+    Upper = [Item - Median for Item in reversed(Data[Split:])]
+    Lower = [Item - Median for Item in reversed(Data[:Split + Ties])]
+    NRows = len(Upper)
+    NColumns = len(Lower)
+    Offset = NRows - Ties #first row of the elements equal to the median
+    
+    def Kernel(Row: int, Column: int) -> TReal:
+        First = Upper[Row]
+        Second = Lower[Column]
+        if First == Second: #both are equal to the median
+            Result = Ties - 1 - (Row - Offset) - Column
+            Result = (Result > 0) - (Result < 0)
+        else:
+            Result = (First + Second) / (First - Second)
+        return Result
+    
+    Total = NRows * NColumns
+    Rank = (Total + 1) // 2 #from the largest, i.e. the upper median
+    Result = _GetMedcoupleLargest(Kernel, NRows, NColumns, Rank)
+    if not Total % 2:
+        _, NotLess = _GetMedcoupleCounts(Kernel, [0] * NRows,
+                                                [NColumns] * NRows, Result)
+        if sum(NotLess) > Rank: #the lower median is the same value
+            Next = Result
+        else: #the largest of the first elements less than the upper median
+            Next = max(Kernel(Row, Column)
+                        for Row, Column in enumerate(NotLess)
+                                                    if Column < NColumns)
+        Result = (Result + Next) / 2
+    return Result
+
+def _GetLMoments(Data: TRealList, Order: int) -> List[TReal]:
+    """
+    Calculates the sample L-moments of a sequence of real numbers sorted in
+    the ascending order from the order 1 up to the requested order via the
+    unbiased probability weighted moments b[r] = sum(C(i, r) * x[i]) /
+    (N * C(N - 1, r)), i = 0 to N - 1, and the shifted Legendre polynomials
+    coefficients. The falling factorials i * (i - 1) * ... * (i - r + 1)
+    replacing the binomial coefficients are accumulated by the multiplication
+    only, so all sums are obtained in a single pass in O(N * Order); the sums
+    are exact for the integer data. If NumPy is installed, the pass over the
+    floating point data is vectorized. The input data is not checked, it must
+    be, at least, Order elements long.
+
+    Signature:
+        seq(int OR float), int > 0 -> list(int OR float)
+    
+    Args:
+        Data: seq(int OR float); a sequence of real numbers sorted in the
+            ascending order
+        Order: int > 0; the highest order of the L-moments to calculate
+    
+    Returns:
+        list(int OR float): the L-moments of the orders 1 to Order
+
+    Version 1.0.0.1
+    """
+    Length = len(Data)
+    Sums = [0] * Order
+    Array = None
+    if np is not None:
+        Array = np.array(Data)
+    if Array is not None and Array.dtype.kind == 'f':
+        Indexes = np.arange(Length, dtype = float)
+        Weighted = Array.copy()
+        Sums[0] = Weighted.sum().item()
+        for Power in range(1, Order):
+            Weighted *= Indexes - (Power - 1)
+            Sums[Power] = Weighted.sum().item()
+    else:
+        for Index, Item in enumerate(Data):
+            Weighted = Item
+            Sums[0] += Item
+            for Power in range(1, Order):
+                Weighted *= Index - Power + 1
+                Sums[Power] += Weighted
+    WeightedMoments = [] #probability weighted moments
+    Denominator = Length
+    for Power, Sum in enumerate(Sums):
+        WeightedMoments.append(Sum / Denominator)
+        Denominator *= Length - Power - 1
+    Result = []
+    for Power in range(Order):
+        Moment = 0
+        for Index, WeightedMoment in enumerate(WeightedMoments[:Power + 1]):
+            #C(Power, Index) * C(Power + Index, Index)
+            Coefficient = (math.factorial(Power + Index) //
+                                    (math.factorial(Index)**2 *
+                                            math.factorial(Power - Index)))
+            if (Power - Index) % 2:
+                Coefficient = - Coefficient
+            Moment += Coefficient * WeightedMoment
+        Result.append(Moment)
+    return Result
+
+def _GetTiedPairs(Data: Sequence[Any]) -> int:
+    """
+    Calculates the number of the pairs of the equal elements t * (t - 1) / 2
+    summed over all groups of t equal elements of a sorted sequence. The input
+    data is not checked.
+
+    Signature:
+        seq(type A) -> int >= 0
+    
+    Args:
+        Data: seq(type A); a sorted sequence of comparable elements
+    
+    Returns:
+        int >= 0: the number of the tied pairs
+
+    Version 1.0.0.0
+    """
+    Result = 0
+    for _, Group in itertools.groupby(Data):
+        Count = sum(1 for _ in Group)
+        Result += Count * (Count - 1) // 2
+    return Result
+
+def _GetTiedPairsArray(IsNewGroup: Any) -> int:
+    """
+    Vectorized (NumPy) version of _GetTiedPairs() working on the flags marking
+    the start of a new group of the equal elements in a sorted array, i.e. the
+    element is not equal to the previous one, with the first flag being True.
+    The input data is not checked.
+
+    Signature:
+        numpy.ndarray(bool) -> int >= 0
+    
+    Args:
+        IsNewGroup: numpy.ndarray(bool); the flags of the group starts
+    
+    Returns:
+        int >= 0: the number of the tied pairs
+
+    Version 1.0.0.0
+    """
+    Starts = np.flatnonzero(IsNewGroup)
+    Counts = np.diff(np.append(Starts, IsNewGroup.size))
+    return int((Counts * (Counts - 1) // 2).sum())
+
+def _CountInversions(Data: TRealList) -> int:
+    """
+    Counts the number of the inversions in a sequence of real numbers, i.e.
+    the pairs of the elements with i < j and x[i] > x[j] (the equal elements
+    are not counted), which is the number of the swaps performed by a bubble
+    sort. Uses the bottom-up merge sort: when an element of the right half of
+    a block is merged before the remaining elements of the left half, it forms
+    an inversion with each of them. Each level of the merge costs O(N), thus
+    the total cost is O(N * log(N)). The input data is not checked or modified.
+
+    Signature:
+        seq(int OR float) -> int >= 0
+    
+    Args:
+        Data: seq(int OR float); a sequence of real numbers
+    
+    Returns:
+        int >= 0: the number of the inversions
+
+    Version 1.1.0.0
+    """
+    Blocks = [[Item] for Item in Data]
+    Result = 0
+    while len(Blocks) > 1:
+        Merged = []
+        for Index in range(0, len(Blocks) - 1, 2):
+            Left = Blocks[Index]
+            Right = Blocks[Index + 1]
+            if Left[-1] > Right[0]:
+                SizeLeft = len(Left)
+                SizeRight = len(Right)
+                Block = []
+                IndexLeft = 0
+                IndexRight = 0
+                while IndexLeft < SizeLeft and IndexRight < SizeRight:
+                    if Right[IndexRight] < Left[IndexLeft]:
+                        Result += SizeLeft - IndexLeft
+                        Block.append(Right[IndexRight])
+                        IndexRight += 1
+                    else:
+                        Block.append(Left[IndexLeft])
+                        IndexLeft += 1
+                Block.extend(Left[IndexLeft:])
+                Block.extend(Right[IndexRight:])
+            else: #already in order - no inversions between the halves
+                Block = Left + Right
+            Merged.append(Block)
+        if len(Blocks) % 2:
+            Merged.append(Blocks[-1])
+        Blocks = Merged
+    return Result
+
+def _CountInversionsArray(Ranks: Any) -> int:
+    """
+    Vectorized (NumPy) version of _CountInversions() working on the dense
+    integer ranks 0 to N - 1 of the elements. At each level of the bottom-up
+    merge the elements of the left halves of the blocks are sorted by the
+    combined key block * N + rank, and the number of the greater elements in
+    the left half of the same block is found for each element of the right
+    half by the binary search, thus the total cost is O(N * log(N)^2). The
+    input data is not checked.
+
+    Signature:
+        numpy.ndarray(int) -> int >= 0
+    
+    Args:
+        Ranks: numpy.ndarray(int); the ranks of the elements
+    
+    Returns:
+        int >= 0: the number of the inversions
+
+    Version 1.0.0.0
+    """
+    Length = Ranks.size
+    Indexes = np.arange(Length)
+    Width = 1
+    Result = 0
+    while Width < Length:
+        Blocks = Indexes // (2 * Width)
+        IsLeft = (Indexes // Width) % 2 == 0
+        Keys = Blocks * Length + Ranks
+        LeftKeys = np.sort(Keys[IsLeft])
+        IsRight = ~IsLeft
+        Ends = np.searchsorted(LeftKeys, Blocks[IsRight] * Length + Length,
+                                                            side = 'left')
+        Starts = np.searchsorted(LeftKeys, Keys[IsRight], side = 'right')
+        Result += int((Ends - Starts).sum())
+        Width *= 2
+    return Result
+
+def _GetKendallReference(DataX: TRealList, DataY: TRealList) -> TReal:
+    """
+    Reference O(N^2) implementation of the Kendall tau-b rank correlation
+    coefficient by the direct comparison of all pairs of the data points, see
+    _GetKendall(). It is used for the short sequences (up to
+    KENDALL_DIRECT_CUTOFF elements), for which it is faster than the sorting
+    based algorithm. The input data is not checked, it must be, at least, 2
+    elements long, and it should not contain NaN values.
+
+    Signature:
+        seq(int OR float), seq(int OR float) -> int OR float
+    
+    Args:
+        DataX: seq(int OR float); X data
+        DataY: seq(int OR float); Y data of the same length
+    
+    Returns:
+        int OR float: the calculated rank correlation value
+
+    Version 1.0.1.0
+    """
+    Length = len(DataX)
+    NConcord = 0
+    NDiscord = 0
+    NXTies = 0
+    NYTies = 0
+    for FirstIdx in range(Length - 1):
+        for SecondIdx in range(FirstIdx + 1, Length):
+            X1 = DataX[FirstIdx]
+            X2 = DataX[SecondIdx]
+            Y1 = DataY[FirstIdx]
+            Y2 = DataY[SecondIdx]
+            if X1 == X2 and Y1 != Y2:
+                NXTies += 1
+            elif X1 != X2 and Y1 == Y2:
+                NYTies += 1
+            elif (X1 > X2 and Y1 > Y2) or (X1 < X2 and Y1 < Y2):
+                NConcord += 1
+            elif (X1 > X2 and Y1 < Y2) or (X1 < X2 and Y1 > Y2):
+                NDiscord += 1
+    Difference = NConcord - NDiscord
+    Correction = math.sqrt((NConcord + NDiscord + NXTies) *
+                                            (NConcord + NDiscord + NYTies))
+    if Correction == 0:
+        Result = 1
+    else:
+        Result = Difference / Correction
+    return Result
+
+def _GetKendall(DataX: TRealList, DataY: TRealList, *,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the Kendall tau-b rank correlation coefficient using the
+    O(N * log(N)) algorithm of Knight (1966). The pairs are sorted by X and then
+    by Y, and the number of the discordant pairs is the number of the swaps
+    needed to sort the Y values in this order (see _CountInversions()). With
+    n0 = N * (N - 1) / 2 and n1, n2 and n3 being the numbers of the pairs tied
+    in X, in Y and in both (joint ties), the coefficient is
+
+    tau = (n0 - n1 - n2 + n3 - 2 * swaps) / sqrt((n0 - n1) * (n0 - n2)),
+
+    which equals (C - D) / sqrt((C + D + Tx) * (C + D + Ty)) with C and D being
+    the numbers of the concordant and discordant pairs, and Tx and Ty - of the
+    pairs tied only in X or only in Y, whereas the value 1 is returned for the
+    zero denominator. If NumPy is installed, the vectorized implementation is
+    used (except for the integers beyond the int64 range). The short sequences
+    (up to KENDALL_DIRECT_CUTOFF elements) are passed to the direct comparison
+    of all pairs, see _GetKendallReference().
+
+    The data is checked for NaN values by the built-in summation. With the SKIP
+    policy the pairs containing NaN are removed, otherwise NaN is returned at
+    once. The input data is not checked otherwise, it must be, at least, 2
+    elements long.
+
+    Signature:
+        seq(int OR float), seq(int OR float)/, *, MissingPolicy/
+            -> int OR float
+    
+    Args:
+        DataX: seq(int OR float); X data
+        DataY: seq(int OR float); Y data of the same length
+        Missing: (keyword) MissingPolicy; the treatment of the NaN values,
+            defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated rank correlation value
+
+    Version 1.1.0.0
+    """
+    SumX = sum(DataX)
+    SumY = sum(DataY)
+    if SumX != SumX or SumY != SumY: #NaN or inf - inf
+        if any(Item != Item for Item in itertools.chain(DataX, DataY)):
+            if not (Missing is MissingPolicy.SKIP):
+                return math.nan
+            Pairs = [(ItemX, ItemY) for ItemX, ItemY in zip(DataX, DataY)
+                                    if ItemX == ItemX and ItemY == ItemY]
+            if len(Pairs) < 2:
+                return 1 if Pairs else math.nan
+            DataX = [Item[0] for Item in Pairs]
+            DataY = [Item[1] for Item in Pairs]
+    if len(DataX) <= KENDALL_DIRECT_CUTOFF:
+        return _GetKendallReference(DataX, DataY)
+    Length = len(DataX)
+    Total = Length * (Length - 1) // 2
+    ArrayX = None
+    if np is not None:
+        ArrayX = np.array(DataX)
+        ArrayY = np.array(DataY)
+    if (ArrayX is not None and ArrayX.dtype.kind in 'if'
+                                            and ArrayY.dtype.kind in 'if'):
+        Order = np.lexsort((ArrayY, ArrayX))
+        SortedX = ArrayX[Order]
+        SortedY = ArrayY[Order]
+        IsNewX = np.empty(Length, dtype = bool)
+        IsNewX[0] = True
+        np.not_equal(SortedX[1:], SortedX[:-1], out = IsNewX[1:])
+        IsNewPair = IsNewX.copy()
+        IsNewPair[1:] |= SortedY[1:] != SortedY[:-1]
+        TiesX = _GetTiedPairsArray(IsNewX)
+        TiesXY = _GetTiedPairsArray(IsNewPair)
+        _, Ranks, Counts = np.unique(SortedY, return_inverse = True,
+                                                        return_counts = True)
+        TiesY = int((Counts * (Counts - 1) // 2).sum())
+        Swaps = _CountInversionsArray(Ranks.ravel().astype(np.int64))
+    else:
+        Pairs = sorted(zip(DataX, DataY))
+        TiesX = _GetTiedPairs([Item[0] for Item in Pairs])
+        TiesXY = _GetTiedPairs(Pairs)
+        TiesY = _GetTiedPairs(sorted(DataY))
+        Swaps = _CountInversions([Item[1] for Item in Pairs])
+    Difference = Total - TiesX - TiesY + TiesXY - 2 * Swaps
+    Correction = math.sqrt((Total - TiesX) * (Total - TiesY))
+    if Correction == 0:
+        Result = 1
+    else:
+        Result = Difference / Correction
+    return Result
+
+#+ main, public functions
+
+#++ 1D statistics
+
+def GetMin(Data: TGenericSequence, *, SkipFrames: int = 1,
+                                            DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the minimum value of a mixed sequence of real numbers and the
+    measurements with uncertainty. Computation speed is O(N), unless the passed
+    sequence is already sorted in ascending order sequence of real numbers,
+    which is indicated by the keyword argument DoCheck = False, in which case
+    the calculation speed is O(1).
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated min value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
+
+    Version 1.1.0.0
+    """
+    _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    if DoCheck:
+        Result = min(_ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                        Missing = Missing))
+    else:
+        Result = Data[0]
+    return Result
+
+def GetMax(Data: TGenericSequence, *, SkipFrames: int = 1,
+                                            DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the maximum value of a mixed sequence of real numbers and the
+    measurements with uncertainty. Computation speed is O(N), unless the passed
+    sequence is already sorted in ascending order sequence of real numbers,
+    which is indicated by the keyword argument DoCheck = False, in which case
+    the calculation speed is O(1).
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated max value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
+
+    Version 1.1.0.0
+    """
+    _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    if DoCheck:
+        Result = max(_ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                        Missing = Missing))
+    else:
+        Result = Data[-1]
+    return Result
+
+def GetMedian(Data: TGenericSequence, *, SkipFrames: int = 1,
+                                            DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the median value of a mixed sequence of real numbers and the
+    measurements with uncertainty. The required order statistics are found by
+    the selection (see _SelectRanks()), thus the expected computation speed is
+    O(N), unless the passed sequence is already sorted in ascending order
+    sequence of real numbers, which is indicated by the keyword argument
+    DoCheck = False, in which case the calculation speed is O(1).
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers
+            and sort the values
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated median value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
+
+    Version 1.2.0.0
+    """
+    _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    if DoCheck:
+        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 2,
+                                                        Missing = Missing)
+    else:
+        _Data = Data
+    N = len(_Data)
+    if N == 1:
+        Result = _Data[0]
+    else:
+        Index, Remainder = divmod(N, 2)
+        if Remainder:
+            Result = _GetOrderStatistics(_Data, (Index, ),
+                                                    IsSorted = not DoCheck)[0]
+        else:
+            Result = sum(_GetOrderStatistics(_Data, (Index - 1, Index),
+                                                    IsSorted = not DoCheck)) / 2
+    return Result
+
+def GetFirstQuartile(Data: TGenericSequence, *, SkipFrames: int = 1,
+                                            DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the first quartile value of a mixed sequence of real numbers and
+    the measurements with uncertainty. The required order statistics are found
+    by the selection (see _SelectRanks()), thus the expected computation speed
+    is O(N), unless the passed sequence is already sorted in ascending order
+    sequence of real numbers, which is indicated by the keyword argument
+    DoCheck = False, in which case the calculation speed is O(1).
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers
+            and sort the values
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated Q1 value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is shorter than 2 elements, OR
+            any keyword argument is of the proper type but unacceptable value,
+            OR a missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
+
+    Version 1.2.0.0
+    """
+    _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    if DoCheck:
+        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 2,
+                                                        Missing = Missing)
+    else:
+        _Data = Data
+    N = len(_Data)
+    if N == 1:
+        raise UT_ValueError(N, '>= 2 - length of the sequence',
+                                                        SkipFrames = SkipFrames)
+    else:
+        Index, Remainder = divmod(N - 1, 4)
+        Portion = Remainder / 4
+        Lower, Upper = _GetOrderStatistics(_Data, (Index, Index + 1),
+                                                        IsSorted = not DoCheck)
+        Result = Lower * (1 - Portion) + Upper * Portion
+    return Result
+
+def GetThirdQuartile(Data: TGenericSequence, *, SkipFrames: int = 1,
+                                            DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the third quartile value of a mixed sequence of real numbers and
+    the measurements with uncertainty. The required order statistics are found
+    by the selection (see _SelectRanks()), thus the expected computation speed
+    is O(N), unless the passed sequence is already sorted in ascending order
+    sequence of real numbers, which is indicated by the keyword argument
+    DoCheck = False, in which case the calculation speed is O(1).
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers
+            and sort the values
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated Q3 value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is shorter than 2 elements, OR
+            any keyword argument is of the proper type but unacceptable value,
+            OR a missing value is found with the RAISE policy, OR all values are
+            missing with the SKIP policy
+
+    Version 1.2.0.0
+    """
+    _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    if DoCheck:
+        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 2,
+                                                        Missing = Missing)
+    else:
+        _Data = Data
+    N = len(_Data)
+    if N == 1:
+        raise UT_ValueError(N, '>= 2 - length of the sequence',
+                                                        SkipFrames = SkipFrames)
+    else:
+        Index, Remainder = divmod((N - 1) * 3, 4)
+        Portion = Remainder / 4
+        Lower, Upper = _GetOrderStatistics(_Data, (Index, Index + 1),
+                                                        IsSorted = not DoCheck)
+        Result = Lower * (1 - Portion) + Upper * Portion
+    return Result
+
+def GetQuantile(Data: TGenericSequence, k: int, m: int, *, SkipFrames: int = 1,
+                                            DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE) -> TReal:
+    """
+    Calculates the k-th of m-quantile value of a mixed sequence of real numbers
+    and the measurements with uncertainty. The required order statistics are
+    found by the selection (see _SelectRanks()), thus the expected computation
+    speed is O(N), unless the passed sequence is already sorted in ascending
+    order sequence of real numbers, which is indicated by the keyword argument
+    DoCheck = False, in which case the calculation speed is O(1).
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+            int >= 0, int > 0/, *, int > 0, bool, MissingPolicy/ -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        k: int >= 0; the quantile index, between 0 and m inclusively
+        m: int > 0; the total number of quantiles
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers
+            and sort the values
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated quantile value
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type, OR quantile index is not an integer, OR the total
+            number of quantiles is not an integer
+        UT_ValueError: passed mandatory sequence is shorter than 2 elements, OR
+            any keyword argument is of the proper type but unacceptable value,
+            OR the total number of quantilies is negative integer or zero, OR
+            the quantile index is negative integer or integer greater than the
+            total number of qunatiles, OR a missing value is found with the
+            RAISE policy, OR all values are missing with the SKIP policy
+
+    Version 1.2.0.0
+    """
+    _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    _CheckPositiveInteger(m)
+    if not isinstance(k, int):
+        raise UT_TypeError(k, int, SkipFrames = SkipFrames)
+    if (k < 0) or (k > m):
+        raise UT_ValueError(k, '>= 0 and <= {} - quantile index'.format(m))
+    if DoCheck:
+        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 2,
+                                                        Missing = Missing)
+    else:
+        _Data = Data
+    N = len(_Data)
+    if N == 1:
+        raise UT_ValueError(N, '>= 2 - length of the sequence',
+                                                        SkipFrames = SkipFrames)
+    else:
+        if k == m:
+            Result = _Data[N-1] if not DoCheck else max(_Data)
+        elif not k:
+            Result = _Data[0] if not DoCheck else min(_Data)
+        else:
+            Index, Remainder = divmod((N - 1) * k, m)
+            Portion = Remainder / m
+            Lower, Upper = _GetOrderStatistics(_Data, (Index, Index + 1),
+                                                        IsSorted = not DoCheck)
+            Result = Lower * (1 - Portion) + Upper * Portion
+    return Result
+
+def GetQuantiles(Data: TGenericSequence, Quantiles: Any, *,
+                    SkipFrames: int = 1, DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                        ) -> Tuple[TReal, ...]:
+    """
+    Calculates a batch of quantiles of a mixed sequence of real numbers and the
+    measurements with uncertainty in a single call: either all k-th of
+    m-quantiles (0 < k < m) for the given number of quantiles m, e.g. 10 for
+    the deciles or 100 for the percentiles, or the quantiles from a sequence of
+    the (k, m) pairs and / or probabilities p between 0 and 1. The arguments
+    and the data are checked only once. All required order statistics are
+    found at once, either by a single sorting or by the multi-selection (see
+    _GetOrderStatistics()), so the computation speed is O(N*log(N)) at most,
+    unless the passed sequence is already sorted in ascending order sequence of
+    real numbers, which is indicated by the keyword argument DoCheck = False,
+    in which case the calculation speed is O(1) per quantile.
+
+    The k-th of m-quantile is the same as calculated by GetQuantile(); the
+    quantile of the probability p is interpolated in the same manner between
+    the elements at the positions floor((N - 1) * p) and the next one of the
+    sorted sequence.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
+            int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR float >= 0)
+                /, *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        Quantiles: int > 1 OR seq(tuple(int >= 0, int > 0) OR int >= 0 OR
+            float >= 0); the number of quantiles m, OR the requested quantiles
+            as (k, m) pairs with 0 <= k <= m and / or probabilities between 0
+            and 1 inclusively
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers
+            and sort the values
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        tuple(int OR float): the calculated quantile values, in the same order
+            as requested (k = 1 to m - 1 for the number of quantiles)
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type, OR the quantiles are neither an integer nor a
+            sequence of the pairs of integers and / or real numbers
+        UT_ValueError: passed mandatory sequence is shorter than 2 elements, OR
+            any keyword argument is of the proper type but unacceptable value,
+            OR the number of quantiles is less than 2, OR the sequence of the
+            quantiles is empty, OR any quantile index or total number of
+            quantiles or probability is out of the range, OR a missing value is
+            found with the RAISE policy, OR all values are missing with the
+            SKIP policy
+
+    Version 1.0.0.0
+    """
+    _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    _Quantiles = _CheckQuantiles(Quantiles, SkipFrames = SkipFrames + 1)
+    if DoCheck:
+        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 2,
+                                                        Missing = Missing)
+    else:
+        _Data = Data
+    N = len(_Data)
+    if N == 1:
+        raise UT_ValueError(N, '>= 2 - length of the sequence',
+                                                        SkipFrames = SkipFrames)
+    Positions = []
+    Ranks = []
+    for k, m, Probability in _Quantiles:
+        if m:
+            Index, Remainder = divmod((N - 1) * k, m)
+            Portion = Remainder / m
+        else:
+            Position = (N - 1) * Probability
+            Index = int(Position)
+            Portion = Position - Index
+        if Index >= N - 1: #maximum
+            Positions.append((N - 1, None))
+            Ranks.append(N - 1)
+        elif not Probability: #minimum
+            Positions.append((0, None))
+            Ranks.append(0)
+        else:
+            Positions.append((Index, Portion))
+            Ranks.append(Index)
+            Ranks.append(Index + 1)
+    Ranks = sorted(set(Ranks))
+    Values = dict(zip(Ranks, _GetOrderStatistics(_Data, Ranks,
+                                                    IsSorted = not DoCheck)))
+    Result = []
+    for Index, Portion in Positions:
+        if Portion is None:
+            Result.append(Values[Index])
+        else:
+            Result.append(Values[Index] * (1 - Portion)
+                                            + Values[Index + 1] * Portion)
+    return tuple(Result)
+
+def GetHistogram(Data: TGenericSequence, *, NBins: Optional[int] = None,
+                        BinSize: Optional[TReal] = None, SkipFrames: int = 1,
+                            DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                         ) -> Dict[TReal, int]:
+    """
+    Calculates the histogram of number of apperance of 'mean' values belonging
+    to the respective bins for the data sample. Either total number of bins OR
+    the desired bin width can be specified, where number of bins takes the
+    precedence. When neither value is defined, the default number of bins is 20.
+    Computation speed is always O(N). The counting is done by the class
+    HistogramAccumulator on the grid of the equal width bins centred at
+    round(Start + i * Step, 16), where the bin of a value is found by the
+    arithmetic index calculation, which is vectorized for a 1D buffer of real
+    numbers (if NumPy is installed) with the same result.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *,
+            int > 0 OR None, int > 0 OR float > 0 OR None, int > 0, bool,
+                MissingPolicy/ -> dict(int OR float -> int >= 0)
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        NBins: (keyword) int > 0 OR None; the desired number of bins
+        BinSize: (keyword) int > 0 OR float > 0 OR None; the desired bin size,
+            ignored is NBins is passed as not None value
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        dict(int OR float -> int >= 0): the calculated histogram
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE or PROPAGATE policy, OR all values
+            are missing with the SKIP policy
+
+    Version 1.3.0.0
+    """
+    _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    if (NBins is None) and (BinSize is None):
+        _NBins = 20
+    elif not (NBins is None):
+        _CheckPositiveInteger(NBins)
+        _NBins = NBins
+    else:
+        if not isinstance(BinSize, (int, float)):
+            raise UT_TypeError(BinSize, (int, float), SkipFrames = SkipFrames)
+        elif BinSize <= 0:
+            raise UT_ValueError(BinSize, '> 0 - bin size',
+                                                        SkipFrames = SkipFrames)
+        _NBins = None
+    if DoCheck:
+        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing)
+    else:
+        _Data = Data
+    Array = _ExtractArray(_Data, SkipFrames = SkipFrames + 1)
+    if Array is None:
+        IsNaN = any(Item != Item for Item in _Data)
+        Min = min(_Data)
+        Max = max(_Data)
+    else:
+        IsNaN = bool(np.isnan(Array).any())
+        Min = Array.min().item()
+        Max = Array.max().item()
+    if IsNaN: #cannot be placed into a bin
+        raise UT_ValueError(math.nan, 'not NaN - value',
+                                                        SkipFrames = SkipFrames)
+    if not (_NBins is None):
+        NSteps = _NBins
+        if NSteps > 1:
+            Start = round(Min, 16)
+            Step = round((Max - Min) / (_NBins - 1), 16)
+        else:
+            Start = round(GetMean(_Data, DoCheck = False), 16)
+            Step = 0
+    else:
+        Step = round(BinSize, 16)
+        Mean = GetMean(_Data, DoCheck = False)
+        NLeft = int(math.ceil((Mean - Min) / Step - 0.5))
+        NRight = int(math.ceil((Max - Mean) / Step - 0.5))
+        NSteps = NLeft + NRight + 1
+        Start = Mean - NLeft * Step
+        #rounding errors may place the maximum value beyond the last bin
+        NSteps = max(NSteps, int((round(Max, 16) - Start) / Step + 0.5) + 1)
+    if Step == 0 or NSteps == 1:
+        Result = {Start : len(_Data)}
+    else:
+        Histogram = HistogramAccumulator(Start = Start, Width = Step,
+                                                                Count = NSteps)
+        Histogram._addValues(_Data if Array is None else Array)
+        Result = Histogram.getHistogram()
+        #rounding errors at the outer edges - into the outer bins
+        if Histogram.Underflow:
+            Result[Histogram.Centres[0]] += Histogram.Underflow
+        if Histogram.Overflow:
+            Result[Histogram.Centres[-1]] += Histogram.Overflow
+    return Result
+
+def GetModes(Data: TGenericSequence, *, SkipFrames: int = 1,
+                                            DoCheck: bool = True,
+                    Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                                ) -> TRealList:
+    """
+    Calculates the mode(s) of a mixed sequence of real numbers and the
+    measurements with uncertainty. Computation speed is always O(N).
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> list(int OR float)
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        list(int OR float): the calculated modes
+    
+    Raises:
+        UT_TypeError: mandatory argument is not a sequence of real numbers or
+            measurements with uncertainty, OR any keyword argument is of
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
+
+    Version 1.1.0.0
+    """
+    _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    if DoCheck:
+        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing)
+    else:
+        _Data = Data
+    Temp = dict()
+    for Item in _Data:
+        Temp[Item] = Temp.get(Item, 0) + 1
+    MaxCount = max(Temp.values())
+    Result = []
+    for Key, Value in Temp.items():
+        if Value == MaxCount:
+            Result.append(Key)
+    return Result
+
+#++ robust (trimmed / winsorized) statistics
+
+def GetTrimmedMean(Data: TGenericSequence, Fraction: TReal = 0.1, *,
+                            SkipFrames: int = 1, DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                                    ) -> TReal:
+    """
+    Calculates the trimmed (truncated) mean of a mixed sequence of real numbers
+    and the measurements with uncertainty, i.e. the arithmetic mean of the
+    values remaining after removal of floor(Fraction * N) lowest and the same
+    number of the highest values. The cut points are found by the selection
+    instead of sorting, thus the computation speed is O(N), unless the passed
+    sequence is already sorted in ascending order sequence of real numbers,
+    which is indicated by the keyword argument DoCheck = False.
+
+    Signature:
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            int >= 0 OR float >= 0, *, int > 0, bool, MissingPolicy/
+                -> int OR float
+    
+    Args:
+        Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
+            sequence of real numbers or 'measurements with uncertainty'
+        Fraction: (optional) int >= 0 OR float >= 0; the fraction of the values
+            to be removed at each end, must be less than 0.5, defaults to 0.1
+        SkipFrames: (keyword) int > 0; how many frames to hide in the
+            exception traceback, defaults to 1
+        DoCheck: (keyword) bool; flag if to perform the input data sanity
+            check, convert the mixed sequence into a list of only real numbers;
+            with False the data must be a sequence of real numbers sorted in
+            ascending order
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
+    
+    Returns:
+        int OR float: the calculated trimmed mean value
+    
+    Raises:
+        UT_TypeError: mandatory data argument is not a sequence of real numbers
+            or measurements with uncertainty, OR the fraction is not a real
+            number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the fraction is
+            negative or not less than 0.5, OR any keyword argument is of the
+            proper type but unacceptable value, OR a missing value is found
+            with the RAISE policy, OR all values are missing with the SKIP
+            policy
+
+    Version 1.0.0.0
+    """
+    _Data = _GetTrimmedData(Data, Fraction, SkipFrames = SkipFrames + 1,
+                                        DoCheck = DoCheck, Missing = Missing)
+    Result = GetMean(_Data, DoCheck = False)
+    return Result
 
-def _GetRanks(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TRealList:
+def GetTrimmedVarianceP(Data: TGenericSequence, Fraction: TReal = 0.1, *,
+                            SkipFrames: int = 1, DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                                    ) -> TReal:
     """
-    Calculates the fractional ranks of the elements of a mixed sequence of real
-    numbers and the measurements with uncertainty. Computation speed is always
-    O(N*log(N)).
+    Calculates the population variance of the values of a mixed sequence of
+    real numbers and the measurements with uncertainty remaining after removal
+    of floor(Fraction * N) lowest and the same number of the highest values.
+    The cut points are found by the selection instead of sorting, and the
+    variance is calculated in a single pass, thus the computation speed is
+    O(N). If the passed sequence is already sorted in ascending order sequence
+    of real numbers, which is indicated by the keyword argument DoCheck = False,
+    the cut points are taken directly. Note that with DoCheck = False the
+    sorting is not checked, and an unsorted sequence results in wrong value.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> list(int OR float)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            int >= 0 OR float >= 0, *, int > 0, bool, MissingPolicy/
+                -> int OR float
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty'
+        Fraction: (optional) int >= 0 OR float >= 0; the fraction of the values
+            to be removed at each end, must be less than 0.5, defaults to 0.1
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
-            check, convert the mixed sequence into a list of only real numbers
-            and sort the values
+            check, convert the mixed sequence into a list of only real numbers;
+            with False the data must be a sequence of real numbers sorted in
+            ascending order
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        list(int OR float): the calculated ranks, in the same order as the
-            initial sequence
+        int OR float: the calculated trimmed variance value
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_TypeError: mandatory data argument is not a sequence of real numbers
+            or measurements with uncertainty, OR the fraction is not a real
+            number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the fraction is
+            negative or not less than 0.5, OR any keyword argument is of the
+            proper type but unacceptable value, OR a missing value is found
+            with the RAISE policy, OR all values are missing with the SKIP
+            policy
 
-    Version 1.0.0.1
+    Version 1.0.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
-    else:
-        _Data = Data
-    _DataSorted = sorted(_Data)
-    Frequencies = dict()
-    for Item in _DataSorted:
-        Frequencies[Item] = Frequencies.get(Item, 0) + 1
-    Ranks = dict()
-    Last = 0
-    if sys.version_info[0] >= 3 and sys.version_info[1] >= 7:
-        Keys = Frequencies.keys()
-    else:
-        Keys = sorted(Frequencies.keys())
-    for Key in Keys:
-        Value = Frequencies[Key]
-        if Value == 1:
-            Ranks[Key] = Last + 1
-        else:
-            Ranks[Key] = Last + (Value + 1) / 2
-        Last += Value
-    Result = [Ranks[Key] for Key in _Data]
+    _Data = _GetTrimmedData(Data, Fraction, SkipFrames = SkipFrames + 1,
+                                        DoCheck = DoCheck, Missing = Missing)
+    Result = _GetMomentsSummary(_Data).Var
     return Result
 
-#+ main, public functions
-
-#++ 1D statistics
-
-def GetMin(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetWinsorizedMean(Data: TGenericSequence, Fraction: TReal = 0.1, *,
+                            SkipFrames: int = 1, DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                                    ) -> TReal:
     """
-    Calculates the minimum value of a mixed sequence of real numbers and the
-    measurements with uncertainty. Computation speed is O(N), unless the passed
-    sequence is already sorted in ascending order sequence of real numbers,
-    which is indicated by the keyword argument DoCheck = False, in which case
-    the calculation speed is O(1).
+    Calculates the winsorized mean of a mixed sequence of real numbers and the
+    measurements with uncertainty, i.e. the arithmetic mean of the values,
+    where floor(Fraction * N) lowest and the same number of the highest values
+    are replaced by the lowest / highest remaining value respectively. The cut
+    points are found by the selection instead of sorting, thus the computation
+    speed is O(N), unless the passed sequence is already sorted in ascending
+    order sequence of real numbers, which is indicated by the keyword argument
+    DoCheck = False.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            int >= 0 OR float >= 0, *, int > 0, bool, MissingPolicy/
+                -> int OR float
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty'
+        Fraction: (optional) int >= 0 OR float >= 0; the fraction of the values
+            to be replaced at each end, must be less than 0.5, defaults to 0.1
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
-            check, convert the mixed sequence into a list of only real numbers
+            check, convert the mixed sequence into a list of only real numbers;
+            with False the data must be a sequence of real numbers sorted in
+            ascending order
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated min value
+        int OR float: the calculated winsorized mean value
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_TypeError: mandatory data argument is not a sequence of real numbers
+            or measurements with uncertainty, OR the fraction is not a real
+            number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the fraction is
+            negative or not less than 0.5, OR any keyword argument is of the
+            proper type but unacceptable value, OR a missing value is found
+            with the RAISE policy, OR all values are missing with the SKIP
+            policy
 
     Version 1.0.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        Result = min(_ExtractMeans(Data, SkipFrames = SkipFrames + 1))
-    else:
-        Result = Data[0]
+    _Data = _GetTrimmedData(Data, Fraction, IsWinsorized = True,
+                            SkipFrames = SkipFrames + 1, DoCheck = DoCheck,
+                                                            Missing = Missing)
+    Result = GetMean(_Data, DoCheck = False)
     return Result
 
-def GetMax(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetWinsorizedVarianceP(Data: TGenericSequence, Fraction: TReal = 0.1, *,
+                            SkipFrames: int = 1, DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                                    ) -> TReal:
     """
-    Calculates the maximum value of a mixed sequence of real numbers and the
-    measurements with uncertainty. Computation speed is O(N), unless the passed
-    sequence is already sorted in ascending order sequence of real numbers,
-    which is indicated by the keyword argument DoCheck = False, in which case
-    the calculation speed is O(1).
+    Calculates the winsorized population variance of a mixed sequence of real
+    numbers and the measurements with uncertainty, i.e. the variance of the
+    values, where floor(Fraction * N) lowest and the same number of the highest
+    values are replaced by the lowest / highest remaining value respectively.
+    The cut points are found by the selection instead of sorting, and the
+    variance is calculated in a single pass, thus the computation speed is
+    O(N). If the passed sequence is already sorted in ascending order sequence
+    of real numbers, which is indicated by the keyword argument DoCheck = False,
+    the cut points are taken directly. Note that with DoCheck = False the
+    sorting is not checked, and an unsorted sequence results in wrong value.
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
+            int >= 0 OR float >= 0, *, int > 0, bool, MissingPolicy/
+                -> int OR float
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty'
+        Fraction: (optional) int >= 0 OR float >= 0; the fraction of the values
+            to be replaced at each end, must be less than 0.5, defaults to 0.1
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
-            check, convert the mixed sequence into a list of only real numbers
+            check, convert the mixed sequence into a list of only real numbers;
+            with False the data must be a sequence of real numbers sorted in
+            ascending order
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated max value
+        int OR float: the calculated winsorized variance value
     
     Raises:
-        UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+        UT_TypeError: mandatory data argument is not a sequence of real numbers
+            or measurements with uncertainty, OR the fraction is not a real
+            number, OR any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty, OR the fraction is
+            negative or not less than 0.5, OR any keyword argument is of the
+            proper type but unacceptable value, OR a missing value is found
+            with the RAISE policy, OR all values are missing with the SKIP
+            policy
 
     Version 1.0.0.0
     """
-    _CheckPositiveInteger(SkipFrames)
-    if DoCheck:
-        Result = max(_ExtractMeans(Data, SkipFrames = SkipFrames + 1))
-    else:
-        Result = Data[-1]
+    _Data = _GetTrimmedData(Data, Fraction, IsWinsorized = True,
+                            SkipFrames = SkipFrames + 1, DoCheck = DoCheck,
+                                                            Missing = Missing)
+    Result = _GetMomentsSummary(_Data).Var
     return Result
 
-def GetMedian(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+#++ robust scale estimators
+
+def GetMAD(Data: TGenericSequence, *, SkipFrames: int = 1,
+                            DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                                    ) -> TReal:
     """
-    Calculates the median value of a mixed sequence of real numbers and the
-    measurements with uncertainty. Computation speed is O(N*log(N)), unless the
-    passed sequence is already sorted in ascending order sequence of real
-    numbers, which is indicated by the keyword argument DoCheck = False, in
-    which case the calculation speed is O(1).
+    Calculates the median absolute deviation (from the median) of a mixed
+    sequence of real numbers and the measurements with uncertainty. The value
+    is not scaled; multiplied by 1.4826 it is a consistent estimator of the
+    standard deviation of the normal distribution. Both medians are found by
+    the selection, thus the computation speed is O(N), unless the passed
+    sequence is already sorted in ascending order sequence of real numbers,
+    which is indicated by the keyword argument DoCheck = False, in which case
+    the computation speed is O(log(N)).
 
     Signature:
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+            bool, MissingPolicy/ -> int >= 0 OR float >= 0
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
@@ -241,48 +3200,51 @@ def GetMedian(Data: TGenericSequence, *, SkipFrames: int = 1,
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check, convert the mixed sequence into a list of only real numbers
-            and sort the values
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated median value
+        int >= 0 OR float >= 0: the median absolute deviation
     
     Raises:
         UT_TypeError: mandatory argument is not a sequence of real numbers or
             measurements with uncertainty, OR any keyword argument is of
             improper type
         UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
 
-    Version 1.0.0.1
+    Version 1.0.0.0
     """
     _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
     if DoCheck:
-        _Data = sorted(_ExtractMeans(Data, SkipFrames = SkipFrames + 2))
-    else:
-        _Data = Data
-    N = len(_Data)
-    if N == 1:
-        Result = _Data[0]
+        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing)
+        Result = _GetMAD(_Data)
     else:
-        Index, Remainder = divmod(N, 2)
-        if Remainder:
-            Result = _Data[Index]
-        else:
-            Result = (_Data[Index - 1] + _Data[Index]) / 2
+        Result = _GetMAD(Data, IsSorted = True)
     return Result
 
-def GetFirstQuartile(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetSn(Data: TGenericSequence, *, SkipFrames: int = 1,
+                            DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                                    ) -> TReal:
     """
-    Calculates the first quartile value of a mixed sequence of real numbers and
-    the measurements with uncertainty. Computation speed is O(N*log(N)), unless
-    the passed sequence is already sorted in ascending order sequence of real
-    numbers, which is indicated by the keyword argument DoCheck = False, in
-    which case the calculation speed is O(1).
+    Calculates the Rousseeuw-Croux Sn robust scale estimator of a mixed
+    sequence of real numbers and the measurements with uncertainty, i.e. the
+    low median over all elements of the high median of the distances from the
+    element to all elements, multiplied by the factor SN_FACTOR = 1.1926 for
+    the consistency with the standard deviation of the normal distribution.
+    The computation speed is O(N*log(N)) due to the sorting, unless the passed
+    sequence is already sorted in ascending order sequence of real numbers,
+    which is indicated by the keyword argument DoCheck = False, in which case
+    the computation speed is O(N).
 
     Signature:
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+            bool, MissingPolicy/ -> int >= 0 OR float >= 0
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
@@ -291,47 +3253,50 @@ def GetFirstQuartile(Data: TGenericSequence, *, SkipFrames: int = 1,
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check, convert the mixed sequence into a list of only real numbers
-            and sort the values
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated Q1 value
+        int >= 0 OR float >= 0: the Sn estimator value
     
     Raises:
         UT_TypeError: mandatory argument is not a sequence of real numbers or
             measurements with uncertainty, OR any keyword argument is of
             improper type
-        UT_ValueError: passed mandatory sequence is shorter than 2 elements, OR
-            any keyword argument is of the proper type but unacceptable value
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
 
     Version 1.0.0.0
     """
     _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
     if DoCheck:
-        _Data = sorted(_ExtractMeans(Data, SkipFrames = SkipFrames + 2))
+        _Data = sorted(_ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing))
     else:
         _Data = Data
-    N = len(_Data)
-    if N == 1:
-        raise UT_ValueError(N, '>= 2 - length of the sequence',
-                                                        SkipFrames = SkipFrames)
-    else:
-        Index, Remainder = divmod(N - 1, 4)
-        Portion = Remainder / 4
-        Result = _Data[Index] * (1 - Portion) + _Data[Index + 1] * Portion
+    Result = SN_FACTOR * _GetSn(_Data)
     return Result
 
-def GetThirdQuartile(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+def GetQn(Data: TGenericSequence, *, SkipFrames: int = 1,
+                            DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                                    ) -> TReal:
     """
-    Calculates the third quartile value of a mixed sequence of real numbers and
-    the measurements with uncertainty. Computation speed is O(N*log(N)), unless
-    the passed sequence is already sorted in ascending order sequence of real
-    numbers, which is indicated by the keyword argument DoCheck = False, in
-    which case the calculation speed is O(1).
+    Calculates the Rousseeuw-Croux Qn robust scale estimator of a mixed
+    sequence of real numbers and the measurements with uncertainty, i.e. the
+    k-th smallest of the pairwise distances between the elements with k =
+    h * (h - 1) / 2 and h = N // 2 + 1, multiplied by the factor QN_FACTOR =
+    2.2219 for the consistency with the standard deviation of the normal
+    distribution. The computation speed is O(N*log(N)) also for
+    the already sorted in ascending order sequence of real numbers, which is
+    indicated by the keyword argument DoCheck = False (saving the sorting).
 
     Signature:
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> int OR float
+            bool, MissingPolicy/ -> int >= 0 OR float >= 0
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
@@ -340,236 +3305,229 @@ def GetThirdQuartile(Data: TGenericSequence, *, SkipFrames: int = 1,
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check, convert the mixed sequence into a list of only real numbers
-            and sort the values
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated Q3 value
+        int >= 0 OR float >= 0: the Qn estimator value
     
     Raises:
         UT_TypeError: mandatory argument is not a sequence of real numbers or
             measurements with uncertainty, OR any keyword argument is of
             improper type
-        UT_ValueError: passed mandatory sequence is shorter than 2 elements, OR
-            any keyword argument is of the proper type but unacceptable value
+        UT_ValueError: passed mandatory sequence is empty or of the length 1, OR
+            any keyword argument is of the proper type but unacceptable value,
+            OR a missing value is found with the RAISE policy, OR all values
+            are missing with the SKIP policy
 
     Version 1.0.0.0
     """
     _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
     if DoCheck:
-        _Data = sorted(_ExtractMeans(Data, SkipFrames = SkipFrames + 2))
+        _Data = sorted(_ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing))
     else:
         _Data = Data
-    N = len(_Data)
-    if N == 1:
-        raise UT_ValueError(N, '>= 2 - length of the sequence',
+    Length = len(_Data)
+    if Length < 2:
+        raise UT_ValueError(Length, '>= 2 - length of the sequence',
                                                         SkipFrames = SkipFrames)
-    else:
-        Index, Remainder = divmod((N - 1) * 3, 4)
-        Portion = Remainder / 4
-        Result = _Data[Index] * (1 - Portion) + _Data[Index + 1] * Portion
+    Result = QN_FACTOR * _GetQn(_Data)
     return Result
 
-def GetQuantile(Data: TGenericSequence, k: int, m: int, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TReal:
+#++ robust skewness
+
+def GetMedcouple(Data: TGenericSequence, *, SkipFrames: int = 1,
+                            DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                                    ) -> TReal:
     """
-    Calculates the k-th of m-quantile value of a mixed sequence of real numbers
-    and the measurements with uncertainty. Computation speed is O(N*log(N)),
-    unless the passed sequence is already sorted in ascending order sequence of
-    real numbers, which is indicated by the keyword argument DoCheck = False, in
-    which case the calculation speed is O(1).
+    Calculates the medcouple (robust skewness) of a mixed sequence of real
+    numbers and the measurements with uncertainty, i.e. the median of the
+    kernel (x[i] + x[j] - 2 * m) / (x[i] - x[j]) over all pairs of the elements
+    x[i] >= m >= x[j], where m is the median of the sequence. The value is
+    between -1 and 1; it is positive for the right-skewed distributions. The
+    fast algorithm is used instead of the enumeration of all pairs, so the
+    computation speed is O(N*log(N)) also for the already sorted in ascending
+    order sequence of real numbers, which is indicated by the keyword argument
+    DoCheck = False (saving the sorting).
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue),
-            int >= 0, int > 0/, *, int > 0, bool/ -> int OR float
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
+            bool, MissingPolicy/ -> int OR float
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty'
-        k: int >= 0; the quantile index, between 0 and m inclusively
-        m: int > 0; the total number of quantiles
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check, convert the mixed sequence into a list of only real numbers
-            and sort the values
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        int OR float: the calculated quantile value
+        int OR float: the medcouple value
     
     Raises:
         UT_TypeError: mandatory argument is not a sequence of real numbers or
             measurements with uncertainty, OR any keyword argument is of
-            improper type, OR quantile index is not an integer, OR the total
-            number of quantiles is not an integer
-        UT_ValueError: passed mandatory sequence is shorter than 2 elements, OR
-            any keyword argument is of the proper type but unacceptable value,
-            OR the total number of quantilies is negative integer or zero, OR
-            the quantile index is negative integer or integer greater than the
-            total number of qunatiles
+            improper type
+        UT_ValueError: passed mandatory sequence is empty, OR any keyword
+            argument is of the proper type but unacceptable value, OR a missing
+            value is found with the RAISE policy, OR all values are missing with
+            the SKIP policy
 
-    Version 1.0.0.1
+    Version 1.0.0.0
     """
     _CheckPositiveInteger(SkipFrames)
-    _CheckPositiveInteger(m)
-    if not isinstance(k, int):
-        raise UT_TypeError(k, int, SkipFrames = SkipFrames)
-    if (k < 0) or (k > m):
-        raise UT_ValueError(k, '>= 0 and <= {} - quantile index'.format(m))
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
     if DoCheck:
-        _Data = sorted(_ExtractMeans(Data, SkipFrames = SkipFrames + 2))
+        _Data = sorted(_ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing))
     else:
         _Data = Data
-    N = len(_Data)
-    if N == 1:
-        raise UT_ValueError(N, '>= 2 - length of the sequence',
-                                                        SkipFrames = SkipFrames)
-    else:
-        if k == m:
-            Result = _Data[N-1]
-        elif not k:
-            Result = _Data[0]
-        else:
-            Index, Remainder = divmod((N - 1) * k, m)
-            Portion = Remainder / m
-            Result = _Data[Index] * (1 - Portion) + _Data[Index + 1] * Portion
+    Result = _GetMedcouple(_Data)
     return Result
 
-def GetHistogram(Data: TGenericSequence, *, NBins: Optional[int] = None,
-                        BinSize: Optional[TReal] = None, SkipFrames: int = 1,
-                            DoCheck: bool = True) -> Dict[TReal, int]:
+#++ L-moments
+
+def GetLMoments(Data: TGenericSequence, Order: int = 4, *,
+                            SkipFrames: int = 1, DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                    ) -> Tuple[TReal, ...]:
     """
-    Calculates the histogram of number of apperance of 'mean' values belonging
-    to the respective bins for the data sample. Either total number of bins OR
-    the desired bin width can be specified, where number of bins takes the
-    precedence. When neither value is defined, the default number of bins is 20.
-    Computation speed is always O(N).
+    Calculates the (unbiased sample) L-moments of a mixed sequence of real
+    numbers and the measurements with uncertainty from the order 1 (L-location,
+    equal to the arithmetic mean) and 2 (L-scale) up to the requested order.
+    They are calculated from the probability weighted moments in a single pass
+    over the sorted data in O(N * Order), thus the computation speed is
+    O(N*log(N)) due to the sorting, unless the passed sequence is already
+    sorted in ascending order sequence of real numbers, which is indicated by
+    the keyword argument DoCheck = False, in which case the computation speed
+    is O(N).
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *,
-            int > 0 OR None, int > 0 OR float > 0 OR None, int > 0, bool/
-                -> dict(int OR float -> int >= 0)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, int > 0,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty'
-        NBins: (keyword) int > 0 OR None; the desired number of bins
-        BinSize: (keyword) int > 0 OR float > 0 OR None; the desired bin size,
-            ignored is NBins is passed as not None value
+        Order: int > 0; the highest order to calculate, defaults to 4, not
+            greater than the length of the sequence
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check, convert the mixed sequence into a list of only real numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        dict(int OR float -> int >= 0): the calculated histogram
+        tuple(int OR float): the L-moments of the orders 1 to Order
     
     Raises:
         UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+            measurements with uncertainty, OR the order is not an integer, OR
+            any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty or shorter than the
+            order, OR the order is not positive, OR any keyword argument is of
+            the proper type but unacceptable value, OR a missing value is found
+            with the RAISE policy, OR all values are missing with the SKIP
+            policy
 
     Version 1.0.0.0
     """
     _CheckPositiveInteger(SkipFrames)
-    if (NBins is None) and (BinSize is None):
-        _NBins = 20
-    elif not (NBins is None):
-        _CheckPositiveInteger(NBins)
-        _NBins = NBins
-    else:
-        if not isinstance(BinSize, (int, float)):
-            raise UT_TypeError(BinSize, (int, float), SkipFrames = SkipFrames)
-        elif BinSize <= 0:
-            raise UT_ValueError(BinSize, '> 0 - bin size',
-                                                        SkipFrames = SkipFrames)
-        _NBins = None
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    _CheckPositiveInteger(Order)
     if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
+        _Data = sorted(_ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing))
     else:
         _Data = Data
-    Min = min(_Data)
-    Max = max(_Data)
-    if not (_NBins is None):
-        NSteps = _NBins
-        if NSteps > 1:
-            Start = round(Min, 16)
-            Step = round((Max - Min) / (_NBins - 1), 16)
-        else:
-            Start = round(GetMean(_Data, DoCheck = False), 16)
-            Step = 0
-    else:
-        Step = round(BinSize, 16)
-        Mean = GetMean(_Data, DoCheck = False)
-        NLeft = int(math.ceil((Mean - Min) / Step - 0.5))
-        NRight = int(math.ceil((Max - Mean) / Step - 0.5))
-        NSteps = NLeft + NRight + 1
-        Start = Mean - NLeft * Step
-    if Step == 0 or NSteps == 1:
-        Result = {Start : len(_Data)}
-    else:
-        Temp = [0 for _ in range(NSteps)]
-        for Item in _Data:
-            Index = int((round(Item, 16) - Start) / Step + 0.5)
-            if Index >= NSteps: #rounding-up errors
-                Index = NSteps + 1
-            elif Index < 0:
-                Index = 0
-            Temp[Index] += 1
-        Result = {round(Start+Index*Step, 16) : Item
-                                            for Index, Item in enumerate(Temp)}
+    Length = len(_Data)
+    if Length < Order:
+        raise UT_ValueError(Length, '>= {} - length of the sequence'.format(
+                                                Order), SkipFrames = SkipFrames)
+    Moments = _GetLMoments(_Data, Order)
+    Result = tuple(Moments)
     return Result
 
-def GetModes(Data: TGenericSequence, *, SkipFrames: int = 1,
-                                            DoCheck: bool = True) -> TRealList:
+def GetLMomentRatios(Data: TGenericSequence, Order: int = 4, *,
+                            SkipFrames: int = 1, DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                    ) -> Tuple[TReal, ...]:
     """
-    Calculates the mode(s) of a mixed sequence of real numbers and the
-    measurements with uncertainty. Computation speed is always O(N).
+    Calculates the L-location and L-scale (the L-moments of the orders 1 and
+    2) and the L-moment ratios of the orders 3 (L-skewness) up to the requested
+    order, i.e. the L-moments divided by the L-scale, of a mixed sequence of
+    real numbers and the measurements with uncertainty. The ratios are zero for
+    a constant sequence. The computation speed is O(N*log(N)) due to the
+    sorting, unless the passed sequence is already sorted in ascending order
+    sequence of real numbers, which is indicated by the keyword argument
+    DoCheck = False, in which case the computation speed is O(N).
 
     Signature:
-        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, *, int > 0,
-            bool/ -> list(int OR float)
+        seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/, int > 0,
+            *, int > 0, bool, MissingPolicy/ -> tuple(int OR float)
     
     Args:
         Data: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
             sequence of real numbers or 'measurements with uncertainty'
+        Order: int > 0; the highest order to calculate, defaults to 4, not
+            greater than the length of the sequence
         SkipFrames: (keyword) int > 0; how many frames to hide in the
             exception traceback, defaults to 1
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check, convert the mixed sequence into a list of only real numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
-        list(int OR float): the calculated modes
+        tuple(int OR float): the L-location, L-scale and the L-moment
+            ratios of the orders 3 to Order
     
     Raises:
         UT_TypeError: mandatory argument is not a sequence of real numbers or
-            measurements with uncertainty, OR any keyword argument is of
-            improper type
-        UT_ValueError: passed mandatory sequence is empty, OR any keyword
-            argument is of the proper type but unacceptable value
+            measurements with uncertainty, OR the order is not an integer, OR
+            any keyword argument is of improper type
+        UT_ValueError: passed mandatory sequence is empty or shorter than the
+            order, OR the order is not positive, OR any keyword argument is of
+            the proper type but unacceptable value, OR a missing value is found
+            with the RAISE policy, OR all values are missing with the SKIP
+            policy
 
-    Version 1.0.0.1
+    Version 1.0.0.0
     """
     _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    _CheckPositiveInteger(Order)
     if DoCheck:
-        _Data = _ExtractMeans(Data, SkipFrames = SkipFrames + 1)
+        _Data = sorted(_ExtractMeans(Data, SkipFrames = SkipFrames + 1,
+                                                            Missing = Missing))
     else:
         _Data = Data
-    Temp = dict()
-    for Item in _Data:
-        Temp[Item] = Temp.get(Item, 0) + 1
-    MaxCount = max(Temp.values())
-    Result = []
-    for Key, Value in Temp.items():
-        if Value == MaxCount:
-            Result.append(Key)
+    Length = len(_Data)
+    if Length < Order:
+        raise UT_ValueError(Length, '>= {} - length of the sequence'.format(
+                                                Order), SkipFrames = SkipFrames)
+    Moments = _GetLMoments(_Data, Order)
+    Scale = Moments[1] if Order > 1 else 0
+    if Scale:
+        Result = tuple(Moments[:2]) + tuple(Moment / Scale
+                                                    for Moment in Moments[2:])
+    else:
+        Result = tuple(Moments[:2]) + (0, ) * (Order - 2)
     return Result
 
 #++ 2D statistics
 
 def GetSpearman(DataX: TGenericSequence, DataY: TGenericSequence, *,
-                            SkipFrames: int = 1, DoCheck: bool = True) -> TReal:
+                            SkipFrames: int = 1, DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                                    ) -> TReal:
     """
     Calculates the Spearman rank correlation coeffificent of the paired  mixed
     sequences of real numbers and the measurements with uncertainty. Computation
@@ -578,7 +3536,7 @@ def GetSpearman(DataX: TGenericSequence, DataY: TGenericSequence, *,
     Signature:
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
             seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
-                *, int > 0, bool/ -> int OR float
+                *, int > 0, bool, MissingPolicy/ -> int OR float
     
     Args:
         DataX: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
@@ -590,6 +3548,8 @@ def GetSpearman(DataX: TGenericSequence, DataY: TGenericSequence, *,
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
         int OR float: the calculated rank correlation value
@@ -600,11 +3560,17 @@ def GetSpearman(DataX: TGenericSequence, DataY: TGenericSequence, *,
             of improper type
         UT_ValueError: any of the passed mandatory sequence is empty, OR any
             keyword argument is of the proper type but unacceptable value, OR
-            the X and Y sequences are of different length
+            the X and Y sequences are of different length, OR a missing value is
+            found with the RAISE policy, OR all values are missing with the SKIP
+            policy
 
-    Version 1.0.1.0
+    Version 1.1.0.0
     """
     _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
+    if DoCheck:
+        DataX, DataY = _DropMissing((DataX, DataY), Missing,
+                                                SkipFrames = SkipFrames + 1)
     RankX = _GetRanks(DataX, SkipFrames = SkipFrames + 1, DoCheck = DoCheck)
     RankY = _GetRanks(DataY, SkipFrames = SkipFrames + 1, DoCheck = DoCheck)
     LengthX = len(RankX)
@@ -619,16 +3585,18 @@ def GetSpearman(DataX: TGenericSequence, DataY: TGenericSequence, *,
     return Result
 
 def GetKendall(DataX: TGenericSequence, DataY: TGenericSequence, *,
-                            SkipFrames: int = 1, DoCheck: bool = True) -> TReal:
+                            SkipFrames: int = 1, DoCheck: bool = True,
+                            Missing: MissingPolicy = MissingPolicy.PROPAGATE
+                                                                    ) -> TReal:
     """
-    Calculates the Kendall rank correlation coeffificent of the paired  mixed
-    sequences of real numbers and the measurements with uncertainty. Computation
-    speed is always O(N^2).
+    Calculates the Kendall rank correlation coeffificent (tau-b) of the paired
+    mixed sequences of real numbers and the measurements with uncertainty.
+    Computation speed is O(N * log(N)), see _GetKendall().
 
     Signature:
         seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
             seq(int OR float OR phyqus_lib.base_classes.MeasuredValue)/,
-                *, int > 0, bool/ -> int OR float
+                *, int > 0, bool, MissingPolicy/ -> int OR float
     
     Args:
         DataX: seq(int OR float OR phyqus_lib.base_classes.MeasuredValue); a
@@ -640,6 +3608,8 @@ def GetKendall(DataX: TGenericSequence, DataY: TGenericSequence, *,
         DoCheck: (keyword) bool; flag if to perform the input data sanity
             check and convert the mixed sequence into a list of only real
             numbers
+        Missing: (keyword) MissingPolicy; the treatment of the missing values
+            (None or NaN), defaults to MissingPolicy.PROPAGATE
     
     Returns:
         int OR float: the calculated rank correlation value
@@ -650,12 +3620,17 @@ def GetKendall(DataX: TGenericSequence, DataY: TGenericSequence, *,
             of improper type
         UT_ValueError: any of the passed mandatory sequence is empty, OR any
             keyword argument is of the proper type but unacceptable value, OR
-            the X and Y sequences are of different length
+            the X and Y sequences are of different length, OR a missing value is
+            found with the RAISE policy, OR all values are missing with the SKIP
+            policy
 
-    Version 1.0.1.0
+    Version 1.2.1.0
     """
     _CheckPositiveInteger(SkipFrames)
+    _CheckMissingPolicy(Missing, SkipFrames = SkipFrames + 1)
     if DoCheck:
+        DataX, DataY = _DropMissing((DataX, DataY), Missing,
+                                                SkipFrames = SkipFrames + 1)
         _DataX = _ExtractMeans(DataX, SkipFrames = SkipFrames + 1)
         _DataY = _ExtractMeans(DataY, SkipFrames = SkipFrames + 1)
     else:
@@ -669,29 +3644,5 @@ def GetKendall(DataX: TGenericSequence, DataY: TGenericSequence, *,
     if LengthX == 1:
         Result = 1
     else:
-        NConcord = 0
-        NDiscord = 0
-        NXTies = 0
-        NYTies = 0
-        for FirstIdx in range(LengthX - 1):
-            for SecondIdx in range(FirstIdx + 1, LengthX):
-                X1 = _DataX[FirstIdx]
-                X2 = _DataX[SecondIdx]
-                Y1 = _DataY[FirstIdx]
-                Y2 = _DataY[SecondIdx]
-                if X1 == X2 and Y1 != Y2:
-                    NXTies += 1
-                elif X1 != X2 and Y1 == Y2:
-                    NYTies += 1
-                elif (X1 > X2 and Y1 > Y2) or (X1 < X2 and Y1 < Y2):
-                    NConcord += 1
-                elif (X1 > X2 and Y1 < Y2) or (X1 < X2 and Y1 > Y2):
-                    NDiscord += 1
-        Difference = NConcord - NDiscord
-        Correction = math.sqrt((NConcord + NDiscord + NXTies) *
-                                                (NConcord + NDiscord + NYTies))
-        if Correction == 0:
-            Result = 1
-        else:
-            Result = Difference / Correction
+        Result = _GetKendall(_DataX, _DataY, Missing = Missing)
     return Result